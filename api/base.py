@@ -14,6 +14,12 @@ import requests
 from typing import Dict, Any, Optional
 from urllib.parse import urljoin
 
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.hooks import RequestHooks
+from kiwoom_api.pool import ConnectionPool
+from kiwoom_api.retry import is_idempotent, is_retryable
+from kiwoom_api.transport import Transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,18 +31,37 @@ class APIBase:
     - HTTP 요청 메서드 (GET, POST, PUT, DELETE)
     - 헤더 생성
     - 응답 처리
+    - 토큰, 호출 속도 제한, 캐시, 재시도, 요청 훅 (kiwoom_api.transport.Transport)
     """
     
-    def __init__(self, base_url: str, headers: Dict[str, str]):
+    def __init__(self, base_url: str, headers: Dict[str, str], pool: Optional[ConnectionPool] = None,
+                 hooks: Optional[RequestHooks] = None, transport: Optional[Transport] = None,
+                 auth: Optional[KiwoomAuth] = None):
         """
         APIBase 클래스 초기화
         
         Args:
             base_url (str): API 기본 URL
             headers (Dict[str, str]): API 요청 헤더
+            pool (ConnectionPool, optional): HTTP 연결 풀. 기본값은 프로세스 공유 연결 풀
+            hooks (RequestHooks, optional): 요청 훅. 기본값은 None (빈 훅 목록)
+            transport (Transport, optional): KiwoomClient 등과 공유할 요청 전송 엔진.
+                지정하면 pool, hooks, auth 대신 transport 의 연결 풀, 호출 한도, 훅, 인증을 사용
+            auth (KiwoomAuth, optional): transport 를 지정하지 않을 때 토큰을 발급할 인증 객체. 기본값은 None
         """
         self.base_url = base_url
         self.headers = headers
+        self.transport = transport or Transport(auth, pool=pool, hooks=hooks)
+    
+    @property
+    def pool(self) -> ConnectionPool:
+        """HTTP 연결 풀"""
+        return self.transport.pool
+    
+    @property
+    def hooks(self) -> RequestHooks:
+        """요청 훅"""
+        return self.transport.hooks
     
     def _get_url(self, endpoint: str) -> str:
         """
@@ -50,149 +75,139 @@ class APIBase:
         """
         return urljoin(self.base_url, endpoint)
     
-    def _process_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _process_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         응답 처리
         
         Args:
-            response (requests.Response): 요청 응답 객체
+            result (Dict[str, Any]): Transport.request 응답 (status_code, headers, data)
             
         Returns:
             Dict[str, Any]: 처리된 응답 데이터
         """
-        try:
-            response.raise_for_status()
-            data = response.json()
-            return {
-                'status': 'success',
-                'message': data.get('msg1', ''),
-                'code': data.get('msg_cd', ''),
-                'data': data
-            }
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP 오류: {str(e)}")
+        data = result['data']
+        return {
+            'status': 'success',
+            'message': data.get('msg1', ''),
+            'code': data.get('msg_cd', ''),
+            'data': data
+        }
+    
+    def _process_error(self, method: str, error: Exception, idempotent: bool = True) -> Dict[str, Any]:
+        """
+        요청 오류 처리
+        
+        Args:
+            method (str): HTTP 메서드
+            error (Exception): 요청 중 발생한 예외
+            idempotent (bool, optional): 재시도해도 안전한 요청인지 여부. 기본값은 True
+            
+        Returns:
+            Dict[str, Any]: 오류 응답 데이터 ('retryable' 에 재시도 가능 여부 포함)
+        """
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            logger.error(f"HTTP 오류: {str(error)}")
             return {
                 'status': 'error',
-                'message': f'HTTP 오류: {str(e)}',
-                'code': str(response.status_code),
+                'message': f'HTTP 오류: {str(error)}',
+                'code': str(error.response.status_code),
+                'retryable': is_retryable(error.response.status_code, idempotent=idempotent),
                 'data': {}
             }
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 디코딩 오류: {str(e)}")
+        if isinstance(error, json.JSONDecodeError):
+            logger.error(f"JSON 디코딩 오류: {str(error)}")
             return {
                 'status': 'error',
-                'message': f'응답을 JSON으로 변환할 수 없습니다: {str(e)}',
+                'message': f'응답을 JSON으로 변환할 수 없습니다: {str(error)}',
                 'code': 'JSON_DECODE_ERROR',
+                'retryable': False,
                 'data': {}
             }
+        logger.error(f"{method} 요청 중 오류 발생: {str(error)}")
+        return {
+            'status': 'error',
+            'message': f'{method} 요청 중 오류 발생: {str(error)}',
+            'code': 'REQUEST_ERROR',
+            'retryable': is_retryable(error=error, idempotent=idempotent),
+            'data': {}
+        }
+    
+    def _execute(self, method: str, endpoint: str, api_id: str = '', data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        요청 전송 및 응답 처리
+        
+        캐시, 요청 병합, 호출 한도, 토큰, 재시도, 훅은 KiwoomClient 와 같은 Transport.request 에서 적용합니다.
+        
+        Args:
+            method (str): HTTP 메서드
+            endpoint (str): API 엔드포인트
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
+            data (Dict[str, Any], optional): 요청 데이터 (GET, DELETE 는 쿼리 파라미터, 나머지는 JSON 본문)
+            
+        Returns:
+            Dict[str, Any]: 응답 데이터
+        """
+        try:
+            result = self.transport.request(method, self._get_url(endpoint), endpoint, api_id, data)
         except Exception as e:
-            logger.error(f"요청 처리 중 오류 발생: {str(e)}")
-            return {
-                'status': 'error',
-                'message': f'요청 처리 중 오류 발생: {str(e)}',
-                'code': 'UNKNOWN_ERROR',
-                'data': {}
-            }
+            return self._process_error(method, e, is_idempotent(api_id, endpoint))
+        return self._process_result(result)
     
-    def request_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def request_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, api_id: str = '') -> Dict[str, Any]:
         """
         GET 요청
         
         Args:
             endpoint (str): API 엔드포인트
             params (Dict[str, Any], optional): 요청 파라미터
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
             
         Returns:
             Dict[str, Any]: 응답 데이터
         """
-        url = self._get_url(endpoint)
-        
-        try:
-            response = requests.get(url, headers=self.headers, params=params)
-            return self._process_response(response)
-        except Exception as e:
-            logger.error(f"GET 요청 중 오류 발생: {str(e)}")
-            return {
-                'status': 'error',
-                'message': f'GET 요청 중 오류 발생: {str(e)}',
-                'code': 'REQUEST_ERROR',
-                'data': {}
-            }
+        return self._execute('GET', endpoint, api_id, params)
     
-    def request_post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def request_post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, api_id: str = '') -> Dict[str, Any]:
         """
         POST 요청
         
         Args:
             endpoint (str): API 엔드포인트
             data (Dict[str, Any], optional): 요청 데이터
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
             
         Returns:
             Dict[str, Any]: 응답 데이터
         """
-        url = self._get_url(endpoint)
-        
-        try:
-            response = requests.post(url, headers=self.headers, json=data)
-            return self._process_response(response)
-        except Exception as e:
-            logger.error(f"POST 요청 중 오류 발생: {str(e)}")
-            return {
-                'status': 'error',
-                'message': f'POST 요청 중 오류 발생: {str(e)}',
-                'code': 'REQUEST_ERROR',
-                'data': {}
-            }
+        return self._execute('POST', endpoint, api_id, data)
     
-    def request_put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def request_put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, api_id: str = '') -> Dict[str, Any]:
         """
         PUT 요청
         
         Args:
             endpoint (str): API 엔드포인트
             data (Dict[str, Any], optional): 요청 데이터
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
             
         Returns:
             Dict[str, Any]: 응답 데이터
         """
-        url = self._get_url(endpoint)
-        
-        try:
-            response = requests.put(url, headers=self.headers, json=data)
-            return self._process_response(response)
-        except Exception as e:
-            logger.error(f"PUT 요청 중 오류 발생: {str(e)}")
-            return {
-                'status': 'error',
-                'message': f'PUT 요청 중 오류 발생: {str(e)}',
-                'code': 'REQUEST_ERROR',
-                'data': {}
-            }
+        return self._execute('PUT', endpoint, api_id, data)
     
-    def request_delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def request_delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None, api_id: str = '') -> Dict[str, Any]:
         """
         DELETE 요청
         
         Args:
             endpoint (str): API 엔드포인트
             params (Dict[str, Any], optional): 요청 파라미터
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
             
         Returns:
             Dict[str, Any]: 응답 데이터
         """
-        url = self._get_url(endpoint)
-        
-        try:
-            response = requests.delete(url, headers=self.headers, params=params)
-            return self._process_response(response)
-        except Exception as e:
-            logger.error(f"DELETE 요청 중 오류 발생: {str(e)}")
-            return {
-                'status': 'error',
-                'message': f'DELETE 요청 중 오류 발생: {str(e)}',
-                'code': 'REQUEST_ERROR',
-                'data': {}
-            }
+        return self._execute('DELETE', endpoint, api_id, params)
 
 
 class BaseAPI:
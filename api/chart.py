@@ -29,15 +29,16 @@ class ChartAPI(APIBase):
     - 틱 데이터 조회 (국내주식)
     """
     
-    def __init__(self, base_url: str, headers: Dict[str, str]):
+    def __init__(self, base_url: str, headers: Dict[str, str], **kwargs):
         """
         ChartAPI 클래스 초기화
         
         Args:
             base_url (str): API 기본 URL
             headers (Dict[str, str]): 요청 헤더
+            **kwargs: APIBase 인자 (pool, hooks, transport)
         """
-        super().__init__(base_url, headers)
+        super().__init__(base_url, headers, **kwargs)
     
     # 국내 주식 차트 API
     
@@ -14,10 +14,13 @@
 import json
 import logging
 import asyncio
-import websockets
 from typing import Dict, Any, Optional, List, Union
 import os
 from datetime import datetime
+from inspect import isawaitable
+
+from kiwoom_api.codec import get_codec
+from kiwoom_api.consumer import DROP_OLDEST, AsyncConsumer
 
 from .base import APIBase, BaseAPI
 
@@ -54,6 +57,8 @@ class ConditionAPI(BaseAPI):
         Returns:
             bool: 연결 성공 여부
         """
+        import websockets  # 웹소켓을 쓰지 않는 조회 작업은 import 비용을 치르지 않도록 지연
+        
         try:
             if self.websocket and not self.websocket.closed:
                 return True
@@ -85,13 +90,15 @@ class ConditionAPI(BaseAPI):
             
     async def _listen_websocket_messages(self):
         """웹소켓 메시지 리스너"""
+        import websockets
+        
         try:
             while self.condition_websocket_connected and self.websocket:
                 message = await self.websocket.recv()
                 self.logger.debug(f"Received message: {message}")
                 
                 try:
-                    data = json.loads(message)
+                    data = get_codec().loads(message)
                     tr_id = data.get("header", {}).get("tr_id", "")
                     
                     if tr_id in self.callbacks:
@@ -251,7 +258,7 @@ class ConditionAPI(BaseAPI):
             }
             
             # 요청 전송
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(get_codec().dumps(request))
             
             return {
                 "status": "success",
@@ -293,7 +300,7 @@ class ConditionAPI(BaseAPI):
             }
             
             # 요청 전송
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(get_codec().dumps(request))
             
             # 콜백 제거
             if tr_id in self.callbacks:
@@ -342,6 +349,8 @@ class WebSocketClient:
         Returns:
             bool: 연결 성공 여부
         """
+        import websockets
+        
         try:
             self.websocket = await websockets.connect(self.uri)
             self.connected = True
@@ -383,7 +392,7 @@ class WebSocketClient:
         try:
             # 메시지 직렬화
             if not isinstance(message, str):
-                message = json.dumps(message)
+                message = get_codec().dumps(message)
             
             await self.websocket.send(message)
             logger.debug(f"메시지 전송: {message}")
@@ -396,11 +405,13 @@ class WebSocketClient:
         """
         서버로부터 메시지 수신 및 처리
         """
+        import websockets
+        
         while self.keep_running:
             try:
                 # 서버로부터 메시지 수신 및 JSON 파싱
                 raw_message = await self.websocket.recv()
-                message = json.loads(raw_message)
+                message = get_codec().loads(raw_message)
                 
                 # 메시지 유형에 따른 처리
                 if message.get('trnm') == 'LOGIN':
@@ -416,19 +427,23 @@ class WebSocketClient:
                 
                 # 실시간 데이터 처리
                 elif message.get('trnm') == 'REAL':
-                    # 콜백 호출
-                    for callback in self.callbacks.values():
+                    # 콜백 호출 (BLOCK 소비자의 대기열이 가득 차면 자리가 날 때까지 대기)
+                    for callback in list(self.callbacks.values()):
                         if callable(callback):
-                            callback(message)
+                            result = callback(message)
+                            if result is not None and isawaitable(result):
+                                await result
                 
                 # 일반 메시지 처리
                 elif message.get('trnm') != 'PING':
-                    logger.debug(f"서버 응답 수신: {message}")
+                    logger.debug("서버 응답 수신: %s", message)
                     
                     # 콜백 호출
                     seq = message.get('seq')
                     if seq in self.callbacks and callable(self.callbacks[seq]):
-                        self.callbacks[seq](message)
+                        result = self.callbacks[seq](message)
+                        if result is not None and isawaitable(result):
+                            await result
             
             except websockets.ConnectionClosed:
                 logger.info("서버에 의해 연결이 닫혔습니다.")
@@ -442,20 +457,37 @@ class WebSocketClient:
         WebSocket 연결 종료
         """
         self.keep_running = False
+        for callback in self.callbacks.values():
+            if isinstance(callback, AsyncConsumer):
+                await callback.close()
         if self.connected and self.websocket:
             await self.websocket.close()
             self.connected = False
             logger.info("WebSocket 서버와의 연결을 종료했습니다.")
     
-    def register_callback(self, seq: str, callback):
+    def register_callback(self, seq: str, callback, maxsize: int = 1000, policy: str = DROP_OLDEST) -> Optional[AsyncConsumer]:
         """
         콜백 함수 등록
         
+        코루틴 함수는 크기가 제한된 대기열을 가진 소비자로 감싸 수신 루프와 따로 실행합니다.
+        
         Args:
             seq (str): 조건검색식 일련번호
-            callback (callable): 콜백 함수
+            callback (callable): 콜백 함수 또는 코루틴 함수
+            maxsize (int, optional): 코루틴 콜백의 대기열 최대 크기. 기본값은 1000
+            policy (str, optional): 대기열이 가득 찼을 때의 처리 정책 ('drop_oldest', 'conflate', 'block').
+                기본값은 'drop_oldest'
+        
+        Returns:
+            AsyncConsumer: 코루틴 콜백을 감싼 소비자 (stats() 로 대기열 통계 조회). 동기 콜백이면 None
         """
+        self.unregister_callback(seq)
+        if asyncio.iscoroutinefunction(callback):
+            callback = AsyncConsumer(callback, maxsize, policy)
+            self.callbacks[seq] = callback
+            return callback
         self.callbacks[seq] = callback
+        return None
     
     def unregister_callback(self, seq: str):
         """
@@ -464,5 +496,6 @@ class WebSocketClient:
         Args:
             seq (str): 조건검색식 일련번호
         """
-        if seq in self.callbacks:
-            del self.callbacks[seq] 
\ No newline at end of file
+        callback = self.callbacks.pop(seq, None)
+        if isinstance(callback, AsyncConsumer):
+            callback.cancel()
\ No newline at end of file
@@ -18,6 +18,8 @@ import json
 from typing import Dict, Any, Optional
 import os
 
+from kiwoom_api.registry import resolve_endpoint
+
 from .base import BaseAPI
 
 logger = logging.getLogger(__name__)
@@ -88,7 +90,7 @@ class CreditOrderAPI(BaseAPI):
             dict: 주문 결과 응답
         """
         api_id = "kt10006"
-        endpoint = "/api/dostk/crdordr"
+        endpoint = resolve_endpoint(api_id)
         
         params = {
             'dmst_stex_tp': exchange_type,
@@ -133,7 +135,7 @@ class CreditOrderAPI(BaseAPI):
             dict: 주문 결과 응답
         """
         api_id = "kt10007"
-        endpoint = "/api/dostk/crdordr"
+        endpoint = resolve_endpoint(api_id)
         
         params = {
             'dmst_stex_tp': exchange_type,
@@ -170,7 +172,7 @@ class CreditOrderAPI(BaseAPI):
             dict: 주문 정정 결과 응답
         """
         api_id = "kt10008"
-        endpoint = "/api/dostk/crdordr"
+        endpoint = resolve_endpoint(api_id)
         
         params = {
             'dmst_stex_tp': exchange_type,
@@ -202,7 +204,7 @@ class CreditOrderAPI(BaseAPI):
             dict: 주문 취소 결과 응답
         """
         api_id = "kt10009"
-        endpoint = "/api/dostk/crdordr"
+        endpoint = resolve_endpoint(api_id)
         
         params = {
             'dmst_stex_tp': exchange_type,
@@ -51,14 +51,12 @@ class ELWAPI(APIBase):
                 - vega (float): 베가
         """
         url = "uapi/domestic-stock/v1/quotations/elw-info"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kf10001')
     
     def get_elw_price(self, symbol: str) -> Dict[str, Any]:
         """
@@ -90,14 +88,12 @@ class ELWAPI(APIBase):
                 - time_value (float): 시간가치
         """
         url = "uapi/domestic-stock/v1/quotations/elw-price"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kf10002')
     
     def get_elw_remain_days(self, symbol: str) -> Dict[str, Any]:
         """
@@ -117,14 +113,12 @@ class ELWAPI(APIBase):
                 - dividend_impact (float): 배당영향
         """
         url = "uapi/domestic-stock/v1/quotations/elw-remain-days"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kf10003')
     
     def get_elw_by_issuer(self, issuer_code: str, base_asset_code: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -149,7 +143,6 @@ class ELWAPI(APIBase):
                     - volume (int): 거래량
         """
         url = "uapi/domestic-stock/v1/quotations/elw-by-issuer"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISSU_CD": issuer_code,
@@ -158,8 +151,7 @@ class ELWAPI(APIBase):
         if base_asset_code:
             params["FID_INPUT_BASS_ASST_CD"] = base_asset_code
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kf10004')
     
     def get_elw_sensitivity(self, symbol: str) -> Dict[str, Any]:
         """
@@ -185,15 +177,12 @@ class ELWAPI(APIBase):
                     - lp (float): LP
         """
         url = "api/dostk/elw"
-        headers = self._get_headers()
-        headers["api-id"] = "ka10050"
         
         data = {
             "stk_cd": symbol
         }
         
-        res = self.request_post(url, headers=headers, json=data)
-        return res.json()
+        return self.request_post(url, data, api_id='ka10050')
     
     def get_elw_daily_sensitivity(self, symbol: str) -> Dict[str, Any]:
         """
@@ -217,15 +206,12 @@ class ELWAPI(APIBase):
                     - lp (float): LP
         """
         url = "api/dostk/elw"
-        headers = self._get_headers()
-        headers["api-id"] = "ka10048"
         
         data = {
             "stk_cd": symbol
         }
         
-        res = self.request_post(url, headers=headers, json=data)
-        return res.json()
+        return self.request_post(url, data, api_id='ka10048')
     
     def get_elw_price_change(self, 
                             change_type: str = "1", 
@@ -257,8 +243,6 @@ class ELWAPI(APIBase):
                     - issuer (str): 발행회사
         """
         url = "api/dostk/elw"
-        headers = self._get_headers()
-        headers["api-id"] = "ka30001"
         
         data = {
             "flu_tp": change_type,
@@ -269,8 +253,7 @@ class ELWAPI(APIBase):
             "bsis_aset_cd": base_asset_code
         }
         
-        res = self.request_post(url, headers=headers, json=data)
-        return res.json()
+        return self.request_post(url, data, api_id='ka30001')
     
     def search_elw(self, 
                   query: str,
@@ -298,7 +281,6 @@ class ELWAPI(APIBase):
                     - issuer (str): 발행회사
         """
         url = "uapi/domestic-stock/v1/quotations/elw-search"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_SEARCH_WORD": query,
@@ -313,5 +295,4 @@ class ELWAPI(APIBase):
         if issuer_code:
             params["FID_INPUT_ISSU_CD"] = issuer_code
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json() 
\ No newline at end of file
+        return self.request_get(url, params) 
\ No newline at end of file
@@ -52,14 +52,12 @@ class ETFAPI(APIBase):
                 - yield_rate (float): 분배금수익률
         """
         url = "uapi/domestic-stock/v1/quotations/etf-info"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kl10001')
     
     def get_etf_components(self, symbol: str) -> Dict[str, Any]:
         """
@@ -81,14 +79,12 @@ class ETFAPI(APIBase):
                     - sector (str): 섹터
         """
         url = "uapi/domestic-stock/v1/quotations/etf-components"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kl10002')
     
     def get_etf_nav(self, symbol: str) -> Dict[str, Any]:
         """
@@ -114,14 +110,12 @@ class ETFAPI(APIBase):
                     - premium (float): 괴리율
         """
         url = "uapi/domestic-stock/v1/quotations/etf-nav"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kl10003')
     
     def get_etf_price(self, symbol: str) -> Dict[str, Any]:
         """
@@ -151,14 +145,12 @@ class ETFAPI(APIBase):
                 - bid_volume (int): 매수호가수량
         """
         url = "uapi/domestic-stock/v1/quotations/etf-price"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params, api_id='kl10004')
     
     def get_etf_list(self, etf_type: Optional[str] = None, market_code: str = 'J') -> Dict[str, Any]:
         """
@@ -179,7 +171,6 @@ class ETFAPI(APIBase):
                     - market (str): 시장구분
         """
         url = "uapi/domestic-stock/v1/quotations/etf-list"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": market_code,
         }
@@ -187,8 +178,7 @@ class ETFAPI(APIBase):
         if etf_type:
             params["FID_INPUT_ETF_TYPE"] = etf_type
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json()
+        return self.request_get(url, params)
     
     def get_etf_price_by_date(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
         """
@@ -215,7 +205,6 @@ class ETFAPI(APIBase):
                     - premium (float): 괴리율
         """
         url = "uapi/domestic-stock/v1/quotations/etf-price-by-date"
-        headers = self._get_headers()
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
@@ -224,5 +213,4 @@ class ETFAPI(APIBase):
             "FID_PERIOD_DIV_CODE": "D"  # 일별 데이터
         }
         
-        res = self.request_get(url, headers=headers, params=params)
-        return res.json() 
\ No newline at end of file
+        return self.request_get(url, params) 
\ No newline at end of file
@@ -55,8 +55,7 @@ class RankingAPI(APIBase):
         if industry_code:
             params["INDUSTRY_CODE"] = industry_code
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10001')
     
     def get_trading_volume_top(self, market_code: str, industry_code: Optional[str] = None,
                                sort_type: str = "DESC", top_n: int = 30) -> Dict[str, Any]:
@@ -85,8 +84,7 @@ class RankingAPI(APIBase):
         if industry_code:
             params["INDUSTRY_CODE"] = industry_code
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10002')
     
     def get_market_cap_top(self, market_code: str, industry_code: Optional[str] = None,
                            sort_type: str = "DESC", top_n: int = 30) -> Dict[str, Any]:
@@ -115,8 +113,7 @@ class RankingAPI(APIBase):
         if industry_code:
             params["INDUSTRY_CODE"] = industry_code
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10003')
     
     def get_order_residual_top(self, market_code: str, residual_type: str = "BUY",
                                sort_type: str = "DESC", top_n: int = 30) -> Dict[str, Any]:
@@ -143,8 +140,7 @@ class RankingAPI(APIBase):
             "RANKINGS": top_n,
         }
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10004')
     
     def get_rising_top(self, market_code: str, time_period: str = "DAY",
                        sort_type: str = "DESC", top_n: int = 30) -> Dict[str, Any]:
@@ -171,8 +167,7 @@ class RankingAPI(APIBase):
             "RANKINGS": top_n,
         }
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10005')
     
     def get_falling_top(self, market_code: str, time_period: str = "DAY",
                         sort_type: str = "DESC", top_n: int = 30) -> Dict[str, Any]:
@@ -199,8 +194,7 @@ class RankingAPI(APIBase):
             "RANKINGS": top_n,
         }
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10006')
     
     def get_investor_net_buying_top(self, market_code: str, investor_type: str = "FOREIGN",
                                     time_period: str = "DAY", sort_type: str = "DESC", 
@@ -230,8 +224,7 @@ class RankingAPI(APIBase):
             "RANKINGS": top_n,
         }
         
-        response = self.request_get(path, params=params)
-        return response.json()
+        return self.request_get(path, params, api_id='ki10007')
     
     def get_new_high_low(self, market_code: str, high_low_type: str = "HIGH",
                          time_period: str = "YEAR", top_n: int = 30) -> Dict[str, Any]:
@@ -258,5 +251,4 @@ class RankingAPI(APIBase):
             "RANKINGS": top_n,
         }
         
-        response = self.request_get(path, params=params)
-        return response.json() 
\ No newline at end of file
+        return self.request_get(path, params, api_id='ki10008') 
\ No newline at end of file
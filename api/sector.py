@@ -35,15 +35,16 @@ class SectorAPI(APIBase):
     - 섹터 지수 조회
     """
     
-    def __init__(self, base_url: str, headers: Dict[str, str]):
+    def __init__(self, base_url: str, headers: Dict[str, str], **kwargs):
         """
         SectorAPI 클래스 초기화
         
         Args:
             base_url (str): API 기본 URL
             headers (Dict[str, str]): API 요청 헤더
+            **kwargs: APIBase 인자 (pool, hooks, transport)
         """
-        super().__init__(base_url, headers)
+        super().__init__(base_url, headers, **kwargs)
     
     def get_sector_price(self, market_type: str, sector_code: str) -> Dict[str, Any]:
         """
@@ -66,17 +67,12 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka20001',
-        })
-        
         params = {
             'mrkt_tp': market_type,
             'inds_cd': sector_code,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka20001')
     
     def get_sector_components(self, market_type: str, sector_code: str) -> Dict[str, Any]:
         """
@@ -91,17 +87,12 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'kb10003',
-        })
-        
         params = {
             'mrkt_tp': market_type,
             'inds_cd': sector_code,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='kb10003')
     
     def get_sector_basic_info(self, sector_code: str) -> Dict[str, Any]:
         """
@@ -115,16 +106,11 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'kb10001',
-        })
-        
         params = {
             'inds_cd': sector_code,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='kb10001')
     
     def get_sector_price_info(self, sector_code: str, date: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -139,11 +125,6 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'kb10002',
-        })
-        
         params = {
             'inds_cd': sector_code,
         }
@@ -151,7 +132,7 @@ class SectorAPI(APIBase):
         if date:
             params['base_dt'] = date
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='kb10002')
     
     def get_sector_investor_trend(self, 
                                   market_type: str,
@@ -172,11 +153,6 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka10051',
-        })
-        
         params = {
             'mrkt_tp': market_type,
             'amt_qty_tp': amount_qty_type,
@@ -186,7 +162,7 @@ class SectorAPI(APIBase):
         if base_date:
             params['base_dt'] = base_date
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka10051')
     
     def get_sector_program_trading(self, stock_code: str) -> Dict[str, Any]:
         """
@@ -200,16 +176,11 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka10010',
-        })
-        
         params = {
             'stk_cd': stock_code,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka10010')
     
     def get_sector_index(self, market_type: str) -> Dict[str, Any]:
         """
@@ -223,39 +194,8 @@ class SectorAPI(APIBase):
         """
         endpoint = "/api/dostk/sect"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'kb10004',
-        })
-        
         params = {
             'mrkt_tp': market_type,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        API 요청용 헤더 생성
-        
-        Returns:
-            Dict[str, str]: API 요청 헤더
-        """
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {self._get_access_token()}',
-            'cont-yn': 'N',
-            'next-key': '',
-        }
-        return headers
-        
-    def _get_access_token(self) -> str:
-        """
-        액세스 토큰 가져오기
-        
-        Returns:
-            str: 액세스 토큰
-        """
-        # 실제 구현에서는 토큰 관리 로직 추가
-        # 예시 목적으로 임시 문자열 반환
-        return "ACCESS_TOKEN" 
\ No newline at end of file
+        return self.request_post(endpoint, params, api_id='kb10004')
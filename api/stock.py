@@ -10,12 +10,15 @@
 - 관리종목 조회
 - 종목별 공시정보 조회
 - 종목코드/명 검색
+- 여러 종목 동시 조회
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Iterator
 from urllib.parse import urljoin
 
+from kiwoom_api.bulk import BulkResult, fan_out
+
 from .base import APIBase
 
 
@@ -29,15 +32,16 @@ class StockAPI(APIBase):
     이 클래스는 국내 및 해외 주식의 종목 정보를 조회하는 메서드를 제공합니다.
     """
     
-    def __init__(self, base_url: str, headers: Dict[str, str]):
+    def __init__(self, base_url: str, headers: Dict[str, str], **kwargs):
         """
         StockAPI 클래스 초기화
         
         Args:
             base_url (str): API 기본 URL
             headers (Dict[str, str]): API 요청 헤더
+            **kwargs: APIBase 인자 (pool, hooks, transport)
         """
-        super().__init__(base_url, headers)
+        super().__init__(base_url, headers, **kwargs)
     
     def get_domestic_stock_info(self, stock_code: str) -> Dict[str, Any]:
         """
@@ -54,7 +58,7 @@ class StockAPI(APIBase):
             "stock_code": stock_code
         }
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10001')
     
     def get_overseas_stock_info(self, stock_code: str, exchange: str) -> Dict[str, Any]:
         """
@@ -73,7 +77,7 @@ class StockAPI(APIBase):
             "exchange": exchange
         }
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke20001')
     
     def get_suspended_stocks(self, market_code: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -91,7 +95,7 @@ class StockAPI(APIBase):
         if market_code:
             params["market_code"] = market_code
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10002')
     
     def get_managed_stocks(self, market_code: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -109,7 +113,7 @@ class StockAPI(APIBase):
         if market_code:
             params["market_code"] = market_code
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10003')
     
     def get_stock_disclosure(self, 
                            stock_code: Optional[str] = None, 
@@ -140,7 +144,7 @@ class StockAPI(APIBase):
         if disclosure_type:
             params["disclosure_type"] = disclosure_type
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10004')
     
     def search_stock(self, 
                     query: str, 
@@ -171,7 +175,7 @@ class StockAPI(APIBase):
         if is_elw is not None:
             params["is_elw"] = "Y" if is_elw else "N"
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10005')
     
     def search_overseas_stock(self, 
                             query: str, 
@@ -194,7 +198,7 @@ class StockAPI(APIBase):
         if exchange:
             params["exchange"] = exchange
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke20002')
     
     def get_stock_financial_info(self, 
                                stock_code: str, 
@@ -217,7 +221,7 @@ class StockAPI(APIBase):
         if info_type:
             params["info_type"] = info_type
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10006')
     
     def get_stock_investor_trend(self, 
                                stock_code: str, 
@@ -241,7 +245,7 @@ class StockAPI(APIBase):
             "end_date": end_date
         }
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10007')
     
     def get_market_stock_list(self, market_code: str) -> Dict[str, Any]:
         """
@@ -258,7 +262,7 @@ class StockAPI(APIBase):
             "market_code": market_code
         }
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10008')
     
     def get_industry_stock_list(self, industry_code: str) -> Dict[str, Any]:
         """
@@ -275,7 +279,7 @@ class StockAPI(APIBase):
             "industry_code": industry_code
         }
         
-        return self.request_get(endpoint, params)
+        return self.request_get(endpoint, params, api_id='ke10009')
     
     def get_stock_price_info(self, 
                           stock_code: str, 
@@ -298,4 +302,26 @@ class StockAPI(APIBase):
         if date:
             params["date"] = date
         
-        return self.request_get(endpoint, params) 
\ No newline at end of file
+        return self.request_get(endpoint, params, api_id='ke10010')
+    
+    def bulk(self, method: str, stock_codes: Iterable[str], max_workers: int = 8, **kwargs) -> Iterator[BulkResult]:
+        """
+        여러 종목 동시 조회 (종목코드 하나로 조회하는 get_domestic_stock_info 등)
+        
+        완료되는 순서대로 BulkResult(key, result, error) 를 반환합니다. 모든 요청은 Transport 의
+        호출 한도를 따르며, 종목별 오류는 해당 결과(status 'error')에 담깁니다.
+        
+            for item in api.stock.bulk('get_domestic_stock_info', ['005930', '000660']):
+                ...
+        
+        Args:
+            method (str): 조회 메서드 이름 (예: 'get_domestic_stock_info')
+            stock_codes (Iterable[str]): 종목코드 목록
+            max_workers (int, optional): 최대 동시 실행 수. 기본값은 8
+            **kwargs: 조회 메서드에 전달할 추가 인자
+            
+        Returns:
+            Iterator[BulkResult]: 조회 결과 이터레이터
+        """
+        func = getattr(self, method)
+        return fan_out(lambda stock_code: func(stock_code, **kwargs), stock_codes, max_workers)
@@ -30,15 +30,16 @@ class ThemeAPI(APIBase):
     - 종목별 테마 조회
     """
     
-    def __init__(self, base_url: str, headers: Dict[str, str]):
+    def __init__(self, base_url: str, headers: Dict[str, str], **kwargs):
         """
         ThemeAPI 클래스 초기화
         
         Args:
             base_url (str): API 기본 URL
             headers (Dict[str, str]): API 요청 헤더
+            **kwargs: APIBase 인자 (pool, hooks, transport)
         """
-        super().__init__(base_url, headers)
+        super().__init__(base_url, headers, **kwargs)
     
     def get_theme_list(self, 
                       query_type: str = '0', 
@@ -61,11 +62,6 @@ class ThemeAPI(APIBase):
         """
         endpoint = "/api/dostk/thme"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka90001',
-        })
-        
         params = {
             'qry_tp': query_type,
             'date_tp': date_type,
@@ -76,7 +72,7 @@ class ThemeAPI(APIBase):
         if theme_name:
             params['thema_nm'] = theme_name
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka90001')
     
     def get_theme_stocks(self, 
                         theme_group_code: str, 
@@ -95,18 +91,13 @@ class ThemeAPI(APIBase):
         """
         endpoint = "/api/dostk/thme"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka90002',
-        })
-        
         params = {
             'thema_grp_cd': theme_group_code,
             'date_tp': date_type,
             'stex_tp': exchange_type,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka90002')
     
     def get_stock_themes(self, 
                         stock_code: str, 
@@ -125,11 +116,6 @@ class ThemeAPI(APIBase):
         """
         endpoint = "/api/dostk/thme"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka90001',
-        })
-        
         params = {
             'qry_tp': '2',  # 종목검색
             'stk_cd': stock_code,
@@ -138,7 +124,7 @@ class ThemeAPI(APIBase):
             'stex_tp': exchange_type,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
+        return self.request_post(endpoint, params, api_id='ka90001')
     
     def search_themes(self, 
                      theme_name: str, 
@@ -157,11 +143,6 @@ class ThemeAPI(APIBase):
         """
         endpoint = "/api/dostk/thme"
         
-        headers = self._get_headers()
-        headers.update({
-            'api-id': 'ka90001',
-        })
-        
         params = {
             'qry_tp': '1',  # 테마검색
             'thema_nm': theme_name,
@@ -170,30 +151,4 @@ class ThemeAPI(APIBase):
             'stex_tp': exchange_type,
         }
         
-        return self.request_post(endpoint, headers=headers, json=params)
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        API 요청용 헤더 생성
-        
-        Returns:
-            Dict[str, str]: API 요청 헤더
-        """
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {self._get_access_token()}',
-            'cont-yn': 'N',
-            'next-key': '',
-        }
-        return headers
-        
-    def _get_access_token(self) -> str:
-        """
-        액세스 토큰 가져오기
-        
-        Returns:
-            str: 액세스 토큰
-        """
-        # 실제 구현에서는 토큰 관리 로직 추가
-        # 예시 목적으로 임시 문자열 반환
-        return "ACCESS_TOKEN" 
\ No newline at end of file
+        return self.request_post(endpoint, params, api_id='ka90001')
@@ -0,0 +1,11 @@
+"""
+키움증권 API 클라이언트 벤치마크
+
+로컬 모의 서버(kiwoom_api.mock.MockKiwoomServer)를 상대로 REST 요청, 연속조회,
+대량 동시 조회, 실시간시세 처리의 처리량과 p50/p99 지연 시간을 측정합니다.
+
+    python -m benchmarks                      # 전체 실행
+    python -m benchmarks rest pagination      # 일부만 실행
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --baseline baseline.json --tolerance 0.2   # 처리량이 20% 넘게 떨어지면 실패
+"""
@@ -0,0 +1,74 @@
+"""
+벤치마크 실행 (python -m benchmarks --help)
+"""
+
+import argparse
+import json
+import sys
+
+from .bench_import import bench_import
+from .bench_realtime import bench_realtime
+from .bench_rest import bench_fan_out, bench_pagination, bench_request
+from .common import compare, print_results
+
+BENCHMARKS = {
+    'rest': bench_request,
+    'pagination': bench_pagination,
+    'fanout': bench_fan_out,
+    'realtime': bench_realtime,
+    'import': bench_import,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='키움증권 API 클라이언트 벤치마크')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help=f"실행할 벤치마크 ({', '.join(BENCHMARKS)}. 기본값: 전체)")
+    parser.add_argument('--requests', type=int, default=500, help='REST 요청 수 (기본값: 500)')
+    parser.add_argument('--latency', type=float, default=0.0, help='모의 서버 응답 지연(초) (기본값: 0)')
+    parser.add_argument('--rows', type=int, default=20, help='응답 목록 행 수 (기본값: 20)')
+    parser.add_argument('--pages', type=int, default=5, help='연속조회 페이지 수 (기본값: 5)')
+    parser.add_argument('--prefetch', action='store_true', help='연속조회 다음 페이지 미리 요청')
+    parser.add_argument('--workers', type=int, default=8, help='대량 조회 동시 실행 수 (기본값: 8)')
+    parser.add_argument('--symbols', type=int, default=200, help='실시간 등록 종목 수 (기본값: 200)')
+    parser.add_argument('--tick-rate', type=float, default=5000.0, help='초당 실시간 프레임 수 (기본값: 5000)')
+    parser.add_argument('--tick-batch', type=int, default=1, help='프레임당 종목 수 (기본값: 1)')
+    parser.add_argument('--shards', type=int, default=1, help='실시간 연결 수 (2 이상이면 다중 연결 클라이언트) (기본값: 1)')
+    parser.add_argument('--duration', type=float, default=2.0, help='실시간 측정 시간(초) (기본값: 2)')
+    parser.add_argument('--import-module', default='kiwoom_api', help='import 시간을 잴 모듈 (기본값: kiwoom_api)')
+    parser.add_argument('--import-runs', type=int, default=10, help='import 측정 횟수 (기본값: 10)')
+    parser.add_argument('--import-budget', type=float, metavar='MS',
+                        help='import 시간 상한(ms). 중앙값이 넘거나 지연 import 대상이 로드되면 실패')
+    parser.add_argument('--save', metavar='FILE', help='결과를 JSON 으로 저장')
+    parser.add_argument('--baseline', metavar='FILE', help='기준 결과 JSON (--save 로 저장한 파일)')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 처리량 저하 비율 (기본값: 0.2)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+
+    results = [BENCHMARKS[name](args) for name in (args.names or BENCHMARKS)]
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({result.name: result.to_dict() for result in results}, f, ensure_ascii=False, indent=2)
+
+    failed = False
+    for result in results:
+        if result.extra.get('over_budget'):
+            print(f"import 예산 초과: {result.name} (상한 {result.extra['budget_ms']} ms, "
+                  f"즉시 로드된 모듈: {', '.join(result.extra['eager']) or '없음'})", file=sys.stderr)
+            failed = True
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f'성능 저하: {regression}', file=sys.stderr)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+import 시간 벤치마크 (새 인터프리터에서 패키지를 처음 import 하는 비용)
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from .common import Result, percentile
+
+# 패키지 import 만으로는 로드되면 안 되는 모듈 (사용할 때 지연 import)
+DEFERRED_MODULES = ('asyncio', 'aiohttp', 'websockets', 'pandas', 'numpy', 'sqlite3', 'http.server')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str) -> Tuple[float, Dict[str, int]]:
+    """
+    새 인터프리터에서 module 을 import 하는 데 걸린 시간
+
+    Args:
+        module (str): import 할 모듈 이름
+
+    Returns:
+        Tuple[float, Dict[str, int]]: (module 누적 import 시간(초), 로드된 모듈별 누적 시간(us))
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    loaded = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self, cumulative, name = line[len('import time:'):].split('|')
+        loaded[name.strip()] = int(cumulative)
+    return loaded[module] / 1e6, loaded
+
+
+def bench_import(args) -> Result:
+    """패키지 cold import 시간과 지연 import 대상 모듈의 로드 여부"""
+    latencies: List[float] = []
+    loaded: Dict[str, int] = {}
+    for _ in range(args.import_runs):
+        seconds, loaded = import_time(args.import_module)
+        latencies.append(seconds)
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    p50_ms = percentile(latencies, 0.5) * 1000
+    over_budget = args.import_budget is not None and (p50_ms > args.import_budget or bool(eager))
+    return Result(f'import.{args.import_module}', len(latencies), sum(latencies), latencies, unit='import',
+                  budget_ms=args.import_budget, eager=eager, over_budget=over_budget)
@@ -0,0 +1,64 @@
+"""
+실시간시세 벤치마크 (REAL 프레임 수신부터 콜백 호출까지)
+"""
+
+import asyncio
+import contextlib
+import time
+
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.mock import MockKiwoomServer
+from kiwoom_api.realtime import KiwoomRealtimeClient
+from kiwoom_api.shard import ShardedRealtimeClient
+
+from .common import Result
+
+# 한 번에 등록하는 종목 수
+REG_CHUNK = 100
+
+
+async def _run(server: MockKiwoomServer, args):
+    auth = KiwoomAuth('bench-appkey', 'bench-secretkey', host=server.url)
+    latencies = []
+
+    def on_tick(item):
+        latencies.append(time.perf_counter() - item['stamp'])
+
+    codes = [f'{i:06d}' for i in range(args.symbols)]
+    if args.shards > 1:
+        # 연결마다 모의 서버가 tick_rate 로 전송하므로 전체 처리량은 연결 수만큼 늘어남
+        client = ShardedRealtimeClient(shards=args.shards, auth=auth, auto_reconnect=False,
+                                       websocket_url=server.websocket_url)
+        client.add_callback('0B', on_tick)
+        await client.register_realtime(codes, ['0B'])
+        receiver = asyncio.ensure_future(client.run())
+    else:
+        client = KiwoomRealtimeClient(auth.ensure_token(), 'bench-appkey', 'bench-secretkey',
+                                      auto_reconnect=False, websocket_url=server.websocket_url)
+        client.add_callback('0B', on_tick)
+        await client.connect()
+        for start in range(0, len(codes), REG_CHUNK):
+            await client.register_realtime(codes[start:start + REG_CHUNK], ['0B'], refresh='1')
+        receiver = asyncio.ensure_future(client.receive_messages())
+
+    await asyncio.sleep(0.2)
+    latencies.clear()
+    started = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    elapsed = time.perf_counter() - started
+    count = len(latencies)
+    samples = list(latencies)
+    await client.disconnect()
+    receiver.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await receiver
+    return count, elapsed, samples
+
+
+def bench_realtime(args) -> Result:
+    """모의 서버가 보내는 0B 프레임의 콜백 처리량과 전송-콜백 지연 시간"""
+    with MockKiwoomServer(tick_rate=args.tick_rate, tick_batch=args.tick_batch, stamp=True) as server:
+        count, elapsed, latencies = asyncio.run(_run(server, args))
+    name = f'realtime.sharded{args.shards}' if args.shards > 1 else 'realtime.dispatch'
+    return Result(name, count, elapsed, latencies, unit='tick',
+                  symbols=args.symbols, tick_batch=args.tick_batch, shards=args.shards)
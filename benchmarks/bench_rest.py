@@ -0,0 +1,70 @@
+"""
+REST 벤치마크 (단건 요청, 연속조회, 대량 동시 조회)
+"""
+
+import time
+
+from kiwoom_api import KiwoomClient, ConnectionPool
+from kiwoom_api.mock import MockKiwoomServer
+
+from .common import Result, Stopwatch
+
+# 벤치마크에 사용하는 TR (주식일봉차트조회요청)
+API_ID = 'ka10081'
+ENDPOINT = '/api/dostk/chart'
+
+
+def _client(server: MockKiwoomServer, max_per_host: int = 32) -> KiwoomClient:
+    """모의 서버에 연결한 클라이언트 (호출 한도와 요청 병합 없이 전송 경로만 측정)"""
+    return KiwoomClient('bench-appkey', 'bench-secretkey', host=server.url, auto_refresh=False,
+                        rate_limiter=False, coalesce=False,
+                        pool=ConnectionPool(max_per_host=max_per_host))
+
+
+def _data(code: int) -> dict:
+    return {'stk_cd': f'{code:06d}', 'base_dt': '20240102', 'upd_stkpc_tp': '1'}
+
+
+def bench_request(args) -> Result:
+    """같은 TR 순차 요청"""
+    with MockKiwoomServer(latency=args.latency, rows=args.rows, websocket=False) as server:
+        with _client(server) as client:
+            client.request_api(API_ID, _data(0), endpoint=ENDPOINT)
+            watch = Stopwatch()
+            for i in range(args.requests):
+                watch.time(client.request_api, API_ID, _data(i), endpoint=ENDPOINT)
+            watch.stop()
+    return Result('rest.request', args.requests, watch.elapsed, watch.latencies, rows=args.rows)
+
+
+def bench_pagination(args) -> Result:
+    """연속조회 전체 페이지 수집 (페이지 단위 지연 시간)"""
+    with MockKiwoomServer(latency=args.latency, rows=args.rows, pages=args.pages, websocket=False) as server:
+        with _client(server) as client:
+            watch = Stopwatch()
+            pages = 0
+            for _ in range(max(1, args.requests // args.pages)):
+                last = time.perf_counter()
+                for _page in client.paginate(API_ID, _data(0), endpoint=ENDPOINT, prefetch=args.prefetch):
+                    now = time.perf_counter()
+                    watch.latencies.append(now - last)
+                    last = now
+                    pages += 1
+            watch.stop()
+    return Result('rest.pagination', pages, watch.elapsed, watch.latencies, unit='page', pages=args.pages)
+
+
+def bench_fan_out(args) -> Result:
+    """여러 종목 동시 조회 (fan_out)"""
+    with MockKiwoomServer(latency=args.latency, rows=args.rows, websocket=False) as server:
+        with _client(server, max_per_host=args.workers) as client:
+            client.request_api(API_ID, _data(0), endpoint=ENDPOINT)
+            watch = Stopwatch()
+
+            def fetch(code: str):
+                return watch.time(client.request_api, API_ID, _data(int(code)), endpoint=ENDPOINT)
+
+            failed = sum(1 for result in client.fan_out(fetch, [str(i) for i in range(args.requests)],
+                                                        max_workers=args.workers) if not result.ok)
+            watch.stop()
+    return Result('rest.fan_out', args.requests, watch.elapsed, watch.latencies, workers=args.workers, failed=failed)
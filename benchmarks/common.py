@@ -0,0 +1,118 @@
+"""
+벤치마크 공통 도구 (결과 집계, 출력, 기준값 비교)
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    분위수 (최근접 순위)
+
+    Args:
+        values (Sequence[float]): 측정값 목록
+        q (float): 0 ~ 1 사이 분위
+
+    Returns:
+        float: 분위수 (값이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+class Result:
+    """벤치마크 하나의 결과"""
+
+    def __init__(self, name: str, ops: int, seconds: float, latencies: Optional[List[float]] = None,
+                 unit: str = 'req', **extra: Any):
+        """
+        벤치마크 결과 초기화
+
+        Args:
+            name (str): 벤치마크 이름
+            ops (int): 처리한 작업 수
+            seconds (float): 전체 소요 시간(초)
+            latencies (List[float], optional): 작업별 지연 시간(초)
+            unit (str, optional): 작업 단위. 기본값은 'req'
+            **extra: 함께 기록할 값
+        """
+        self.name = name
+        self.ops = ops
+        self.seconds = seconds
+        self.latencies = latencies or []
+        self.unit = unit
+        self.extra = extra
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리량"""
+        return self.ops / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'ops': self.ops,
+            'seconds': round(self.seconds, 4),
+            'throughput': round(self.throughput, 1),
+            'unit': self.unit,
+            'p50_ms': round(percentile(self.latencies, 0.5) * 1000, 3),
+            'p99_ms': round(percentile(self.latencies, 0.99) * 1000, 3),
+            **self.extra,
+        }
+
+
+class Stopwatch:
+    """작업별 지연 시간 측정"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def time(self, func, *args, **kwargs):
+        """함수 실행 시간 기록 후 결과 반환"""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.latencies.append(time.perf_counter() - start)
+        return result
+
+    def stop(self) -> float:
+        self.elapsed = time.perf_counter() - self.started
+        return self.elapsed
+
+
+def print_results(results: List[Result]):
+    """결과 표 출력"""
+    print(f"{'benchmark':<28}{'ops':>8}{'sec':>9}{'throughput':>16}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for result in results:
+        row = result.to_dict()
+        throughput = f"{row['throughput']:.1f} {row['unit']}/s"
+        print(f"{row['name']:<28}{row['ops']:>8}{row['seconds']:>9.3f}{throughput:>16}"
+              f"{row['p50_ms']:>10.3f}{row['p99_ms']:>10.3f}")
+
+
+def compare(results: List[Result], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    기준값 대비 처리량 저하 확인
+
+    Args:
+        results (List[Result]): 이번 결과
+        baseline (Dict[str, Dict[str, Any]]): 벤치마크 이름별 기준 결과 (--save 로 저장한 파일)
+        tolerance (float): 허용 저하 비율 (0.2 이면 20%)
+
+    Returns:
+        List[str]: 허용 범위를 넘은 벤치마크 설명 (없으면 빈 목록)
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not base or not base.get('throughput'):
+            continue
+        ratio = result.throughput / base['throughput']
+        if ratio < 1.0 - tolerance:
+            regressions.append(f"{result.name}: {result.throughput:.1f} {result.unit}/s "
+                               f"(기준 {base['throughput']:.1f}, {(1 - ratio) * 100:.0f}% 저하)")
+    return regressions
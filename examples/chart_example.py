@@ -10,8 +10,6 @@
 import os
 import json
 from datetime import datetime, timedelta
-import pandas as pd
-from matplotlib import pyplot as plt
 
 # 프로젝트 루트 경로를 파이썬 경로에 추가
 import sys
@@ -45,6 +43,10 @@ def plot_chart_data(data, title="주가 차트"):
         print("시각화할 데이터가 없습니다.")
         return
     
+    # 시각화할 때만 pandas, matplotlib 을 불러옴
+    import pandas as pd
+    from matplotlib import pyplot as plt
+    
     chart_data = data['data']
     
     # 데이터프레임 생성
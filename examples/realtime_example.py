@@ -8,8 +8,12 @@
 import os
 import json
 import asyncio
+import logging
 from kiwoom_api import KiwoomClient
 
+# 연결, 로그인, 재연결 상태를 화면에 출력
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+
 # 환경변수에서 API 키 가져오기
 appkey = os.environ.get('kiwoom_appkey')
 secretkey = os.environ.get('kiwoom_secretkey')
@@ -10,8 +10,6 @@
 import os
 import json
 from datetime import datetime, timedelta
-import pandas as pd
-from tabulate import tabulate
 
 # 프로젝트 루트 경로를 파이썬 경로에 추가
 import sys
@@ -45,6 +43,10 @@ def print_table(data, title='데이터 테이블'):
         print(f"출력할 {title} 데이터가 없습니다.")
         return
     
+    # 표 출력이 필요할 때만 pandas, tabulate 를 불러옴
+    import pandas as pd
+    from tabulate import tabulate
+    
     # 데이터프레임 생성
     df = pd.DataFrame(data)
     
@@ -9,28 +9,30 @@
 
 import os
 import logging
+import importlib
 from typing import Dict, Any, Optional
 
 from .api.base import APIBase
-from .api.chart import ChartAPI
-from .api.stock import StockAPI
-from .api.ranking import RankingAPI
-from .api.etf import ETFAPI
-from .api.elw import ELWAPI
-from .api.sector import SectorAPI
-from .api.theme import ThemeAPI
-from .auth import KiwoomAuth
-from .api.condition import ConditionAPI
-from .api.foreigner import ForeignerAPI
-from .api.credit_order import CreditOrderAPI
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.transport import Transport
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-)
 logger = logging.getLogger(__name__)
 
+# API 모듈 속성 이름별 (모듈, 클래스). 처음 접근할 때 import 하고 생성합니다.
+API_MODULES = {
+    'stock': ('.api.stock', 'StockAPI'),
+    'chart': ('.api.chart', 'ChartAPI'),
+    'ranking': ('.api.ranking', 'RankingAPI'),
+    'etf': ('.api.etf', 'ETFAPI'),
+    'elw': ('.api.elw', 'ELWAPI'),
+    'sector': ('.api.sector', 'SectorAPI'),
+    'theme': ('.api.theme', 'ThemeAPI'),
+    'condition': ('.api.condition', 'ConditionAPI'),
+    'foreigner': ('.api.foreigner', 'ForeignerAPI'),
+    'credit_order': ('.api.credit_order', 'CreditOrderAPI'),
+}
+
 
 class KiwoomOpenAPI:
     """
@@ -47,7 +49,9 @@ class KiwoomOpenAPI:
     # API 기본 URL
     BASE_URL = "https://openapi.kiwoom.com"
     
-    def __init__(self, app_key: Optional[str] = None, app_secret: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(self, app_key: Optional[str] = None, app_secret: Optional[str] = None, base_url: Optional[str] = None,
+                 token_store: Optional[Any] = None, hooks: Optional[Any] = None, metrics: Optional[Any] = None,
+                 transport: Optional[Transport] = None):
         """
         KiwoomOpenAPI 클래스 초기화
         
@@ -55,6 +59,11 @@ class KiwoomOpenAPI:
             app_key (str, optional): 애플리케이션 키. 기본값은 환경 변수에서 가져옵니다.
             app_secret (str, optional): 애플리케이션 시크릿. 기본값은 환경 변수에서 가져옵니다.
             base_url (str, optional): API 기본 URL. 기본값은 BASE_URL입니다.
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소 (kiwoom_api.auth 참고)
+            hooks (RequestHooks, optional): 모든 API 모듈이 공유할 요청 훅 (kiwoom_api.hooks 참고)
+            metrics (MetricsCollector, optional): TR 별 요청 지표 수집기 (kiwoom_api.metrics 참고)
+            transport (Transport, optional): KiwoomClient 와 공유할 요청 전송 엔진 (kiwoom_api.transport 참고).
+                지정하면 token_store, hooks, metrics 대신 transport 의 인증, 연결 풀, 호출 한도, 훅, 지표를 사용
         """
         self.app_key = app_key or os.environ.get('kiwoom_appkey')
         self.app_secret = app_secret or os.environ.get('kiwoom_secretkey')
@@ -62,37 +71,53 @@ class KiwoomOpenAPI:
         if not self.app_key or not self.app_secret:
             raise ValueError("키움 API 키가 설정되지 않았습니다. 환경 변수 또는 생성자를 통해 키를 제공하세요.")
         
-        # 인증 모듈 초기화
-        self.auth = KiwoomAuth(self.app_key, self.app_secret)
-        
         # 헤더 초기화
         self.headers = {
             "content-type": "application/json",
             "authorization": "",  # 토큰 인증 후 설정
         }
         
-        # API 모듈 초기화
-        self._init_api_modules()
-        
-        self.condition = None
+        # 요청 전송 엔진 (모든 API 모듈이 인증, 연결 풀, 호출 한도, 훅을 공유)
+        if transport is None:
+            auth = KiwoomAuth(self.app_key, self.app_secret, token_store=token_store)
+            transport = Transport(auth, hooks=hooks, metrics=metrics)
+        self.transport = transport
+        self.auth = transport.auth
+        self.hooks = self.transport.hooks
+        self.metrics = self.transport.metrics
         
         if base_url:
             self.BASE_URL = base_url
+        
+        # API 모듈 초기화 (실제 생성은 처음 접근할 때)
+        self._init_api_modules()
     
     def _init_api_modules(self):
         """
         API 모듈들을 초기화합니다.
+        
+        이미 생성한 모듈을 버리고, 각 모듈은 처음 접근할 때 현재 설정으로 다시 생성합니다.
         """
-        # 필요한 API 모듈 초기화
-        self.stock = StockAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.ranking = RankingAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.etf = ETFAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.elw = ELWAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.sector = SectorAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.theme = ThemeAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.condition = ConditionAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.foreigner = ForeignerAPI(self.BASE_URL, self.app_key, self.app_secret)
-        self.credit_order = CreditOrderAPI(self.BASE_URL, self.app_key, self.app_secret)
+        for name in API_MODULES:
+            self.__dict__.pop(name, None)
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        API 모듈 지연 생성
+        
+        ranking 만 쓰는 작업이 나머지 모듈의 import 와 생성 비용을 치르지 않도록
+        처음 접근할 때 모듈을 import 하고 인스턴스를 만들어 속성으로 저장합니다.
+        """
+        if name not in API_MODULES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        module_name, class_name = API_MODULES[name]
+        api_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        if issubclass(api_class, APIBase):
+            module = api_class(self.BASE_URL, self.headers, transport=self.transport)
+        else:
+            module = api_class(self.BASE_URL, self.app_key, self.app_secret)
+        setattr(self, name, module)
+        return module
     
     def auth_login(self) -> Dict[str, Any]:
         """
@@ -102,9 +127,10 @@ class KiwoomOpenAPI:
             Dict[str, Any]: 인증 결과
         """
         try:
-            auth_result = self.auth.get_access_token()
-            if auth_result and auth_result.get('access_token'):
-                self.headers["authorization"] = f"Bearer {auth_result['access_token']}"
+            token = self.auth.ensure_token()
+            auth_result = {'access_token': token, 'expires_dt': self.auth.expires_dt}
+            if token:
+                self.headers["authorization"] = f"Bearer {token}"
                 logger.info("인증에 성공했습니다.")
                 return {"status": "success", "message": "인증에 성공했습니다.", "data": auth_result}
             else:
@@ -4,8 +4,89 @@
 키움증권 API를 쉽게 사용할 수 있도록 도와주는 오픈소스 패키지입니다.
 """
 
+import importlib
+
 from .client import KiwoomClient
-from .auth import get_access_token
+from .auth import get_access_token, TokenStore, FileTokenStore, RedisTokenStore
+from .pool import ConnectionPool, AsyncConnectionPool, get_default_pool, close_default_pool
+from .ratelimit import RateLimiter
+from .credentials import Credential, CredentialPool
+from .cache import ResponseCache
+from .codec import Codec, LazyJSON, get_codec, set_default_codec
+from .retry import RetryEngine, RetryPolicy, CircuitOpenError
+from .hooks import RequestEvent, RequestHooks
+from .metrics import MetricsCollector, MetricsServer
+from .transport import Transport
+
+# 처음 접근할 때 import 하는 이름 (asyncio, TR 스키마 등 무거운 모듈을 필요할 때만 로드)
+_LAZY_IMPORTS = {
+    "AsyncKiwoomClient": ".async_client",
+    "Row": ".rows",
+    "RecordBatch": ".rows",
+    "row_class": ".rows",
+    "parse_rows": ".rows",
+    "parse_record": ".rows",
+    "parse_batch": ".rows",
+    "ColumnarResult": ".columnar",
+    "ColumnarClient": ".columnar",
+    "to_columnar": ".columnar",
+    "SessionRecorder": ".replay",
+    "SessionReplay": ".replay",
+    "ReplayMissError": ".replay",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.1.0"
-__all__ = ["KiwoomClient", "get_access_token"] 
\ No newline at end of file
+__all__ = [
+    "KiwoomClient",
+    "Transport",
+    "AsyncKiwoomClient",
+    "get_access_token",
+    "TokenStore",
+    "FileTokenStore",
+    "RedisTokenStore",
+    "ConnectionPool",
+    "AsyncConnectionPool",
+    "get_default_pool",
+    "close_default_pool",
+    "RateLimiter",
+    "Credential",
+    "CredentialPool",
+    "ResponseCache",
+    "RetryEngine",
+    "RetryPolicy",
+    "CircuitOpenError",
+    "Codec",
+    "LazyJSON",
+    "get_codec",
+    "set_default_codec",
+    "Row",
+    "RecordBatch",
+    "row_class",
+    "parse_rows",
+    "parse_record",
+    "parse_batch",
+    "ColumnarResult",
+    "ColumnarClient",
+    "to_columnar",
+    "RequestEvent",
+    "RequestHooks",
+    "MetricsCollector",
+    "MetricsServer",
+    "SessionRecorder",
+    "SessionReplay",
+    "ReplayMissError",
+] 
\ No newline at end of file
@@ -1,278 +1,267 @@
 """
 키움증권 계좌 관련 API 모듈
+
+키움증권 REST API 는 접근토큰을 발급한 계좌를 조회하므로 cano, acnt_prdt_cd 인자는 요청에 사용하지 않으며,
+이전 버전과의 호환을 위해서만 남겨 둡니다.
 """
 
 from typing import Dict, Any, Optional, List
 
 from ..client import KiwoomClient
 
+# 이전 버전의 매매구분코드(sll_buy_dvsn_cd)를 위탁종합거래내역(kt00015) 구분(tp)으로 변환
+_TRANSACTION_TP = {
+    '00': '0',  # 전체
+    '01': '5',  # 매도
+    '02': '4',  # 매수
+}
+
 
 class AccountAPI:
     """키움증권 계좌 정보 API 클래스"""
-    
+
     def __init__(self, client: KiwoomClient):
         """
         계좌 API 초기화
-        
+
         Args:
             client (KiwoomClient): 키움증권 API 클라이언트 객체
         """
         self.client = client
-    
-    def get_account_balance(self, 
-                          cano: str, 
-                          acnt_prdt_cd: str, 
-                          inqr_dvsn_cd: str = '00', 
-                          bal_dvsn_cd: str = '01', 
-                          next_key: str = '') -> Dict[str, Any]:
+
+    def _request(self, api_id: str, data: Dict[str, Any], next_key: str = '') -> Dict[str, Any]:
+        """계좌 TR 요청 (next_key 가 있으면 연속조회)"""
+        return self.client.request_api(api_id, data, cont_yn='Y' if next_key else 'N', next_key=next_key)
+
+    def get_account_balance(self,
+                          cano: str = '',
+                          acnt_prdt_cd: str = '',
+                          inqr_dvsn_cd: str = '00',
+                          bal_dvsn_cd: str = '01',
+                          next_key: str = '',
+                          qry_tp: str = '1',
+                          dmst_stex_tp: str = 'KRX') -> Dict[str, Any]:
         """
-        계좌 잔고 조회 (domestic-stock-balance, etc_psbl_amt2)
-        
+        계좌평가잔고내역요청 (kt00018)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            inqr_dvsn_cd (str, optional): 조회구분코드. 기본값은 '00'
-                00: 전체, 01: 주식, 02: 채권 등
-            bal_dvsn_cd (str, optional): 잔고구분코드. 기본값은 '01'
-                01: 유가증권잔고, 02: 신용잔고 등
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+            inqr_dvsn_cd (str, optional): 사용하지 않음 (이전 버전 호환용)
+            bal_dvsn_cd (str, optional): 사용하지 않음 (이전 버전 호환용)
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            qry_tp (str, optional): 조회구분. 기본값은 '1'
+                1: 합산, 2: 개별
+            dmst_stex_tp (str, optional): 국내거래소구분 ('KRX', 'NXT'). 기본값은 'KRX'
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'inqr_dvsn_cd': inqr_dvsn_cd,
-            'bal_dvsn_cd': bal_dvsn_cd
+            'qry_tp': qry_tp,
+            'dmst_stex_tp': dmst_stex_tp
         }
-        return self.client.request_api('etc_psbl_amt2', data, next_key=next_key)
-    
-    def get_account_info(self, 
-                       cano: str, 
-                       acnt_prdt_cd: str, 
-                       acnt_inqr_dvsn_cd: str = '0') -> Dict[str, Any]:
+        return self._request('kt00018', data, next_key)
+
+    def get_account_info(self,
+                       cano: str = '',
+                       acnt_prdt_cd: str = '',
+                       acnt_inqr_dvsn_cd: str = '0',
+                       qry_tp: str = '0',
+                       dmst_stex_tp: str = 'KRX') -> Dict[str, Any]:
         """
-        계좌 상세정보 조회 (account-info, etc_crdt_bal)
-        
+        계좌평가현황요청 (kt00004)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            acnt_inqr_dvsn_cd (str, optional): 계좌조회구분코드. 기본값은 '0'
-                0: 전체, 1: 일반, 2: 신용 등
-            
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+            acnt_inqr_dvsn_cd (str, optional): 사용하지 않음 (이전 버전 호환용)
+            qry_tp (str, optional): 상장폐지조회구분. 기본값은 '0'
+                0: 전체, 1: 상장폐지종목제외
+            dmst_stex_tp (str, optional): 국내거래소구분 ('KRX', 'NXT'). 기본값은 'KRX'
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'acnt_inqr_dvsn_cd': acnt_inqr_dvsn_cd
+            'qry_tp': qry_tp,
+            'dmst_stex_tp': dmst_stex_tp
         }
-        return self.client.request_api('etc_crdt_bal', data)
-    
-    def get_deposit(self, 
-                  cano: str, 
-                  acnt_prdt_cd: str, 
-                  inqr_dvsn: str = '2', 
-                  next_key: str = '') -> Dict[str, Any]:
+        return self._request('kt00004', data)
+
+    def get_deposit(self,
+                  cano: str = '',
+                  acnt_prdt_cd: str = '',
+                  inqr_dvsn: str = '2',
+                  next_key: str = '',
+                  qry_tp: str = '3') -> Dict[str, Any]:
         """
-        계좌 예수금 조회 (deposit-detail, etc_cma_dt)
-        
+        예수금상세현황요청 (kt00001)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            inqr_dvsn (str, optional): 조회구분. 기본값은 '2'
-                1: 예수금총합, 2: 예수금상세
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+            inqr_dvsn (str, optional): 사용하지 않음 (이전 버전 호환용)
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            qry_tp (str, optional): 조회구분. 기본값은 '3'
+                3: 추정조회, 2: 일반조회
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'inqr_dvsn': inqr_dvsn
+            'qry_tp': qry_tp
         }
-        return self.client.request_api('etc_cma_dt', data, next_key=next_key)
-    
-    def get_account_profit_loss(self, 
-                              cano: str, 
-                              acnt_prdt_cd: str, 
-                              inqr_dvsn_cd: str = '00', 
-                              next_key: str = '') -> Dict[str, Any]:
+        return self._request('kt00001', data, next_key)
+
+    def get_account_profit_loss(self,
+                              cano: str = '',
+                              acnt_prdt_cd: str = '',
+                              inqr_dvsn_cd: str = '00',
+                              next_key: str = '',
+                              stex_tp: str = '0') -> Dict[str, Any]:
         """
-        계좌 손익현황 조회 (domestic-stock-profit-loss, etc_psbl_amt4)
-        
+        계좌수익률요청 (ka10085)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            inqr_dvsn_cd (str, optional): 조회구분코드. 기본값은 '00'
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+            inqr_dvsn_cd (str, optional): 사용하지 않음 (이전 버전 호환용)
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            stex_tp (str, optional): 거래소구분. 기본값은 '0'
+                0: 통합, 1: KRX, 2: NXT
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'inqr_dvsn_cd': inqr_dvsn_cd
+            'stex_tp': stex_tp
         }
-        return self.client.request_api('etc_psbl_amt4', data, next_key=next_key)
-    
-    def get_credit_info(self, 
-                      cano: str, 
-                      acnt_prdt_cd: str) -> Dict[str, Any]:
+        return self._request('ka10085', data, next_key)
+
+    def get_credit_info(self,
+                      cano: str = '',
+                      acnt_prdt_cd: str = '') -> Dict[str, Any]:
         """
-        계좌 신용정보 조회 (credit-info, etc_crdt_ord)
-        
+        증거금세부내역조회요청 (kt00013)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd
-        }
-        return self.client.request_api('etc_crdt_ord', data)
-    
-    def get_overseas_account_balance(self, 
-                                   cano: str, 
-                                   acnt_prdt_cd: str, 
-                                   ovrs_excg_cd: str, 
-                                   curr_cd: str, 
+        return self._request('kt00013', {})
+
+    def get_overseas_account_balance(self,
+                                   cano: str,
+                                   acnt_prdt_cd: str,
+                                   ovrs_excg_cd: str,
+                                   curr_cd: str,
                                    next_key: str = '') -> Dict[str, Any]:
         """
-        해외주식 계좌 잔고 조회 (overseas-stock-balance, otc_bal1)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            curr_cd (str): 통화코드
-            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 계좌 잔고 조회
+
+        키움증권 REST API 에는 해외주식 잔고 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
-            'curr_cd': curr_cd
-        }
-        return self.client.request_api('otc_bal1', data, next_key=next_key)
-    
-    def get_overseas_account_info(self, 
-                                cano: str, 
-                                acnt_prdt_cd: str, 
-                                ovrs_excg_cd: str, 
+        raise NotImplementedError('키움증권 REST API 는 해외주식 계좌 잔고 조회를 제공하지 않습니다.')
+
+    def get_overseas_account_info(self,
+                                cano: str,
+                                acnt_prdt_cd: str,
+                                ovrs_excg_cd: str,
                                 curr_cd: str) -> Dict[str, Any]:
         """
-        해외주식 계좌 상세정보 조회 (overseas-account-info, otc_bal2)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            curr_cd (str): 통화코드
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 계좌 상세정보 조회
+
+        키움증권 REST API 에는 해외주식 계좌 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
-            'curr_cd': curr_cd
-        }
-        return self.client.request_api('otc_bal2', data)
-    
-    def get_transaction_history(self, 
-                              cano: str, 
-                              acnt_prdt_cd: str, 
-                              inqr_strt_dt: str, 
-                              inqr_end_dt: str, 
-                              stk_cd: str = '', 
-                              sll_buy_dvsn_cd: str = '00', 
-                              inqr_dvsn: str = '00', 
-                              pdno: str = '', 
-                              ccld_dvsn: str = '00', 
-                              next_key: str = '') -> Dict[str, Any]:
+        raise NotImplementedError('키움증권 REST API 는 해외주식 계좌 상세정보 조회를 제공하지 않습니다.')
+
+    def get_transaction_history(self,
+                              cano: str,
+                              acnt_prdt_cd: str,
+                              inqr_strt_dt: str,
+                              inqr_end_dt: str,
+                              stk_cd: str = '',
+                              sll_buy_dvsn_cd: str = '00',
+                              inqr_dvsn: str = '00',
+                              pdno: str = '',
+                              ccld_dvsn: str = '00',
+                              next_key: str = '',
+                              dmst_stex_tp: str = '%') -> Dict[str, Any]:
         """
-        계좌 거래내역 조회 (account-transaction-history, etc_ctrct_qty)
-        
+        국내주식 위탁종합거래내역요청 (kt00015)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
             inqr_strt_dt (str): 조회시작일자 (YYYYMMDD)
             inqr_end_dt (str): 조회종료일자 (YYYYMMDD)
-            stk_cd (str, optional): 종목코드. 기본값은 빈 문자열
+            stk_cd (str, optional): 종목코드. 기본값은 빈 문자열 (전체 종목)
             sll_buy_dvsn_cd (str, optional): 매매구분코드. 기본값은 '00'
                 00: 전체, 01: 매도, 02: 매수
-            inqr_dvsn (str, optional): 조회구분. 기본값은 '00'
-                00: 전체, 01: 체결, 02: 미체결
-            pdno (str, optional): 상품번호. 기본값은 빈 문자열
-            ccld_dvsn (str, optional): 체결구분. 기본값은 '00'
-                00: 전체, 01: 매매, 02: 입출금 등
+            inqr_dvsn (str, optional): 사용하지 않음 (이전 버전 호환용)
+            pdno (str, optional): 상품번호. stk_cd 가 없을 때 종목코드로 사용. 기본값은 빈 문자열
+            ccld_dvsn (str, optional): 사용하지 않음 (이전 버전 호환용)
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            dmst_stex_tp (str, optional): 국내거래소구분 ('%': 전체, 'KRX', 'NXT'). 기본값은 '%'
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'inqr_strt_dt': inqr_strt_dt,
-            'inqr_end_dt': inqr_end_dt,
-            'sll_buy_dvsn_cd': sll_buy_dvsn_cd,
-            'inqr_dvsn': inqr_dvsn,
-            'ccld_dvsn': ccld_dvsn
+            'strt_dt': inqr_strt_dt,
+            'end_dt': inqr_end_dt,
+            'tp': _TRANSACTION_TP.get(sll_buy_dvsn_cd, '0'),
+            'stk_cd': stk_cd or pdno,
+            'crnc_cd': '',
+            'gds_tp': '1',
+            'frgn_stex_code': '',
+            'dmst_stex_tp': dmst_stex_tp
         }
-        
-        if stk_cd:
-            data['stk_cd'] = stk_cd
-            
-        if pdno:
-            data['pdno'] = pdno
-            
-        return self.client.request_api('etc_ctrct_qty', data, next_key=next_key)
-    
-    def get_overseas_transaction_history(self, 
-                                       cano: str, 
-                                       acnt_prdt_cd: str, 
-                                       ovrs_excg_cd: str, 
-                                       strt_dt: str, 
-                                       end_dt: str, 
-                                       stk_cd: str = '', 
-                                       next_key: str = '') -> Dict[str, Any]:
+        return self._request('kt00015', data, next_key)
+
+    def get_overseas_transaction_history(self,
+                                       cano: str,
+                                       acnt_prdt_cd: str,
+                                       ovrs_excg_cd: str,
+                                       strt_dt: str,
+                                       end_dt: str,
+                                       stk_cd: str = '',
+                                       next_key: str = '',
+                                       crnc_cd: str = '') -> Dict[str, Any]:
         """
-        해외주식 계좌 거래내역 조회 (overseas-account-transaction-history, otc_ctrct_eng)
-        
+        해외주식 위탁종합거래내역요청 (kt00015, 상품구분 해외주식)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
             ovrs_excg_cd (str): 해외거래소코드
             strt_dt (str): 시작일자 (YYYYMMDD)
             end_dt (str): 종료일자 (YYYYMMDD)
             stk_cd (str, optional): 종목코드. 기본값은 빈 문자열
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            crnc_cd (str, optional): 통화코드. 기본값은 빈 문자열 (전체)
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
             'strt_dt': strt_dt,
-            'end_dt': end_dt
+            'end_dt': end_dt,
+            'tp': '0',
+            'stk_cd': stk_cd,
+            'crnc_cd': crnc_cd,
+            'gds_tp': '3',
+            'frgn_stex_code': ovrs_excg_cd,
+            'dmst_stex_tp': '%'
         }
-        
-        if stk_cd:
-            data['stk_cd'] = stk_cd
-            
-        return self.client.request_api('otc_ctrct_eng', data, next_key=next_key) 
\ No newline at end of file
+        return self._request('kt00015', data, next_key)
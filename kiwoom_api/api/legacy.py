@@ -0,0 +1,61 @@
+"""
+이전 버전 API 호환 도우미
+
+TR 명세에 맞춰 바뀐 메서드와 인자를 이전 이름으로도 호출할 수 있도록 DeprecationWarning 과 함께 변환합니다.
+"""
+
+import warnings
+from typing import Dict, Any, Optional, Callable
+
+
+def deprecated(name: str, replacement: str):
+    """
+    이전 버전 메서드 사용 경고
+
+    Args:
+        name (str): 메서드 이름 (예: 'ChartAPI.get_domestic_chart')
+        replacement (str): 대신 사용할 메서드나 TR
+    """
+    warnings.warn(f'{name} 는 사용 중단 예정입니다. {replacement} 를 사용하세요.', DeprecationWarning, stacklevel=3)
+
+
+def legacy_args(name: str,
+                legacy: Dict[str, Any],
+                renames: Dict[str, Optional[str]],
+                converters: Optional[Dict[str, Callable[[Any], Any]]] = None) -> Dict[str, Any]:
+    """
+    이전 버전 인자를 새 인자로 변환
+
+    Args:
+        name (str): 메서드 이름 (예: 'ChartAPI.get_domestic_stock_daily')
+        legacy (Dict[str, Any]): 이전 버전 인자
+        renames (Dict[str, Optional[str]]): 이전 인자 이름별 새 인자 이름 (None 이면 대응하는 요청 필드가 없어 무시)
+        converters (Dict[str, Callable], optional): 이전 인자 이름별 값 변환 함수. 기본값은 None
+
+    Returns:
+        Dict[str, Any]: 새 인자 이름별 값
+
+    Raises:
+        TypeError: 알 수 없는 인자가 있는 경우
+    """
+    unknown = sorted(set(legacy) - set(renames))
+    if unknown:
+        raise TypeError(f"{name}() got unexpected keyword arguments: {', '.join(unknown)}")
+    if legacy:
+        warnings.warn(f"{name} 의 {', '.join(sorted(legacy))} 인자는 사용 중단 예정입니다.", DeprecationWarning,
+                      stacklevel=3)
+
+    converters = converters or {}
+    converted = {}
+    for key, value in legacy.items():
+        target = renames[key]
+        if target is None or value is None:
+            continue
+        convert = converters.get(key)
+        converted[target] = convert(value) if convert is not None else value
+    return converted
+
+
+def cont_yn(next_key: str) -> str:
+    """연속조회키가 있으면 연속조회('Y')"""
+    return 'Y' if next_key else 'N'
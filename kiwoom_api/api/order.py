@@ -1,24 +1,41 @@
 """
 키움증권 주문 관련 API 모듈
+
+키움증권 REST API 는 접근토큰을 발급한 계좌로 주문하므로 cano, acnt_prdt_cd 인자는 요청에 사용하지 않으며,
+이전 버전과의 호환을 위해서만 남겨 둡니다.
 """
 
 from typing import Dict, Any, Optional, List
 
 from ..client import KiwoomClient
 
+# 이전 버전의 주문구분코드(ord_dvsn)를 REST API 매매구분(trde_tp)으로 변환 (그 밖의 값은 trde_tp 로 그대로 사용)
+_TRDE_TP = {
+    '00': '0',  # 지정가 → 보통
+    '01': '3',  # 시장가
+    '02': '5',  # 조건부지정가
+}
+
+# 이전 버전의 조회구분코드(inqr_dvsn)를 매도수구분(sell_tp)으로 변환
+_SELL_TP = {
+    '00': '0',  # 전체
+    '01': '1',  # 매도
+    '02': '2',  # 매수
+}
+
 
 class OrderAPI:
     """키움증권 주문 API 클래스"""
-    
+
     def __init__(self, client: KiwoomClient):
         """
         주문 API 초기화
-        
+
         Args:
             client (KiwoomClient): 키움증권 API 클라이언트 객체
         """
         self.client = client
-    
+
     def place_domestic_order(self,
                            cano: str,
                            acnt_prdt_cd: str,
@@ -28,47 +45,60 @@ class OrderAPI:
                            ord_unpr: str,
                            loan_dvsn: str = None,
                            loan_dt: str = None,
-                           ord_mkis_mkt_name: str = None) -> Dict[str, Any]:
+                           ord_mkis_mkt_name: str = None,
+                           sell_tp: str = None,
+                           dmst_stex_tp: str = 'KRX',
+                           cond_uv: str = '') -> Dict[str, Any]:
         """
-        국내주식 주문 (domestic-stock-order, etc_ord)
-        
+        국내주식 매수/매도주문 (kt10000, kt10001), 신용 매수/매도주문 (kt10006, kt10007)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
             stk_cd (str): 종목코드
-            ord_dvsn (str): 주문구분코드
-                00: 지정가, 01: 시장가, 02: 조건부지정가, ...
+            ord_dvsn (str): 매매구분 (REST API 의 trde_tp)
+                0: 보통, 3: 시장가, 5: 조건부지정가, 6: 최유리지정가, ...
+                이전 버전의 00: 지정가, 01: 시장가, 02: 조건부지정가 도 사용 가능
             ord_qty (str): 주문수량
-            ord_unpr (str): 주문단가
-            loan_dvsn (str, optional): 신용구분
-                00: 현금, 01: 융자, 02: 대주, ...
-            loan_dt (str, optional): 대출일자 (YYYYMMDD)
-            ord_mkis_mkt_name (str, optional): 주문시장조건구분코드명
-                (장, 시간외단일가, 시간외종가, ...)
-            
+            ord_unpr (str): 주문단가 (시장가는 빈 문자열)
+            loan_dvsn (str, optional): 신용구분. '00' 이나 None 이 아니면 신용주문
+                01: 융자
+            loan_dt (str, optional): 대출일자 (YYYYMMDD, 신용 매도시 융자 상환할 대출일)
+            ord_mkis_mkt_name (str, optional): 사용하지 않음 (이전 버전 호환용)
+            sell_tp (str): 매도수구분 (필수)
+                1: 매도, 2: 매수
+            dmst_stex_tp (str, optional): 국내거래소구분 ('KRX', 'NXT', 'SOR'). 기본값은 'KRX'
+            cond_uv (str, optional): 조건단가 (스톱지정가 등). 기본값은 빈 문자열
+
         Returns:
             Dict[str, Any]: API 응답 데이터
+
+        Raises:
+            ValueError: sell_tp 가 '1' 또는 '2' 가 아닌 경우
         """
+        if sell_tp not in ('1', '2'):
+            raise ValueError("sell_tp 는 '1'(매도) 또는 '2'(매수) 이어야 합니다.")
+
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
+            'dmst_stex_tp': dmst_stex_tp,
             'stk_cd': stk_cd,
-            'ord_dvsn': ord_dvsn,
             'ord_qty': ord_qty,
-            'ord_unpr': ord_unpr
+            'ord_uv': ord_unpr,
+            'trde_tp': _TRDE_TP.get(ord_dvsn, ord_dvsn),
+            'cond_uv': cond_uv
         }
-        
-        if loan_dvsn:
-            data['loan_dvsn'] = loan_dvsn
-        
-        if loan_dt:
-            data['loan_dt'] = loan_dt
-            
-        if ord_mkis_mkt_name:
-            data['ord_mkis_mkt_name'] = ord_mkis_mkt_name
-            
-        return self.client.request_api('etc_ord', data)
-    
+
+        if loan_dvsn in (None, '', '00'):
+            api_id = 'kt10001' if sell_tp == '1' else 'kt10000'
+        elif sell_tp == '2':
+            api_id = 'kt10006'
+        else:
+            api_id = 'kt10007'
+            data['crd_deal_tp'] = '33' if loan_dt else '99'
+            data['crd_loan_dt'] = loan_dt or ''
+
+        return self.client.request_api(api_id, data)
+
     def place_overseas_order(self,
                            cano: str,
                            acnt_prdt_cd: str,
@@ -81,78 +111,46 @@ class OrderAPI:
                            ord_gnd_cndt_cd: str = None,
                            prd_prc_rule_cd: str = None) -> Dict[str, Any]:
         """
-        해외주식 주문 (overseas-stock-order, otc_ord)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            stk_cd (str): 종목코드
-            ord_dvsn (str): 주문구분코드
-                00: 지정가, 01: 시장가, ...
-            ord_qty (str): 주문수량
-            ord_unpr (str): 주문단가
-            curr_cd (str): 통화코드
-            ord_gnd_cndt_cd (str, optional): 주문체결조건코드
-            prd_prc_rule_cd (str, optional): 상품가격규칙코드
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 주문
+
+        키움증권 REST API 에는 해외주식 주문 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
-            'stk_cd': stk_cd,
-            'ord_dvsn': ord_dvsn,
-            'ord_qty': ord_qty,
-            'ord_unpr': ord_unpr,
-            'curr_cd': curr_cd
-        }
-        
-        if ord_gnd_cndt_cd:
-            data['ord_gnd_cndt_cd'] = ord_gnd_cndt_cd
-            
-        if prd_prc_rule_cd:
-            data['prd_prc_rule_cd'] = prd_prc_rule_cd
-            
-        return self.client.request_api('otc_ord', data)
-    
+        raise NotImplementedError('키움증권 REST API 는 해외주식 주문을 제공하지 않습니다.')
+
     def cancel_domestic_order(self,
                             cano: str,
                             acnt_prdt_cd: str,
                             stk_cd: str,
                             orgn_odno: str,
                             ord_qty: str,
-                            ord_mkis_mkt_name: str = None) -> Dict[str, Any]:
+                            ord_mkis_mkt_name: str = None,
+                            dmst_stex_tp: str = 'KRX') -> Dict[str, Any]:
         """
-        국내주식 주문 취소 (domestic-stock-order-cancel, etc_cncl)
-        
+        국내주식 취소주문 (kt10003)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
             stk_cd (str): 종목코드
             orgn_odno (str): 원주문번호
-            ord_qty (str): 주문수량
-            ord_mkis_mkt_name (str, optional): 주문시장조건구분코드명
-                (장, 시간외단일가, 시간외종가, ...)
-            
+            ord_qty (str): 취소수량 ('0' 이면 잔량 전부 취소)
+            ord_mkis_mkt_name (str, optional): 사용하지 않음 (이전 버전 호환용)
+            dmst_stex_tp (str, optional): 국내거래소구분 ('KRX', 'NXT', 'SOR'). 기본값은 'KRX'
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
+            'dmst_stex_tp': dmst_stex_tp,
+            'orig_ord_no': orgn_odno,
             'stk_cd': stk_cd,
-            'orgn_odno': orgn_odno,
-            'ord_qty': ord_qty
+            'cncl_qty': ord_qty
         }
-        
-        if ord_mkis_mkt_name:
-            data['ord_mkis_mkt_name'] = ord_mkis_mkt_name
-            
-        return self.client.request_api('etc_cncl', data)
-    
+        return self.client.request_api('kt10003', data)
+
     def modify_domestic_order(self,
                             cano: str,
                             acnt_prdt_cd: str,
@@ -161,40 +159,37 @@ class OrderAPI:
                             ord_qty: str,
                             ord_unpr: str,
                             ord_dvsn: str,
-                            ord_mkis_mkt_name: str = None) -> Dict[str, Any]:
+                            ord_mkis_mkt_name: str = None,
+                            dmst_stex_tp: str = 'KRX',
+                            mdfy_cond_uv: str = '') -> Dict[str, Any]:
         """
-        국내주식 주문 정정 (domestic-stock-order-revision, etc_mdfy)
-        
+        국내주식 정정주문 (kt10002)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
             stk_cd (str): 종목코드
             orgn_odno (str): 원주문번호
-            ord_qty (str): 주문수량
-            ord_unpr (str): 주문단가
-            ord_dvsn (str): 주문구분코드
-                00: 지정가, 01: 시장가, 02: 조건부지정가, ...
-            ord_mkis_mkt_name (str, optional): 주문시장조건구분코드명
-                (장, 시간외단일가, 시간외종가, ...)
-            
+            ord_qty (str): 정정수량
+            ord_unpr (str): 정정단가
+            ord_dvsn (str): 사용하지 않음 (정정주문은 원주문의 매매구분을 따름)
+            ord_mkis_mkt_name (str, optional): 사용하지 않음 (이전 버전 호환용)
+            dmst_stex_tp (str, optional): 국내거래소구분 ('KRX', 'NXT', 'SOR'). 기본값은 'KRX'
+            mdfy_cond_uv (str, optional): 정정조건단가. 기본값은 빈 문자열
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
+            'dmst_stex_tp': dmst_stex_tp,
+            'orig_ord_no': orgn_odno,
             'stk_cd': stk_cd,
-            'orgn_odno': orgn_odno,
-            'ord_qty': ord_qty,
-            'ord_unpr': ord_unpr,
-            'ord_dvsn': ord_dvsn
+            'mdfy_qty': ord_qty,
+            'mdfy_uv': ord_unpr,
+            'mdfy_cond_uv': mdfy_cond_uv
         }
-        
-        if ord_mkis_mkt_name:
-            data['ord_mkis_mkt_name'] = ord_mkis_mkt_name
-            
-        return self.client.request_api('etc_mdfy', data)
-    
+        return self.client.request_api('kt10002', data)
+
     def cancel_overseas_order(self,
                             cano: str,
                             acnt_prdt_cd: str,
@@ -205,36 +200,15 @@ class OrderAPI:
                             curr_cd: str,
                             ord_dvsn: str = None) -> Dict[str, Any]:
         """
-        해외주식 주문 취소 (overseas-stock-order-cancel, otc_cncl)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            stk_cd (str): 종목코드
-            orgn_odno (str): 원주문번호
-            ord_qty (str): 주문수량
-            curr_cd (str): 통화코드
-            ord_dvsn (str, optional): 주문구분코드
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 주문 취소
+
+        키움증권 REST API 에는 해외주식 주문 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
-            'stk_cd': stk_cd,
-            'orgn_odno': orgn_odno,
-            'ord_qty': ord_qty,
-            'curr_cd': curr_cd
-        }
-        
-        if ord_dvsn:
-            data['ord_dvsn'] = ord_dvsn
-            
-        return self.client.request_api('otc_cncl', data)
-    
+        raise NotImplementedError('키움증권 REST API 는 해외주식 주문 취소를 제공하지 않습니다.')
+
     def modify_overseas_order(self,
                             cano: str,
                             acnt_prdt_cd: str,
@@ -246,69 +220,53 @@ class OrderAPI:
                             curr_cd: str,
                             ord_dvsn: str = None) -> Dict[str, Any]:
         """
-        해외주식 주문 정정 (overseas-stock-order-revision, otc_mdfy)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            stk_cd (str): 종목코드
-            orgn_odno (str): 원주문번호
-            ord_qty (str): 주문수량
-            ord_unpr (str): 주문단가
-            curr_cd (str): 통화코드
-            ord_dvsn (str, optional): 주문구분코드
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 주문 정정
+
+        키움증권 REST API 에는 해외주식 주문 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd,
-            'stk_cd': stk_cd,
-            'orgn_odno': orgn_odno,
-            'ord_qty': ord_qty,
-            'ord_unpr': ord_unpr,
-            'curr_cd': curr_cd
-        }
-        
-        if ord_dvsn:
-            data['ord_dvsn'] = ord_dvsn
-            
-        return self.client.request_api('otc_mdfy', data)
-    
+        raise NotImplementedError('키움증권 REST API 는 해외주식 주문 정정을 제공하지 않습니다.')
+
     def get_order_status(self,
-                       cano: str,
-                       acnt_prdt_cd: str,
+                       cano: str = '',
+                       acnt_prdt_cd: str = '',
                        inqr_dvsn: str = '00',
                        stk_cd: str = '',
-                       next_key: str = '') -> Dict[str, Any]:
+                       next_key: str = '',
+                       ord_dt: str = '',
+                       qry_tp: str = '1',
+                       dmst_stex_tp: str = '%') -> Dict[str, Any]:
         """
-        주문내역 조회 (domestic-stock-order-status, etc_psbl_amt3)
-        
+        계좌별주문체결내역상세요청 (kt00007)
+
         Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            inqr_dvsn (str, optional): 조회구분코드. 기본값은 '00'
+            cano (str): 계좌번호 (사용하지 않음)
+            acnt_prdt_cd (str): 계좌상품코드 (사용하지 않음)
+            inqr_dvsn (str, optional): 매도수구분. 기본값은 '00'
                 00: 전체, 01: 매도, 02: 매수
-            stk_cd (str, optional): 종목코드. 기본값은 빈 문자열
+            stk_cd (str, optional): 종목코드. 기본값은 빈 문자열 (전체 종목)
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            ord_dt (str, optional): 주문일자 (YYYYMMDD). 기본값은 빈 문자열 (당일)
+            qry_tp (str, optional): 조회구분. 기본값은 '1'
+                1: 주문순, 2: 역순, 3: 미체결, 4: 체결내역만
+            dmst_stex_tp (str, optional): 국내거래소구분 ('%': 전체, 'KRX', 'NXT', 'SOR'). 기본값은 '%'
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'inqr_dvsn': inqr_dvsn
+            'ord_dt': ord_dt,
+            'qry_tp': qry_tp,
+            'stk_bond_tp': '1',
+            'sell_tp': _SELL_TP.get(inqr_dvsn, inqr_dvsn),
+            'stk_cd': stk_cd,
+            'fr_ord_no': '',
+            'dmst_stex_tp': dmst_stex_tp
         }
-        
-        if stk_cd:
-            data['stk_cd'] = stk_cd
-            
-        return self.client.request_api('etc_psbl_amt3', data, next_key=next_key)
-    
+        return self.client.request_api('kt00007', data, cont_yn='Y' if next_key else 'N', next_key=next_key)
+
     def get_overseas_order_status(self,
                                 cano: str,
                                 acnt_prdt_cd: str,
@@ -318,33 +276,11 @@ class OrderAPI:
                                 ord_brnc_cd: str = '',
                                 next_key: str = '') -> Dict[str, Any]:
         """
-        해외주식 주문내역 조회 (overseas-stock-order-status, otc_crct)
-        
-        Args:
-            cano (str): 계좌번호
-            acnt_prdt_cd (str): 계좌상품코드
-            ovrs_excg_cd (str): 해외거래소코드
-            curr_cd (str, optional): 통화코드. 기본값은 빈 문자열
-            stk_cd (str, optional): 종목코드. 기본값은 빈 문자열
-            ord_brnc_cd (str, optional): 주문지점코드. 기본값은 빈 문자열
-            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
+        해외주식 주문내역 조회
+
+        키움증권 REST API 에는 해외주식 주문내역 TR 이 없습니다.
+
+        Raises:
+            NotImplementedError: 항상
         """
-        data = {
-            'cano': cano,
-            'acnt_prdt_cd': acnt_prdt_cd,
-            'ovrs_excg_cd': ovrs_excg_cd
-        }
-        
-        if curr_cd:
-            data['curr_cd'] = curr_cd
-            
-        if stk_cd:
-            data['stk_cd'] = stk_cd
-            
-        if ord_brnc_cd:
-            data['ord_brnc_cd'] = ord_brnc_cd
-            
-        return self.client.request_api('otc_crct', data, next_key=next_key) 
\ No newline at end of file
+        raise NotImplementedError('키움증권 REST API 는 해외주식 주문내역 조회를 제공하지 않습니다.')
@@ -2,10 +2,18 @@
 키움증권 시세 API 모듈
 """
 
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable
 
 from ..client import KiwoomClient
 
+# 조회구분별 차트 TR (일봉, 주봉, 월봉)
+_PERIOD_TRS = {
+    'D': 'ka10081',
+    'W': 'ka10082',
+    'M': 'ka10083',
+}
+
 
 class PriceAPI:
     """키움증권 시세 API 클래스"""
@@ -21,7 +29,7 @@ class PriceAPI:
     
     def get_current_price(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        현재가 조회 (ks10001)
+        현재가 조회 (주식기본정보요청 ka10001)
         
         Args:
             stk_cd (str): 종목코드
@@ -34,11 +42,11 @@ class PriceAPI:
         data = {
             'stk_cd': stk_cd
         }
-        return self.client.request_api('ks10001', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10001', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_askbid_price(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        호가 조회 (ks10002)
+        호가 조회 (주식호가요청 ka10004)
         
         Args:
             stk_cd (str): 종목코드
@@ -51,11 +59,11 @@ class PriceAPI:
         data = {
             'stk_cd': stk_cd
         }
-        return self.client.request_api('ks10002', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10004', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_investor_breakdown(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        투자자별 매매동향 (ks10003)
+        투자자별 매매동향 (종목별투자자기관별요청 ka10059, 당일 기준 금액/순매수/천주 단위)
         
         Args:
             stk_cd (str): 종목코드
@@ -66,9 +74,13 @@ class PriceAPI:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'stk_cd': stk_cd
+            'dt': datetime.now().strftime('%Y%m%d'),
+            'stk_cd': stk_cd,
+            'amt_qty_tp': '1',
+            'trde_tp': '0',
+            'unit_tp': '1000'
         }
-        return self.client.request_api('ks10003', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10059', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_daily_price(self, 
                       stk_cd: str, 
@@ -76,7 +88,7 @@ class PriceAPI:
                       cont_yn: str = 'N', 
                       next_key: str = '') -> Dict[str, Any]:
         """
-        일별 시세 (ks10004)
+        일/주/월봉 시세 (주식일봉/주봉/월봉차트조회요청 ka10081, ka10082, ka10083, 당일 기준 수정주가)
         
         Args:
             stk_cd (str): 종목코드
@@ -87,12 +99,19 @@ class PriceAPI:
             
         Returns:
             Dict[str, Any]: API 응답 데이터
+
+        Raises:
+            ValueError: 지원하지 않는 조회구분인 경우
         """
+        api_id = _PERIOD_TRS.get(inquiry_type)
+        if api_id is None:
+            raise ValueError(f'지원하지 않는 조회구분입니다: {inquiry_type}')
         data = {
             'stk_cd': stk_cd,
-            'inquiry_tp': inquiry_type
+            'base_dt': datetime.now().strftime('%Y%m%d'),
+            'upd_stkpc_tp': '1'
         }
-        return self.client.request_api('ks10004', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api(api_id, data, cont_yn=cont_yn, next_key=next_key)
     
     def get_minute_price(self, 
                        stk_cd: str, 
@@ -100,7 +119,7 @@ class PriceAPI:
                        cont_yn: str = 'N', 
                        next_key: str = '') -> Dict[str, Any]:
         """
-        분봉 시세 (ks10005)
+        분봉 시세 (주식분봉차트조회요청 ka10080, 수정주가)
         
         Args:
             stk_cd (str): 종목코드
@@ -114,13 +133,14 @@ class PriceAPI:
         """
         data = {
             'stk_cd': stk_cd,
-            'inquiry_tp': inquiry_type
+            'tic_scope': inquiry_type,
+            'upd_stkpc_tp': '1'
         }
-        return self.client.request_api('ks10005', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10080', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_tick_price(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        틱 시세 (ks10006)
+        틱 시세 (체결정보요청 ka10003)
         
         Args:
             stk_cd (str): 종목코드
@@ -133,11 +153,11 @@ class PriceAPI:
         data = {
             'stk_cd': stk_cd
         }
-        return self.client.request_api('ks10006', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10003', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_time_price(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        시간대별시세 (ks10007)
+        시간대별시세 (주식시분요청 ka10006)
         
         Args:
             stk_cd (str): 종목코드
@@ -150,11 +170,11 @@ class PriceAPI:
         data = {
             'stk_cd': stk_cd
         }
-        return self.client.request_api('ks10007', data, cont_yn=cont_yn, next_key=next_key)
+        return self.client.request_api('ka10006', data, cont_yn=cont_yn, next_key=next_key)
     
     def get_trade_history(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        거래내역 (ks10015)
+        거래내역 (당일전일체결요청 ka10084, 당일 틱)
         
         Args:
             stk_cd (str): 종목코드
@@ -165,6 +185,32 @@ class PriceAPI:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'stk_cd': stk_cd
+            'stk_cd': stk_cd,
+            'tdy_pred': '1',
+            'tic_min': '0',
+            'tm': ''
         }
-        return self.client.request_api('ks10015', data, cont_yn=cont_yn, next_key=next_key) 
\ No newline at end of file
+        return self.client.request_api('ka10084', data, cont_yn=cont_yn, next_key=next_key)
+    
+    def bulk(self, method: str, stk_cds: Iterable[str], max_workers: int = None, **kwargs):
+        """
+        여러 종목 동시 조회
+        
+        완료되는 순서대로 BulkResult(key, result, error) 를 반환하며, 종목별 오류는 해당 결과의 error 에 담깁니다.
+        AsyncKiwoomClient 에서는 비동기 이터레이터를 반환합니다.
+        
+            for item in client.price.bulk('get_current_price', ['005930', '000660']):
+                ...
+        
+        Args:
+            method (str): 조회 메서드 이름 (예: 'get_current_price')
+            stk_cds (Iterable[str]): 종목코드 목록
+            max_workers (int, optional): 최대 동시 실행 수. 기본값은 클라이언트 기본값
+            **kwargs: 조회 메서드에 전달할 추가 인자
+            
+        Returns:
+            Iterator[BulkResult]: 조회 결과 이터레이터
+        """
+        func = getattr(self, method)
+        options = {'max_workers': max_workers} if max_workers else {}
+        return self.client.fan_out(lambda stk_cd: func(stk_cd, **kwargs), stk_cds, **options)
@@ -2,338 +2,213 @@
 키움증권 종목정보 관련 API 모듈
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Iterable
 
 from ..client import KiwoomClient
+from .legacy import deprecated, legacy_args
+
+# 이전 버전 인자 → 새 인자 (None 이면 대응하는 요청 필드가 없어 무시)
+_STOCK_LIST_ARGS = {
+    'inq_cnd_dvsn_cd': None,
+    'inq_cnd_dvsn_val': None,
+}
+
+_INVESTOR_TREND_ARGS = {
+    'inq_strt_dt': None,
+    'inq_end_dt': 'dt',
+    'stk_mkt_cd': None,
+}
 
 
 class StockAPI:
-    """키움증권 종목정보 API 클래스"""
-    
+    """키움증권 종목정보 API 클래스
+
+    이전 버전의 메서드와 인자도 DeprecationWarning 과 함께 대응하는 TR 로 처리하며,
+    대응하는 TR 이 없는 메서드는 NotImplementedError 를 발생시킵니다.
+    """
+
     def __init__(self, client: KiwoomClient):
         """
         종목정보 API 초기화
-        
+
         Args:
             client (KiwoomClient): 키움증권 API 클라이언트 객체
         """
         self.client = client
-    
-    def get_stock_basic_info(self,
-                           stk_cd: str) -> Dict[str, Any]:
+
+    def get_stock_basic_info(self, stk_cd: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        종목 기본정보 조회 (stock-basic-info, etc_issue)
-        
+        주식기본정보요청 (ka10001)
+
         Args:
-            stk_cd (str): 종목 코드
-            
+            stk_cd (str): 종목코드 (거래소별 종목코드. KRX:039490, NXT:039490_NX, SOR:039490_AL)
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
             'stk_cd': stk_cd
         }
-        
-        return self.client.request_api('etc_issue', data)
-    
-    def get_stock_meta_info(self,
-                          stk_cd: str,
-                          stk_mkt_cd: str = '') -> Dict[str, Any]:
+        return self.client.request_api('ka10001', data, cont_yn=cont_yn, next_key=next_key)
+
+    def get_stock_meta_info(self, stk_cd: str, stk_mkt_cd: str = '') -> Dict[str, Any]:
         """
-        종목 메타정보 조회 (stock-meta-info, etc_misi)
-        
+        종목정보 조회 (ka10100)
+
         Args:
-            stk_cd (str): 종목 코드
-            stk_mkt_cd (str, optional): 주식시장코드. 기본값은 빈 문자열
-            
+            stk_cd (str): 종목코드 (6자리)
+            stk_mkt_cd (str, optional): 사용하지 않음 (이전 버전 호환용)
+
         Returns:
-            Dict[str, Any]: API 응답 데이터
+            Dict[str, Any]: API 응답 데이터 (상장주식수, 감리구분, 상장일, 종목상태 등)
         """
         data = {
             'stk_cd': stk_cd
         }
-        
-        if stk_mkt_cd:
-            data['stk_mkt_cd'] = stk_mkt_cd
-            
-        return self.client.request_api('etc_misi', data)
-    
-    def get_stock_list(self,
-                     inq_cnd_dvsn_cd: str = '1',
-                     inq_cnd_dvsn_val: str = '') -> Dict[str, Any]:
-        """
-        종목 목록 조회 (stock-list, etc_sangsi)
-        
-        Args:
-            inq_cnd_dvsn_cd (str, optional): 조회조건구분코드. 기본값은 '1'
-                '1': 시장구분, '2': 업종구분, '6': 상장주식수 '7': 자본금 '8': 시가총액 등
-            inq_cnd_dvsn_val (str, optional): 조회조건구분값. 기본값은 빈 문자열
-                inq_cnd_dvsn_cd가 '1'인 경우: '0': 전체, '1': 코스피, '2': 코스닥 등
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {
-            'inq_cnd_dvsn_cd': inq_cnd_dvsn_cd
-        }
-        
-        if inq_cnd_dvsn_val:
-            data['inq_cnd_dvsn_val'] = inq_cnd_dvsn_val
-            
-        return self.client.request_api('etc_sangsi', data)
-    
-    def get_delisted_stocks(self,
-                          inq_dt_strt: str = '',
-                          inq_dt_end: str = '',
-                          stk_mkt_cd: str = '') -> Dict[str, Any]:
-        """
-        상장폐지 종목 조회 (delisted-stocks, etc_sanof)
-        
-        Args:
-            inq_dt_strt (str, optional): 조회시작일자 (YYYYMMDD). 기본값은 빈 문자열
-            inq_dt_end (str, optional): 조회종료일자 (YYYYMMDD). 기본값은 빈 문자열
-            stk_mkt_cd (str, optional): 주식시장코드. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {}
-        
-        if inq_dt_strt:
-            data['inq_dt_strt'] = inq_dt_strt
-            
-        if inq_dt_end:
-            data['inq_dt_end'] = inq_dt_end
-            
-        if stk_mkt_cd:
-            data['stk_mkt_cd'] = stk_mkt_cd
-            
-        return self.client.request_api('etc_sanof', data)
-    
-    def get_suspended_stocks(self,
-                           inq_tp_cd: str = '00',
-                           stk_mkt_cd: str = '') -> Dict[str, Any]:
-        """
-        거래정지 종목 조회 (suspended-stocks, etc_sangf)
-        
-        Args:
-            inq_tp_cd (str, optional): 조회구분코드. 기본값은 '00'
-                '00': 전체, '01': 거래정지, '02': 단기과열, '03': 투자유의 등
-            stk_mkt_cd (str, optional): 주식시장코드. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {
-            'inq_tp_cd': inq_tp_cd
-        }
-        
-        if stk_mkt_cd:
-            data['stk_mkt_cd'] = stk_mkt_cd
-            
-        return self.client.request_api('etc_sangf', data)
-    
-    def get_watch_stocks(self,
-                       stk_mkt_cd: str = '') -> Dict[str, Any]:
-        """
-        관리종목 조회 (watch-stocks, etc_sangg)
-        
-        Args:
-            stk_mkt_cd (str, optional): 주식시장코드. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {}
-        
-        if stk_mkt_cd:
-            data['stk_mkt_cd'] = stk_mkt_cd
-            
-        return self.client.request_api('etc_sangg', data)
-    
-    def get_stock_disclosure(self,
-                           inq_strt_dt: str = '',
-                           inq_end_dt: str = '',
-                           stk_cd: str = '',
-                           stk_nm: str = '',
-                           opn_tp_cd: str = '',
-                           dsc_cd: str = '',
-                           next_key: str = '') -> Dict[str, Any]:
-        """
-        종목 공시정보 조회 (stock-disclosure, etc_sangi)
-        
-        Args:
-            inq_strt_dt (str, optional): 조회시작일자 (YYYYMMDD). 기본값은 빈 문자열
-            inq_end_dt (str, optional): 조회종료일자 (YYYYMMDD). 기본값은 빈 문자열
-            stk_cd (str, optional): 종목 코드. 기본값은 빈 문자열
-            stk_nm (str, optional): 종목명. 기본값은 빈 문자열
-            opn_tp_cd (str, optional): 공시구분코드. 기본값은 빈 문자열
-            dsc_cd (str, optional): 공시코드. 기본값은 빈 문자열
-            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {}
-        
-        if inq_strt_dt:
-            data['inq_strt_dt'] = inq_strt_dt
-            
-        if inq_end_dt:
-            data['inq_end_dt'] = inq_end_dt
-            
-        if stk_cd:
-            data['stk_cd'] = stk_cd
-            
-        if stk_nm:
-            data['stk_nm'] = stk_nm
-            
-        if opn_tp_cd:
-            data['opn_tp_cd'] = opn_tp_cd
-            
-        if dsc_cd:
-            data['dsc_cd'] = dsc_cd
-            
-        return self.client.request_api('etc_sangi', data, next_key=next_key)
-    
-    def get_stock_symbol_search(self,
-                              stk_ctr_no: str = '',
-                              stk_nm: str = '',
-                              stk_tp_cd_1: str = 'Y',
-                              stk_tp_cd_2: str = 'Y',
-                              stk_tp_cd_3: str = 'Y',
-                              stk_tp_cd_4: str = 'Y',
-                              next_key: str = '') -> Dict[str, Any]:
+        return self.client.request_api('ka10100', data)
+
+    def get_stock_list(self, mrkt_tp: str = '0', cont_yn: str = 'N', next_key: str = '', **legacy) -> Dict[str, Any]:
         """
-        종목 코드/명 조회 (stock-symbol-search, etc_sangj)
-        
+        종목정보 리스트 (ka10099)
+
         Args:
-            stk_ctr_no (str, optional): 종목 코드. 기본값은 빈 문자열
-            stk_nm (str, optional): 종목명. 기본값은 빈 문자열
-            stk_tp_cd_1 (str, optional): 주식구분코드1(코스피). 기본값은 'Y'
-            stk_tp_cd_2 (str, optional): 주식구분코드2(코스닥). 기본값은 'Y'
-            stk_tp_cd_3 (str, optional): 주식구분코드3(ETF). 기본값은 'Y'
-            stk_tp_cd_4 (str, optional): 주식구분코드4(ELW). 기본값은 'Y'
+            mrkt_tp (str, optional): 시장구분. 기본값은 '0'
+                '0': 코스피, '10': 코스닥, '3': ELW, '8': ETF, '30': K-OTC, '50': 코넥스,
+                '5': 신주인수권, '4': 뮤추얼펀드, '6': 리츠, '9': 하이일드
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            **legacy: 이전 버전 인자 (inq_cnd_dvsn_cd, inq_cnd_dvsn_val 는 대응하는 요청 필드가 없어 무시)
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
+        legacy_args('StockAPI.get_stock_list', legacy, _STOCK_LIST_ARGS)
         data = {
-            'stk_tp_cd_1': stk_tp_cd_1,
-            'stk_tp_cd_2': stk_tp_cd_2,
-            'stk_tp_cd_3': stk_tp_cd_3,
-            'stk_tp_cd_4': stk_tp_cd_4
+            'mrkt_tp': mrkt_tp
         }
-        
-        if stk_ctr_no:
-            data['stk_ctr_no'] = stk_ctr_no
-            
-        if stk_nm:
-            data['stk_nm'] = stk_nm
-            
-        return self.client.request_api('etc_sangj', data, next_key=next_key)
-    
-    def get_overseas_stock_symbol_search(self,
-                                       excd: str = '',
-                                       symb: str = '',
-                                       name: str = '',
-                                       next_key: str = '') -> Dict[str, Any]:
-        """
-        해외종목 코드/명 조회 (overseas-stock-symbol-search, ovc_ccsymbolic)
-        
-        Args:
-            excd (str, optional): 거래소코드. 기본값은 빈 문자열
-            symb (str, optional): 종목코드. 기본값은 빈 문자열
-            name (str, optional): 종목명. 기본값은 빈 문자열
-            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        data = {}
-        
-        if excd:
-            data['excd'] = excd
-            
-        if symb:
-            data['symb'] = symb
-            
-        if name:
-            data['name'] = name
-            
-        return self.client.request_api('ovc_ccsymbolic', data, next_key=next_key)
-    
-    def get_stock_financial_info(self,
-                               stk_cd: str,
-                               fin_gubun: str = '0',
-                               next_key: str = '') -> Dict[str, Any]:
+        return self.client.request_api('ka10099', data, cont_yn=cont_yn, next_key=next_key)
+
+    def get_industry_code_list(self, mrkt_tp: str = '0', cont_yn: str = 'N', next_key: str = '') -> Dict[str, Any]:
         """
-        종목 재무정보 조회 (stock-financial-info, etc_sangk)
-        
+        업종코드 리스트 (ka10101)
+
         Args:
-            stk_cd (str): 종목 코드
-            fin_gubun (str, optional): 재무구분. 기본값은 '0'
-                '0': 전체, '1': 포괄손익계산서, '2': 재무상태표, '3': 현금흐름표
+            mrkt_tp (str, optional): 시장구분. 기본값은 '0'
+                '0': 코스피(거래소), '1': 코스닥, '2': KOSPI200, '4': KOSPI100, '7': KRX100(통합지수)
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+
         Returns:
             Dict[str, Any]: API 응답 데이터
         """
         data = {
-            'stk_cd': stk_cd,
-            'fin_gubun': fin_gubun
+            'mrkt_tp': mrkt_tp
         }
-        
-        return self.client.request_api('etc_sangk', data, next_key=next_key)
-    
+        return self.client.request_api('ka10101', data, cont_yn=cont_yn, next_key=next_key)
+
     def get_stock_investor_trend(self,
-                               stk_cd: str,
-                               inq_strt_dt: str,
-                               inq_end_dt: str,
-                               stk_mkt_cd: str = '',
-                               next_key: str = '') -> Dict[str, Any]:
-        """
-        투자자별 동향 조회 (stock-investor-trend, etc_sangm)
-        
+                                 stk_cd: str,
+                                 dt: Optional[str] = None,
+                                 amt_qty_tp: str = '1',
+                                 trde_tp: str = '0',
+                                 unit_tp: str = '1000',
+                                 cont_yn: str = 'N',
+                                 next_key: str = '',
+                                 **legacy) -> Dict[str, Any]:
+        """
+        종목별투자자기관별요청 (ka10059)
+
         Args:
-            stk_cd (str): 종목 코드
-            inq_strt_dt (str): 조회시작일자 (YYYYMMDD)
-            inq_end_dt (str): 조회종료일자 (YYYYMMDD)
-            stk_mkt_cd (str, optional): 주식시장코드. 기본값은 빈 문자열
+            stk_cd (str): 종목코드 (거래소별 종목코드)
+            dt (str): 일자 (YYYYMMDD, 필수)
+            amt_qty_tp (str, optional): 금액수량구분 ('1': 금액, '2': 수량). 기본값은 '1'
+            trde_tp (str, optional): 매매구분 ('0': 순매수, '1': 매수, '2': 매도). 기본값은 '0'
+            unit_tp (str, optional): 단위구분 ('1000': 천주, '1': 단주). 기본값은 '1000'
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
             next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
+            **legacy: 이전 버전 인자 (inq_end_dt 는 dt 로 변환, inq_strt_dt, stk_mkt_cd 는 무시)
+
         Returns:
             Dict[str, Any]: API 응답 데이터
+
+        Raises:
+            ValueError: 일자(dt 또는 inq_end_dt)가 없는 경우
         """
+        dt = legacy_args('StockAPI.get_stock_investor_trend', legacy, _INVESTOR_TREND_ARGS).get('dt', dt)
+        if not dt:
+            raise ValueError('dt(일자)가 필요합니다.')
         data = {
+            'dt': dt,
             'stk_cd': stk_cd,
-            'inq_strt_dt': inq_strt_dt,
-            'inq_end_dt': inq_end_dt
+            'amt_qty_tp': amt_qty_tp,
+            'trde_tp': trde_tp,
+            'unit_tp': unit_tp
         }
-        
-        if stk_mkt_cd:
-            data['stk_mkt_cd'] = stk_mkt_cd
-            
-        return self.client.request_api('etc_sangm', data, next_key=next_key)
-    
-    def get_overseas_stock_info(self,
-                              excd: str,
-                              symb: str) -> Dict[str, Any]:
+        return self.client.request_api('ka10059', data, cont_yn=cont_yn, next_key=next_key)
+
+    # 이전 버전 호환 메서드
+
+    def get_delisted_stocks(self, inq_dt_strt: str = '', inq_dt_end: str = '', stk_mkt_cd: str = '') -> Dict[str, Any]:
+        """상장폐지 종목 조회 (키움증권 REST API 에 상장폐지 종목 TR 이 없어 NotImplementedError)"""
+        raise NotImplementedError('키움증권 REST API 는 상장폐지 종목 조회를 제공하지 않습니다.')
+
+    def get_suspended_stocks(self, inq_tp_cd: str = '00', stk_mkt_cd: str = '') -> Dict[str, Any]:
+        """거래정지 종목 조회 (전용 TR 이 없어 NotImplementedError, get_stock_list 응답의 state 필드로 확인)"""
+        raise NotImplementedError('키움증권 REST API 는 거래정지 종목 조회를 제공하지 않습니다. '
+                                  'get_stock_list 응답의 state 필드를 사용하세요.')
+
+    def get_watch_stocks(self, stk_mkt_cd: str = '') -> Dict[str, Any]:
+        """투자유의 종목 조회 (전용 TR 이 없어 NotImplementedError, get_stock_list 응답의 orderWarning 필드로 확인)"""
+        raise NotImplementedError('키움증권 REST API 는 투자유의 종목 조회를 제공하지 않습니다. '
+                                  'get_stock_list 응답의 orderWarning 필드를 사용하세요.')
+
+    def get_stock_disclosure(self, inq_strt_dt: str = '', inq_end_dt: str = '', stk_cd: str = '', stk_nm: str = '',
+                             opn_tp_cd: str = '', dsc_cd: str = '', next_key: str = '') -> Dict[str, Any]:
+        """공시 조회 (키움증권 REST API 에 공시 TR 이 없어 NotImplementedError)"""
+        raise NotImplementedError('키움증권 REST API 는 공시 조회를 제공하지 않습니다.')
+
+    def get_stock_symbol_search(self, stk_ctr_no: str = '', stk_nm: str = '', stk_tp_cd_1: str = 'Y',
+                                stk_tp_cd_2: str = 'Y', stk_tp_cd_3: str = 'Y', stk_tp_cd_4: str = 'Y',
+                                next_key: str = '') -> Dict[str, Any]:
+        """종목 검색 (검색 TR 이 없어 NotImplementedError, get_stock_list 의 종목명으로 검색)"""
+        raise NotImplementedError('키움증권 REST API 는 종목 검색을 제공하지 않습니다. '
+                                  'get_stock_list 응답의 name 필드를 사용하세요.')
+
+    def get_overseas_stock_symbol_search(self, excd: str = '', symb: str = '', name: str = '',
+                                         next_key: str = '') -> Dict[str, Any]:
+        """해외주식 종목 검색 (키움증권 REST API 에 해외주식 TR 이 없어 NotImplementedError)"""
+        raise NotImplementedError('키움증권 REST API 는 해외주식 종목 검색을 제공하지 않습니다.')
+
+    def get_stock_financial_info(self, stk_cd: str, fin_gubun: str = '0', next_key: str = '') -> Dict[str, Any]:
+        """종목 재무정보 (사용 중단 예정, 매출액, 영업이익, PER, EPS, ROE 등이 있는 주식기본정보요청 ka10001)"""
+        deprecated('StockAPI.get_stock_financial_info', 'get_stock_basic_info')
+        return self.get_stock_basic_info(stk_cd)
+
+    def get_overseas_stock_info(self, excd: str, symb: str) -> Dict[str, Any]:
+        """해외주식 종목정보 (키움증권 REST API 에 해외주식 TR 이 없어 NotImplementedError)"""
+        raise NotImplementedError('키움증권 REST API 는 해외주식 종목정보 조회를 제공하지 않습니다.')
+
+    def bulk(self, method: str, stk_cds: Iterable[str], max_workers: int = None, **kwargs):
         """
-        해외종목 기본정보 조회 (overseas-stock-info, ovc_ccbasic)
-        
+        여러 종목 동시 조회
+
+        완료되는 순서대로 BulkResult(key, result, error) 를 반환하며, 종목별 오류는 해당 결과의 error 에 담깁니다.
+        AsyncKiwoomClient 에서는 비동기 이터레이터를 반환합니다.
+
+            for item in client.stock.bulk('get_stock_basic_info', ['005930', '000660']):
+                ...
+
         Args:
-            excd (str): 거래소코드
-            symb (str): 종목코드
-            
+            method (str): 조회 메서드 이름 (예: 'get_stock_basic_info')
+            stk_cds (Iterable[str]): 종목코드 목록
+            max_workers (int, optional): 최대 동시 실행 수. 기본값은 클라이언트 기본값
+            **kwargs: 조회 메서드에 전달할 추가 인자
+
         Returns:
-            Dict[str, Any]: API 응답 데이터
+            Iterator[BulkResult]: 조회 결과 이터레이터
         """
-        data = {
-            'excd': excd,
-            'symb': symb
-        }
-        
-        return self.client.request_api('ovc_ccbasic', data) 
\ No newline at end of file
+        func = getattr(self, method)
+        options = {'max_workers': max_workers} if max_workers else {}
+        return self.client.fan_out(lambda stk_cd: func(stk_cd, **kwargs), stk_cds, **options)
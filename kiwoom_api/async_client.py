@@ -0,0 +1,373 @@
+"""
+키움증권 REST API 비동기 클라이언트
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Union, AsyncIterator, Awaitable, Callable, Iterable
+
+from .auth import KiwoomAuth, TokenStore, MOCK_HOST, REAL_HOST
+from .bulk import BulkResult, fan_out_async
+from .cache import ResponseCache
+from .codec import Codec
+from .credentials import CredentialPool
+from .hooks import RequestHooks
+from .metrics import MetricsCollector
+from .client import extract_rows
+from .pool import AsyncConnectionPool, get_default_pool
+from .ratelimit import RateLimiter
+from .registry import lookup, resolve_endpoint
+from .retry import RetryEngine
+from .transport import Transport
+
+
+class AsyncKiwoomClient:
+    """
+    키움증권 API 비동기 클라이언트 클래스
+
+    request_api 가 코루틴을 반환하므로 PriceAPI, ChartAPI, AccountAPI, OrderAPI 등
+    기존 API 모듈의 메서드를 그대로 await 하여 사용할 수 있습니다.
+
+        async with AsyncKiwoomClient(appkey, secretkey) as client:
+            result = await client.price.get_current_price('005930')
+    """
+
+    def __init__(self,
+                 appkey: str = None,
+                 secretkey: str = None,
+                 is_mock: bool = False,
+                 pool: Optional[AsyncConnectionPool] = None,
+                 rate_limiter: Union[RateLimiter, bool, None] = None,
+                 token_store: Optional[TokenStore] = None,
+                 credential_pool: Optional[CredentialPool] = None,
+                 cache: Optional[ResponseCache] = None,
+                 coalesce: bool = True,
+                 retry: Union[RetryEngine, bool, None] = None,
+                 codec: Union[Codec, str, None] = None,
+                 raw: bool = False,
+                 hooks: Optional[RequestHooks] = None,
+                 metrics: Optional[MetricsCollector] = None,
+                 host: Optional[str] = None,
+                 transport: Optional[Transport] = None,
+                 account_no: Optional[str] = None):
+        """
+        키움증권 API 비동기 클라이언트 초기화
+
+        Args:
+            appkey (str, optional): API 앱키. 기본값은 환경변수 'kiwoom_appkey'에서 가져옴
+            secretkey (str, optional): API 시크릿키. 기본값은 환경변수 'kiwoom_secretkey'에서 가져옴
+            is_mock (bool, optional): 모의투자 여부. 기본값은 False
+            pool (AsyncConnectionPool, optional): 비동기 HTTP 연결 풀. 기본값은 클라이언트 전용 연결 풀
+            rate_limiter (RateLimiter, optional): 호출 속도 제한 스케줄러. 기본값은 None (기본 한도로 생성),
+                False 이면 속도 제한을 사용하지 않음
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소. 기본값은 None
+            credential_pool (CredentialPool, optional): 여러 앱키에 요청을 분산할 앱키 풀.
+                지정하면 appkey, secretkey, rate_limiter 대신 앱키별 인증과 속도 제한을 사용
+            cache (ResponseCache, optional): 기준정보 TR 응답 캐시. 기본값은 None (캐시하지 않음)
+            coalesce (bool, optional): 동시에 들어온 같은 조회 요청을 한 번만 전송. 기본값은 True
+            retry (RetryEngine, optional): 재시도 및 서킷 브레이커 실행기. 기본값은 None (기본 정책으로 생성),
+                False 이면 재시도하지 않음
+            codec (Codec | str, optional): 응답 JSON 코덱 ('json', 'orjson'). 기본값은 None (orjson 이 있으면 orjson)
+            raw (bool, optional): True 이면 응답 본문을 필드를 처음 읽을 때 변환하는 LazyJSON 으로 반환. 기본값은 False
+            hooks (RequestHooks, optional): 요청 전송 전, 응답 수신 후, 오류 발생시 호출할 훅. 기본값은 None
+            metrics (MetricsCollector, optional): TR 별 지연 시간, 전송량, 오류 코드 지표 수집기. 기본값은 None
+            host (str, optional): API 호스트 URL (모의 서버 등). 기본값은 None (is_mock 에 따라 실전/모의투자 호스트)
+            transport (Transport, optional): KiwoomClient 나 KiwoomOpenAPI 와 공유할 요청 전송 엔진.
+                지정하면 인증, 호출 한도, 캐시 등 전송 관련 인자 대신 transport 의 설정을 사용
+                (비동기 연결 풀이 없으면 pool 을 사용)
+            account_no (str, optional): 계좌·주문 TR 을 처리할 계좌번호. 앱키 풀을 사용할 때 이 계좌를 소유한 앱키로 요청.
+                기본값은 None (앱키 풀의 기본 앱키 계좌)
+
+        Raises:
+            ValueError: 계좌를 소유한 앱키가 앱키 풀에 없는 경우
+        """
+        self._own_transport = transport is None
+        self._own_async_pool = False
+        if transport is None:
+            if credential_pool is None:
+                # 토큰 동기 발급(토큰 저장소 사용시)도 전송 엔진과 같은 공유 연결 풀 사용
+                auth = KiwoomAuth(appkey, secretkey, is_mock, pool=get_default_pool(), token_store=token_store,
+                                  host=host)
+            else:
+                auth = None
+            transport = Transport(auth, None, rate_limiter, credential_pool, cache, coalesce, retry, codec, raw,
+                                  hooks, metrics, pool or AsyncConnectionPool())
+        elif transport.async_pool is None:
+            transport.async_pool = pool or AsyncConnectionPool()
+            self._own_async_pool = pool is None
+        self.transport = transport
+        self.pool = transport.async_pool
+        self.auth = transport.auth
+        self.credentials = transport.credentials
+        if account_no and self.credentials is not None:
+            # 계좌·주문 TR 을 보낼 때가 아니라 생성 시점에 잘못된 계좌를 알림
+            self.credentials.owner(account_no)
+        self.account_no = account_no
+        self.rate_limiter = transport.rate_limiter
+        self.cache = transport.cache
+        self.codec = transport.codec
+        self.raw = transport.raw
+        self.hooks = transport.hooks
+        self.metrics = transport.metrics
+        self.retry = transport.retry
+        self.single_flight = transport.async_single_flight
+        self.host = host or (MOCK_HOST if is_mock else REAL_HOST)
+        self.is_mock = is_mock
+        self._token_task = None
+
+        # API 모듈 초기화
+        self._init_api_modules()
+
+    def _init_api_modules(self):
+        """API 모듈 초기화"""
+        # lazy import to avoid circular imports
+        from .api.account import AccountAPI
+        from .api.chart import ChartAPI
+        from .api.order import OrderAPI
+        from .api.price import PriceAPI
+        from .api.stock import StockAPI
+
+        # API 모듈 인스턴스 생성 (메서드 호출 결과는 코루틴)
+        self.account = AccountAPI(self)
+        self.chart = ChartAPI(self)
+        self.order = OrderAPI(self)
+        self.price = PriceAPI(self)
+        self.stock = StockAPI(self)
+
+    def _auths(self) -> List[KiwoomAuth]:
+        """클라이언트가 사용하는 모든 인증 객체"""
+        return self.transport.auths()
+
+    async def get_access_token(self, auth: KiwoomAuth = None) -> str:
+        """
+        접근 토큰 비동기 발급 (au10001)
+
+        Args:
+            auth (KiwoomAuth, optional): 토큰을 발급할 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 발급된 접근 토큰
+        """
+        return await self.transport.get_access_token_async(auth)
+
+    async def ensure_token(self, auth: KiwoomAuth = None) -> str:
+        """
+        유효한 접근 토큰 반환 (만료가 가까우면 갱신)
+
+        여러 코루틴이 동시에 호출해도 토큰 발급 요청은 한 번만 수행됩니다.
+
+        Args:
+            auth (KiwoomAuth, optional): 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 유효한 접근 토큰
+        """
+        return await self.transport.ensure_token_async(auth)
+
+    async def refresh_token(self, stale_token: str = None, auth: KiwoomAuth = None) -> str:
+        """
+        접근 토큰 재발급 (401 응답 등으로 토큰이 거부된 경우)
+
+        Args:
+            stale_token (str, optional): 거부된 토큰. 기본값은 현재 토큰
+            auth (KiwoomAuth, optional): 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 새 접근 토큰
+        """
+        return await self.transport.refresh_token_async(stale_token, auth)
+
+    def start_auto_refresh(self):
+        """만료 전 백그라운드 토큰 갱신 태스크 시작 (이벤트 루프 안에서 호출)"""
+        if self._token_task is None or self._token_task.done():
+            self._token_task = asyncio.ensure_future(self._auto_refresh_loop())
+
+    async def _auto_refresh_loop(self):
+        """만료 여유 시간 전에 토큰을 갱신하는 백그라운드 루프"""
+        while True:
+            delay = 60
+            for auth in self._auths():
+                if auth.expires_at is None:
+                    continue
+                remaining = auth.expires_at - auth.refresh_margin - time.time()
+                if remaining <= 0:
+                    try:
+                        await self.ensure_token(auth)
+                    except Exception:
+                        remaining = 10
+                    else:
+                        remaining = auth.expires_at - auth.refresh_margin - time.time()
+                delay = min(delay, max(remaining, 1))
+            await asyncio.sleep(delay)
+
+    async def request_api(self,
+                          api_id: str,
+                          data: Dict[str, Any] = None,
+                          method: str = 'POST',
+                          endpoint: str = None,
+                          cont_yn: str = 'N',
+                          next_key: str = '') -> Dict[str, Any]:
+        """
+        비동기 API 요청 메서드 (KiwoomClient.request_api 와 동일한 인자)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            method (str, optional): HTTP 메서드. 기본값은 'POST'
+            endpoint (str, optional): API 엔드포인트 경로. 기본값은 None (자동 결정)
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+
+        Returns:
+            Dict[str, Any]: API 응답 데이터
+        """
+        if not endpoint:
+            endpoint = resolve_endpoint(api_id)
+
+        # 캐시, 요청 병합, 호출 한도, 토큰, 재시도, 훅은 KiwoomClient 와 같은 전송 엔진에서 적용
+        return await self.transport.request_async(method, self.host + endpoint, endpoint, api_id, data,
+                                                  cont_yn, next_key, self.account_no)
+
+    async def paginate(self,
+                       api_id: str,
+                       data: Dict[str, Any] = None,
+                       method: str = 'POST',
+                       endpoint: str = None,
+                       rows: bool = False,
+                       list_field: str = None,
+                       prefetch: bool = False,
+                       max_pages: int = None,
+                       max_rows: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        연속조회(cont-yn / next-key) 자동 반복 비동기 제너레이터 (KiwoomClient.paginate 와 동일한 인자)
+
+            async for row in client.paginate('ka10032', data, rows=True):
+                ...
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            method (str, optional): HTTP 메서드. 기본값은 'POST'
+            endpoint (str, optional): API 엔드포인트 경로. 기본값은 None (자동 결정)
+            rows (bool, optional): True 이면 페이지 대신 목록 필드의 행을 하나씩 반환. 기본값은 False
+            list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+            prefetch (bool, optional): 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청. 기본값은 False
+            max_pages (int, optional): 최대 조회 페이지 수. 기본값은 None (제한 없음)
+            max_rows (int, optional): 최대 조회 행 수. 기본값은 None (제한 없음)
+
+        Yields:
+            Dict[str, Any]: API 응답 데이터 (rows=True 이면 행 데이터)
+        """
+        # 명세에 있는 TR 은 등록 정보의 목록 필드와 연속조회 지원 여부 사용
+        info = lookup(api_id)
+        if list_field is None and info is not None:
+            list_field = info.list_field
+        paginated = info is None or info.paginated
+
+        pending = None
+        cont_yn, next_key = 'N', ''
+        pages = row_count = 0
+
+        try:
+            while True:
+                if pending is not None:
+                    page, pending = await pending, None
+                else:
+                    page = await self.request_api(api_id, data, method, endpoint, cont_yn, next_key)
+                pages += 1
+
+                cont_yn = 'Y'
+                next_key = page['headers'].get('next-key') or ''
+                has_next = (paginated and page['headers'].get('cont-yn') == 'Y'
+                            and (max_pages is None or pages < max_pages))
+
+                # 현재 페이지를 처리하는 동안 다음 페이지 요청
+                if has_next and prefetch:
+                    pending = asyncio.ensure_future(
+                        self.request_api(api_id, data, method, endpoint, cont_yn, next_key))
+
+                if rows:
+                    for row in extract_rows(page['data'], list_field):
+                        yield row
+                        row_count += 1
+                        if max_rows is not None and row_count >= max_rows:
+                            return
+                else:
+                    yield page
+                    row_count += len(extract_rows(page['data'], list_field))
+                    if max_rows is not None and row_count >= max_rows:
+                        return
+
+                if not has_next:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if self.metrics is not None and pages:
+                self.metrics.observe_pages(api_id, pages, endpoint or '')
+
+    def fan_out(self,
+                func: Callable[[str], Awaitable[Dict[str, Any]]],
+                keys: Iterable[str],
+                max_workers: int = 32) -> AsyncIterator[BulkResult]:
+        """
+        여러 키(종목코드 등)를 동시에 조회 (모든 요청은 호출 속도 제한을 따름)
+
+        Args:
+            func (Callable): 키 하나를 받아 API 응답 코루틴을 반환하는 함수
+            keys (Iterable[str]): 조회할 키 목록
+            max_workers (int, optional): 최대 동시 실행 수. 기본값은 32
+
+        Yields:
+            BulkResult: 완료된 순서대로 조회 결과 (key, result, error)
+        """
+        return fan_out_async(func, keys, max_workers)
+
+    def columnar(self, list_field: str = None):
+        """
+        응답 본문을 필드별 NumPy 배열(ColumnarResult)로 반환하는 클라이언트 래퍼 생성
+
+            result = client.columnar().chart.get_domestic_stock_minute('005930')
+            df = result['data'].to_dataframe()
+
+        Args:
+            list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+
+        Returns:
+            ColumnarClient: 컬럼형 클라이언트 래퍼
+        """
+        from .columnar import ColumnarClient
+        return ColumnarClient(self, list_field)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        연결 풀 통계 조회
+
+        Returns:
+            Dict[str, int]: 연결 풀 통계 (requests, hits, new_connections, waits)
+        """
+        return self.pool.stats()
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """
+        요청 병합 통계 조회
+
+        Returns:
+            Dict[str, int]: 요청 병합 통계 (calls, coalesced, in_flight). 병합을 사용하지 않으면 빈 딕셔너리
+        """
+        return self.single_flight.stats() if self.single_flight is not None else {}
+
+    async def close(self):
+        """토큰 자동 갱신 중지 및 클라이언트가 만든 연결 풀 종료 (공유받은 transport 의 연결 풀은 유지)"""
+        if self._token_task is not None:
+            self._token_task.cancel()
+            self._token_task = None
+        if self._own_transport or self._own_async_pool:
+            await self.transport.close_async()
+
+    async def __aenter__(self):
+        self.start_auto_refresh()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
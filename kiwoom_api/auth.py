@@ -1,20 +1,42 @@
 """
 키움증권 OAuth2 인증 모듈
 """
+import abc
 import os
-import requests
 import json
-from typing import Dict, Optional, Any, Tuple
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Any, Tuple, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .pool import ConnectionPool, get_default_pool
 
 # API 호스트 정보
 MOCK_HOST = "https://mockapi.kiwoom.com"
 REAL_HOST = "https://api.kiwoom.com"
 
+# 토큰 만료시각(expires_dt) 기준 시간대 (KST)
+KST = timezone(timedelta(hours=9))
+
+# 만료 전 토큰을 미리 갱신하는 여유 시간(초)
+DEFAULT_REFRESH_MARGIN = 300
+
 
 class KiwoomAuth:
     """키움증권 인증 클래스"""
     
-    def __init__(self, appkey: str = None, secretkey: str = None, is_mock: bool = False):
+    def __init__(self, appkey: str = None, secretkey: str = None, is_mock: bool = False,
+                 pool: Optional[ConnectionPool] = None,
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+                 token_store: Optional['TokenStore'] = None,
+                 host: Optional[str] = None):
         """
         키움증권 인증 객체 초기화
         
@@ -22,13 +44,25 @@ class KiwoomAuth:
             appkey (str, optional): API 앱키. 기본값은 환경변수 'kiwoom_appkey'에서 가져옴
             secretkey (str, optional): API 시크릿키. 기본값은 환경변수 'kiwoom_secretkey'에서 가져옴
             is_mock (bool, optional): 모의투자 여부. 기본값은 False
+            pool (ConnectionPool, optional): HTTP 연결 풀. 기본값은 프로세스 공유 연결 풀
+            refresh_margin (float, optional): 만료 몇 초 전에 토큰을 미리 갱신할지. 기본값은 DEFAULT_REFRESH_MARGIN
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소. 기본값은 None (공유하지 않음)
+            host (str, optional): API 호스트 URL. 기본값은 None (is_mock 에 따라 실전/모의투자 호스트)
         """
+        self.pool = pool or get_default_pool()
+        self.refresh_margin = refresh_margin
+        self.token_store = token_store
         self.appkey = appkey or os.environ.get('kiwoom_appkey')
         self.secretkey = secretkey or os.environ.get('kiwoom_secretkey')
-        self.host = MOCK_HOST if is_mock else REAL_HOST
+        self.host = host or (MOCK_HOST if is_mock else REAL_HOST)
         self.token = None
         self.token_type = None
         self.expires_dt = None
+        self.expires_at = None
+        
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
         
         if not self.appkey or not self.secretkey:
             raise ValueError("appkey와 secretkey가 필요합니다. 환경변수 'kiwoom_appkey'와 'kiwoom_secretkey'를 설정하거나 직접 인자로 전달하세요.")
@@ -40,6 +74,26 @@ class KiwoomAuth:
         Returns:
             str: 발급된 접근 토큰
         """
+        url, headers, data = self._token_request()
+        
+        response = self.pool.request('POST', url, headers=headers, json=data)
+        response.raise_for_status()
+        
+        token = self._set_token(response.json())
+        
+        # 다른 프로세스가 재사용할 수 있도록 저장소에 기록
+        if self.token_store is not None:
+            self.token_store.save(self.appkey, self._token_record())
+        
+        return token
+    
+    def _token_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """
+        토큰 발급 요청 정보 생성
+        
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, str]]: (URL, 헤더, 요청 데이터)
+        """
         endpoint = '/oauth2/token'
         url = self.host + endpoint
         
@@ -53,16 +107,162 @@ class KiwoomAuth:
             'secretkey': self.secretkey,
         }
         
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
+        return url, headers, data
+    
+    def _set_token(self, result: Dict[str, Any]) -> str:
+        """
+        토큰 발급 응답 저장
         
-        result = response.json()
+        Args:
+            result (Dict[str, Any]): au10001 응답 데이터
+            
+        Returns:
+            str: 발급된 접근 토큰
+        """
         self.token = result.get('token')
         self.token_type = result.get('token_type')
         self.expires_dt = result.get('expires_dt')
+        self.expires_at = parse_expires_dt(self.expires_dt)
         
         return self.token
     
+    def _token_record(self) -> Dict[str, Any]:
+        """토큰 저장소에 기록할 토큰 정보"""
+        return {
+            'token': self.token,
+            'token_type': self.token_type,
+            'expires_dt': self.expires_dt,
+        }
+    
+    def _load_stored_token(self, stale_token: str = None) -> bool:
+        """
+        토큰 저장소의 유효한 토큰 적용
+        
+        Args:
+            stale_token (str, optional): 사용하지 않을(거부된) 토큰
+            
+        Returns:
+            bool: 유효한 토큰을 적용했으면 True
+        """
+        record = self.token_store.load(self.appkey)
+        if not record or not record.get('token') or record.get('token') == stale_token:
+            return False
+        expires_at = parse_expires_dt(record.get('expires_dt'))
+        if expires_at is not None and time.time() >= expires_at - self.refresh_margin:
+            return False
+        self._set_token(record)
+        return True
+    
+    def is_token_valid(self, margin: float = None) -> bool:
+        """
+        토큰 유효 여부 확인
+        
+        Args:
+            margin (float, optional): 만료 전 여유 시간(초). 기본값은 refresh_margin
+            
+        Returns:
+            bool: 토큰이 있고 만료 여유 시간 전이면 True (만료시각을 모르면 토큰 존재 여부)
+        """
+        if not self.token:
+            return False
+        if self.expires_at is None:
+            return True
+        if margin is None:
+            margin = self.refresh_margin
+        return time.time() < self.expires_at - margin
+    
+    def ensure_token(self) -> str:
+        """
+        유효한 접근 토큰 반환 (만료가 가까우면 갱신)
+        
+        여러 스레드가 동시에 호출해도 토큰 발급 요청은 한 번만 수행됩니다.
+        
+        Returns:
+            str: 유효한 접근 토큰
+        """
+        if self.is_token_valid():
+            return self.token
+        
+        with self._refresh_lock:
+            # 대기하는 동안 다른 스레드가 갱신했으면 그 토큰을 사용
+            if self.is_token_valid():
+                return self.token
+            if self.token_store is None:
+                return self.get_access_token()
+            
+            # 다른 프로세스가 발급한 토큰이 있으면 잠금 없이 바로 재사용
+            if self._load_stored_token():
+                return self.token
+            
+            with self.token_store.lock(self.appkey):
+                # 잠금을 기다리는 동안 다른 프로세스가 발급했을 수 있으므로 다시 확인
+                if self._load_stored_token():
+                    return self.token
+                return self.get_access_token()
+    
+    def refresh_token(self, stale_token: str = None) -> str:
+        """
+        접근 토큰 재발급 (401 응답 등으로 토큰이 거부된 경우)
+        
+        여러 스레드가 같은 토큰으로 거부되어도 재발급은 한 번만 수행됩니다.
+        
+        Args:
+            stale_token (str, optional): 거부된 토큰. 기본값은 현재 토큰
+            
+        Returns:
+            str: 새 접근 토큰
+        """
+        stale_token = stale_token or self.token
+        with self._refresh_lock:
+            # 대기하는 동안 다른 스레드가 이미 재발급했으면 그 토큰을 사용
+            if self.token and self.token != stale_token:
+                return self.token
+            if self.token_store is None:
+                return self.get_access_token()
+            
+            with self.token_store.lock(self.appkey):
+                # 다른 프로세스가 이미 재발급했으면 그 토큰을 사용
+                if self._load_stored_token(stale_token):
+                    return self.token
+                return self.get_access_token()
+    
+    def start_auto_refresh(self):
+        """만료 전 백그라운드 토큰 갱신 시작"""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(target=self._auto_refresh_loop,
+                                                name='kiwoom-token-refresh',
+                                                daemon=True)
+        self._refresh_thread.start()
+    
+    def stop_auto_refresh(self):
+        """백그라운드 토큰 갱신 중지"""
+        self._refresh_stop.set()
+        if self._refresh_thread and self._refresh_thread is not threading.current_thread():
+            self._refresh_thread.join(timeout=1)
+        self._refresh_thread = None
+    
+    def _auto_refresh_loop(self):
+        """만료 여유 시간 전에 토큰을 갱신하는 백그라운드 루프"""
+        retry_interval = 10
+        while not self._refresh_stop.is_set():
+            if self.expires_at is None:
+                # 만료시각을 모르면 주기적으로 다시 확인
+                delay = 60
+            else:
+                delay = self.expires_at - self.refresh_margin - time.time()
+            
+            if delay > 0:
+                self._refresh_stop.wait(min(delay, 3600))
+                continue
+            
+            try:
+                self.ensure_token()
+            except Exception:
+                # 일시적인 발급 실패는 잠시 후 재시도 (요청 경로의 ensure_token 도 계속 시도함)
+                self._refresh_stop.wait(retry_interval)
+    
     def revoke_token(self, token: str = None) -> bool:
         """
         접근 토큰 폐기 (au10002)
@@ -90,17 +290,200 @@ class KiwoomAuth:
             'token': token_to_revoke,
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = self.pool.request('POST', url, headers=headers, json=data)
         
         if response.status_code == 200:
             if token_to_revoke == self.token:
                 self.token = None
                 self.token_type = None
                 self.expires_dt = None
+                self.expires_at = None
             return True
         return False
 
 
+class TokenStore(abc.ABC):
+    """
+    토큰 저장소 기본 클래스
+    
+    여러 프로세스가 하나의 접근 토큰을 공유하도록 앱키별 토큰 정보를 저장합니다.
+    하위 클래스는 load, save 를 구현하고, 프로세스 간 잠금이 필요하면 lock 을 재정의합니다.
+    """
+    
+    @abc.abstractmethod
+    def load(self, appkey: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 토큰 정보 조회
+        
+        Args:
+            appkey (str): API 앱키
+            
+        Returns:
+            Dict[str, Any]: 토큰 정보 (token, token_type, expires_dt). 없으면 None
+        """
+    
+    @abc.abstractmethod
+    def save(self, appkey: str, record: Dict[str, Any]):
+        """
+        토큰 정보 저장
+        
+        Args:
+            appkey (str): API 앱키
+            record (Dict[str, Any]): 토큰 정보 (token, token_type, expires_dt)
+        """
+    
+    @contextmanager
+    def lock(self, appkey: str) -> Iterator[None]:
+        """
+        토큰 발급 구간 잠금 (프로세스 간 한 번만 발급하도록 보장)
+        
+        Args:
+            appkey (str): API 앱키
+        """
+        yield
+
+
+class FileTokenStore(TokenStore):
+    """파일 기반 토큰 저장소 (같은 호스트의 프로세스 간 공유)"""
+    
+    def __init__(self, path: str = None):
+        """
+        파일 토큰 저장소 초기화
+        
+        Args:
+            path (str, optional): 토큰 파일 경로. 기본값은 ~/.kiwoom_token.json
+        """
+        self.path = path or os.path.join(os.path.expanduser('~'), '.kiwoom_token.json')
+        self.lock_path = self.path + '.lock'
+        self._thread_lock = threading.Lock()
+    
+    def _read(self) -> Dict[str, Any]:
+        """토큰 파일 전체 읽기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def load(self, appkey: str) -> Optional[Dict[str, Any]]:
+        return self._read().get(appkey)
+    
+    def save(self, appkey: str, record: Dict[str, Any]):
+        records = self._read()
+        records[appkey] = record
+        
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        # (토큰이 다른 사용자에게 보이지 않도록 임시 파일을 처음부터 0600 으로 생성)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(records, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+    
+    @contextmanager
+    def lock(self, appkey: str) -> Iterator[None]:
+        with self._thread_lock:
+            with open(self.lock_path, 'a+') as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                    else:
+                        f.seek(0)
+                        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RedisTokenStore(TokenStore):
+    """
+    Redis 기반 토큰 저장소 (여러 호스트의 프로세스 간 공유)
+    
+    토큰은 '{key}', 만료시각은 '{key}_expires' 키에 저장합니다.
+    namespace_by_appkey=False 이면 main.py 와 같은 'kiwoom_token' / 'kiwoom_token_expires' 키를 그대로 사용합니다.
+    """
+    
+    def __init__(self,
+                 redis_client: Any = None,
+                 url: str = None,
+                 key: str = 'kiwoom_token',
+                 namespace_by_appkey: bool = True,
+                 lock_timeout: float = 30):
+        """
+        Redis 토큰 저장소 초기화
+        
+        Args:
+            redis_client (redis.Redis, optional): Redis 클라이언트. 기본값은 url 또는 localhost:6379 로 생성
+            url (str, optional): Redis 접속 URL (예: 'redis://localhost:6379/0')
+            key (str, optional): 토큰 저장 키. 기본값은 'kiwoom_token'
+            namespace_by_appkey (bool, optional): 앱키별로 키를 구분할지 여부. 기본값은 True
+            lock_timeout (float, optional): 발급 잠금 최대 유지 시간(초). 기본값은 30
+        """
+        if redis_client is None:
+            import redis
+            redis_client = redis.Redis.from_url(url) if url else redis.Redis(host='localhost', port=6379, db=0)
+        self.redis = redis_client
+        self.key = key
+        self.namespace_by_appkey = namespace_by_appkey
+        self.lock_timeout = lock_timeout
+    
+    def _key(self, appkey: str, suffix: str = '') -> str:
+        """Redis 키 생성"""
+        key = self.key + suffix
+        return f'{key}:{appkey}' if self.namespace_by_appkey else key
+    
+    @staticmethod
+    def _decode(value: Any) -> Optional[str]:
+        """Redis 응답 값을 문자열로 변환"""
+        if isinstance(value, bytes):
+            return value.decode('utf-8')
+        return value
+    
+    def load(self, appkey: str) -> Optional[Dict[str, Any]]:
+        token, expires_dt, token_type = self.redis.mget(self._key(appkey),
+                                                        self._key(appkey, '_expires'),
+                                                        self._key(appkey, '_type'))
+        if not token:
+            return None
+        return {
+            'token': self._decode(token),
+            'token_type': self._decode(token_type),
+            'expires_dt': self._decode(expires_dt),
+        }
+    
+    def save(self, appkey: str, record: Dict[str, Any]):
+        expires_at = parse_expires_dt(record.get('expires_dt'))
+        ttl = int(expires_at - time.time()) if expires_at else None
+        if ttl is not None and ttl <= 0:
+            return
+        
+        pipe = self.redis.pipeline()
+        pipe.set(self._key(appkey), record.get('token'), ex=ttl)
+        pipe.set(self._key(appkey, '_expires'), record.get('expires_dt') or '', ex=ttl)
+        pipe.set(self._key(appkey, '_type'), record.get('token_type') or '', ex=ttl)
+        pipe.execute()
+    
+    @contextmanager
+    def lock(self, appkey: str) -> Iterator[None]:
+        with self.redis.lock(self._key(appkey, '_lock'), timeout=self.lock_timeout):
+            yield
+
+
 def get_access_token(appkey: str = None, secretkey: str = None, is_mock: bool = False) -> str:
     """
     접근 토큰 빠르게 발급받기
@@ -114,4 +497,22 @@ def get_access_token(appkey: str = None, secretkey: str = None, is_mock: bool =
         str: 발급된 접근 토큰
     """
     auth = KiwoomAuth(appkey, secretkey, is_mock)
-    return auth.get_access_token() 
\ No newline at end of file
+    return auth.get_access_token()
+
+
+def parse_expires_dt(expires_dt: Optional[str]) -> Optional[float]:
+    """
+    토큰 만료시각 문자열 변환
+    
+    Args:
+        expires_dt (str): 만료시각 (YYYYMMDDHHMMSS, KST)
+        
+    Returns:
+        float: 만료시각 (epoch 초). 형식이 올바르지 않으면 None
+    """
+    if not expires_dt:
+        return None
+    try:
+        return datetime.strptime(str(expires_dt), '%Y%m%d%H%M%S').replace(tzinfo=KST).timestamp()
+    except ValueError:
+        return None
@@ -0,0 +1,103 @@
+"""
+키움증권 API 다종목 동시 조회 모듈
+
+종목코드 목록을 제한된 동시 실행 수로 나누어 조회하고, 완료되는 순서대로 결과를 반환합니다.
+종목별 오류는 해당 결과에만 담기며 나머지 조회는 계속 진행됩니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, AsyncIterator, NamedTuple, Optional
+
+
+class BulkResult(NamedTuple):
+    """다종목 조회 결과"""
+    key: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """조회 성공 여부"""
+        return self.error is None
+
+
+def fan_out(func: Callable[[str], Dict[str, Any]],
+            keys: Iterable[str],
+            max_workers: int = 8) -> Iterator[BulkResult]:
+    """
+    스레드 풀로 여러 키(종목코드 등)를 동시에 조회
+
+    Args:
+        func (Callable): 키 하나를 받아 API 응답을 반환하는 함수
+        keys (Iterable[str]): 조회할 키 목록
+        max_workers (int, optional): 최대 동시 실행 수. 기본값은 8
+
+    Yields:
+        BulkResult: 완료된 순서대로 조회 결과
+    """
+    keys = iter(keys)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    running = {}
+
+    def submit_next() -> bool:
+        for key in keys:
+            running[executor.submit(func, key)] = key
+            return True
+        return False
+
+    try:
+        while len(running) < max_workers and submit_next():
+            pass
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                error = future.exception()
+                yield BulkResult(key, None if error else future.result(), error)
+                submit_next()
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def fan_out_async(func: Callable[[str], Awaitable[Dict[str, Any]]],
+                        keys: Iterable[str],
+                        max_workers: int = 32) -> AsyncIterator[BulkResult]:
+    """
+    asyncio 태스크로 여러 키(종목코드 등)를 동시에 조회
+
+    Args:
+        func (Callable): 키 하나를 받아 API 응답 코루틴을 반환하는 함수
+        keys (Iterable[str]): 조회할 키 목록
+        max_workers (int, optional): 최대 동시 실행 수. 기본값은 32
+
+    Yields:
+        BulkResult: 완료된 순서대로 조회 결과
+    """
+    import asyncio  # 동기 클라이언트만 쓰는 경우 asyncio import 비용을 치르지 않도록 지연
+
+    keys = iter(keys)
+    running = {}
+
+    def submit_next() -> bool:
+        for key in keys:
+            running[asyncio.ensure_future(func(key))] = key
+            return True
+        return False
+
+    try:
+        while len(running) < max_workers and submit_next():
+            pass
+
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = running.pop(task)
+                error = task.exception()
+                yield BulkResult(key, None if error else task.result(), error)
+                submit_next()
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,203 @@
+"""
+키움증권 API 응답 캐시 모듈
+
+종목 기본정보, ETF/ELW 정보, 업종·테마 목록처럼 하루에 한 번 정도만 바뀌는 기준정보 TR 응답을
+(api_id, 요청 데이터) 키로 저장해 두고 TR 별 유효시간(TTL) 동안 재사용합니다.
+메모리 LRU 캐시를 기본으로 하고, 선택적으로 sqlite 디스크 캐시를 함께 사용할 수 있습니다.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .codec import to_plain
+from .registry import is_order
+
+# 하루 (초)
+DAY = 24 * 60 * 60
+
+# 기준정보 TR 기본 유효시간(초)
+# 현재가, 등락률 같은 시세 필드를 함께 반환하는 TR(ka10001 주식기본정보요청, ka20002 업종별주가요청 등)은
+# 하루 동안 지난 시세를 돌려주게 되므로 기본값에 넣지 않음 (필요하면 ttls 로 짧은 유효시간 지정)
+DEFAULT_TTLS = {
+    'ka10099': DAY,  # 종목정보 리스트
+    'ka10100': DAY,  # 종목정보 조회
+    'ka10101': DAY,  # 업종코드 리스트
+    'ka10102': DAY,  # 회원사 리스트
+    'ka40002': DAY,  # ETF종목정보요청
+}
+
+
+class ResponseCache:
+    """TR 별 유효시간과 LRU 교체를 지원하는 API 응답 캐시 클래스"""
+
+    def __init__(self,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: Optional[float] = None,
+                 maxsize: int = 1024,
+                 path: Optional[str] = None):
+        """
+        응답 캐시 초기화
+
+        Args:
+            ttls (Dict[str, float], optional): api_id 별 유효시간(초). 기본값은 DEFAULT_TTLS
+            default_ttl (float, optional): ttls 에 없는 조회 TR 의 유효시간(초). 기본값은 None (캐시하지 않음)
+            maxsize (int, optional): 메모리 캐시 최대 항목 수. 기본값은 1024
+            path (str, optional): sqlite 디스크 캐시 파일 경로. 기본값은 None (메모리 캐시만 사용)
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'evictions': 0}
+
+        self._db = None
+        if path:
+            import sqlite3  # 디스크 캐시를 쓸 때만 import
+
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses '
+                             '(key TEXT PRIMARY KEY, expires REAL, value TEXT)')
+            self._db.commit()
+
+    def ttl_for(self, api_id: str) -> Optional[float]:
+        """
+        TR 유효시간 조회
+
+        Args:
+            api_id (str): API ID (TR 코드)
+
+        Returns:
+            float: 유효시간(초). 캐시하지 않는 TR 이면 None (주문 TR 은 default_ttl 을 적용하지 않음)
+        """
+        ttl = self.ttls.get(api_id)
+        if ttl is None and not is_order(api_id):
+            ttl = self.default_ttl
+        return ttl
+
+    @staticmethod
+    def make_key(api_id: str, data: Dict[str, Any] = None, cont_yn: str = 'N', next_key: str = '') -> str:
+        """
+        캐시 키 생성 (요청 데이터는 키 순서와 무관하게 정규화)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+
+        Returns:
+            str: 캐시 키
+        """
+        return json.dumps([api_id, data or {}, cont_yn, next_key or ''],
+                          sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+    def get(self, api_id: str, data: Dict[str, Any] = None, cont_yn: str = 'N', next_key: str = '') -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회
+
+        반환된 응답은 캐시와 같은 객체이므로 수정하지 않아야 합니다.
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+
+        Returns:
+            Dict[str, Any]: 캐시된 API 응답. 없거나 만료되었으면 None
+        """
+        if self.ttl_for(api_id) is None:
+            return None
+
+        key = self.make_key(api_id, data, cont_yn, next_key)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[1]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute('SELECT expires, value FROM responses WHERE key = ?', (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    result = json.loads(row[1])
+                    self._store(key, row[0], result)
+                    self._stats['hits'] += 1
+                    self._stats['disk_hits'] += 1
+                    return result
+
+            self._stats['misses'] += 1
+            return None
+
+    def set(self, api_id: str, data: Dict[str, Any], result: Dict[str, Any], cont_yn: str = 'N', next_key: str = ''):
+        """
+        응답 저장 (유효시간이 지정된 TR 의 정상 응답만 저장)
+
+        HTTP 200 이어도 본문의 return_code 가 0 이 아니면 (조회 실패, 일시 오류 등) 저장하지 않습니다.
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any]): 요청 데이터
+            result (Dict[str, Any]): API 응답
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+        """
+        ttl = self.ttl_for(api_id)
+        if ttl is None or result.get('status_code') != 200:
+            return
+        body = result.get('data') or {}
+        if body.get('return_code') not in (0, None):
+            return
+
+        key = self.make_key(api_id, data, cont_yn, next_key)
+        expires = time.time() + ttl
+        with self._lock:
+            self._store(key, expires, result)
+            if self._db is not None:
+                self._db.execute('INSERT OR REPLACE INTO responses (key, expires, value) VALUES (?, ?, ?)',
+                                 (key, expires, json.dumps(result, ensure_ascii=False, default=to_plain)))
+                self._db.commit()
+
+    def _store(self, key: str, expires: float, result: Dict[str, Any]):
+        """메모리 캐시에 저장하고 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 제거 (잠금 상태에서 호출)"""
+        self._entries[key] = (expires, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM responses')
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict[str, int]: 통계 정보 (hits, misses, disk_hits, evictions, size)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            return stats
+
+    def close(self):
+        """디스크 캐시 연결 종료"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -2,18 +2,47 @@
 키움증권 REST API 클라이언트
 """
 
-import os
-import requests
-import json
-from typing import Dict, List, Optional, Any, Union, Tuple
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator, Iterable, Callable
 
-from .auth import KiwoomAuth, MOCK_HOST, REAL_HOST
+from .auth import KiwoomAuth, TokenStore, MOCK_HOST, REAL_HOST
+from .bulk import BulkResult, fan_out
+from .cache import ResponseCache
+from .codec import Codec
+from .credentials import CredentialPool
+from .hooks import RequestHooks
+from .metrics import MetricsCollector
+from .pool import ConnectionPool, get_default_pool
+from .ratelimit import RateLimiter
+from .registry import lookup, resolve_endpoint
+from .retry import RetryEngine
+from .transport import Transport, build_headers  # noqa: F401 (기존 import 경로 호환)
 
 
 class KiwoomClient:
     """키움증권 API 클라이언트 클래스"""
     
-    def __init__(self, appkey: str = None, secretkey: str = None, is_mock: bool = False, auto_auth: bool = True):
+    def __init__(self,
+                 appkey: str = None,
+                 secretkey: str = None,
+                 is_mock: bool = False,
+                 auto_auth: bool = True,
+                 pool: Optional[ConnectionPool] = None,
+                 rate_limiter: Union[RateLimiter, bool, None] = None,
+                 auto_refresh: bool = True,
+                 token_store: Optional[TokenStore] = None,
+                 credential_pool: Optional[CredentialPool] = None,
+                 cache: Optional[ResponseCache] = None,
+                 coalesce: bool = True,
+                 retry: Union[RetryEngine, bool, None] = None,
+                 codec: Union[Codec, str, None] = None,
+                 raw: bool = False,
+                 hooks: Optional[RequestHooks] = None,
+                 metrics: Optional[MetricsCollector] = None,
+                 host: Optional[str] = None,
+                 transport: Optional[Transport] = None,
+                 account_no: Optional[str] = None):
         """
         키움증권 API 클라이언트 초기화
         
@@ -22,9 +51,56 @@ class KiwoomClient:
             secretkey (str, optional): API 시크릿키. 기본값은 환경변수 'kiwoom_secretkey'에서 가져옴
             is_mock (bool, optional): 모의투자 여부. 기본값은 False
             auto_auth (bool, optional): 초기화시 자동으로 인증 수행 여부. 기본값은 True
+            pool (ConnectionPool, optional): HTTP 연결 풀. 기본값은 프로세스 공유 연결 풀
+            rate_limiter (RateLimiter, optional): 호출 속도 제한 스케줄러. 기본값은 None (기본 한도로 생성),
+                False 이면 속도 제한을 사용하지 않음
+            auto_refresh (bool, optional): 토큰 만료 전 백그라운드 자동 갱신 여부. 기본값은 True
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소. 기본값은 None
+            credential_pool (CredentialPool, optional): 여러 앱키에 요청을 분산할 앱키 풀.
+                지정하면 appkey, secretkey, rate_limiter 대신 앱키별 인증과 속도 제한을 사용
+            cache (ResponseCache, optional): 기준정보 TR 응답 캐시. 기본값은 None (캐시하지 않음)
+            coalesce (bool, optional): 동시에 들어온 같은 조회 요청을 한 번만 전송. 기본값은 True
+            retry (RetryEngine, optional): 재시도 및 서킷 브레이커 실행기. 기본값은 None (기본 정책으로 생성),
+                False 이면 재시도하지 않음
+            codec (Codec | str, optional): 응답 JSON 코덱 ('json', 'orjson'). 기본값은 None (orjson 이 있으면 orjson)
+            raw (bool, optional): True 이면 응답 본문을 필드를 처음 읽을 때 변환하는 LazyJSON 으로 반환. 기본값은 False
+            hooks (RequestHooks, optional): 요청 전송 전, 응답 수신 후, 오류 발생시 호출할 훅. 기본값은 None
+            metrics (MetricsCollector, optional): TR 별 지연 시간, 전송량, 오류 코드 지표 수집기. 기본값은 None
+            host (str, optional): API 호스트 URL (모의 서버 등). 기본값은 None (is_mock 에 따라 실전/모의투자 호스트)
+            transport (Transport, optional): 다른 클라이언트나 KiwoomOpenAPI 와 공유할 요청 전송 엔진.
+                지정하면 인증, 연결 풀, 호출 한도, 캐시 등 전송 관련 인자 대신 transport 의 설정을 사용
+            account_no (str, optional): 계좌·주문 TR 을 처리할 계좌번호. 앱키 풀을 사용할 때 이 계좌를 소유한 앱키로 요청.
+                기본값은 None (앱키 풀의 기본 앱키 계좌)
+
+        Raises:
+            ValueError: 계좌를 소유한 앱키가 앱키 풀에 없는 경우
         """
-        self.auth = KiwoomAuth(appkey, secretkey, is_mock)
-        self.host = MOCK_HOST if is_mock else REAL_HOST
+        self._own_transport = transport is None
+        if transport is None:
+            if credential_pool is None:
+                auth = KiwoomAuth(appkey, secretkey, is_mock, pool=pool or get_default_pool(), token_store=token_store,
+                                  host=host)
+            else:
+                auth = None
+            transport = Transport(auth, pool, rate_limiter, credential_pool, cache, coalesce, retry, codec, raw,
+                                  hooks, metrics)
+        self.transport = transport
+        self.pool = transport.pool
+        self.auth = transport.auth
+        self.credentials = transport.credentials
+        if account_no and self.credentials is not None:
+            # 계좌·주문 TR 을 보낼 때가 아니라 생성 시점에 잘못된 계좌를 알림
+            self.credentials.owner(account_no)
+        self.account_no = account_no
+        self.rate_limiter = transport.rate_limiter
+        self.cache = transport.cache
+        self.codec = transport.codec
+        self.raw = transport.raw
+        self.hooks = transport.hooks
+        self.metrics = transport.metrics
+        self.retry = transport.retry
+        self.single_flight = transport.single_flight
+        self.host = host or (MOCK_HOST if is_mock else REAL_HOST)
         self.is_mock = is_mock
         
         # API 모듈 초기화
@@ -32,77 +108,33 @@ class KiwoomClient:
         
         # 자동 인증 수행
         if auto_auth:
-            self.auth.get_access_token()
+            for auth in self._auths():
+                auth.ensure_token()
+        
+        # 만료 전 토큰 자동 갱신
+        if auto_refresh:
+            for auth in self._auths():
+                auth.start_auto_refresh()
+    
+    def _auths(self) -> List[KiwoomAuth]:
+        """클라이언트가 사용하는 모든 인증 객체"""
+        return self.transport.auths()
     
     def _init_api_modules(self):
         """API 모듈 초기화"""
         # lazy import to avoid circular imports
         from .api.account import AccountAPI
+        from .api.chart import ChartAPI
         from .api.order import OrderAPI
         from .api.price import PriceAPI
+        from .api.stock import StockAPI
         
         # API 모듈 인스턴스 생성
         self.account = AccountAPI(self)
+        self.chart = ChartAPI(self)
         self.order = OrderAPI(self)
         self.price = PriceAPI(self)
-    
-    def _request(self, 
-                method: str, 
-                endpoint: str, 
-                api_id: str, 
-                data: Dict[str, Any] = None, 
-                cont_yn: str = 'N', 
-                next_key: str = '') -> Dict[str, Any]:
-        """
-        API 요청 공통 메서드
-        
-        Args:
-            method (str): HTTP 메서드 (GET, POST 등)
-            endpoint (str): API 엔드포인트 경로
-            api_id (str): API ID (TR 코드)
-            data (Dict[str, Any], optional): 요청 데이터
-            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
-            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
-            
-        Returns:
-            Dict[str, Any]: API 응답 데이터
-        """
-        if not self.auth.token:
-            self.auth.get_access_token()
-            
-        url = self.host + endpoint
-        
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {self.auth.token}',
-            'cont-yn': cont_yn,
-            'next-key': next_key,
-            'api-id': api_id,
-        }
-        
-        if method.upper() == 'GET':
-            response = requests.get(url, headers=headers, params=data)
-        else:  # POST
-            response = requests.post(url, headers=headers, json=data)
-        
-        # HTTP 에러 처리
-        response.raise_for_status()
-        
-        # 응답 헤더 정보 저장
-        response_headers = {
-            'cont-yn': response.headers.get('cont-yn'),
-            'next-key': response.headers.get('next-key'),
-            'api-id': response.headers.get('api-id')
-        }
-        
-        # 응답 데이터와 헤더 정보 함께 반환
-        result = {
-            'status_code': response.status_code,
-            'headers': response_headers,
-            'data': response.json()
-        }
-        
-        return result
+        self.stock = StockAPI(self)
     
     def request_api(self, 
                    api_id: str, 
@@ -127,45 +159,115 @@ class KiwoomClient:
         """
         # API ID 앞 두 글자로 API 타입 판별하여, 엔드포인트 자동 결정
         if not endpoint:
-            # 앞 두 글자에 따라 다른 엔드포인트 지정
-            api_type = api_id[:2].lower()
+            endpoint = resolve_endpoint(api_id)
+        
+        return self.transport.request(method, self.host + endpoint, endpoint, api_id, data, cont_yn, next_key,
+                                      self.account_no)
+        
+    def paginate(self,
+                 api_id: str,
+                 data: Dict[str, Any] = None,
+                 method: str = 'POST',
+                 endpoint: str = None,
+                 rows: bool = False,
+                 list_field: str = None,
+                 prefetch: bool = False,
+                 max_pages: int = None,
+                 max_rows: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        연속조회(cont-yn / next-key) 자동 반복 제너레이터
+        
+        응답 헤더의 cont-yn 이 'Y' 인 동안 next-key 로 다음 페이지를 요청하며,
+        페이지 또는 행 단위로 하나씩 반환합니다.
+        
+        Args:
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            method (str, optional): HTTP 메서드. 기본값은 'POST'
+            endpoint (str, optional): API 엔드포인트 경로. 기본값은 None (자동 결정)
+            rows (bool, optional): True 이면 페이지 대신 목록 필드의 행을 하나씩 반환. 기본값은 False
+            list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+            prefetch (bool, optional): 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청. 기본값은 False
+            max_pages (int, optional): 최대 조회 페이지 수. 기본값은 None (제한 없음)
+            max_rows (int, optional): 최대 조회 행 수. 기본값은 None (제한 없음)
             
-            if api_type == 'au':  # 인증
-                endpoint = '/oauth2/token'
-            elif api_type == 'ka':  # 계좌
-                endpoint = '/api/dostk/acnt'
-            elif api_type == 'kt':  # 주문
-                endpoint = '/api/dostk/ordr'
-            elif api_type == 'kr':  # 신용주문
-                endpoint = '/api/dostk/ordr'
-            elif api_type == 'kc':  # 차트
-                endpoint = '/api/dostk/chart'
-            elif api_type == 'ks':  # 시세
-                endpoint = '/api/dostk/price'
-            elif api_type == 'ke':  # 종목정보
-                endpoint = '/api/dostk/stock'
-            elif api_type == 'ki':  # 순위정보
-                endpoint = '/api/dostk/rkinfo'
-            elif api_type == 'kb':  # 업종
-                endpoint = '/api/dostk/sector'
-            elif api_type == 'kl':  # ETF
-                endpoint = '/api/dostk/etf'
-            elif api_type == 'kf':  # ELW
-                endpoint = '/api/dostk/elw'
-            elif api_type == 'kh':  # 테마
-                endpoint = '/api/dostk/theme'
-            elif api_type == 'ko':  # 조건검색
-                endpoint = '/api/dostk/condition'
-            elif api_type == 'kg':  # 기관외국인
-                endpoint = '/api/dostk/forgnr'
-            else:
-                raise ValueError(f"알 수 없는 API 유형: {api_id}")
+        Yields:
+            Dict[str, Any]: API 응답 데이터 (rows=True 이면 행 데이터)
+        """
+        # 명세에 있는 TR 은 등록 정보의 목록 필드와 연속조회 지원 여부 사용
+        info = lookup(api_id)
+        if list_field is None and info is not None:
+            list_field = info.list_field
+        paginated = info is None or info.paginated
         
-        return self._request(method, endpoint, api_id, data, cont_yn, next_key)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending = None
+        cont_yn, next_key = 'N', ''
+        pages = row_count = 0
         
-    def get_realtime_client(self):
+        try:
+            while True:
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    page = self.request_api(api_id, data, method, endpoint, cont_yn, next_key)
+                pages += 1
+                
+                cont_yn = 'Y'
+                next_key = page['headers'].get('next-key') or ''
+                has_next = (paginated and page['headers'].get('cont-yn') == 'Y'
+                            and (max_pages is None or pages < max_pages))
+                
+                # 현재 페이지를 처리하는 동안 다음 페이지 요청
+                if has_next and executor:
+                    pending = executor.submit(self.request_api, api_id, data, method, endpoint, cont_yn, next_key)
+                
+                if rows:
+                    for row in extract_rows(page['data'], list_field):
+                        yield row
+                        row_count += 1
+                        if max_rows is not None and row_count >= max_rows:
+                            return
+                else:
+                    yield page
+                    row_count += len(extract_rows(page['data'], list_field))
+                    if max_rows is not None and row_count >= max_rows:
+                        return
+                
+                if not has_next:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if self.metrics is not None and pages:
+                self.metrics.observe_pages(api_id, pages, endpoint or '')
+            if executor:
+                executor.shutdown(wait=False)
+    
+    def fan_out(self,
+                func: Callable[[str], Dict[str, Any]],
+                keys: Iterable[str],
+                max_workers: int = 8) -> Iterator[BulkResult]:
         """
-        실시간시세 클라이언트 생성
+        여러 키(종목코드 등)를 동시에 조회 (모든 요청은 호출 속도 제한을 따름)
+        
+        Args:
+            func (Callable): 키 하나를 받아 API 응답을 반환하는 함수
+            keys (Iterable[str]): 조회할 키 목록
+            max_workers (int, optional): 최대 동시 실행 수. 기본값은 8
+            
+        Yields:
+            BulkResult: 완료된 순서대로 조회 결과 (key, result, error)
+        """
+        return fan_out(func, keys, max_workers)
+    
+    def get_realtime_client(self, websocket_url: str = None, **kwargs):
+        """
+        실시간시세 클라이언트 생성 (클라이언트의 지표 수집기에 재연결 공백 시간도 기록)
+        
+        Args:
+            websocket_url (str, optional): WebSocket 서버 URL. 기본값은 None (is_mock 에 따라 결정)
+            **kwargs: KiwoomRealtimeClient 인자 (auto_reconnect, reconnect_policy 등)
         
         Returns:
             KiwoomRealtimeClient: 실시간시세 클라이언트 객체
@@ -175,5 +277,78 @@ class KiwoomClient:
             token=self.auth.token,
             appkey=self.auth.appkey,
             secretkey=self.auth.secretkey,
-            is_mock=self.is_mock
-        ) 
\ No newline at end of file
+            is_mock=self.is_mock,
+            token_store=self.auth.token_store,
+            codec=self.codec,
+            websocket_url=websocket_url,
+            metrics=kwargs.pop('metrics', self.metrics),
+            **kwargs
+        )
+    
+    def columnar(self, list_field: str = None):
+        """
+        응답 본문을 필드별 NumPy 배열(ColumnarResult)로 반환하는 클라이언트 래퍼 생성
+        
+            result = client.columnar().chart.get_domestic_stock_minute('005930')
+            df = result['data'].to_dataframe()
+        
+        Args:
+            list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+        
+        Returns:
+            ColumnarClient: 컬럼형 클라이언트 래퍼
+        """
+        from .columnar import ColumnarClient
+        return ColumnarClient(self, list_field)
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        연결 풀 통계 조회
+        
+        Returns:
+            Dict[str, int]: 연결 풀 통계 (requests, hits, new_connections, waits, hosts)
+        """
+        return self.pool.stats()
+    
+    def coalesce_stats(self) -> Dict[str, int]:
+        """
+        요청 병합 통계 조회
+        
+        Returns:
+            Dict[str, int]: 요청 병합 통계 (calls, coalesced, in_flight). 병합을 사용하지 않으면 빈 딕셔너리
+        """
+        return self.single_flight.stats() if self.single_flight is not None else {}
+    
+    def close(self):
+        """토큰 자동 갱신 중지 및 클라이언트 전용 연결 풀 종료 (공유 연결 풀은 close_default_pool 로 종료)"""
+        for auth in self._auths():
+            auth.stop_auto_refresh()
+        if self._own_transport:
+            self.transport.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def extract_rows(body: Dict[str, Any], list_field: str = None) -> List[Dict[str, Any]]:
+    """
+    응답 데이터에서 행 목록 추출
+    
+    Args:
+        body (Dict[str, Any]): API 응답 본문
+        list_field (str, optional): 행 목록 필드명. 기본값은 None (첫 번째 목록 필드)
+        
+    Returns:
+        List[Dict[str, Any]]: 행 목록 (없으면 빈 목록)
+    """
+    if not isinstance(body, Mapping):
+        return []
+    if list_field:
+        return body.get(list_field) or []
+    for value in body.values():
+        if isinstance(value, list):
+            return value
+    return []
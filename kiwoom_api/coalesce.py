@@ -0,0 +1,163 @@
+"""
+키움증권 API 동일 요청 병합 모듈
+
+같은 (api_id, 요청 데이터) 조회가 동시에 여러 번 들어오면 첫 요청만 전송하고
+나머지는 그 응답을 함께 받도록 병합하여 호출 한도 사용을 줄입니다.
+주문 TR(kt*, kr*)은 요청마다 결과가 달라야 하므로 병합하지 않습니다.
+"""
+
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .cache import ResponseCache
+from .ratelimit import PRIORITY_TYPES
+from .registry import is_order
+
+
+class _Call:
+    """진행 중인 요청"""
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """스레드 간 동일 요청 병합 클래스"""
+
+    def __init__(self, skip_types: Tuple[str, ...] = PRIORITY_TYPES):
+        """
+        동일 요청 병합 초기화
+
+        Args:
+            skip_types (Tuple[str, ...], optional): 병합하지 않는 TR 유형(api_id 앞 두 글자).
+                기본값은 PRIORITY_TYPES (주문, 신용주문)
+        """
+        self.skip_types = tuple(skip_types)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {'calls': 0, 'coalesced': 0}
+
+    def applies(self, api_id: str) -> bool:
+        """
+        병합 대상 TR 여부
+
+        Args:
+            api_id (str): API ID (TR 코드)
+
+        Returns:
+            bool: 병합 대상이면 True
+        """
+        return not is_order(api_id, self.skip_types)
+
+    def do(self, key: str, func: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 아니면 func 를 실행
+
+        Args:
+            key (str): 요청 키 (ResponseCache.make_key)
+            func (Callable): 실제 요청을 수행하는 함수
+
+        Returns:
+            Dict[str, Any]: API 응답 (병합된 요청은 같은 응답 객체를 공유)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['calls'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        요청 병합 통계 조회
+
+        Returns:
+            Dict[str, int]: 통계 정보
+                calls: 실제 전송한 요청 수
+                coalesced: 진행 중인 요청에 병합된 요청 수
+                in_flight: 현재 진행 중인 요청 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+            return stats
+
+
+class AsyncSingleFlight(SingleFlight):
+    """asyncio 태스크 간 동일 요청 병합 클래스"""
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 아니면 func 를 실행
+
+        요청은 별도 태스크로 실행되므로 먼저 요청한 쪽이 취소되어도 나머지는 응답을 받습니다.
+
+        Args:
+            key (str): 요청 키 (ResponseCache.make_key)
+            func (Callable): 실제 요청 코루틴을 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: API 응답 (병합된 요청은 같은 응답 객체를 공유)
+        """
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self._stats['calls'] += 1
+        else:
+            self._stats['coalesced'] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: 'asyncio.Future'):
+        """완료된 요청 정리"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 기다리던 쪽이 모두 취소된 경우에도 예외 미확인 경고가 나지 않도록 확인
+            task.exception()
+
+
+def request_key(api_id: str,
+                data: Dict[str, Any] = None,
+                cont_yn: str = 'N',
+                next_key: str = '',
+                account: Optional[str] = None) -> str:
+    """
+    요청 병합 키 생성 (계좌를 지정하지 않으면 응답 캐시와 같은 키)
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        data (Dict[str, Any], optional): 요청 데이터
+        cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+        next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+        account (str, optional): 요청한 클라이언트에 지정한 계좌번호 (계좌가 다른 요청은 병합하지 않음). 기본값은 None
+
+    Returns:
+        str: 요청 키
+    """
+    key = ResponseCache.make_key(api_id, data, cont_yn, next_key)
+    return f'{account}|{key}' if account else key
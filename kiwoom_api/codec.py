@@ -0,0 +1,165 @@
+"""
+키움증권 API JSON 코덱 모듈
+
+REST 응답과 실시간시세 프레임의 JSON 변환을 한 곳에서 처리합니다.
+orjson 이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json 으로 동작합니다.
+지연 변환(raw) 모드에서는 원본 바이트를 보관했다가 필드를 처음 읽을 때 변환합니다.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 아직 변환하지 않은 상태
+_UNSET = object()
+
+
+class LazyJSON(Mapping):
+    """필드를 처음 읽을 때 변환하는 JSON 객체 (읽기 전용 딕셔너리처럼 사용)"""
+
+    __slots__ = ('raw', '_loads', '_value')
+
+    def __init__(self, raw: Union[bytes, str], loads: Callable[[Union[bytes, str]], Any]):
+        """
+        지연 변환 JSON 초기화
+
+        Args:
+            raw (bytes | str): 원본 JSON
+            loads (Callable): JSON 변환 함수
+        """
+        self.raw = raw
+        self._loads = loads
+        self._value = _UNSET
+
+    @property
+    def value(self) -> Any:
+        """변환된 JSON 값 (처음 접근할 때 변환)"""
+        if self._value is _UNSET:
+            self._value = self._loads(self.raw)
+        return self._value
+
+    @property
+    def decoded(self) -> bool:
+        """변환 여부"""
+        return self._value is not _UNSET
+
+    def __getitem__(self, key: str) -> Any:
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __repr__(self) -> str:
+        if self._value is _UNSET:
+            return f"LazyJSON({len(self.raw)} bytes)"
+        return f"LazyJSON({self._value!r})"
+
+
+class Codec:
+    """JSON 인코딩/디코딩 코덱"""
+
+    def __init__(self, name: str, loads: Callable[[Union[bytes, str]], Any], dumps: Callable[[Any], str]):
+        """
+        코덱 초기화
+
+        Args:
+            name (str): 코덱 이름
+            loads (Callable): bytes 또는 str 을 받아 JSON 값을 반환하는 함수
+            dumps (Callable): JSON 값을 받아 str 을 반환하는 함수
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def decode(self, data: Union[bytes, str], lazy: bool = False) -> Any:
+        """
+        JSON 변환
+
+        Args:
+            data (bytes | str): 원본 JSON
+            lazy (bool, optional): True 이면 필드를 처음 읽을 때 변환하는 LazyJSON 반환. 기본값은 False
+
+        Returns:
+            변환된 JSON 값 또는 LazyJSON
+        """
+        if lazy:
+            return LazyJSON(data, self.loads)
+        return self.loads(data)
+
+    def __repr__(self) -> str:
+        return f"Codec({self.name!r})"
+
+
+def to_plain(obj: Any) -> Any:
+    """
+    json.dumps 의 default 인자로 사용하여 LazyJSON 을 일반 값으로 변환
+
+    Raises:
+        TypeError: 변환할 수 없는 객체인 경우
+    """
+    if isinstance(obj, LazyJSON):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=to_plain)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj, default=to_plain).decode()
+
+
+JSON_CODEC = Codec('json', json.loads, _json_dumps)
+ORJSON_CODEC = Codec('orjson', orjson.loads, _orjson_dumps) if orjson is not None else None
+
+_CODECS = {'json': JSON_CODEC}
+if ORJSON_CODEC is not None:
+    _CODECS['orjson'] = ORJSON_CODEC
+
+_default_codec = ORJSON_CODEC or JSON_CODEC
+
+
+def get_codec(codec: Union[Codec, str, None] = None) -> Codec:
+    """
+    코덱 조회
+
+    Args:
+        codec (Codec | str, optional): 코덱 객체 또는 이름 ('json', 'orjson'). 기본값은 None (기본 코덱)
+
+    Returns:
+        Codec: 코덱 객체
+
+    Raises:
+        ValueError: 사용할 수 없는 코덱 이름인 경우
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, Codec):
+        return codec
+    if codec not in _CODECS:
+        raise ValueError(f"사용할 수 없는 코덱입니다: {codec} (사용 가능: {', '.join(_CODECS)})")
+    return _CODECS[codec]
+
+
+def set_default_codec(codec: Union[Codec, str]) -> Codec:
+    """
+    기본 코덱 변경
+
+    Args:
+        codec (Codec | str): 코덱 객체 또는 이름
+
+    Returns:
+        Codec: 이전 기본 코덱
+    """
+    global _default_codec
+    previous, _default_codec = _default_codec, get_codec(codec)
+    return previous
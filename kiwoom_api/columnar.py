@@ -0,0 +1,231 @@
+"""
+키움증권 API 컬럼형 결과 모듈
+
+행 딕셔너리 목록 대신 필드별 NumPy 배열로 응답을 반환합니다.
+TR 별 필드 스키마(kiwoom_api.schema)에 따라 응답을 한 번 순회하며 int64/float64/object 배열로 변환하고,
+to_dataframe() 은 배열을 복사하지 않고 pandas DataFrame 을 만듭니다.
+
+    chart = client.columnar().chart
+    result = chart.get_domestic_stock_minute('005930')
+    df = result['data'].to_dataframe()
+"""
+
+import importlib
+import inspect
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from .rows import INT, FLOAT, parse_int, parse_float, schema_for
+
+# columnar() 에서 사용할 수 있는 API 모듈 (속성명: (모듈, 클래스))
+API_MODULES = {
+    'account': ('.api.account', 'AccountAPI'),
+    'chart': ('.api.chart', 'ChartAPI'),
+    'index': ('.api.index', 'IndexAPI'),
+    'order': ('.api.order', 'OrderAPI'),
+    'price': ('.api.price', 'PriceAPI'),
+    'ranking': ('.api.ranking', 'RankingAPI'),
+    'stock': ('.api.stock', 'StockAPI'),
+    'trade': ('.api.trade', 'TradeAPI'),
+}
+
+
+def _numpy():
+    """numpy 지연 import"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("컬럼형 결과를 사용하려면 numpy 가 필요합니다. pip install numpy 로 설치하세요.")
+    return numpy
+
+
+def _int_array(np, values: Sequence[Any]):
+    """정수 필드 배열 변환 (소수점이 섞이면 float64, 숫자가 아닌 값이 섞이면 object)"""
+    try:
+        return np.fromiter(map(int, values), np.int64, len(values))
+    except (ValueError, TypeError, OverflowError):
+        pass
+    parsed = list(map(parse_int, values))
+    if all(value.__class__ is int for value in parsed):
+        return np.array(parsed, dtype=np.int64)
+    return _float_array(np, parsed)
+
+
+def _float_array(np, values: Sequence[Any]):
+    """실수 필드 배열 변환 (숫자가 아닌 값이 섞이면 object)"""
+    try:
+        return np.fromiter(map(parse_float, values), np.float64, len(values))
+    except (ValueError, TypeError):
+        return np.array(values, dtype=object)
+
+
+class ColumnarResult(Mapping):
+    """필드별 NumPy 배열로 저장한 TR 응답"""
+
+    def __init__(self, api_id: str, columns: Dict[str, Any], meta: Dict[str, Any] = None, list_field: str = None):
+        """
+        컬럼형 결과 초기화 (보통 to_columnar 로 생성)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            columns (Dict[str, ndarray]): 필드명별 배열
+            meta (Dict[str, Any], optional): 목록이 아닌 응답 본문 필드 (return_code, return_msg 등)
+            list_field (str, optional): 행 목록 필드명
+        """
+        self.api_id = api_id
+        self.columns = columns
+        self.meta = meta or {}
+        self.list_field = list_field
+
+    @property
+    def num_rows(self) -> int:
+        """행 수"""
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.columns:
+            return self.columns[key]
+        return self.meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.columns
+        yield from self.meta
+
+    def __len__(self) -> int:
+        return len(self.columns) + len(self.meta)
+
+    def to_dataframe(self):
+        """
+        pandas DataFrame 으로 변환 (배열을 복사하지 않음)
+
+        Returns:
+            pandas.DataFrame: 필드별 열로 구성된 DataFrame
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("to_dataframe() 을 사용하려면 pandas 가 필요합니다. pip install pandas 로 설치하세요.")
+        # 문자열 필드도 object 배열 그대로 사용 (pandas 의 문자열 dtype 추론으로 인한 복사 방지)
+        columns = {
+            field: pandas.Series(column, dtype=object, copy=False) if column.dtype == object else column
+            for field, column in self.columns.items()
+        }
+        return pandas.DataFrame(columns, copy=False)
+
+    @classmethod
+    def concat(cls, results: Iterable['ColumnarResult']) -> 'ColumnarResult':
+        """
+        같은 TR 의 컬럼형 결과 이어붙이기 (연속조회 페이지 누적)
+
+        Args:
+            results (Iterable[ColumnarResult]): 컬럼형 결과 목록
+
+        Returns:
+            ColumnarResult: 이어붙인 결과 (meta 는 첫 번째 결과 기준)
+        """
+        np = _numpy()
+        results = list(results)
+        if not results:
+            raise ValueError("이어붙일 결과가 없습니다.")
+        first = results[0]
+        columns = {field: np.concatenate([result.columns[field] for result in results]) for field in first.columns}
+        return cls(first.api_id, columns, dict(first.meta), first.list_field)
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult({self.api_id}, {self.num_rows} rows, {len(self.columns)} fields)"
+
+
+def to_columnar(api_id: str, body: Mapping, list_field: str = None) -> ColumnarResult:
+    """
+    응답 본문의 행 목록을 필드별 NumPy 배열로 변환
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        body (Mapping): API 응답 본문 (request_api 결과의 'data')
+        list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+
+    Returns:
+        ColumnarResult: 컬럼형 결과
+    """
+    np = _numpy()
+    list_field, schema = schema_for(api_id, list_field, body)
+    meta = {key: value for key, value in body.items() if key != list_field}
+    rows = (body.get(list_field) or []) if list_field is not None else []
+    fields = list(schema)
+
+    # 응답을 한 번 순회하며 행을 필드별 값 목록으로 전치
+    if not rows or not fields:
+        values = [[] for _ in fields]
+    else:
+        try:
+            getter = itemgetter(*fields)
+            values = list(zip(*map(getter, rows))) if len(fields) > 1 else [list(map(getter, rows))]
+        except KeyError:
+            values = list(zip(*([row.get(field, '') for field in fields] for row in rows)))
+
+    columns = {}
+    for field, column in zip(fields, values):
+        kind = schema[field]
+        if kind == INT:
+            columns[field] = _int_array(np, column)
+        elif kind == FLOAT:
+            columns[field] = _float_array(np, column)
+        else:
+            columns[field] = np.array(column, dtype=object)
+    return ColumnarResult(api_id, columns, meta, list_field)
+
+
+class ColumnarClient:
+    """
+    응답 본문('data')을 ColumnarResult 로 변환하는 클라이언트 래퍼
+
+    KiwoomClient.columnar() 또는 AsyncKiwoomClient.columnar() 로 생성하며,
+    API 모듈(chart, price, stock 등)의 메서드를 그대로 호출하면 컬럼형 결과를 반환합니다.
+    그 밖의 속성과 메서드는 원래 클라이언트에 위임합니다.
+    """
+
+    def __init__(self, client: Any, list_field: Optional[str] = None):
+        """
+        컬럼형 클라이언트 래퍼 초기화
+
+        Args:
+            client (KiwoomClient | AsyncKiwoomClient): 원래 클라이언트
+            list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+        """
+        self._client = client
+        self._list_field = list_field
+        self._modules = {}
+
+    def _convert(self, api_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """응답의 'data' 를 ColumnarResult 로 교체한 새 응답 반환 (캐시된 원래 응답은 변경하지 않음)"""
+        converted = dict(result)
+        converted['data'] = to_columnar(api_id, result['data'], self._list_field)
+        return converted
+
+    async def _convert_async(self, api_id: str, pending) -> Dict[str, Any]:
+        return self._convert(api_id, await pending)
+
+    def request_api(self, api_id: str, *args, **kwargs) -> Any:
+        """
+        API 요청 후 응답 본문을 컬럼형으로 변환 (KiwoomClient.request_api 와 동일한 인자)
+
+        Returns:
+            Dict[str, Any]: 'data' 가 ColumnarResult 인 API 응답 (비동기 클라이언트는 코루틴)
+        """
+        result = self._client.request_api(api_id, *args, **kwargs)
+        if inspect.isawaitable(result):
+            return self._convert_async(api_id, result)
+        return self._convert(api_id, result)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in API_MODULES:
+            module = self._modules.get(name)
+            if module is None:
+                module_name, class_name = API_MODULES[name]
+                api_class = getattr(importlib.import_module(module_name, __package__), class_name)
+                module = self._modules[name] = api_class(self)
+            return module
+        return getattr(self._client, name)
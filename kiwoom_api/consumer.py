@@ -0,0 +1,229 @@
+"""
+키움증권 실시간 데이터 비동기 소비자 모듈
+
+느린 콜백(DB 저장 등)이 WebSocket 수신 루프를 막지 않도록 콜백마다 크기가 제한된 대기열과
+작업 태스크를 둡니다. 수신 루프는 대기열에 넣기만 하고 바로 다음 프레임을 읽으며,
+대기열이 가득 차면 소비자별 정책에 따라 처리합니다.
+
+- DROP_OLDEST: 가장 오래된 데이터를 버리고 새 데이터를 넣음
+- CONFLATE: 같은 (실시간 항목, 종목)의 대기 중인 데이터를 최신 데이터로 바꿈 (가득 차면 가장 오래된 종목을 버림)
+- BLOCK: 자리가 날 때까지 수신 루프가 기다림 (데이터를 버리지 않는 대신 수신이 늦어짐)
+
+    async def save(data):
+        await db.insert(data)
+
+    consumer = realtime.add_consumer('0B', save, maxsize=10000, policy=CONFLATE)
+    consumer.stats()  # {'depth': 12, 'dropped': 0, 'conflated': 340, ...}
+"""
+
+import asyncio
+import collections
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 대기열이 가득 찼을 때의 처리 정책
+DROP_OLDEST = 'drop_oldest'
+CONFLATE = 'conflate'
+BLOCK = 'block'
+
+POLICIES = (DROP_OLDEST, CONFLATE, BLOCK)
+
+
+def default_key(data: Dict[str, Any]) -> Hashable:
+    """CONFLATE 정책에서 같은 데이터로 취급할 키 ((실시간 항목, 종목))"""
+    return data.get('type'), data.get('item')
+
+
+class AsyncConsumer:
+    """크기가 제한된 대기열을 가진 실시간 데이터 소비자"""
+
+    def __init__(self,
+                 callback: Callable[[Dict[str, Any]], Any],
+                 maxsize: int = 1000,
+                 policy: str = DROP_OLDEST,
+                 key: Callable[[Dict[str, Any]], Hashable] = default_key):
+        """
+        소비자 초기화
+
+        Args:
+            callback (Callable): 데이터를 처리할 콜백 (코루틴 함수이면 작업 태스크에서 await)
+            maxsize (int, optional): 대기열 최대 크기. 기본값은 1000
+            policy (str, optional): 대기열이 가득 찼을 때의 처리 정책 (DROP_OLDEST, CONFLATE, BLOCK).
+                기본값은 DROP_OLDEST
+            key (Callable, optional): CONFLATE 정책에서 데이터를 합칠 키 함수. 기본값은 (실시간 항목, 종목)
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"지원하지 않는 대기열 정책: {policy}")
+        if maxsize < 1:
+            raise ValueError("maxsize 는 1 이상이어야 합니다.")
+        self.callback = callback
+        self.is_coroutine = asyncio.iscoroutinefunction(callback)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self._pending = {} if policy == CONFLATE else collections.deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # 취소/종료할 때마다 증가 (자리를 기다리던 BLOCK 추가 요청이 깨어나 포기하도록)
+        self._generation = 0
+
+        # 대기열 통계
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.blocked = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """대기 중인 데이터 수"""
+        return len(self._pending)
+
+    def __call__(self, data: Dict[str, Any]) -> Optional[Awaitable[None]]:
+        return self.offer(data)
+
+    def offer(self, data: Dict[str, Any]) -> Optional[Awaitable[None]]:
+        """
+        대기열에 데이터 추가 (수신 루프에서 호출)
+
+        Args:
+            data (Dict[str, Any]): 실시간 데이터
+
+        Returns:
+            Awaitable: BLOCK 정책에서 대기열이 가득 찼으면 자리가 날 때까지 기다리는 코루틴, 그 밖에는 None
+        """
+        if self._task is None:
+            self.start()
+        self.received += 1
+        pending = self._pending
+
+        if self.policy == CONFLATE:
+            key = self.key(data)
+            if key in pending:
+                # 대기 중인 자리는 유지하고 값만 최신 데이터로 교체
+                pending[key] = data
+                self.conflated += 1
+                return None
+            if len(pending) >= self.maxsize:
+                del pending[next(iter(pending))]
+                self.dropped += 1
+            pending[key] = data
+        else:
+            if len(pending) >= self.maxsize:
+                if self.policy == BLOCK:
+                    self.blocked += 1
+                    return self._put(data)
+                pending.popleft()
+                self.dropped += 1
+            pending.append(data)
+
+        if len(pending) > self.max_depth:
+            self.max_depth = len(pending)
+        self._ready.set()
+        return None
+
+    async def _put(self, data: Dict[str, Any]):
+        """대기열에 자리가 날 때까지 기다린 뒤 추가 (BLOCK 정책, 기다리는 동안 소비자가 취소되면 버림)"""
+        generation = self._generation
+        space = self._space
+        while len(self._pending) >= self.maxsize:
+            space.clear()
+            await space.wait()
+            if self._generation != generation:
+                self.dropped += 1
+                return
+        self._pending.append(data)
+        self._ready.set()
+
+    def _abort_puts(self):
+        """자리를 기다리는 BLOCK 추가 요청을 깨워 포기시킴 (수신 루프가 멈추지 않도록)"""
+        self._generation += 1
+        if self._space is not None:
+            self._space.set()
+
+    def start(self):
+        """작업 태스크 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._space = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        """대기열의 데이터를 차례로 콜백에 전달"""
+        pending = self._pending
+        while True:
+            if not pending:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            if self.policy == CONFLATE:
+                data = pending.pop(next(iter(pending)))
+            else:
+                data = pending.popleft()
+            self._space.set()
+
+            try:
+                result = self.callback(data)
+                if self.is_coroutine:
+                    await result
+            except Exception:
+                self.errors += 1
+                logger.exception('실시간 데이터 소비자 콜백 실행 중 오류 발생')
+            self.delivered += 1
+
+            # 동기 콜백만 연달아 처리할 때도 수신 루프에 차례를 줌
+            if not self.is_coroutine:
+                await asyncio.sleep(0)
+
+    def cancel(self):
+        """작업 태스크 취소 (대기 중인 데이터와 자리를 기다리던 BLOCK 추가 요청은 버림)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending.clear()
+        self._abort_puts()
+
+    async def close(self, drain: bool = False):
+        """
+        작업 태스크 종료
+
+        Args:
+            drain (bool, optional): True 이면 대기 중인 데이터를 모두 처리한 뒤 종료. 기본값은 False
+        """
+        if self._task is None:
+            return
+        if drain:
+            while self._pending and not self._task.done():
+                await asyncio.sleep(0.01)
+        self._task.cancel()
+        self._abort_puts()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        대기열 통계 조회
+
+        Returns:
+            Dict[str, Any]: policy, depth, max_depth, received, delivered, dropped, conflated, blocked, errors
+        """
+        return {
+            'policy': self.policy,
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'received': self.received,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'blocked': self.blocked,
+            'errors': self.errors,
+        }
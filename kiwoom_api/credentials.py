@@ -0,0 +1,218 @@
+"""
+키움증권 다중 앱키 관리 모듈
+
+호출 한도는 앱키 단위로 적용되므로 여러 앱키를 묶어 조회 요청을 분산합니다.
+앱키마다 토큰과 호출 속도 제한을 따로 관리합니다.
+키움증권 REST API 의 계좌·주문 TR 은 요청 본문에 계좌번호가 없고 접근토큰을 발급한 앱키의 계좌로 처리되므로,
+클라이언트에 지정한 계좌(account)를 소유한 앱키로 고정합니다.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple, Union
+
+from .auth import KiwoomAuth, TokenStore
+from .pool import ConnectionPool
+from .ratelimit import RateLimiter
+
+# 계좌에 묶인 TR 의 엔드포인트 (계좌, 주문, 신용주문)
+ACCOUNT_ENDPOINTS = ('/api/dostk/acnt', '/api/dostk/ordr', '/api/dostk/crdordr')
+
+# 앱키 선택 방식
+ROUND_ROBIN = 'round_robin'
+LEAST_LOADED = 'least_loaded'
+
+
+class Credential:
+    """앱키 하나의 인증 및 호출 속도 제한 상태"""
+
+    def __init__(self,
+                 appkey: str,
+                 secretkey: str,
+                 accounts: Iterable[str] = (),
+                 is_mock: bool = False,
+                 pool: Optional[ConnectionPool] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 token_store: Optional[TokenStore] = None,
+                 host: Optional[str] = None):
+        """
+        앱키 초기화
+
+        Args:
+            appkey (str): API 앱키
+            secretkey (str): API 시크릿키
+            accounts (Iterable[str], optional): 이 앱키가 소유한 계좌번호 목록
+            is_mock (bool, optional): 모의투자 여부. 기본값은 False
+            pool (ConnectionPool, optional): HTTP 연결 풀. 기본값은 프로세스 공유 연결 풀
+            rate_limiter (RateLimiter, optional): 이 앱키의 호출 속도 제한. 기본값은 기본 한도로 생성
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소
+            host (str, optional): 토큰을 발급할 API 호스트 URL (모의 서버 등). 기본값은 None (is_mock 에 따라 결정)
+        """
+        self.auth = KiwoomAuth(appkey, secretkey, is_mock, pool=pool, token_store=token_store, host=host)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.accounts = set(accounts)
+        self.in_flight = 0
+        self.requests = 0
+
+    @property
+    def appkey(self) -> str:
+        """API 앱키"""
+        return self.auth.appkey
+
+
+class CredentialPool:
+    """여러 앱키에 요청을 분산하는 앱키 풀 클래스"""
+
+    def __init__(self,
+                 credentials: Iterable[Union[Credential, Tuple[str, str]]],
+                 strategy: str = ROUND_ROBIN,
+                 is_mock: bool = False,
+                 pool: Optional[ConnectionPool] = None,
+                 token_store: Optional[TokenStore] = None,
+                 host: Optional[str] = None):
+        """
+        앱키 풀 초기화
+
+        Args:
+            credentials (Iterable): Credential 객체 또는 (appkey, secretkey[, accounts]) 튜플 목록.
+                첫 번째 앱키는 계좌를 지정하지 않은 클라이언트의 계좌·주문 TR 을 처리하는 기본 앱키
+            strategy (str, optional): 조회 TR 앱키 선택 방식. 기본값은 ROUND_ROBIN
+                round_robin: 순서대로, least_loaded: 처리 중인 요청이 가장 적은 앱키
+            is_mock (bool, optional): 모의투자 여부 (튜플로 전달한 앱키에 적용). 기본값은 False
+            pool (ConnectionPool, optional): HTTP 연결 풀 (튜플로 전달한 앱키에 적용)
+            token_store (TokenStore, optional): 토큰 저장소 (튜플로 전달한 앱키에 적용)
+            host (str, optional): 토큰을 발급할 API 호스트 URL (튜플로 전달한 앱키에 적용)
+        """
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"알 수 없는 앱키 선택 방식: {strategy}")
+
+        self.credentials: List[Credential] = []
+        for credential in credentials:
+            if not isinstance(credential, Credential):
+                credential = Credential(*credential, is_mock=is_mock, pool=pool, token_store=token_store,
+                                        host=host)
+            self.credentials.append(credential)
+        if not self.credentials:
+            raise ValueError("앱키가 하나 이상 필요합니다.")
+
+        self.strategy = strategy
+        self._accounts: Dict[str, Credential] = {}
+        for credential in self.credentials:
+            for account in credential.accounts:
+                self._accounts[account] = credential
+
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(self.credentials)
+
+    @property
+    def primary(self) -> Credential:
+        """기본 앱키"""
+        return self.credentials[0]
+
+    def assign_account(self, account: str, appkey: str):
+        """
+        계좌번호를 소유한 앱키 지정
+
+        Args:
+            account (str): 계좌번호
+            appkey (str): 계좌를 소유한 앱키
+        """
+        for credential in self.credentials:
+            if credential.appkey == appkey:
+                credential.accounts.add(account)
+                self._accounts[account] = credential
+                return
+        raise ValueError(f"풀에 없는 앱키입니다: {appkey}")
+
+    def owner(self, account: str) -> Credential:
+        """
+        계좌를 소유한 앱키 조회
+
+        Args:
+            account (str): 계좌번호
+
+        Returns:
+            Credential: 계좌를 소유한 앱키
+
+        Raises:
+            ValueError: 계좌를 소유한 앱키가 풀에 없는 경우
+        """
+        credential = self._accounts.get(account)
+        if credential is None:
+            raise ValueError(f"계좌를 소유한 앱키가 풀에 없습니다: {account}")
+        return credential
+
+    def select(self, api_id: str, endpoint: str = None, account: str = None) -> Credential:
+        """
+        요청을 처리할 앱키 선택
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            endpoint (str, optional): API 엔드포인트 경로
+            account (str, optional): 요청한 클라이언트에 지정한 계좌번호. 기본값은 None (기본 앱키의 계좌)
+
+        Returns:
+            Credential: 선택된 앱키
+
+        Raises:
+            ValueError: 계좌를 소유한 앱키가 풀에 없는 경우
+        """
+        if endpoint in ACCOUNT_ENDPOINTS:
+            # 계좌·주문 TR 은 계좌를 소유한 앱키로 고정 (본문에 계좌번호가 없으므로 다른 앱키로 보내면 다른 계좌로 처리됨)
+            return self.owner(account) if account else self.primary
+
+        with self._lock:
+            if self.strategy == LEAST_LOADED:
+                return min(self.credentials, key=lambda credential: (credential.in_flight, credential.requests))
+            return next(self._cycle)
+
+    @contextmanager
+    def use(self, api_id: str, endpoint: str = None, account: str = None) -> Iterator[Credential]:
+        """
+        앱키를 선택하여 요청 처리 중으로 표시
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            endpoint (str, optional): API 엔드포인트 경로
+            account (str, optional): 요청한 클라이언트에 지정한 계좌번호. 기본값은 None (기본 앱키의 계좌)
+
+        Yields:
+            Credential: 선택된 앱키
+        """
+        credential = self.select(api_id, endpoint, account)
+        with self._lock:
+            credential.in_flight += 1
+            credential.requests += 1
+        try:
+            yield credential
+        finally:
+            with self._lock:
+                credential.in_flight -= 1
+
+    def start_auto_refresh(self):
+        """모든 앱키의 만료 전 백그라운드 토큰 갱신 시작"""
+        for credential in self.credentials:
+            credential.auth.start_auto_refresh()
+
+    def stop_auto_refresh(self):
+        """모든 앱키의 백그라운드 토큰 갱신 중지"""
+        for credential in self.credentials:
+            credential.auth.stop_auto_refresh()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        앱키별 통계 조회
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 앱키별 통계 (requests, in_flight, rate_limiter)
+        """
+        with self._lock:
+            return {
+                credential.appkey: {
+                    'requests': credential.requests,
+                    'in_flight': credential.in_flight,
+                    'rate_limiter': credential.rate_limiter.stats(),
+                }
+                for credential in self.credentials
+            }
@@ -0,0 +1,187 @@
+"""
+키움증권 API 요청 훅 모듈
+
+요청 전송 전(before_send), 응답 수신 후(after_receive), 오류 발생시(on_error)
+등록한 함수를 호출하여 지연 시간, 전송량, 오류 코드 등을 수집할 수 있도록 합니다.
+등록한 훅이 없으면 이벤트 객체를 만들지 않으므로 요청 경로에 비용이 없습니다.
+
+    hooks = RequestHooks()
+    hooks.add('after_receive', lambda event: print(event.api_id, event.elapsed))
+    client = KiwoomClient(appkey, secretkey, hooks=hooks)
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional
+
+from .codec import get_codec
+
+logger = logging.getLogger(__name__)
+
+# 훅 이벤트 종류
+BEFORE_SEND = 'before_send'
+AFTER_RECEIVE = 'after_receive'
+ON_ERROR = 'on_error'
+HOOK_EVENTS = (BEFORE_SEND, AFTER_RECEIVE, ON_ERROR)
+
+
+class RequestEvent:
+    """훅에 전달되는 요청 하나의 정보"""
+
+    __slots__ = ('api_id', 'endpoint', 'method', 'data', 'cont_yn', 'next_key', 'limiter_wait',
+                 'started', 'elapsed', 'response', 'status_code', 'return_code', 'error', '_bytes_out')
+
+    def __init__(self,
+                 api_id: str,
+                 endpoint: str,
+                 method: str,
+                 data: Dict[str, Any] = None,
+                 cont_yn: str = 'N',
+                 next_key: str = '',
+                 limiter_wait: float = 0.0):
+        """
+        요청 이벤트 초기화
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            endpoint (str): API 엔드포인트 경로
+            method (str): HTTP 메서드
+            data (Dict[str, Any], optional): 요청 데이터
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+            limiter_wait (float, optional): 호출 속도 제한으로 대기한 시간(초). 기본값은 0.0
+        """
+        self.api_id = api_id
+        self.endpoint = endpoint
+        self.method = method
+        self.data = data
+        self.cont_yn = cont_yn
+        self.next_key = next_key
+        self.limiter_wait = limiter_wait
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.response = None
+        self.status_code = None
+        self.return_code = None
+        self.error = None
+        self._bytes_out = None
+
+    @property
+    def bytes_out(self) -> int:
+        """요청 본문 크기 (처음 읽을 때 계산)"""
+        if self._bytes_out is None:
+            request = getattr(self.response, 'request', None)
+            body = getattr(request, 'body', None)
+            if body is not None:
+                self._bytes_out = len(body)
+            elif self.data and self.method.upper() != 'GET':
+                self._bytes_out = len(get_codec().dumps(self.data).encode())
+            else:
+                self._bytes_out = 0
+        return self._bytes_out
+
+    @property
+    def bytes_in(self) -> int:
+        """응답 본문 크기"""
+        content = getattr(self.response, 'content', None)
+        return len(content) if content is not None else 0
+
+    @property
+    def error_code(self) -> Optional[str]:
+        """
+        오류 코드 (정상 응답이면 None)
+
+        HTTP 오류는 상태 코드(raise_for_status 로 발생한 예외 포함), 키움 오류는 'rc' 와 return_code,
+        응답이 없는 예외(연결 실패 등)는 예외 클래스명입니다.
+        """
+        status_code = self.status_code
+        if status_code is None and self.error is not None:
+            status_code = getattr(getattr(self.error, 'response', None), 'status_code', None)
+        if status_code is not None and status_code >= 400:
+            return str(status_code)
+        if self.return_code not in (None, 0, '0'):
+            return f'rc{self.return_code}'
+        if self.error is not None:
+            return type(self.error).__name__
+        return None
+
+    def finish(self, response: Any = None, body: Any = None, error: BaseException = None):
+        """
+        요청 결과 기록
+
+        Args:
+            response (optional): HTTP 응답 객체
+            body (optional): 변환된 응답 본문 (지연 변환 중이면 return_code 를 읽지 않음)
+            error (BaseException, optional): 요청 중 발생한 예외
+        """
+        self.elapsed = time.perf_counter() - self.started
+        if response is not None:
+            self.response = response
+            self.status_code = response.status_code
+        if isinstance(body, dict):
+            self.return_code = body.get('return_code')
+        elif isinstance(body, Mapping) and getattr(body, 'decoded', False):
+            self.return_code = body.get('return_code')
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"RequestEvent({self.api_id}, {self.endpoint}, status={self.status_code}, elapsed={self.elapsed:.4f})"
+
+
+class RequestHooks:
+    """요청 훅 목록"""
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Callable[[RequestEvent], Any]]] = {event: [] for event in HOOK_EVENTS}
+        self._lock = threading.Lock()
+
+    def add(self, event: str, func: Callable[[RequestEvent], Any]) -> Callable[[RequestEvent], Any]:
+        """
+        훅 등록
+
+        Args:
+            event (str): 'before_send', 'after_receive', 'on_error' 중 하나
+            func (Callable): RequestEvent 를 받는 함수
+
+        Returns:
+            Callable: 등록한 함수 (데코레이터로 사용 가능)
+
+        Raises:
+            ValueError: 알 수 없는 이벤트인 경우
+        """
+        if event not in self._hooks:
+            raise ValueError(f"알 수 없는 훅 이벤트입니다: {event} (사용 가능: {', '.join(HOOK_EVENTS)})")
+        with self._lock:
+            # 호출 중인 목록을 바꾸지 않도록 새 목록으로 교체
+            self._hooks[event] = self._hooks[event] + [func]
+        return func
+
+    def remove(self, event: str, func: Callable[[RequestEvent], Any]):
+        """
+        훅 등록 해제
+
+        Args:
+            event (str): 이벤트 종류
+            func (Callable): 등록한 함수
+        """
+        with self._lock:
+            self._hooks[event] = [hook for hook in self._hooks.get(event, []) if hook is not func]
+
+    def emit(self, event: str, request: RequestEvent):
+        """
+        등록한 훅 호출 (훅에서 발생한 예외는 기록만 하고 요청에는 영향을 주지 않음)
+
+        Args:
+            event (str): 이벤트 종류
+            request (RequestEvent): 요청 이벤트
+        """
+        for hook in self._hooks[event]:
+            try:
+                hook(request)
+            except Exception:
+                logger.exception("%s 훅 실행 중 오류 발생", event)
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
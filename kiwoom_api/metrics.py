@@ -0,0 +1,352 @@
+"""
+키움증권 API 요청 지표 모듈
+
+요청 훅(kiwoom_api.hooks)으로 TR 별 지연 시간 히스토그램, 송수신 바이트, 연속조회 깊이,
+호출 속도 제한 대기 시간, 오류 코드를 수집하고 Prometheus 텍스트 형식으로 내보냅니다.
+실시간시세 클라이언트(kiwoom_api.realtime)의 재연결 공백 시간도 함께 기록합니다.
+
+    metrics = MetricsCollector()
+    client = KiwoomClient(appkey, secretkey, metrics=metrics)
+    server = metrics.serve(9464)    # http://127.0.0.1:9464/metrics
+    print(metrics.top(5))           # 누적 지연 시간이 큰 TR
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .hooks import AFTER_RECEIVE, ON_ERROR, RequestEvent, RequestHooks
+
+# 지연 시간 히스토그램 구간 상한(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 연속조회 페이지 수 히스토그램 구간 상한
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# 실시간시세 재연결 공백 시간 히스토그램 구간 상한(초)
+GAP_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+# Prometheus 지표 이름 접두어
+PREFIX = 'kiwoom'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    """누적 구간 히스토그램"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """값 기록"""
+        index = bisect.bisect_left(self.bounds, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """구간 상한별 누적 개수 (Prometheus le 레이블 순서)"""
+        total, result = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        구간 상한으로 근사한 분위수
+
+        Args:
+            q (float): 0 ~ 1 사이 분위
+
+        Returns:
+            float: 분위수 근사값 (마지막 구간을 넘으면 inf)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')
+
+
+class _TRMetrics:
+    """TR 하나의 지표"""
+
+    __slots__ = ('endpoint', 'latency', 'limiter_wait', 'pages', 'requests', 'bytes_in', 'bytes_out')
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.limiter_wait = Histogram(LATENCY_BUCKETS)
+        self.pages = Histogram(PAGE_BUCKETS)
+        self.requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+class MetricsCollector:
+    """TR 별 요청 지표 수집기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._trs: Dict[str, _TRMetrics] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._gaps = Histogram(GAP_BUCKETS)
+
+    def attach(self, hooks: RequestHooks) -> 'MetricsCollector':
+        """
+        요청 훅에 수집기 등록
+
+        Args:
+            hooks (RequestHooks): 클라이언트 또는 APIBase 의 요청 훅
+
+        Returns:
+            MetricsCollector: self
+        """
+        hooks.add(AFTER_RECEIVE, self.observe)
+        hooks.add(ON_ERROR, self.observe)
+        return self
+
+    def _tr(self, api_id: str, endpoint: str = '') -> _TRMetrics:
+        """TR 지표 조회 (self._lock 잠금 상태에서 호출)"""
+        tr = self._trs.get(api_id)
+        if tr is None:
+            tr = self._trs[api_id] = _TRMetrics(endpoint)
+        return tr
+
+    def observe(self, event: RequestEvent):
+        """
+        요청 결과 기록 (after_receive, on_error 훅)
+
+        Args:
+            event (RequestEvent): 완료된 요청 이벤트
+        """
+        api_id = event.api_id or 'unknown'
+        bytes_in, bytes_out, error_code = event.bytes_in, event.bytes_out, event.error_code
+        with self._lock:
+            tr = self._tr(api_id, event.endpoint)
+            tr.requests += 1
+            tr.latency.observe(event.elapsed)
+            tr.limiter_wait.observe(event.limiter_wait)
+            tr.bytes_in += bytes_in
+            tr.bytes_out += bytes_out
+            if error_code is not None:
+                key = (api_id, error_code)
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def observe_pages(self, api_id: str, pages: int, endpoint: str = ''):
+        """
+        연속조회 한 번에 요청한 페이지 수 기록
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            pages (int): 페이지 수
+            endpoint (str, optional): API 엔드포인트 경로
+        """
+        with self._lock:
+            self._tr(api_id, endpoint).pages.observe(pages)
+
+    def observe_gap(self, seconds: float):
+        """
+        실시간시세 재연결 공백 시간 기록 (연결이 끊긴 시점부터 다시 등록을 마칠 때까지)
+
+        Args:
+            seconds (float): 공백 시간(초)
+        """
+        with self._lock:
+            self._gaps.observe(seconds)
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        누적 지연 시간이 큰 TR 순으로 요약
+
+        Args:
+            n (int, optional): 반환할 TR 수. 기본값은 10
+
+        Returns:
+            List[Dict[str, Any]]: api_id, endpoint, requests, total_time, p50, p99, limiter_wait, errors
+        """
+        return sorted(self.snapshot().values(), key=lambda tr: tr['total_time'], reverse=True)[:n]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        TR 별 지표 요약 조회
+
+        Returns:
+            Dict[str, Dict[str, Any]]: api_id 별 요약 (p50, p99 는 히스토그램 구간 상한 근사값)
+        """
+        with self._lock:
+            errors: Dict[str, Dict[str, int]] = {}
+            for (api_id, code), count in self._errors.items():
+                errors.setdefault(api_id, {})[code] = count
+            return {
+                api_id: {
+                    'api_id': api_id,
+                    'endpoint': tr.endpoint,
+                    'requests': tr.requests,
+                    'total_time': tr.latency.sum,
+                    'p50': tr.latency.quantile(0.5),
+                    'p99': tr.latency.quantile(0.99),
+                    'limiter_wait': tr.limiter_wait.sum,
+                    'bytes_in': tr.bytes_in,
+                    'bytes_out': tr.bytes_out,
+                    'pages': tr.pages.count and tr.pages.sum / tr.pages.count,
+                    'errors': errors.get(api_id, {}),
+                }
+                for api_id, tr in self._trs.items()
+            }
+
+    def reset(self):
+        """수집한 지표 초기화"""
+        with self._lock:
+            self._trs.clear()
+            self._errors.clear()
+            self._gaps = Histogram(GAP_BUCKETS)
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식으로 지표 출력
+
+        Returns:
+            str: 텍스트 형식 지표
+        """
+        lines = []
+        with self._lock:
+            trs = sorted(self._trs.items())
+            _histogram(lines, 'request_duration_seconds', 'TR 요청 지연 시간', trs, 'latency')
+            _histogram(lines, 'ratelimit_wait_seconds', '호출 속도 제한 대기 시간', trs, 'limiter_wait')
+            _histogram(lines, 'pagination_pages', '연속조회 한 번에 요청한 페이지 수', trs, 'pages')
+            _counter(lines, 'response_bytes_total', '응답 본문 크기',
+                     [(_labels(api_id, tr.endpoint), tr.bytes_in) for api_id, tr in trs])
+            _counter(lines, 'request_bytes_total', '요청 본문 크기',
+                     [(_labels(api_id, tr.endpoint), tr.bytes_out) for api_id, tr in trs])
+            _counter(lines, 'errors_total', '오류 코드별 요청 수',
+                     [(_labels(api_id, code=code), count) for (api_id, code), count in sorted(self._errors.items())])
+            if self._gaps.count:
+                name = f'{PREFIX}_realtime_gap_seconds'
+                lines.append(f'# HELP {name} 실시간시세 재연결 공백 시간')
+                lines.append(f'# TYPE {name} histogram')
+                for bound, total in self._gaps.cumulative():
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {total}')
+                lines.append(f'{name}_bucket{{le="+Inf"}} {self._gaps.count}')
+                lines.append(f'{name}_sum {self._gaps.sum}')
+                lines.append(f'{name}_count {self._gaps.count}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1') -> 'MetricsServer':
+        """
+        지표 HTTP 서버 시작 (GET /metrics)
+
+        Args:
+            port (int, optional): 포트. 기본값은 9464 (0 이면 빈 포트 자동 선택)
+            host (str, optional): 바인딩 주소. 기본값은 '127.0.0.1'
+
+        Returns:
+            MetricsServer: 실행 중인 서버
+        """
+        return MetricsServer(self, port, host).start()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(api_id: str, endpoint: str = None, **extra: str) -> str:
+    labels = [('api_id', api_id)]
+    if endpoint:
+        labels.append(('endpoint', endpoint))
+    labels.extend(extra.items())
+    return ','.join(f'{key}="{_escape(value)}"' for key, value in labels)
+
+
+def _counter(lines: List[str], name: str, help_text: str, samples: List[Tuple[str, float]]):
+    name = f'{PREFIX}_{name}'
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} counter')
+    for labels, value in samples:
+        lines.append(f'{name}{{{labels}}} {value}')
+
+
+def _histogram(lines: List[str], name: str, help_text: str, trs: List[Tuple[str, _TRMetrics]], attr: str):
+    name = f'{PREFIX}_{name}'
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} histogram')
+    for api_id, tr in trs:
+        histogram = getattr(tr, attr)
+        if not histogram.count:
+            continue
+        labels = _labels(api_id, tr.endpoint)
+        for bound, total in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {total}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+        lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+
+
+class MetricsServer:
+    """지표를 텍스트로 제공하는 로컬 HTTP 서버 (백그라운드 스레드)"""
+
+    def __init__(self, collector: MetricsCollector, port: int = 9464, host: str = '127.0.0.1'):
+        """
+        지표 서버 초기화
+
+        Args:
+            collector (MetricsCollector): 지표 수집기
+            port (int, optional): 포트. 기본값은 9464 (0 이면 빈 포트 자동 선택)
+            host (str, optional): 바인딩 주소. 기본값은 '127.0.0.1'
+        """
+        self.collector = collector
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'MetricsServer':
+        """서버 시작"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        collector = self.collector
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = collector.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='kiwoom-metrics', daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def url(self) -> str:
+        """지표 URL"""
+        return f'http://{self.host}:{self.port}/metrics'
+
+    def stop(self):
+        """서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
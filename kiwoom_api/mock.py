@@ -0,0 +1,391 @@
+"""
+키움증권 API 로컬 모의 서버
+
+실제 api.kiwoom.com 대신 사용할 수 있는 로컬 서버입니다.
+/oauth2/token, /oauth2/revoke, /api/dostk/* REST 엔드포인트와 실시간시세 WebSocket 을 제공하며,
+응답 지연, 초당 호출 한도, 응답 행 수, 연속조회 페이지 수, 실시간 프레임 전송 속도를 설정할 수 있습니다.
+REST 응답 본문은 TR 별 필드 스키마(kiwoom_api.schema)로 만듭니다.
+
+    with MockKiwoomServer(latency=0.005, rate=20) as server:
+        client = KiwoomClient('appkey', 'secretkey', host=server.url)
+        realtime = KiwoomRealtimeClient(client.auth.token, 'appkey', 'secretkey',
+                                        websocket_url=server.websocket_url)
+"""
+
+import asyncio
+import itertools
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .auth import KST
+from .codec import get_codec
+from .ratelimit import TokenBucket
+from .rows import INT, FLOAT
+from .schema import TR_SCHEMAS
+
+# 실시간 프레임에 담는 필드 (FID: 값)
+REALTIME_VALUES = {
+    '20': '090000', '10': '+71000', '11': '+500', '12': '+0.71', '27': '+71100', '28': '+71000',
+    '15': '+10', '13': '1234567', '14': '87654', '16': '+70500', '17': '+71500', '18': '-70000',
+    '25': '2', '228': '105.32', '290': '2', '9081': '1',
+}
+
+# 호출 한도 초과 응답
+RATE_LIMIT_BODY = {'return_code': 5, 'return_msg': '허용된 요청 개수를 초과하였습니다[1700:허용된 요청 개수를 초과하였습니다]'}
+
+
+def _sample_value(field: str, kind: str, index: int) -> str:
+    """스키마 종류에 맞는 예시 값"""
+    if kind == INT:
+        return f'{"+-"[index % 2]}{71000 + index * 10}'
+    if kind == FLOAT:
+        return f'{"+-"[index % 2]}{(index % 300) / 100:.2f}'
+    if field.endswith('_dt') or field in ('dt', 'date'):
+        return (datetime(2024, 1, 1) + timedelta(days=index)).strftime('%Y%m%d')
+    return f'{field}{index}'
+
+
+def sample_body(api_id: str, rows: int = 20) -> Dict[str, Any]:
+    """
+    TR 스키마로 예시 응답 본문 생성
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        rows (int, optional): 목록 필드의 행 수. 기본값은 20
+
+    Returns:
+        Dict[str, Any]: 응답 본문 (스키마에 없는 TR 은 return_code 와 return_msg 만 포함)
+    """
+    schema = TR_SCHEMAS.get(api_id, {})
+    body = {field: _sample_value(field, kind, 0) for field, kind in schema.get('fields', {}).items()}
+    for list_field, row_schema in schema.get('lists', {}).items():
+        body[list_field] = [{field: _sample_value(field, kind, index) for field, kind in row_schema.items()}
+                            for index in range(rows)]
+    body['return_code'] = 0
+    body['return_msg'] = '정상적으로 처리되었습니다'
+    return body
+
+
+class MockKiwoomServer:
+    """키움증권 REST/WebSocket 모의 서버 (백그라운드 스레드에서 실행)"""
+
+    def __init__(self,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 rate: Optional[float] = None,
+                 rows: int = 20,
+                 pages: int = 1,
+                 tick_rate: float = 1000.0,
+                 tick_batch: int = 1,
+                 stamp: bool = False,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 websocket_port: int = 0,
+                 websocket: bool = True):
+        """
+        모의 서버 초기화
+
+        Args:
+            latency (float, optional): REST 응답 지연 시간(초). 기본값은 0.0
+            jitter (float, optional): 응답 지연에 더할 무작위 시간 상한(초). 기본값은 0.0
+            rate (float, optional): 초당 REST 호출 한도 (초과하면 429). 기본값은 None (제한 없음)
+            rows (int, optional): 목록 필드의 행 수 (응답 크기). 기본값은 20
+            pages (int, optional): 연속조회 페이지 수. 기본값은 1
+            tick_rate (float, optional): 연결당 초당 실시간 프레임 수. 기본값은 1000.0
+            tick_batch (int, optional): 실시간 프레임 하나에 담는 종목 수. 기본값은 1
+            stamp (bool, optional): 실시간 데이터마다 전송 시각(time.perf_counter)을 'stamp' 로 포함. 기본값은 False
+            host (str, optional): 바인딩 주소. 기본값은 '127.0.0.1'
+            port (int, optional): REST 포트. 기본값은 0 (빈 포트 자동 선택)
+            websocket_port (int, optional): WebSocket 포트. 기본값은 0 (빈 포트 자동 선택)
+            websocket (bool, optional): WebSocket 서버 실행 여부. 기본값은 True
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.rows = rows
+        self.pages = pages
+        self.tick_rate = tick_rate
+        self.tick_batch = tick_batch
+        self.stamp = stamp
+        self.host = host
+        self.port = port
+        self.websocket_port = websocket_port
+        self.websocket = websocket
+
+        self.codec = get_codec()
+        self.tokens: Set[str] = set()
+        self._token_seq = itertools.count(1)
+        self._bucket = TokenBucket(rate) if rate else None
+        self._bodies: Dict[Tuple[str, int], bytes] = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'throttled': 0, 'unauthorized': 0, 'tokens': 0,
+                       'connections': 0, 'frames': 0}
+
+        self._http: Optional[ThreadingHTTPServer] = None
+        self._http_thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_server = None
+        self._connections: Set[Any] = set()
+
+    @property
+    def url(self) -> str:
+        """REST 호스트 URL (KiwoomClient 의 host 인자로 사용)"""
+        return f'http://{self.host}:{self.port}'
+
+    @property
+    def websocket_url(self) -> str:
+        """실시간시세 WebSocket URL (KiwoomRealtimeClient 의 websocket_url 인자로 사용)"""
+        return f'ws://{self.host}:{self.websocket_port}/api/dostk/websocket'
+
+    def start(self) -> 'MockKiwoomServer':
+        """서버 시작"""
+        self._http = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._http.daemon_threads = True
+        self.port = self._http.server_address[1]
+        self._http_thread = threading.Thread(target=self._http.serve_forever, name='kiwoom-mock-http', daemon=True)
+        self._http_thread.start()
+
+        if self.websocket:
+            ready = threading.Event()
+            self._ws_thread = threading.Thread(target=self._run_websocket, args=(ready,),
+                                               name='kiwoom-mock-ws', daemon=True)
+            self._ws_thread.start()
+            ready.wait()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._ws_thread.join(timeout=5)
+            self._loop = None
+
+    def __enter__(self) -> 'MockKiwoomServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        서버 통계 조회
+
+        Returns:
+            Dict[str, int]: requests, throttled, unauthorized, tokens, connections, frames
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self._stats[key] += n
+
+    def expire_tokens(self):
+        """발급한 토큰을 모두 무효화 (이후 REST 요청은 401)"""
+        with self._lock:
+            self.tokens.clear()
+
+    def drop_connections(self):
+        """WebSocket 연결을 모두 끊음 (재연결 시험용)"""
+        if self._loop is not None:
+            for connection in list(self._connections):
+                asyncio.run_coroutine_threadsafe(connection.close(), self._loop)
+
+    # REST
+
+    def issue_token(self) -> Dict[str, Any]:
+        """접근 토큰 발급 응답 (au10001)"""
+        token = f'mock-token-{next(self._token_seq)}'
+        with self._lock:
+            self.tokens.add(token)
+            self._stats['tokens'] += 1
+        expires = datetime.now(KST) + timedelta(days=1)
+        return {'expires_dt': expires.strftime('%Y%m%d%H%M%S'), 'token_type': 'bearer', 'token': token,
+                'return_code': 0, 'return_msg': '정상적으로 처리되었습니다'}
+
+    def _body(self, api_id: str) -> bytes:
+        """TR 응답 본문 (TR 별로 한 번만 생성)"""
+        key = (api_id, self.rows)
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = self.codec.dumps(sample_body(api_id, self.rows)).encode()
+        return body
+
+    def _throttled(self) -> bool:
+        """초당 호출 한도 확인"""
+        if self._bucket is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if self._bucket.wait_time(now) > 0:
+                self._stats['throttled'] += 1
+                return True
+            self._bucket.take(now)
+            return False
+
+    def handle(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        REST 요청 처리
+
+        Args:
+            path (str): 요청 경로
+            headers (Dict[str, str]): 요청 헤더 (소문자 키)
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: (상태 코드, 응답 헤더, 응답 본문)
+        """
+        self._count('requests')
+        if path == '/oauth2/token':
+            return 200, {'api-id': 'au10001'}, self.codec.dumps(self.issue_token()).encode()
+        if path == '/oauth2/revoke':
+            return 200, {'api-id': 'au10002'}, self.codec.dumps({'return_code': 0, 'return_msg': ''}).encode()
+        if not path.startswith('/api/dostk/'):
+            return 404, {}, b''
+
+        token = headers.get('authorization', '')[len('Bearer '):]
+        if token not in self.tokens:
+            self._count('unauthorized')
+            return 401, {}, self.codec.dumps({'return_code': 3, 'return_msg': '접근토큰이 유효하지 않습니다'}).encode()
+        if self._throttled():
+            return 429, {}, self.codec.dumps(RATE_LIMIT_BODY).encode()
+
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        api_id = headers.get('api-id', '')
+        page = int(headers.get('next-key') or 0) if headers.get('cont-yn') == 'Y' else 0
+        response_headers = {
+            'api-id': api_id,
+            'cont-yn': 'Y' if page + 1 < self.pages else 'N',
+            'next-key': str(page + 1) if page + 1 < self.pages else '',
+        }
+        return 200, response_headers, self._body(api_id)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문을 나눠 보낼 때 Nagle 알고리즘으로 응답이 지연되지 않도록 함
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                headers = {key.lower(): value for key, value in self.headers.items()}
+                status, response_headers, body = server.handle(self.path.split('?', 1)[0], headers)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json;charset=UTF-8')
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in response_headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    # WebSocket
+
+    def _run_websocket(self, ready: threading.Event):
+        import websockets
+
+        async def serve():
+            return await websockets.serve(self._session, self.host, self.websocket_port)
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._ws_server = self._loop.run_until_complete(serve())
+            self.websocket_port = next(iter(self._ws_server.sockets)).getsockname()[1]
+        finally:
+            ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._ws_server.close()
+            self._loop.run_until_complete(self._ws_server.wait_closed())
+            self._loop.close()
+
+    async def _session(self, connection, path: str = None):
+        """WebSocket 연결 하나 처리 (LOGIN, REG, REMOVE, PING)"""
+        self._connections.add(connection)
+        self._count('connections')
+        subscriptions: Dict[str, Dict[Tuple[str, str], None]] = {}
+        ticker = None
+        try:
+            async for raw in connection:
+                message = self.codec.loads(raw)
+                trnm = message.get('trnm')
+                if trnm == 'LOGIN':
+                    ok = message.get('token') in self.tokens
+                    await connection.send(self.codec.dumps(
+                        {'trnm': 'LOGIN', 'return_code': 0 if ok else 1,
+                         'return_msg': '' if ok else '접근토큰이 유효하지 않습니다'}))
+                    if not ok:
+                        break
+                elif trnm == 'PING':
+                    await connection.send(raw)
+                elif trnm in ('REG', 'REMOVE'):
+                    group = subscriptions.setdefault(message.get('grp_no', '1'), {})
+                    if trnm == 'REG' and message.get('refresh') == '0':
+                        group.clear()
+                    for entry in message.get('data', []):
+                        for item in entry.get('item', []):
+                            for realtime_type in entry.get('type', []):
+                                if trnm == 'REG':
+                                    group[(realtime_type, item)] = None
+                                else:
+                                    group.pop((realtime_type, item), None)
+                    await connection.send(self.codec.dumps({'trnm': trnm, 'return_code': 0, 'return_msg': ''}))
+                    if ticker is None:
+                        ticker = asyncio.ensure_future(self._stream(connection, subscriptions))
+        except Exception:
+            pass
+        finally:
+            if ticker is not None:
+                ticker.cancel()
+            self._connections.discard(connection)
+
+    async def _stream(self, connection, subscriptions: Dict[str, Dict[Tuple[str, str], None]]):
+        """등록된 (실시간 항목, 종목)을 돌아가며 REAL 프레임 전송"""
+        interval = 1.0 / self.tick_rate if self.tick_rate else 0.0
+        next_at = time.monotonic()
+        cursor = 0
+        while True:
+            keys: List[Tuple[str, str]] = [key for group in subscriptions.values() for key in group]
+            if not keys:
+                await asyncio.sleep(0.01)
+                continue
+            data = []
+            for _ in range(self.tick_batch):
+                realtime_type, item = keys[cursor % len(keys)]
+                cursor += 1
+                entry = {'type': realtime_type, 'name': realtime_type, 'item': item, 'values': REALTIME_VALUES}
+                if self.stamp:
+                    entry['stamp'] = time.perf_counter()
+                data.append(entry)
+            await connection.send(self.codec.dumps({'trnm': 'REAL', 'data': data}))
+            self._count('frames')
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif cursor % 100 == 0:
+                # 전송 속도를 따라가지 못하면 다른 연결에도 차례를 줌
+                await asyncio.sleep(0)
+                next_at = time.monotonic()
@@ -0,0 +1,328 @@
+"""
+키움증권 HTTP 연결 풀 모듈
+
+모든 REST 요청이 TCP/TLS 연결을 재사용할 수 있도록 keep-alive 세션을 공유합니다.
+"""
+
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .codec import get_codec
+
+
+def _counting_pool_class(base: type, pool: 'ConnectionPool') -> type:
+    """연결을 꺼낼 때마다 pool 의 재사용/신규 연결 수를 세는 urllib3 호스트 연결 풀 클래스 생성"""
+
+    class CountingConnectionPool(base):
+        def _get_conn(self, timeout=None):
+            conn = super()._get_conn(timeout)
+            # 소켓이 열려 있으면 재사용, 새로 만들었거나 끊겨서 닫힌 연결은 요청 시 새로 연결
+            pool._count('hits' if getattr(conn, 'sock', None) is not None else 'new_connections')
+            return conn
+
+    CountingConnectionPool.__name__ = f'Counting{base.__name__}'
+    return CountingConnectionPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """호스트 연결 풀을 통계를 세는 연결 풀로 바꾼 HTTPAdapter"""
+
+    def __init__(self, pool: 'ConnectionPool', **kwargs):
+        self._pool = pool
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(base, self._pool)
+            for scheme, base in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class ConnectionPool:
+    """keep-alive HTTP 연결 풀 클래스"""
+
+    def __init__(self,
+                 pool_size: int = 10,
+                 max_per_host: int = 10,
+                 keep_alive: bool = True,
+                 timeout: Optional[float] = 10.0):
+        """
+        연결 풀 초기화
+
+        Args:
+            pool_size (int, optional): 호스트별 연결 풀을 유지할 최대 호스트 수. 기본값은 10
+            max_per_host (int, optional): 호스트당 최대 동시 연결 수. 기본값은 10
+            keep_alive (bool, optional): 연결 재사용 여부. 기본값은 True
+            timeout (float, optional): 요청 타임아웃(초). 기본값은 10.0
+        """
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._requests = 0
+        self._hits = 0
+        self._new_connections = 0
+        self._waits = 0
+        self._closed = False
+
+        self._adapter = _CountingAdapter(self,
+                                         pool_connections=pool_size,
+                                         pool_maxsize=max_per_host,
+                                         pool_block=True)
+        self.session = requests.Session()
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def _count(self, key: str):
+        """연결 통계 증가 (urllib3 호스트 연결 풀에서 호출)"""
+        with self._lock:
+            setattr(self, f'_{key}', getattr(self, f'_{key}') + 1)
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 연결 제한 세마포어 반환"""
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        연결 풀을 통한 HTTP 요청
+
+        Args:
+            method (str): HTTP 메서드 (GET, POST 등)
+            url (str): 요청 URL
+            **kwargs: requests.Session.request 에 전달할 인자 (headers, params, json 등)
+
+        Returns:
+            requests.Response: 응답 객체
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 연결 풀입니다.")
+
+        host = urlsplit(url).netloc
+        slot = self._slot(host)
+        if not slot.acquire(blocking=False):
+            # 호스트당 연결 한도에 도달하면 빈 연결이 생길 때까지 대기
+            with self._lock:
+                self._waits += 1
+            slot.acquire()
+
+        kwargs.setdefault('timeout', self.timeout)
+        try:
+            response = self.session.request(method.upper(), url, **kwargs)
+        finally:
+            slot.release()
+
+        with self._lock:
+            self._requests += 1
+
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        연결 풀 통계 조회
+
+        Returns:
+            Dict[str, int]: 통계 정보
+                requests: 전체 요청 수
+                hits: 열려 있는 기존 연결을 재사용한 횟수
+                new_connections: 새로 연결한 횟수 (끊긴 연결을 다시 연결한 경우 포함)
+                waits: 호스트당 연결 한도로 대기한 요청 수
+                hosts: 연결 풀이 유지 중인 호스트 수
+        """
+        pools = self._adapter.poolmanager.pools
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'hits': self._hits,
+                'new_connections': self._new_connections,
+                'waits': self._waits,
+                'hosts': len(pools),
+            }
+
+    def close(self):
+        """연결 풀의 모든 연결 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncResponse:
+    """비동기 연결 풀 응답 객체 (requests.Response 와 같은 방식으로 사용)"""
+
+    def __init__(self, status_code: int, headers: Any, content: bytes, reason: str = '', url: str = ''):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.reason = reason
+        self.url = url
+
+    def json(self) -> Any:
+        """응답 본문을 JSON 으로 변환"""
+        return get_codec().loads(self.content)
+
+    def raise_for_status(self):
+        """HTTP 에러 상태 코드이면 예외 발생"""
+        if self.status_code >= 400:
+            raise AsyncHTTPError(self)
+
+
+class AsyncHTTPError(Exception):
+    """비동기 요청 HTTP 에러"""
+
+    def __init__(self, response: AsyncResponse):
+        super().__init__(f"{response.status_code} Error: {response.reason} for url: {response.url}")
+        self.response = response
+
+
+class AsyncConnectionPool:
+    """asyncio 용 keep-alive HTTP 연결 풀 클래스 (aiohttp 필요)"""
+
+    def __init__(self,
+                 pool_size: int = 100,
+                 max_per_host: int = 0,
+                 keep_alive: bool = True,
+                 keepalive_timeout: float = 15.0,
+                 timeout: Optional[float] = 10.0):
+        """
+        비동기 연결 풀 초기화
+
+        Args:
+            pool_size (int, optional): 전체 최대 동시 연결 수. 기본값은 100
+            max_per_host (int, optional): 호스트당 최대 동시 연결 수 (0 이면 무제한). 기본값은 0
+            keep_alive (bool, optional): 연결 재사용 여부. 기본값은 True
+            keepalive_timeout (float, optional): 유휴 연결 유지 시간(초). 기본값은 15.0
+            timeout (float, optional): 요청 타임아웃(초). 기본값은 10.0
+        """
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+        self._session = None
+        self._stats = {'requests': 0, 'hits': 0, 'new_connections': 0, 'waits': 0}
+        self._closed = False
+
+    def _create_session(self):
+        """aiohttp 세션 생성 (이벤트 루프 안에서 호출)"""
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("AsyncConnectionPool 을 사용하려면 aiohttp 가 필요합니다. 'pip install aiohttp' 로 설치하세요.")
+
+        stats = self._stats
+
+        async def on_reuse(session, context, params):
+            stats['hits'] += 1
+
+        async def on_create(session, context, params):
+            stats['new_connections'] += 1
+
+        async def on_queued(session, context, params):
+            stats['waits'] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_queued_start.append(on_queued)
+
+        connector = aiohttp.TCPConnector(limit=self.pool_size,
+                                         limit_per_host=self.max_per_host,
+                                         force_close=not self.keep_alive,
+                                         keepalive_timeout=self.keepalive_timeout if self.keep_alive else None)
+        return aiohttp.ClientSession(connector=connector,
+                                     timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                     trace_configs=[trace_config])
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """
+        연결 풀을 통한 비동기 HTTP 요청
+
+        Args:
+            method (str): HTTP 메서드 (GET, POST 등)
+            url (str): 요청 URL
+            **kwargs: aiohttp.ClientSession.request 에 전달할 인자 (headers, params, json 등)
+
+        Returns:
+            AsyncResponse: 응답 객체
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 연결 풀입니다.")
+        if self._session is None:
+            self._session = self._create_session()
+
+        async with self._session.request(method.upper(), url, **kwargs) as response:
+            content = await response.read()
+            self._stats['requests'] += 1
+            return AsyncResponse(response.status, response.headers, content,
+                                 reason=response.reason or '', url=str(response.url))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        연결 풀 통계 조회
+
+        Returns:
+            Dict[str, int]: 통계 정보 (requests, hits, new_connections, waits)
+        """
+        return dict(self._stats)
+
+    async def close(self):
+        """연결 풀의 모든 연결 종료"""
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+_default_pool: Optional[ConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ConnectionPool:
+    """
+    프로세스 전역 공유 연결 풀 반환
+
+    Returns:
+        ConnectionPool: 공유 연결 풀 (최초 호출시 생성)
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool._closed:
+            _default_pool = ConnectionPool()
+        return _default_pool
+
+
+def close_default_pool():
+    """공유 연결 풀 종료"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+            _default_pool = None
@@ -0,0 +1,238 @@
+"""
+키움증권 API 호출 속도 제한 모듈
+
+TR 유형(api_id 앞 두 글자)별 토큰 버킷으로 초당 호출 한도를 관리합니다.
+한도에 가까우면 HTTP 429 로 실패하는 대신 대기열에서 순서를 기다리며,
+주문 TR(kt*, kr*)은 우선순위 대기열로 차트·순위 조회보다 먼저 처리됩니다.
+"""
+
+import bisect
+import itertools
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .registry import ORDER_TYPES, is_order, quota_class
+
+# 앱키 전체에 적용되는 기본 초당 호출 한도
+DEFAULT_RATE = 5.0
+
+# 우선순위 대기열을 사용하는 TR 유형 (주문, 신용주문. registry.ORDER_TYPES 와 동일)
+PRIORITY_TYPES = ORDER_TYPES
+
+# 우선순위
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+class TokenBucket:
+    """토큰 버킷 클래스"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate (float): 초당 충전되는 토큰 수
+            capacity (float, optional): 버킷 최대 토큰 수 (순간 허용량). 기본값은 rate
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """
+        토큰 1개를 사용할 수 있을 때까지 남은 시간
+
+        Args:
+            now (float): 현재 시각 (time.monotonic)
+
+        Returns:
+            float: 대기 시간(초). 바로 사용 가능하면 0
+        """
+        self._refill(now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        """토큰 1개 사용"""
+        self._refill(now)
+        self.tokens -= 1.0
+
+
+class RateLimiter:
+    """TR 유형별 토큰 버킷 기반 호출 속도 제한 스케줄러"""
+
+    def __init__(self,
+                 rate: float = DEFAULT_RATE,
+                 type_rates: Optional[Dict[str, float]] = None,
+                 priority_types: Tuple[str, ...] = PRIORITY_TYPES):
+        """
+        호출 속도 제한 스케줄러 초기화
+
+        Args:
+            rate (float, optional): 앱키 전체 초당 호출 한도. 기본값은 DEFAULT_RATE
+            type_rates (Dict[str, float], optional): TR 유형(api_id 앞 두 글자) 또는 호출 한도 구분('query', 'order')별
+                초당 호출 한도. 지정한 유형은 전체 한도와 별도로 자체 한도를 추가로 적용받음
+            priority_types (Tuple[str, ...], optional): 명세에 없는 TR 중 우선순위 대기열을 사용하는 TR 유형.
+                명세에 있는 TR 은 등록 정보의 호출 한도 구분으로 판별. 기본값은 PRIORITY_TYPES (주문, 신용주문)
+        """
+        self.rate = rate
+        self.type_rates = dict(type_rates or {})
+        self.priority_types = tuple(priority_types)
+
+        self._bucket = TokenBucket(rate)
+        self._type_buckets = {api_type: TokenBucket(type_rate) for api_type, type_rate in self.type_rates.items()}
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._seq = itertools.count()
+        self._stats = {'acquired': 0, 'waited': 0, 'wait_time': 0.0}
+
+    def priority_of(self, api_id: str) -> int:
+        """
+        TR 우선순위 판별
+
+        Args:
+            api_id (str): API ID (TR 코드)
+
+        Returns:
+            int: PRIORITY_HIGH 또는 PRIORITY_NORMAL
+        """
+        return PRIORITY_HIGH if is_order(api_id, self.priority_types) else PRIORITY_NORMAL
+
+    def _try_acquire(self, entry: Tuple[int, int, str], now: float) -> float:
+        """
+        대기열 순서에 따라 토큰 획득 시도 (self._cond 잠금 상태에서 호출)
+
+        우선순위가 높은 대기자부터, 같은 우선순위는 도착 순서대로 처리합니다.
+        앞선 대기자가 자신의 TR 유형 한도 때문에 기다리는 중이면 다음 대기자가 먼저 진행할 수 있습니다.
+
+        Returns:
+            float: 0 이면 획득 성공, 아니면 다시 시도할 때까지의 대기 시간(초)
+        """
+        global_wait = self._bucket.wait_time(now)
+        for waiter in self._waiters:
+            type_bucket = self._type_buckets.get(waiter[2])
+            type_wait = type_bucket.wait_time(now) if type_bucket else 0.0
+            if waiter is entry:
+                wait = max(global_wait, type_wait)
+                if wait == 0.0:
+                    self._bucket.take(now)
+                    if type_bucket:
+                        type_bucket.take(now)
+                    self._waiters.remove(entry)
+                return wait
+            if type_wait == 0.0:
+                # 앞선 대기자가 먼저 토큰을 사용할 차례
+                return max(global_wait, 1.0 / self._bucket.rate)
+        raise RuntimeError("대기열에 없는 요청입니다.")
+
+    def _enqueue(self, api_id: str, priority: Optional[int]) -> Tuple[int, int, str]:
+        """대기열에 요청 추가 (self._cond 잠금 상태에서 호출)"""
+        if priority is None:
+            priority = self.priority_of(api_id)
+        api_type = api_id[:2].lower()
+        if api_type not in self._type_buckets:
+            api_type = quota_class(api_id)
+        entry = (priority, next(self._seq), api_type)
+        bisect.insort(self._waiters, entry)
+        return entry
+
+    def _record(self, waited: float):
+        """대기 통계 기록 (self._cond 잠금 상태에서 호출)"""
+        self._stats['acquired'] += 1
+        if waited > 0:
+            self._stats['waited'] += 1
+            self._stats['wait_time'] += waited
+
+    def acquire(self, api_id: str, priority: Optional[int] = None) -> float:
+        """
+        호출 허가 획득 (한도 초과시 차례가 올 때까지 대기)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            priority (int, optional): 우선순위. 기본값은 TR 유형에 따라 자동 결정
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        start = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(api_id, priority)
+            blocked = False
+            try:
+                while True:
+                    wait = self._try_acquire(entry, time.monotonic())
+                    if wait == 0.0:
+                        break
+                    blocked = True
+                    self._cond.wait(wait)
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                raise
+            finally:
+                self._cond.notify_all()
+            waited = time.monotonic() - start if blocked else 0.0
+            self._record(waited)
+        return waited
+
+    async def acquire_async(self, api_id: str, priority: Optional[int] = None) -> float:
+        """
+        호출 허가 비동기 획득 (한도 초과시 이벤트 루프를 막지 않고 대기)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            priority (int, optional): 우선순위. 기본값은 TR 유형에 따라 자동 결정
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        import asyncio
+
+        start = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(api_id, priority)
+        blocked = False
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_acquire(entry, time.monotonic())
+                    if wait == 0.0:
+                        self._cond.notify_all()
+                        waited = time.monotonic() - start if blocked else 0.0
+                        self._record(waited)
+                        return waited
+                blocked = True
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._cond:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                self._cond.notify_all()
+            raise
+
+    def stats(self) -> Dict[str, float]:
+        """
+        호출 속도 제한 통계 조회
+
+        Returns:
+            Dict[str, float]: 통계 정보
+                acquired: 허가된 호출 수
+                waited: 대기가 발생한 호출 수
+                wait_time: 누적 대기 시간(초)
+                queued: 현재 대기 중인 호출 수
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats['queued'] = len(self._waiters)
+            return stats
@@ -1,14 +1,288 @@
 """
 키움증권 실시간시세 WebSocket 클라이언트
+
+등록한 실시간 항목은 그룹번호별 등록 표(subscriptions)로 관리하며, 연결이 끊기면
+지터를 적용한 지수 백오프로 재연결한 뒤 로그인이 확인되면 등록 표를 묶음 REG 메시지로 다시 등록합니다.
+
+연결, 로그인, 재연결 같은 상태 변화는 logging 으로 남기고, 수신 루프는 로그 수준이 켜져 있지 않으면
+문자열을 만들지 않습니다. 송수신 프레임을 보려면 샘플링과 초당 한도를 적용하는 FrameLogger 를 지정합니다.
+코루틴 콜백은 크기가 제한된 대기열을 가진 소비자(kiwoom_api.consumer)로 감싸 수신 루프와 따로 실행합니다.
+
+    logging.getLogger('kiwoom_api.realtime.frames').setLevel(logging.DEBUG)
+    client = KiwoomRealtimeClient(frame_log=FrameLogger(sample=100, rate=5))
 """
 
 import os
-import json
+import time
+import logging
 import asyncio
 import websockets
-from typing import Dict, List, Callable, Any, Optional, Union
+from inspect import isawaitable
+from typing import Dict, Iterable, List, Callable, Any, Awaitable, Optional, Tuple, Union
+
+from .auth import KiwoomAuth, TokenStore, MOCK_HOST, REAL_HOST
+from .codec import Codec, get_codec
+from .consumer import DROP_OLDEST, AsyncConsumer, default_key
+from .metrics import MetricsCollector
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# REG 메시지 하나에 담는 최대 종목 수
+REG_CHUNK = 100
+
+# 그룹번호별 등록 표 (그룹번호 -> {(실시간 항목, 종목코드): None})
+Subscriptions = Dict[str, Dict[Tuple[str, str], None]]
+
+# 콜백 등록시 모든 실시간 항목 또는 모든 종목을 뜻하는 값
+WILDCARD = '*'
+
+Callback = Callable[[Dict[str, Any]], None]
+
+
+class DispatchTable:
+    """
+    (실시간 항목, 종목) 별 콜백 표
+
+    콜백은 실시간 항목과 종목(WILDCARD 가능)으로 등록하고, 수신할 때는 등록한 (실시간 항목, 종목)마다
+    호출할 콜백을 미리 모아 둔 평평한 딕셔너리 하나만 조회합니다. 표는 콜백이나 등록 종목이 바뀐 뒤
+    처음 조회할 때 다시 만들고, 표에 없는 (실시간 항목, 종목)은 처음 수신할 때 계산하여 추가합니다.
+    코루틴 콜백은 AsyncConsumer 로 감싸 등록합니다.
+    """
+
+    def __init__(self, keys: Callable[[], Iterable[Tuple[str, str]]] = tuple):
+        """
+        콜백 표 초기화
+
+        Args:
+            keys (Callable, optional): 등록한 (실시간 항목, 종목) 목록을 반환하는 함수. 기본값은 빈 목록
+        """
+        self.keys = keys
+        self.handlers: List[Tuple[str, str, Callback]] = []
+        self.consumers: List[AsyncConsumer] = []
+        self.table: Optional[Dict[Tuple[str, str], Tuple[Callback, ...]]] = None
+
+    def add(self, realtime_type: str, callback: Callback, item: str = WILDCARD):
+        """
+        콜백 등록
+
+        Args:
+            realtime_type (str): 실시간 항목 (TR 코드). WILDCARD 이면 모든 항목
+            callback (Callable): 콜백 함수 (인자로 실시간 데이터를 받음)
+            item (str, optional): 종목코드. 기본값은 WILDCARD (모든 종목)
+        """
+        if asyncio.iscoroutinefunction(callback):
+            self.add_consumer(realtime_type, callback, item)
+            return
+        self.handlers.append((realtime_type, item, callback))
+        self.table = None
+
+    def add_consumer(self,
+                     realtime_type: str,
+                     callback: Callable[[Dict[str, Any]], Any],
+                     item: str = WILDCARD,
+                     maxsize: int = 1000,
+                     policy: str = DROP_OLDEST,
+                     key: Callable[[Dict[str, Any]], Any] = default_key) -> AsyncConsumer:
+        """
+        크기가 제한된 대기열을 가진 소비자로 콜백 등록
+
+        Args:
+            realtime_type (str): 실시간 항목 (TR 코드). WILDCARD 이면 모든 항목
+            callback (Callable): 콜백 함수 또는 코루틴 함수
+            item (str, optional): 종목코드. 기본값은 WILDCARD (모든 종목)
+            maxsize (int, optional): 대기열 최대 크기. 기본값은 1000
+            policy (str, optional): 대기열이 가득 찼을 때의 처리 정책 (DROP_OLDEST, CONFLATE, BLOCK).
+                기본값은 DROP_OLDEST
+            key (Callable, optional): CONFLATE 정책에서 데이터를 합칠 키 함수. 기본값은 (실시간 항목, 종목)
+
+        Returns:
+            AsyncConsumer: 등록한 소비자 (stats() 로 대기열 통계 조회)
+        """
+        consumer = AsyncConsumer(callback, maxsize, policy, key)
+        self.consumers.append(consumer)
+        self.handlers.append((realtime_type, item, consumer))
+        self.table = None
+        return consumer
+
+    def remove(self, realtime_type: str, callback: Callback, item: str = WILDCARD) -> bool:
+        """
+        콜백 해제
+
+        Args:
+            realtime_type (str): 등록한 실시간 항목
+            callback (Callable): 등록한 콜백 함수
+            item (str, optional): 등록한 종목코드. 기본값은 WILDCARD
+
+        Returns:
+            bool: 해제한 콜백이 있으면 True
+        """
+        for handler in self.handlers:
+            handler_type, handler_item, registered = handler
+            if handler_type != realtime_type or handler_item != item:
+                continue
+            if registered == callback or (isinstance(registered, AsyncConsumer) and registered.callback == callback):
+                self.handlers.remove(handler)
+                if isinstance(registered, AsyncConsumer):
+                    self.consumers.remove(registered)
+                    registered.cancel()
+                self.table = None
+                return True
+        return False
+
+    async def close(self):
+        """모든 소비자의 작업 태스크 종료"""
+        for consumer in self.consumers:
+            await consumer.close()
+
+    def invalidate(self):
+        """등록 종목이 바뀌면 다음 조회에서 표를 다시 만들도록 표시"""
+        self.table = None
+
+    def resolve(self, realtime_type: str, item: str) -> Tuple[Callback, ...]:
+        """(실시간 항목, 종목)에 해당하는 콜백 (등록한 순서)"""
+        return tuple(callback for handler_type, handler_item, callback in self.handlers
+                     if handler_type in (realtime_type, WILDCARD) and handler_item in (item, WILDCARD))
+
+    def compile(self) -> Dict[Tuple[str, str], Tuple[Callback, ...]]:
+        """등록한 (실시간 항목, 종목)별 콜백 표 생성"""
+        self.table = {key: self.resolve(*key) for key in self.keys()}
+        return self.table
+
+    def lookup(self, realtime_type: str, item: str) -> Tuple[Callback, ...]:
+        """
+        (실시간 항목, 종목)에 해당하는 콜백 조회
+
+        Args:
+            realtime_type (str): 실시간 항목 (TR 코드)
+            item (str): 종목코드
+
+        Returns:
+            Tuple[Callable, ...]: 호출할 콜백
+        """
+        table = self.table if self.table is not None else self.compile()
+        key = (realtime_type, item)
+        callbacks = table.get(key)
+        if callbacks is None:
+            callbacks = table[key] = self.resolve(realtime_type, item)
+        return callbacks
+
+    def dispatch(self, message: Dict[str, Any]) -> Optional[List[Awaitable[None]]]:
+        """
+        REAL 메시지의 실시간 데이터마다 해당 콜백 호출
+
+        Args:
+            message (Dict[str, Any]): 수신된 실시간 데이터
+
+        Returns:
+            List[Awaitable]: 대기열이 가득 찬 BLOCK 소비자의 대기 코루틴 (없으면 None)
+        """
+        table = self.table if self.table is not None else self.compile()
+        blocked = None
+        for item_data in message.get('data', ()):
+            key = (item_data.get('type'), item_data.get('item'))
+            callbacks = table.get(key)
+            if callbacks is None:
+                callbacks = table[key] = self.resolve(*key)
+            for callback in callbacks:
+                result = callback(item_data)
+                if result is not None and isawaitable(result):
+                    if blocked is None:
+                        blocked = []
+                    blocked.append(result)
+        return blocked
+
+
+class FrameLogger:
+    """샘플링과 초당 한도를 적용한 송수신 프레임 디버그 로거"""
+
+    def __init__(self,
+                 frame_logger: Optional[logging.Logger] = None,
+                 sample: int = 100,
+                 rate: float = 10.0,
+                 max_length: int = 500,
+                 level: int = logging.DEBUG):
+        """
+        프레임 로거 초기화
+
+        Args:
+            frame_logger (logging.Logger, optional): 프레임을 기록할 로거. 기본값은 None ('kiwoom_api.realtime.frames')
+            sample (int, optional): 프레임 sample 개마다 하나씩 기록. 기본값은 100
+            rate (float, optional): 초당 최대 기록 수. 기본값은 10.0
+            max_length (int, optional): 기록할 프레임 최대 길이(글자 수). 기본값은 500
+            level (int, optional): 기록 수준. 기본값은 logging.DEBUG
+        """
+        self.logger = frame_logger or logging.getLogger(f'{__name__}.frames')
+        self.sample = max(1, sample)
+        self.rate = rate
+        self.max_length = max_length
+        self.level = level
+        self.count = 0
+        self.suppressed = 0
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    def log(self, direction: str, frame: Union[str, bytes]):
+        """
+        프레임 기록 (샘플 차례가 아니거나 로그 수준이 꺼져 있거나 초당 한도를 넘으면 바로 반환)
+
+        Args:
+            direction (str): 'send' 또는 'recv'
+            frame (str | bytes): 직렬화된 프레임
+        """
+        self.count += 1
+        if self.count % self.sample or not self.logger.isEnabledFor(self.level):
+            return
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            self.suppressed += 1
+            return
+        self._tokens -= 1
+        if isinstance(frame, bytes):
+            frame = frame.decode('utf-8', 'replace')
+        self.logger.log(self.level, '%s #%d (한도 초과 생략 %d): %s',
+                        direction, self.count, self.suppressed, frame[:self.max_length])
+
+
+def build_reg_frames(subscriptions: Subscriptions, chunk: int = REG_CHUNK) -> List[Dict[str, Any]]:
+    """
+    등록 표를 다시 등록하는 최소 개수의 REG 메시지 생성
 
-from .auth import KiwoomAuth, MOCK_HOST, REAL_HOST
+    같은 실시간 항목 조합을 등록한 종목끼리 묶어 data 항목 하나로 만들고,
+    메시지 하나에 종목이 chunk 개를 넘지 않도록 data 항목을 나누어 담습니다.
+
+    Args:
+        subscriptions (Subscriptions): 그룹번호별 등록 표
+        chunk (int, optional): REG 메시지 하나에 담는 최대 종목 수. 기본값은 REG_CHUNK
+
+    Returns:
+        List[Dict[str, Any]]: REG 메시지 목록 (기존등록유지여부 '1')
+    """
+    frames = []
+    for group_no, keys in subscriptions.items():
+        types_of: Dict[str, List[str]] = {}
+        for realtime_type, item in keys:
+            types_of.setdefault(item, []).append(realtime_type)
+        batches: Dict[Tuple[str, ...], List[str]] = {}
+        for item, types in types_of.items():
+            batches.setdefault(tuple(sorted(types)), []).append(item)
+
+        data, count = [], 0
+        for types, items in batches.items():
+            start = 0
+            while start < len(items):
+                take = items[start:start + chunk - count]
+                data.append({'item': take, 'type': list(types)})
+                count += len(take)
+                start += len(take)
+                if count >= chunk:
+                    frames.append({'trnm': 'REG', 'grp_no': group_no, 'refresh': '1', 'data': data})
+                    data, count = [], 0
+        if data:
+            frames.append({'trnm': 'REG', 'grp_no': group_no, 'refresh': '1', 'data': data})
+    return frames
 
 
 class KiwoomRealtimeClient:
@@ -20,7 +294,16 @@ class KiwoomRealtimeClient:
                  secretkey: str = None, 
                  is_mock: bool = False,
                  auto_reconnect: bool = True,
-                 ping_interval: int = 30):
+                 ping_interval: int = 30,
+                 token_store: Optional[TokenStore] = None,
+                 codec: Union[Codec, str, None] = None,
+                 websocket_url: Optional[str] = None,
+                 connector: Optional[Callable[[str], Awaitable[Any]]] = None,
+                 reconnect_policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[MetricsCollector] = None,
+                 dispatcher: Optional[Callable[[Dict[str, Any]], Optional[List[Awaitable[None]]]]] = None,
+                 frame_log: Optional[FrameLogger] = None,
+                 auth: Optional[KiwoomAuth] = None):
         """
         실시간시세 WebSocket 클라이언트 초기화
         
@@ -31,28 +314,62 @@ class KiwoomRealtimeClient:
             is_mock (bool, optional): 모의투자 여부. 기본값은 False
             auto_reconnect (bool, optional): 연결 끊김시 자동 재연결 여부. 기본값은 True
             ping_interval (int, optional): PING 메시지 전송 간격(초). 기본값은 30
+            token_store (TokenStore, optional): 여러 프로세스가 토큰을 공유할 저장소. 기본값은 None
+            codec (Codec | str, optional): 프레임 JSON 코덱 ('json', 'orjson'). 기본값은 None (orjson 이 있으면 orjson)
+            websocket_url (str, optional): WebSocket 서버 URL (모의 서버 등). 기본값은 None (is_mock 에 따라 결정)
+            connector (Callable, optional): URL 을 받아 WebSocket 연결을 반환하는 코루틴 함수 (기록/재생 등).
+                기본값은 None (websockets.connect)
+            reconnect_policy (RetryPolicy, optional): 재연결 백오프 정책. 기본값은 None
+                (첫 재연결은 바로 시도하고 이후 0.5초부터 최대 30초까지 지수 백오프, 횟수 제한 없음).
+                max_attempts 가 0 보다 크면 그 횟수만큼 실패했을 때 재연결을 멈춤
+            metrics (MetricsCollector, optional): 재연결 공백 시간을 기록할 지표 수집기. 기본값은 None
+            dispatcher (Callable, optional): REAL 메시지를 받아 처리할 함수 (여러 연결을 하나로 합칠 때 사용).
+                기다려야 할 코루틴 목록을 반환하면 수신 루프가 await. 기본값은 None (add_callback 으로 등록한 콜백 호출)
+            frame_log (FrameLogger, optional): 송수신 프레임 디버그 로거. 기본값은 None (프레임을 기록하지 않음)
+            auth (KiwoomAuth, optional): 토큰을 발급할 인증 객체 (여러 연결이 토큰을 함께 쓸 때 지정).
+                기본값은 None (appkey, secretkey, token_store 로 생성)
         """
-        self.auth = KiwoomAuth(appkey, secretkey, is_mock)
+        self.auth = auth or KiwoomAuth(appkey, secretkey, is_mock, token_store=token_store)
         host_domain = MOCK_HOST.replace('https://', '') if is_mock else REAL_HOST.replace('https://', '')
-        self.websocket_url = f'wss://{host_domain}:10000/api/dostk/websocket'
+        self.websocket_url = websocket_url or f'wss://{host_domain}:10000/api/dostk/websocket'
         self.token = token
         self.websocket = None
         self.connected = False
         self.keep_running = True
         self.auto_reconnect = auto_reconnect
         self.ping_interval = ping_interval
-        self.callbacks = {}
+        self.dispatch_table = DispatchTable(lambda: (key for group in self.subscriptions.values() for key in group))
+        self.codec = get_codec(codec)
+        self.connector = connector or websockets.connect
+        self.reconnect_policy = reconnect_policy or RetryPolicy(max_attempts=0, base_delay=0.5, max_delay=30.0)
+        self.metrics = metrics
+        self.dispatcher = dispatcher or self._process_realtime
+        self.frame_log = frame_log
+        self.subscriptions: Subscriptions = {}
+
+        # 재연결 상태와 통계 (공백 시간은 연결이 끊긴 시점부터 다시 등록을 마칠 때까지)
+        self._disconnected_at: Optional[float] = None
+        self.reconnects = 0
+        self.reconnect_failures = 0
+        self.last_gap = 0.0
+        self.max_gap = 0.0
+        self.total_gap = 0.0
         
         # 토큰이 없으면 자동으로 발급
         if not self.token:
-            self.token = self.auth.get_access_token()
+            self.token = self.auth.ensure_token()
     
     async def connect(self):
         """WebSocket 서버에 연결"""
         try:
-            self.websocket = await websockets.connect(self.websocket_url)
+            # 재연결할 때 만료된 토큰으로 로그인하지 않도록 LOGIN 마다 토큰 확인 (만료가 가까우면 재발급).
+            # 직접 지정한 토큰은 처음 연결할 때만 그대로 사용
+            if self.auth.token is not None or self._disconnected_at is not None:
+                self.token = await asyncio.get_running_loop().run_in_executor(None, self.auth.ensure_token)
+
+            self.websocket = await self.connector(self.websocket_url)
             self.connected = True
-            print("서버와 연결을 시도 중입니다.")
+            logger.info('실시간 시세 서버에 연결하였습니다: %s', self.websocket_url)
             
             # 로그인 패킷
             login_message = {
@@ -60,12 +377,11 @@ class KiwoomRealtimeClient:
                 'token': self.token
             }
             
-            print('실시간 시세 서버로 로그인 패킷을 전송합니다.')
             await self.send_message(login_message)
             
             return True
         except Exception as e:
-            print(f'Connection error: {e}')
+            logger.warning('실시간 시세 서버 연결 실패: %s', e)
             self.connected = False
             return False
     
@@ -74,18 +390,24 @@ class KiwoomRealtimeClient:
         서버에 메시지 전송
         
         Args:
-            message: 전송할 메시지 (dict 또는 str)
+            message: 전송할 메시지 (dict, str 또는 bytes). str 은 텍스트 프레임, bytes 는 바이너리 프레임으로 그대로 전송
         """
         if not self.connected:
             await self.connect()
             
         if self.connected:
-            # message가 문자열이 아니면 JSON으로 직렬화
-            if not isinstance(message, str):
-                message = json.dumps(message)
-                
-            await self.websocket.send(message)
-            print(f'Message sent: {message}')
+            # 받은 프레임을 돌려보내는 경우(PING) 등 이미 직렬화된 프레임은 그대로 전송
+            if not isinstance(message, (str, bytes, bytearray)):
+                message = self.codec.dumps(message)
+            
+            websocket = self.websocket
+            if isinstance(message, str):
+                send = getattr(websocket, 'send_str', websocket.send)
+            else:
+                send = getattr(websocket, 'send_bytes', websocket.send)
+            await send(message)
+            if self.frame_log is not None:
+                self.frame_log.log('send', message)
     
     async def register_realtime(self, items: List[str], types: List[str], group_no: str = '1', refresh: str = '1'):
         """
@@ -97,6 +419,18 @@ class KiwoomRealtimeClient:
             group_no (str, optional): 그룹번호. 기본값은 '1'
             refresh (str, optional): 기존등록유지여부. 기본값은 '1' (유지)
         """
+        group = self.subscriptions.setdefault(group_no, {})
+        if refresh == '0':
+            group.clear()
+        for item in items:
+            for realtime_type in types:
+                group[(realtime_type, item)] = None
+        self.dispatch_table.invalidate()
+
+        # 재연결 중이면 로그인 후 등록 표를 다시 등록할 때 함께 전송
+        if self._disconnected_at is not None:
+            return
+
         register_message = {
             'trnm': 'REG',
             'grp_no': group_no,
@@ -118,6 +452,19 @@ class KiwoomRealtimeClient:
             types (List[str]): 실시간 항목 (TR 코드)
             group_no (str, optional): 그룹번호. 기본값은 '1'
         """
+        group = self.subscriptions.get(group_no)
+        if group is not None:
+            for item in items:
+                for realtime_type in types:
+                    group.pop((realtime_type, item), None)
+            if not group:
+                del self.subscriptions[group_no]
+            self.dispatch_table.invalidate()
+
+        # 재연결 중이면 등록 표에서만 빼고 다시 등록하지 않음
+        if self._disconnected_at is not None:
+            return
+
         unregister_message = {
             'trnm': 'REMOVE',
             'grp_no': group_no,
@@ -129,99 +476,205 @@ class KiwoomRealtimeClient:
         
         await self.send_message(unregister_message)
     
-    def add_callback(self, realtime_type: str, callback: Callable[[Dict[str, Any]], None]):
+    def add_callback(self, realtime_type: str, callback: Callback, item: str = WILDCARD):
         """
         실시간시세 수신 콜백 함수 추가
         
         Args:
-            realtime_type (str): 실시간 항목 (TR 코드)
-            callback (Callable): 콜백 함수 (인자로 실시간 데이터를 받음)
+            realtime_type (str): 실시간 항목 (TR 코드). WILDCARD('*') 이면 모든 항목
+            callback (Callable): 콜백 함수 (인자로 실시간 데이터를 받음).
+                코루틴 함수이면 기본 대기열(1000개, DROP_OLDEST)을 가진 소비자로 등록
+            item (str, optional): 종목코드. 기본값은 WILDCARD (모든 종목)
         """
-        if realtime_type not in self.callbacks:
-            self.callbacks[realtime_type] = []
-            
-        self.callbacks[realtime_type].append(callback)
+        self.dispatch_table.add(realtime_type, callback, item)
+    
+    def add_consumer(self,
+                     realtime_type: str,
+                     callback: Callable[[Dict[str, Any]], Any],
+                     item: str = WILDCARD,
+                     maxsize: int = 1000,
+                     policy: str = DROP_OLDEST,
+                     key: Callable[[Dict[str, Any]], Any] = default_key) -> AsyncConsumer:
+        """
+        수신 루프와 따로 실행되는 대기열 소비자로 콜백 추가
+        
+        Args:
+            realtime_type (str): 실시간 항목 (TR 코드). WILDCARD('*') 이면 모든 항목
+            callback (Callable): 콜백 함수 또는 코루틴 함수
+            item (str, optional): 종목코드. 기본값은 WILDCARD (모든 종목)
+            maxsize (int, optional): 대기열 최대 크기. 기본값은 1000
+            policy (str, optional): 대기열이 가득 찼을 때의 처리 정책 ('drop_oldest', 'conflate', 'block').
+                기본값은 'drop_oldest'
+            key (Callable, optional): 'conflate' 정책에서 데이터를 합칠 키 함수. 기본값은 (실시간 항목, 종목)
+        
+        Returns:
+            AsyncConsumer: 등록한 소비자 (stats() 로 대기열 깊이, 버린 데이터 수 조회)
+        """
+        return self.dispatch_table.add_consumer(realtime_type, callback, item, maxsize, policy, key)
+    
+    def remove_callback(self, realtime_type: str, callback: Callback, item: str = WILDCARD) -> bool:
+        """
+        실시간시세 수신 콜백 함수 제거
+        
+        Args:
+            realtime_type (str): 등록한 실시간 항목
+            callback (Callable): 등록한 콜백 함수
+            item (str, optional): 등록한 종목코드. 기본값은 WILDCARD
+        
+        Returns:
+            bool: 제거한 콜백이 있으면 True
+        """
+        return self.dispatch_table.remove(realtime_type, callback, item)
     
     async def receive_messages(self):
         """서버로부터 메시지 수신 및 처리"""
+        loads = self.codec.loads
         while self.keep_running:
             try:
-                response = json.loads(await self.websocket.recv())
+                raw = await self.websocket.recv()
+                if self.frame_log is not None:
+                    self.frame_log.log('recv', raw)
+                response = loads(raw)
+                trnm = response.get('trnm')
+                
+                # 실시간 데이터 처리 (가장 많이 수신하는 메시지이므로 먼저 확인)
+                if trnm == 'REAL':
+                    blocked = self.dispatcher(response)
+                    # BLOCK 소비자의 대기열에 자리가 날 때까지 다음 프레임을 읽지 않음
+                    if blocked:
+                        for waiter in blocked:
+                            await waiter
+                
+                # PING 응답 처리 (받은 프레임을 그대로 돌려보냄)
+                elif trnm == 'PING':
+                    await self.send_message(raw)
                 
                 # 로그인 응답 처리
-                if response.get('trnm') == 'LOGIN':
+                elif trnm == 'LOGIN':
                     if response.get('return_code') != 0:
-                        print('로그인 실패하였습니다. : ', response.get('return_msg'))
+                        logger.error('로그인 실패하였습니다: %s', response.get('return_msg'))
                         await self.disconnect()
                     else:
-                        print('로그인 성공하였습니다.')
-                
-                # PING 응답 처리
-                elif response.get('trnm') == 'PING':
-                    await self.send_message(response)
+                        logger.info('로그인 성공하였습니다.')
+                        if self._disconnected_at is not None:
+                            await self._resubscribe()
                 
-                # 실시간 데이터 처리
-                elif response.get('trnm') == 'REAL':
-                    self._process_realtime(response)
-                
-                # 디버깅용 로그 출력 (PING 제외)
-                if response.get('trnm') != 'PING':
-                    print(f'실시간 시세 서버 응답 수신: {response}')
+                # 등록, 해지 응답 등
+                elif response.get('return_code', 0) != 0:
+                    logger.warning('%s 요청 실패: %s', trnm, response.get('return_msg'))
                     
             except websockets.ConnectionClosed:
-                print('Connection closed by the server')
                 self.connected = False
+                if not self.keep_running:
+                    break
+                logger.warning('실시간 시세 서버가 연결을 종료하였습니다.')
                 
-                if self.auto_reconnect:
-                    print('Attempting to reconnect...')
-                    await asyncio.sleep(5)  # 재연결 시도 전 대기
-                    await self.connect()
-                else:
+                if not (self.auto_reconnect and await self._reconnect()):
                     break
                     
             except Exception as e:
-                print(f'Error in receive_messages: {e}')
-                if self.auto_reconnect:
-                    print('Attempting to reconnect...')
-                    await asyncio.sleep(5)
-                    await self.connect()
-                else:
+                self.connected = False
+                if not self.keep_running:
+                    break
+                logger.warning('실시간 시세 수신 중 오류 발생: %s', e)
+                if not (self.auto_reconnect and await self._reconnect()):
                     break
     
+    async def _reconnect(self) -> bool:
+        """
+        지터를 적용한 지수 백오프로 재연결 (첫 시도는 바로)
+
+        Returns:
+            bool: 재연결하여 로그인 메시지를 보냈으면 True
+        """
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+        policy = self.reconnect_policy
+        attempt = 0
+        while self.keep_running:
+            if attempt:
+                await asyncio.sleep(policy.delay(attempt - 1))
+            attempt += 1
+            logger.info('실시간 시세 서버에 재연결합니다 (%d회)', attempt)
+            if await self.connect():
+                return True
+            self.reconnect_failures += 1
+            if policy.max_attempts and attempt >= policy.max_attempts:
+                break
+        return False
+    
+    async def _resubscribe(self):
+        """재연결 후 등록 표를 다시 등록하고 공백 시간 기록"""
+        for frame in build_reg_frames(self.subscriptions):
+            await self.send_message(frame)
+
+        gap = time.monotonic() - self._disconnected_at
+        self._disconnected_at = None
+        self.reconnects += 1
+        self.last_gap = gap
+        self.max_gap = max(self.max_gap, gap)
+        self.total_gap += gap
+        if self.metrics is not None:
+            self.metrics.observe_gap(gap)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        재연결 통계 조회
+
+        Returns:
+            Dict[str, Any]: reconnects, reconnect_failures, last_gap, max_gap, total_gap(초),
+                groups, subscriptions(등록한 (실시간 항목, 종목) 수), consumers(소비자별 대기열 통계)
+        """
+        return {
+            'reconnects': self.reconnects,
+            'reconnect_failures': self.reconnect_failures,
+            'last_gap': self.last_gap,
+            'max_gap': self.max_gap,
+            'total_gap': self.total_gap,
+            'groups': len(self.subscriptions),
+            'subscriptions': sum(len(group) for group in self.subscriptions.values()),
+            'consumers': [consumer.stats() for consumer in self.dispatch_table.consumers],
+        }
+    
     def _process_realtime(self, data: Dict[str, Any]):
         """
         실시간 데이터 처리 및 콜백 호출
         
         Args:
             data (Dict[str, Any]): 수신된 실시간 데이터
+        
+        Returns:
+            List[Awaitable]: 대기열이 가득 찬 BLOCK 소비자의 대기 코루틴 (없으면 None)
         """
         try:
-            for item_data in data.get('data', []):
-                realtime_type = item_data.get('type')
-                
-                if realtime_type in self.callbacks:
-                    for callback in self.callbacks[realtime_type]:
-                        callback(item_data)
-        except Exception as e:
-            print(f'Error processing realtime data: {e}')
+            return self.dispatch_table.dispatch(data)
+        except Exception:
+            logger.exception('실시간 데이터 처리 중 오류 발생')
+            return None
     
     async def disconnect(self):
-        """WebSocket 연결 종료"""
+        """WebSocket 연결 종료 (소비자의 작업 태스크도 종료)"""
         self.keep_running = False
+        await self.dispatch_table.close()
         if self.connected and self.websocket:
             await self.websocket.close()
             self.connected = False
-            print('Disconnected from WebSocket server')
+            logger.info('실시간 시세 서버와 연결을 종료하였습니다.')
     
     async def _ping_sender(self):
         """일정 간격으로 PING 메시지 전송"""
-        while self.keep_running and self.connected:
+        while self.keep_running:
             try:
                 await asyncio.sleep(self.ping_interval)
                 if self.connected:
                     await self.send_message({'trnm': 'PING'})
             except Exception as e:
-                print(f'Error sending ping: {e}')
+                logger.warning('PING 전송 실패: %s', e)
     
     async def run(self):
         """WebSocket 클라이언트 실행"""
@@ -234,4 +687,4 @@ class KiwoomRealtimeClient:
             # 모든 태스크가 완료될 때까지 대기
             await asyncio.gather(ping_task, receive_task)
         else:
-            print("WebSocket 연결에 실패했습니다.") 
\ No newline at end of file
+            logger.error('WebSocket 연결에 실패했습니다.') 
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+키움증권 TR 등록 정보 모듈
+
+document/*.txt 명세에서 생성한 TR 별 엔드포인트, HTTP 메서드, 연속조회 지원 여부, 목록 필드명,
+호출 한도 구분(routes.py)과 응답 필드 스키마(schema.py)를 api_id 로 조회합니다.
+엔드포인트 결정, 호출 속도 제한, 응답 캐시, 연속조회, 컬럼형 변환이 모두 이 정보를 사용합니다.
+
+    info = lookup('ka10081')
+    info.endpoint, info.list_field, info.quota  # '/api/dostk/chart', 'stk_dt_pole_chart_qry', 'query'
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# 호출 한도 구분
+QUERY = 'query'
+ORDER = 'order'
+
+# 주문 한도를 사용하는 엔드포인트 (주문, 신용주문)
+ORDER_ENDPOINTS = ('/api/dostk/ordr', '/api/dostk/crdordr')
+
+# 명세에 없는 TR 중 주문으로 취급하는 TR 유형 (api_id 앞 두 글자)
+ORDER_TYPES = ('kt', 'kr')
+
+# 명세에 없는 TR 의 API 유형(api_id 앞 두 글자)별 엔드포인트
+PREFIX_ENDPOINTS = {
+    'au': '/oauth2/token',  # 인증
+    'ka': '/api/dostk/acnt',  # 계좌
+    'kt': '/api/dostk/ordr',  # 주문
+    'kr': '/api/dostk/ordr',  # 신용주문
+    'kc': '/api/dostk/chart',  # 차트
+    'ks': '/api/dostk/price',  # 시세
+    'ke': '/api/dostk/stock',  # 종목정보
+    'ki': '/api/dostk/rkinfo',  # 순위정보
+    'kb': '/api/dostk/sector',  # 업종
+    'kl': '/api/dostk/etf',  # ETF
+    'kf': '/api/dostk/elw',  # ELW
+    'kh': '/api/dostk/theme',  # 테마
+    'ko': '/api/dostk/condition',  # 조건검색
+    'kg': '/api/dostk/forgnr',  # 기관외국인
+}
+
+
+class TRInfo(NamedTuple):
+    """TR 등록 정보"""
+    api_id: str
+    title: str
+    endpoint: str
+    method: str = 'POST'
+    paginated: bool = True
+    list_field: Optional[str] = None
+    quota: str = QUERY
+
+    @property
+    def schema(self) -> Dict[str, Dict]:
+        """응답 필드 스키마 ({'title', 'fields', 'lists'}. 스키마가 없으면 빈 딕셔너리)"""
+        from .schema import TR_SCHEMAS
+        return TR_SCHEMAS.get(self.api_id, {})
+
+
+_registry: Optional[Dict[str, TRInfo]] = None
+
+
+def registry() -> Dict[str, TRInfo]:
+    """
+    전체 TR 등록 정보
+
+    Returns:
+        Dict[str, TRInfo]: api_id 별 등록 정보 (처음 호출할 때 한 번 로드)
+    """
+    global _registry
+    if _registry is None:
+        from .routes import TR_ROUTES
+        _registry = {api_id: TRInfo(api_id, *route) for api_id, route in TR_ROUTES.items()}
+    return _registry
+
+
+def lookup(api_id: str) -> Optional[TRInfo]:
+    """
+    TR 등록 정보 조회
+
+    Args:
+        api_id (str): API ID (TR 코드)
+
+    Returns:
+        TRInfo: 등록 정보 (명세에 없는 TR 이면 None)
+    """
+    return (_registry if _registry is not None else registry()).get(api_id)
+
+
+def classify_quota(endpoint: str) -> str:
+    """
+    엔드포인트의 호출 한도 구분
+
+    Args:
+        endpoint (str): API 엔드포인트 경로
+
+    Returns:
+        str: ORDER 또는 QUERY
+    """
+    return ORDER if endpoint in ORDER_ENDPOINTS else QUERY
+
+
+def is_order(api_id: str, types: Tuple[str, ...] = ORDER_TYPES) -> bool:
+    """
+    주문 TR 인지 판별
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        types (Tuple[str, ...], optional): 명세에 없는 TR 을 주문으로 취급할 TR 유형. 기본값은 ORDER_TYPES
+
+    Returns:
+        bool: 명세에 있는 TR 은 호출 한도 구분이 ORDER 이면, 없는 TR 은 TR 유형이 types 에 있으면 True
+    """
+    info = lookup(api_id)
+    if info is not None:
+        return info.quota == ORDER
+    return api_id[:2].lower() in types
+
+
+def quota_class(api_id: str) -> str:
+    """
+    TR 의 호출 한도 구분
+
+    Args:
+        api_id (str): API ID (TR 코드)
+
+    Returns:
+        str: ORDER 또는 QUERY
+    """
+    return ORDER if is_order(api_id) else QUERY
+
+
+def resolve_endpoint(api_id: str) -> str:
+    """
+    API ID(TR 코드)로 엔드포인트 경로 결정
+
+    Args:
+        api_id (str): API ID (TR 코드)
+
+    Returns:
+        str: API 엔드포인트 경로 (명세에 없는 TR 은 API 유형별 기본 엔드포인트)
+
+    Raises:
+        ValueError: 명세에 없고 API 유형도 알 수 없는 경우
+    """
+    info = lookup(api_id)
+    if info is not None:
+        return info.endpoint
+    endpoint = PREFIX_ENDPOINTS.get(api_id[:2].lower())
+    if endpoint is None:
+        raise ValueError(f"알 수 없는 API 유형: {api_id}")
+    return endpoint
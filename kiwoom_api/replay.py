@@ -0,0 +1,416 @@
+"""
+키움증권 API 기록/재생 모듈
+
+REST 요청·응답과 실시간시세 WebSocket 프레임을 수신 시각과 함께 JSON Lines 파일에 추가 기록하고,
+같은 파일로 네트워크, 호출 한도, 인증 정보 없이 세션을 1배속, N배속 또는 최대 속도로 재생합니다.
+기록은 연결 풀(request)과 WebSocket 연결 함수를 감싸는 방식이므로 클라이언트 코드는 그대로 사용합니다.
+시크릿키와 접근토큰은 기록하지 않습니다.
+
+    # 기록
+    recorder = SessionRecorder('20240102.jsonl')
+    client = KiwoomClient(appkey, secretkey, pool=recorder.pool())
+    realtime = client.get_realtime_client()
+    realtime.connector = recorder.connector()
+
+    # 재생 (10배속, speed=None 이면 대기 없이 최대 속도)
+    replay = SessionReplay('20240102.jsonl', speed=10)
+    client = KiwoomClient('replay', 'replay', pool=replay.pool())
+    realtime = KiwoomRealtimeClient('replay', 'replay', 'replay', connector=replay.connector())
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .codec import get_codec
+from .pool import AsyncResponse
+
+# 기록 종류
+REST = 'rest'
+WS_IN = 'ws_in'
+WS_OUT = 'ws_out'
+
+# 기록하는 응답 헤더
+RECORDED_HEADERS = ('cont-yn', 'next-key', 'api-id', 'Retry-After')
+
+# 기록하지 않는 값 (인증 요청 본문, 접근토큰)
+REDACTED = '***'
+
+
+class ReplayMissError(LookupError):
+    """재생 파일에 해당 요청의 응답이 없는 경우 발생하는 예외"""
+
+
+def _request_key(method: str, url: str, headers: Dict[str, str], data: Any) -> Tuple[str, ...]:
+    """요청 식별 키 (메서드, 경로, api-id, 연속조회 헤더, 요청 데이터)"""
+    headers = headers or {}
+    path = urlsplit(url).path
+    if path.startswith('/oauth2/'):
+        # 인증 요청은 본문(앱키, 시크릿키)과 관계없이 같은 요청으로 취급
+        data = None
+    return (method.upper(), path, headers.get('api-id', ''), headers.get('cont-yn', '') or '',
+            headers.get('next-key', '') or '', get_codec().dumps(data) if data is not None else '')
+
+
+def _redact(path: str, body: bytes) -> str:
+    """기록할 응답 본문 (접근토큰 제거)"""
+    text = body.decode('utf-8', errors='replace')
+    if path.startswith('/oauth2/'):
+        codec = get_codec()
+        try:
+            value = codec.loads(text)
+        except ValueError:
+            return text
+        if isinstance(value, dict) and 'token' in value:
+            value['token'] = REDACTED
+            return codec.dumps(value)
+    return text
+
+
+class SessionRecorder:
+    """REST 요청과 WebSocket 프레임을 추가 기록하는 클래스"""
+
+    def __init__(self, path: str):
+        """
+        기록기 초기화
+
+        Args:
+            path (str): 기록 파일 경로 (JSON Lines, 이미 있으면 이어서 기록)
+        """
+        self.path = path
+        self.codec = get_codec()
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self.count = 0
+
+    def write(self, record: Dict[str, Any]):
+        """
+        기록 한 줄 추가
+
+        Args:
+            record (Dict[str, Any]): 기록 ('t' 에 기록 시작 후 경과 시간이 추가됨)
+        """
+        record['t'] = round(time.monotonic() - self.started, 6)
+        line = self.codec.dumps(record)
+        with self._lock:
+            self._file.write(line + '\n')
+            self.count += 1
+
+    def record_exchange(self, method: str, url: str, kwargs: Dict[str, Any], response: Any, elapsed: float):
+        """REST 요청·응답 기록"""
+        path = urlsplit(url).path
+        headers = kwargs.get('headers') or {}
+        data = kwargs.get('json', kwargs.get('params'))
+        self.write({
+            'k': REST,
+            'method': method.upper(),
+            'path': path,
+            'api_id': headers.get('api-id', ''),
+            'cont_yn': headers.get('cont-yn', '') or '',
+            'next_key': headers.get('next-key', '') or '',
+            'data': None if path.startswith('/oauth2/') else data,
+            'status': response.status_code,
+            'headers': {key: response.headers[key] for key in RECORDED_HEADERS if response.headers.get(key)},
+            'body': _redact(path, response.content),
+            'elapsed': round(elapsed, 6),
+        })
+
+    def pool(self, pool: Any = None) -> 'RecordingPool':
+        """
+        연결 풀을 감싼 기록용 연결 풀 (KiwoomClient 의 pool 인자로 사용)
+
+        Args:
+            pool (ConnectionPool, optional): 실제 연결 풀. 기본값은 새 ConnectionPool
+
+        Returns:
+            RecordingPool: 기록용 연결 풀
+        """
+        if pool is None:
+            from .pool import ConnectionPool
+            pool = ConnectionPool()
+        return RecordingPool(pool, self)
+
+    def async_pool(self, pool: Any = None) -> 'AsyncRecordingPool':
+        """
+        비동기 연결 풀을 감싼 기록용 연결 풀 (AsyncKiwoomClient 의 pool 인자로 사용)
+
+        Args:
+            pool (AsyncConnectionPool, optional): 실제 비동기 연결 풀. 기본값은 새 AsyncConnectionPool
+
+        Returns:
+            AsyncRecordingPool: 기록용 비동기 연결 풀
+        """
+        if pool is None:
+            from .pool import AsyncConnectionPool
+            pool = AsyncConnectionPool()
+        return AsyncRecordingPool(pool, self)
+
+    def connector(self, connect: Callable[[str], Awaitable[Any]] = None) -> Callable[[str], Awaitable[Any]]:
+        """
+        WebSocket 연결 함수를 감싼 기록용 연결 함수 (KiwoomRealtimeClient 의 connector 로 사용)
+
+        Args:
+            connect (Callable, optional): 실제 연결 함수. 기본값은 websockets.connect
+
+        Returns:
+            Callable: URL 을 받아 기록용 WebSocket 을 반환하는 코루틴 함수
+        """
+        async def connector(url: str):
+            nonlocal connect
+            if connect is None:
+                import websockets
+                connect = websockets.connect
+            return RecordingWebSocket(await connect(url), self)
+        return connector
+
+    def flush(self):
+        """버퍼 내용을 파일에 기록"""
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """기록 파일 닫기"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RecordingPool:
+    """요청을 실제 연결 풀로 보내고 요청·응답을 기록하는 연결 풀"""
+
+    def __init__(self, pool: Any, recorder: SessionRecorder):
+        self.pool = pool
+        self.recorder = recorder
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = self.pool.request(method, url, **kwargs)
+        self.recorder.record_exchange(method, url, kwargs, response, time.perf_counter() - start)
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        return self.pool.stats()
+
+    def close(self):
+        self.pool.close()
+        self.recorder.flush()
+
+
+class AsyncRecordingPool(RecordingPool):
+    """비동기 연결 풀용 RecordingPool"""
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        start = time.perf_counter()
+        response = await self.pool.request(method, url, **kwargs)
+        self.recorder.record_exchange(method, url, kwargs, response, time.perf_counter() - start)
+        return response
+
+    async def close(self):
+        await self.pool.close()
+        self.recorder.flush()
+
+
+class RecordingWebSocket:
+    """주고받은 프레임을 기록하는 WebSocket 래퍼"""
+
+    def __init__(self, websocket: Any, recorder: SessionRecorder):
+        self.websocket = websocket
+        self.recorder = recorder
+
+    async def send(self, message: str):
+        await self.websocket.send(message)
+        # 로그인 프레임의 접근토큰은 기록하지 않음
+        if '"LOGIN"' in message:
+            message = self.recorder.codec.dumps({'trnm': 'LOGIN', 'token': REDACTED})
+        self.recorder.write({'k': WS_OUT, 'frame': message})
+
+    async def recv(self) -> str:
+        message = await self.websocket.recv()
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+        self.recorder.write({'k': WS_IN, 'frame': message})
+        return message
+
+    async def close(self):
+        await self.websocket.close()
+        self.recorder.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.websocket, name)
+
+
+class SessionReplay:
+    """기록 파일로 REST 응답과 WebSocket 프레임을 재생하는 클래스"""
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0):
+        """
+        재생기 초기화
+
+        Args:
+            path (str): 기록 파일 경로
+            speed (float, optional): 재생 배속. 기본값은 1.0 (기록된 시간 그대로),
+                None 또는 0 이면 대기 없이 최대 속도
+        """
+        self.path = path
+        self.speed = speed or None
+        self.codec = get_codec()
+        self.exchanges: Dict[Tuple[str, ...], Deque[Dict[str, Any]]] = {}
+        self.frames: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._stats = {'replayed': 0, 'missed': 0}
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = self.codec.loads(line)
+                kind = record.get('k')
+                if kind == REST:
+                    key = _request_key(record['method'], record['path'],
+                                       {'api-id': record['api_id'], 'cont-yn': record['cont_yn'],
+                                        'next-key': record['next_key']},
+                                       record['data'])
+                    self.exchanges.setdefault(key, deque()).append(record)
+                elif kind == WS_IN:
+                    self.frames.append((record['t'], record['frame']))
+
+    def _wait_time(self, seconds: float) -> float:
+        """배속을 적용한 대기 시간"""
+        return seconds / self.speed if self.speed else 0.0
+
+    def next_exchange(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        요청에 해당하는 기록 조회 (같은 요청이 여러 번 기록되었으면 기록 순서대로 반환)
+
+        Raises:
+            ReplayMissError: 기록에 없는 요청인 경우
+        """
+        key = _request_key(method, url, kwargs.get('headers'), kwargs.get('json', kwargs.get('params')))
+        with self._lock:
+            records = self.exchanges.get(key)
+            if not records:
+                self._stats['missed'] += 1
+                raise ReplayMissError(f"기록에 없는 요청입니다: {key[0]} {key[1]} api-id={key[2]} "
+                                      f"cont-yn={key[3]} next-key={key[4]}")
+            self._stats['replayed'] += 1
+            # 마지막 기록은 남겨 두어 같은 요청을 반복 재생할 수 있도록 함
+            return records.popleft() if len(records) > 1 else records[0]
+
+    def pool(self) -> 'ReplayPool':
+        """재생용 연결 풀 (KiwoomClient 의 pool 인자로 사용)"""
+        return ReplayPool(self)
+
+    def async_pool(self) -> 'AsyncReplayPool':
+        """재생용 비동기 연결 풀 (AsyncKiwoomClient 의 pool 인자로 사용)"""
+        return AsyncReplayPool(self)
+
+    def connector(self) -> Callable[[str], Awaitable['ReplayWebSocket']]:
+        """재생용 WebSocket 연결 함수 (KiwoomRealtimeClient 의 connector 로 사용)"""
+        async def connector(url: str):
+            return ReplayWebSocket(self)
+        return connector
+
+    def stats(self) -> Dict[str, int]:
+        """
+        재생 통계 조회
+
+        Returns:
+            Dict[str, int]: replayed (재생한 요청 수), missed (기록에 없던 요청 수), frames (기록된 수신 프레임 수)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['frames'] = len(self.frames)
+        return stats
+
+
+class ReplayPool:
+    """기록된 응답을 반환하는 연결 풀"""
+
+    def __init__(self, replay: SessionReplay):
+        self.replay = replay
+
+    def _response(self, record: Dict[str, Any], url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = record['status']
+        response.headers = CaseInsensitiveDict(record.get('headers') or {})
+        response._content = record['body'].encode('utf-8')
+        response.url = url
+        response.reason = ''
+        return response
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        record = self.replay.next_exchange(method, url, **kwargs)
+        delay = self.replay._wait_time(record.get('elapsed', 0.0))
+        if delay:
+            time.sleep(delay)
+        return self._response(record, url)
+
+    def stats(self) -> Dict[str, int]:
+        return self.replay.stats()
+
+    def close(self):
+        pass
+
+
+class AsyncReplayPool(ReplayPool):
+    """기록된 응답을 반환하는 비동기 연결 풀"""
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        record = self.replay.next_exchange(method, url, **kwargs)
+        delay = self.replay._wait_time(record.get('elapsed', 0.0))
+        if delay:
+            await asyncio.sleep(delay)
+        return AsyncResponse(record['status'], CaseInsensitiveDict(record.get('headers') or {}),
+                             record['body'].encode('utf-8'), url=url)
+
+    async def close(self):
+        pass
+
+
+class ReplayWebSocket:
+    """기록된 수신 프레임을 기록 시각 간격(배속 적용)대로 돌려주는 WebSocket"""
+
+    def __init__(self, replay: SessionReplay):
+        self.replay = replay
+        self.sent: List[str] = []
+        self._index = 0
+        self._started = None
+        self._closed = False
+
+    async def send(self, message: str):
+        self.sent.append(message)
+
+    async def recv(self) -> str:
+        import websockets
+
+        frames = self.replay.frames
+        if self._closed or self._index >= len(frames):
+            self._closed = True
+            raise websockets.ConnectionClosed(None, None)
+
+        offset, frame = frames[self._index]
+        self._index += 1
+        if self.replay.speed:
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now - self.replay._wait_time(offset)
+            delay = self._started + self.replay._wait_time(offset) - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return frame
+
+    async def close(self):
+        self._closed = True
@@ -0,0 +1,359 @@
+"""
+키움증권 API 재시도 및 서킷 브레이커 모듈
+
+일시적인 오류(5xx, 429, 연결 끊김)는 지터를 적용한 지수 백오프로 재시도하고,
+엔드포인트 계열(/api/dostk/chart, /api/dostk/ordr 등)별 서킷 브레이커로
+장애가 계속되는 엔드포인트에 대한 요청을 즉시 실패시켜 작업 스레드가 묶이지 않도록 합니다.
+
+주문 TR 은 같은 주문이 두 번 접수될 수 있으므로 서버에 요청이 전달되지 않은 것이 확실한 경우
+(연결 실패, 429 호출 한도 거부)에만 재시도합니다.
+"""
+
+import random
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import requests
+
+from .ratelimit import PRIORITY_TYPES
+from .registry import ORDER_ENDPOINTS, is_order
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# 서킷 브레이커 상태
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 요청을 보내지 않은 경우 발생하는 예외"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"{endpoint} 엔드포인트 장애로 요청을 차단했습니다. {retry_after:.1f}초 후 다시 시도하세요.")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def is_idempotent(api_id: str = None, endpoint: str = None) -> bool:
+    """
+    재시도해도 안전한 요청인지 판별
+
+    Args:
+        api_id (str, optional): API ID (TR 코드)
+        endpoint (str, optional): API 엔드포인트 경로
+
+    Returns:
+        bool: 주문 TR 이 아니면 True
+    """
+    if api_id and is_order(api_id, PRIORITY_TYPES):
+        return False
+    return endpoint not in ORDER_ENDPOINTS
+
+
+def is_connect_error(error: BaseException) -> bool:
+    """
+    서버에 요청이 전달되기 전에 실패한 연결 오류인지 판별
+
+    Args:
+        error (BaseException): 요청 중 발생한 예외
+
+    Returns:
+        bool: 연결 수립 단계의 오류이면 True
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        from urllib3.exceptions import NewConnectionError
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    aiohttp = sys.modules.get('aiohttp')
+    return aiohttp is not None and isinstance(error, aiohttp.ClientConnectorError)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    재시도하면 성공할 수 있는 일시적 오류인지 판별
+
+    Args:
+        error (BaseException): 요청 중 발생한 예외
+
+    Returns:
+        bool: 연결 끊김, 시간 초과 등 일시적 오류이면 True
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, ConnectionError)):
+        return True
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is not None and isinstance(error, asyncio.TimeoutError):
+        return True
+    aiohttp = sys.modules.get('aiohttp')
+    return aiohttp is not None and isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError))
+
+
+def is_retryable(status_code: int = None, error: BaseException = None, idempotent: bool = True) -> bool:
+    """
+    응답 상태 코드 또는 예외로 재시도 가능 여부 판별
+
+    Args:
+        status_code (int, optional): HTTP 상태 코드
+        error (BaseException, optional): 요청 중 발생한 예외
+        idempotent (bool, optional): 재시도해도 안전한 요청인지 여부. 기본값은 True
+
+    Returns:
+        bool: 재시도 가능하면 True
+    """
+    if error is not None:
+        return is_transient_error(error) if idempotent else is_connect_error(error)
+    if status_code == 429:
+        # 호출 한도 초과는 서버가 처리하지 않은 요청
+        return True
+    return idempotent and status_code in RETRYABLE_STATUS
+
+
+class RetryPolicy:
+    """지터를 적용한 지수 백오프 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0):
+        """
+        재시도 정책 초기화
+
+        Args:
+            max_attempts (int, optional): 첫 요청을 포함한 최대 시도 횟수. 기본값은 3
+            base_delay (float, optional): 첫 재시도 대기 시간 상한(초). 기본값은 0.2
+            max_delay (float, optional): 재시도 대기 시간 상한(초). 기본값은 5.0
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, response: Any = None) -> float:
+        """
+        재시도 전 대기 시간 계산 (full jitter)
+
+        Args:
+            attempt (int): 실패한 시도 순번 (0부터 시작)
+            response (optional): 실패한 응답. Retry-After 헤더가 있으면 그 이상 대기
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.max_delay))
+            except ValueError:
+                pass
+        return delay
+
+
+class CircuitBreaker:
+    """연속 실패시 요청을 차단하는 서킷 브레이커"""
+
+    def __init__(self, endpoint: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        서킷 브레이커 초기화
+
+        Args:
+            endpoint (str): 엔드포인트 계열
+            failure_threshold (int, optional): 서킷을 여는 연속 실패 횟수. 기본값은 5
+            recovery_timeout (float, optional): 서킷을 연 뒤 시험 요청을 허용할 때까지의 시간(초). 기본값은 30.0
+        """
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        요청 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+                self._trial = False
+            if self.state == HALF_OPEN and not self._trial:
+                # 시험 요청 하나만 통과
+                self._trial = True
+                return
+            raise CircuitOpenError(self.endpoint, max(remaining, 0.0))
+
+    def record_success(self):
+        """요청 성공 기록 (서킷 닫힘)"""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial = False
+
+    def release(self):
+        """결과 없이 끝난 요청 기록 (취소된 시험 요청의 자리를 반환하여 다음 요청이 시험할 수 있도록 함)"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._trial = False
+
+    def record_failure(self):
+        """요청 실패 기록 (연속 실패가 기준을 넘거나 시험 요청이 실패하면 서킷 열림)"""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._trial = False
+
+
+class RetryEngine:
+    """엔드포인트 계열별 서킷 브레이커와 재시도 정책을 적용하는 요청 실행기"""
+
+    def __init__(self,
+                 policy: Optional[RetryPolicy] = None,
+                 failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0):
+        """
+        요청 실행기 초기화
+
+        Args:
+            policy (RetryPolicy, optional): 재시도 정책. 기본값은 RetryPolicy()
+            failure_threshold (int, optional): 서킷을 여는 연속 실패 횟수. 기본값은 5
+            recovery_timeout (float, optional): 서킷을 연 뒤 시험 요청을 허용할 때까지의 시간(초). 기본값은 30.0
+        """
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._stats = {'retries': 0, 'rejected': 0}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        엔드포인트 계열의 서킷 브레이커 조회
+
+        Args:
+            endpoint (str): API 엔드포인트 경로
+
+        Returns:
+            CircuitBreaker: 서킷 브레이커
+        """
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    endpoint, self.failure_threshold, self.recovery_timeout)
+            return breaker
+
+    def _before_call(self, breaker: CircuitBreaker):
+        """서킷 확인 (차단 통계 기록)"""
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise
+
+    def _should_retry(self, breaker: CircuitBreaker, attempt: int, idempotent: bool,
+                      response: Any = None, error: BaseException = None) -> bool:
+        """결과를 서킷 브레이커에 기록하고 재시도 여부 결정"""
+        status_code = response.status_code if response is not None else None
+        if error is not None or status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        if attempt + 1 >= self.policy.max_attempts or not is_retryable(status_code, error, idempotent):
+            return False
+        with self._lock:
+            self._stats['retries'] += 1
+        return True
+
+    def call(self, api_id: str, endpoint: str, send: Callable[[], Any]) -> Any:
+        """
+        재시도 정책과 서킷 브레이커를 적용하여 요청 전송
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            endpoint (str): API 엔드포인트 경로 (서킷 브레이커 단위)
+            send (Callable): 요청을 한 번 전송하고 응답을 반환하는 함수
+
+        Returns:
+            응답 객체 (재시도 후에도 실패한 응답은 그대로 반환)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+        """
+        breaker = self.breaker(endpoint)
+        idempotent = is_idempotent(api_id, endpoint)
+        attempt = 0
+        while True:
+            self._before_call(breaker)
+            response = None
+            try:
+                response = send()
+            except Exception as e:
+                if not self._should_retry(breaker, attempt, idempotent, error=e):
+                    raise
+            except BaseException:
+                # KeyboardInterrupt 등으로 결과 없이 끝나면 시험 요청 자리만 반환
+                breaker.release()
+                raise
+            else:
+                if not self._should_retry(breaker, attempt, idempotent, response=response):
+                    return response
+            time.sleep(self.policy.delay(attempt, response))
+            attempt += 1
+
+    async def call_async(self, api_id: str, endpoint: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        재시도 정책과 서킷 브레이커를 적용하여 비동기 요청 전송 (call 과 동일한 인자)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+        """
+        import asyncio
+
+        breaker = self.breaker(endpoint)
+        idempotent = is_idempotent(api_id, endpoint)
+        attempt = 0
+        while True:
+            self._before_call(breaker)
+            response = None
+            try:
+                response = await send()
+            except Exception as e:
+                if not self._should_retry(breaker, attempt, idempotent, error=e):
+                    raise
+            except BaseException:
+                # 태스크가 취소되면(asyncio.CancelledError) 결과 없이 끝나므로 시험 요청 자리만 반환
+                breaker.release()
+                raise
+            else:
+                if not self._should_retry(breaker, attempt, idempotent, response=response):
+                    return response
+            await asyncio.sleep(self.policy.delay(attempt, response))
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        재시도 및 서킷 브레이커 통계 조회
+
+        Returns:
+            Dict[str, Any]: 통계 정보
+                retries: 재시도 횟수
+                rejected: 서킷이 열려 차단된 요청 수
+                circuits: 엔드포인트 계열별 서킷 상태
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['circuits'] = {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+            return stats
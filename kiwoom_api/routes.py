@@ -0,0 +1,158 @@
+"""
+키움증권 TR 라우팅 정보
+
+이 파일은 tools/gen_schema.py 로 document/*.txt 에서 자동 생성되었습니다. 직접 수정하지 마세요.
+
+TR_ROUTES[api_id] = (TR 명, 엔드포인트, HTTP 메서드, 연속조회 지원 여부, 목록 필드명, 호출 한도 구분)
+"""
+
+TR_ROUTES = {'ka10001': ('주식기본정보요청', '/api/dostk/stkinfo', 'POST', True, None, 'query'),
+ 'ka10002': ('주식거래원요청', '/api/dostk/stkinfo', 'POST', True, None, 'query'),
+ 'ka10003': ('체결정보요청', '/api/dostk/stkinfo', 'POST', True, 'cntr_infr', 'query'),
+ 'ka10004': ('주식호가요청', '/api/dostk/mrkcond', 'POST', True, None, 'query'),
+ 'ka10005': ('주식일주월시분요청', '/api/dostk/mrkcond', 'POST', True, 'stk_ddwkmm', 'query'),
+ 'ka10006': ('주식시분요청', '/api/dostk/mrkcond', 'POST', True, None, 'query'),
+ 'ka10007': ('시세표성정보요청', '/api/dostk/mrkcond', 'POST', True, None, 'query'),
+ 'ka10008': ('주식외국인종목별매매동향', '/api/dostk/frgnistt', 'POST', True, 'stk_frgnr', 'query'),
+ 'ka10009': ('주식기관요청', '/api/dostk/frgnistt', 'POST', True, None, 'query'),
+ 'ka10010': ('업종프로그램요청', '/api/dostk/sect', 'POST', True, None, 'query'),
+ 'ka10011': ('신주인수권전체시세요청', '/api/dostk/mrkcond', 'POST', True, 'newstk_recvrht_mrpr', 'query'),
+ 'ka10013': ('신용매매동향요청', '/api/dostk/stkinfo', 'POST', True, 'crd_trde_trend', 'query'),
+ 'ka10015': ('일별거래상세요청', '/api/dostk/stkinfo', 'POST', True, 'daly_trde_dtl', 'query'),
+ 'ka10016': ('신고저가요청', '/api/dostk/stkinfo', 'POST', True, 'ntl_pric', 'query'),
+ 'ka10017': ('상하한가요청', '/api/dostk/stkinfo', 'POST', True, 'updown_pric', 'query'),
+ 'ka10018': ('고저가근접요청', '/api/dostk/stkinfo', 'POST', True, 'high_low_pric_alacc', 'query'),
+ 'ka10019': ('가격급등락요청', '/api/dostk/stkinfo', 'POST', True, 'pric_jmpflu', 'query'),
+ 'ka10020': ('호가잔량상위요청', '/api/dostk/rkinfo', 'POST', True, 'bid_req_upper', 'query'),
+ 'ka10021': ('호가잔량급증요청', '/api/dostk/rkinfo', 'POST', True, 'bid_req_sdnin', 'query'),
+ 'ka10022': ('잔량율급증요청', '/api/dostk/rkinfo', 'POST', True, 'req_rt_sdnin', 'query'),
+ 'ka10023': ('거래량급증요청', '/api/dostk/rkinfo', 'POST', True, 'trde_qty_sdnin', 'query'),
+ 'ka10024': ('거래량갱신요청', '/api/dostk/stkinfo', 'POST', True, 'trde_qty_updt', 'query'),
+ 'ka10025': ('매물대집중요청', '/api/dostk/stkinfo', 'POST', True, 'prps_cnctr', 'query'),
+ 'ka10026': ('고저PER요청', '/api/dostk/stkinfo', 'POST', True, 'high_low_per', 'query'),
+ 'ka10027': ('전일대비등락률상위요청', '/api/dostk/rkinfo', 'POST', True, 'pred_pre_flu_rt_upper', 'query'),
+ 'ka10028': ('시가대비등락률요청', '/api/dostk/stkinfo', 'POST', True, 'open_pric_pre_flu_rt', 'query'),
+ 'ka10029': ('예상체결등락률상위요청', '/api/dostk/rkinfo', 'POST', True, 'exp_cntr_flu_rt_upper', 'query'),
+ 'ka10030': ('당일거래량상위요청', '/api/dostk/rkinfo', 'POST', True, 'tdy_trde_qty_upper', 'query'),
+ 'ka10031': ('전일거래량상위요청', '/api/dostk/rkinfo', 'POST', True, 'pred_trde_qty_upper', 'query'),
+ 'ka10032': ('거래대금상위요청', '/api/dostk/rkinfo', 'POST', True, 'trde_prica_upper', 'query'),
+ 'ka10033': ('신용비율상위요청', '/api/dostk/rkinfo', 'POST', True, 'crd_rt_upper', 'query'),
+ 'ka10034': ('외인기간별매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'for_dt_trde_upper', 'query'),
+ 'ka10035': ('외인연속순매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'for_cont_nettrde_upper', 'query'),
+ 'ka10036': ('외인한도소진율증가상위', '/api/dostk/rkinfo', 'POST', True, 'for_limit_exh_rt_incrs_upper', 'query'),
+ 'ka10037': ('외국계창구매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'frgn_wicket_trde_upper', 'query'),
+ 'ka10038': ('종목별증권사순위요청', '/api/dostk/rkinfo', 'POST', True, 'stk_sec_rank', 'query'),
+ 'ka10039': ('증권사별매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'sec_trde_upper', 'query'),
+ 'ka10040': ('당일주요거래원요청', '/api/dostk/rkinfo', 'POST', True, 'tdy_main_trde_ori', 'query'),
+ 'ka10042': ('순매수거래원순위요청', '/api/dostk/rkinfo', 'POST', True, 'netprps_trde_ori_rank', 'query'),
+ 'ka10043': ('거래원매물대분석요청', '/api/dostk/stkinfo', 'POST', True, 'trde_ori_prps_anly', 'query'),
+ 'ka10044': ('일별기관매매종목요청', '/api/dostk/mrkcond', 'POST', True, 'daly_orgn_trde_stk', 'query'),
+ 'ka10045': ('종목별기관매매추이요청', '/api/dostk/mrkcond', 'POST', True, 'stk_orgn_trde_trnsn', 'query'),
+ 'ka10046': ('체결강도추이시간별요청', '/api/dostk/mrkcond', 'POST', True, 'cntr_str_tm', 'query'),
+ 'ka10047': ('체결강도추이일별요청', '/api/dostk/mrkcond', 'POST', True, 'cntr_str_daly', 'query'),
+ 'ka10048': ('ELW일별민감도지표요청', '/api/dostk/elw', 'POST', True, 'elwdaly_snst_ix', 'query'),
+ 'ka10050': ('ELW민감도지표요청', '/api/dostk/elw', 'POST', True, 'elwsnst_ix_array', 'query'),
+ 'ka10051': ('업종별투자자순매수요청', '/api/dostk/sect', 'POST', True, 'inds_netprps', 'query'),
+ 'ka10052': ('거래원순간거래량요청', '/api/dostk/stkinfo', 'POST', True, 'trde_ori_mont_trde_qty', 'query'),
+ 'ka10053': ('당일상위이탈원요청', '/api/dostk/rkinfo', 'POST', True, 'tdy_upper_scesn_ori', 'query'),
+ 'ka10054': ('변동성완화장치발동종목요청', '/api/dostk/stkinfo', 'POST', True, 'motn_stk', 'query'),
+ 'ka10055': ('당일전일체결량요청', '/api/dostk/stkinfo', 'POST', True, 'tdy_pred_cntr_qty', 'query'),
+ 'ka10058': ('투자자별일별매매종목요청', '/api/dostk/stkinfo', 'POST', True, 'invsr_daly_trde_stk', 'query'),
+ 'ka10059': ('종목별투자자기관별요청', '/api/dostk/stkinfo', 'POST', True, 'stk_invsr_orgn', 'query'),
+ 'ka10060': ('종목별투자자기관별차트요청', '/api/dostk/chart', 'POST', True, 'stk_invsr_orgn_chart', 'query'),
+ 'ka10061': ('종목별투자자기관별합계요청', '/api/dostk/stkinfo', 'POST', True, 'stk_invsr_orgn_tot', 'query'),
+ 'ka10062': ('동일순매매순위요청', '/api/dostk/rkinfo', 'POST', True, 'eql_nettrde_rank', 'query'),
+ 'ka10063': ('장중투자자별매매요청', '/api/dostk/mrkcond', 'POST', True, 'opmr_invsr_trde', 'query'),
+ 'ka10064': ('장중투자자별매매차트요청', '/api/dostk/chart', 'POST', True, 'opmr_invsr_trde_chart', 'query'),
+ 'ka10065': ('장중투자자별매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'opmr_invsr_trde_upper', 'query'),
+ 'ka10066': ('장마감후투자자별매매요청', '/api/dostk/mrkcond', 'POST', True, 'opaf_invsr_trde', 'query'),
+ 'ka10069': ('대차거래상위10종목요청', '/api/dostk/rkinfo', 'POST', True, 'dbrt_trde_upper_10stk', 'query'),
+ 'ka10072': ('일자별종목별실현손익요청_일자', '/api/dostk/acnt', 'POST', True, 'dt_stk_div_rlzt_pl', 'query'),
+ 'ka10073': ('일자별종목별실현손익요청_기간', '/api/dostk/acnt', 'POST', True, 'dt_rlzt_pl', 'query'),
+ 'ka10074': ('일자별실현손익요청', '/api/dostk/acnt', 'POST', True, 'dt_rlzt_pl', 'query'),
+ 'ka10075': ('미체결요청', '/api/dostk/acnt', 'POST', True, 'oso', 'query'),
+ 'ka10076': ('체결요청', '/api/dostk/acnt', 'POST', True, 'cntr', 'query'),
+ 'ka10077': ('당일실현손익상세요청', '/api/dostk/acnt', 'POST', True, 'tdy_rlzt_pl_dtl', 'query'),
+ 'ka10078': ('증권사별종목매매동향요청', '/api/dostk/mrkcond', 'POST', True, 'sec_stk_trde_trend', 'query'),
+ 'ka10079': ('주식틱차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_tic_chart_qry', 'query'),
+ 'ka10080': ('주식분봉차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_min_pole_chart_qry', 'query'),
+ 'ka10081': ('주식일봉차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_dt_pole_chart_qry', 'query'),
+ 'ka10082': ('주식주봉차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_stk_pole_chart_qry', 'query'),
+ 'ka10083': ('주식월봉차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_mth_pole_chart_qry', 'query'),
+ 'ka10084': ('당일전일체결요청', '/api/dostk/stkinfo', 'POST', True, 'tdy_pred_cntr', 'query'),
+ 'ka10085': ('계좌수익률요청', '/api/dostk/acnt', 'POST', True, 'acnt_prft_rt', 'query'),
+ 'ka10086': ('일별주가요청', '/api/dostk/mrkcond', 'POST', True, 'daly_stkpc', 'query'),
+ 'ka10087': ('시간외단일가요청', '/api/dostk/mrkcond', 'POST', True, None, 'query'),
+ 'ka10088': ('미체결 분할주문 상세', '/api/dostk/acnt', 'POST', True, 'osop', 'query'),
+ 'ka10094': ('주식년봉차트조회요청', '/api/dostk/chart', 'POST', True, 'stk_yr_pole_chart_qry', 'query'),
+ 'ka10095': ('관심종목정보요청', '/api/dostk/stkinfo', 'POST', False, None, 'query'),
+ 'ka10098': ('시간외단일가등락율순위요청', '/api/dostk/rkinfo', 'POST', True, 'ovt_sigpric_flu_rt_rank', 'query'),
+ 'ka10099': ('종목정보 리스트', '/api/dostk/stkinfo', 'POST', True, 'list', 'query'),
+ 'ka10100': ('종목정보 조회', '/api/dostk/stkinfo', 'POST', True, None, 'query'),
+ 'ka10101': ('업종코드 리스트', '/api/dostk/stkinfo', 'POST', True, 'list', 'query'),
+ 'ka10102': ('회원사 리스트', '/api/dostk/stkinfo', 'POST', True, 'list', 'query'),
+ 'ka10131': ('기관외국인연속매매현황요청', '/api/dostk/frgnistt', 'POST', True, 'orgn_frgnr_cont_trde_prst', 'query'),
+ 'ka10170': ('당일매매일지요청', '/api/dostk/acnt', 'POST', True, 'tdy_trde_diary', 'query'),
+ 'ka20001': ('업종현재가요청', '/api/dostk/sect', 'POST', True, 'inds_cur_prc_tm', 'query'),
+ 'ka20002': ('업종별주가요청', '/api/dostk/sect', 'POST', True, 'inds_stkpc', 'query'),
+ 'ka20003': ('전업종지수요청', '/api/dostk/sect', 'POST', True, 'all_inds_idex', 'query'),
+ 'ka20004': ('업종틱차트조회요청', '/api/dostk/chart', 'POST', True, 'inds_tic_chart_qry', 'query'),
+ 'ka20005': ('업종분봉조회요청', '/api/dostk/chart', 'POST', True, 'inds_min_pole_qry', 'query'),
+ 'ka20006': ('업종일봉조회요청', '/api/dostk/chart', 'POST', True, 'inds_dt_pole_qry', 'query'),
+ 'ka20007': ('업종주봉조회요청', '/api/dostk/chart', 'POST', True, 'inds_stk_pole_qry', 'query'),
+ 'ka20008': ('업종월봉조회요청', '/api/dostk/chart', 'POST', True, 'inds_mth_pole_qry', 'query'),
+ 'ka20009': ('업종현재가일별요청', '/api/dostk/sect', 'POST', True, 'inds_cur_prc_daly_rept', 'query'),
+ 'ka20019': ('업종년봉조회요청', '/api/dostk/chart', 'POST', True, 'inds_yr_pole_qry', 'query'),
+ 'ka30001': ('ELW가격급등락요청', '/api/dostk/elw', 'POST', True, 'elwpric_jmpflu', 'query'),
+ 'ka30002': ('거래원별ELW순매매상위요청', '/api/dostk/elw', 'POST', True, 'trde_ori_elwnettrde_upper', 'query'),
+ 'ka30003': ('ELWLP보유일별추이요청', '/api/dostk/elw', 'POST', True, 'elwlpposs_daly_trnsn', 'query'),
+ 'ka30004': ('ELW괴리율요청', '/api/dostk/elw', 'POST', True, 'elwdispty_rt', 'query'),
+ 'ka30005': ('ELW조건검색요청', '/api/dostk/elw', 'POST', True, 'elwcnd_qry', 'query'),
+ 'ka30009': ('ELW등락율순위요청', '/api/dostk/elw', 'POST', True, 'elwflu_rt_rank', 'query'),
+ 'ka30010': ('ELW잔량순위요청', '/api/dostk/elw', 'POST', True, 'elwreq_rank', 'query'),
+ 'ka30011': ('ELW근접율요청', '/api/dostk/elw', 'POST', True, 'elwalacc_rt', 'query'),
+ 'ka30012': ('ELW종목상세정보요청', '/api/dostk/elw', 'POST', True, None, 'query'),
+ 'ka40001': ('ETF수익율요청', '/api/dostk/etf', 'POST', True, 'etfprft_rt_lst', 'query'),
+ 'ka40002': ('ETF종목정보요청', '/api/dostk/etf', 'POST', True, None, 'query'),
+ 'ka40003': ('ETF일별추이요청', '/api/dostk/etf', 'POST', True, 'etfdaly_trnsn', 'query'),
+ 'ka40004': ('ETF전체시세요청', '/api/dostk/etf', 'POST', True, 'etfall_mrpr', 'query'),
+ 'ka40006': ('ETF시간대별추이요청', '/api/dostk/etf', 'POST', True, 'etftisl_trnsn', 'query'),
+ 'ka40007': ('ETF시간대별체결요청', '/api/dostk/etf', 'POST', True, 'etftisl_cntr_array', 'query'),
+ 'ka40008': ('ETF일자별체결요청', '/api/dostk/etf', 'POST', True, 'etfnetprps_qty_array', 'query'),
+ 'ka40009': ('ETF시간대별체결요청', '/api/dostk/etf', 'POST', True, 'etfnavarray', 'query'),
+ 'ka40010': ('ETF시간대별추이요청', '/api/dostk/etf', 'POST', True, 'etftisl_trnsn', 'query'),
+ 'ka90001': ('테마그룹별요청', '/api/dostk/thme', 'POST', True, 'thema_grp', 'query'),
+ 'ka90002': ('테마구성종목요청', '/api/dostk/thme', 'POST', True, 'thema_comp_stk', 'query'),
+ 'ka90003': ('프로그램순매수상위50요청', '/api/dostk/stkinfo', 'POST', True, 'prm_netprps_upper_50', 'query'),
+ 'ka90004': ('종목별프로그램매매현황요청', '/api/dostk/stkinfo', 'POST', True, 'stk_prm_trde_prst', 'query'),
+ 'ka90005': ('프로그램매매추이요청 시간대별', '/api/dostk/mrkcond', 'POST', True, 'prm_trde_trnsn', 'query'),
+ 'ka90006': ('프로그램매매차익잔고추이요청', '/api/dostk/mrkcond', 'POST', True, 'prm_trde_dfrt_remn_trnsn', 'query'),
+ 'ka90007': ('프로그램매매누적추이요청', '/api/dostk/mrkcond', 'POST', True, 'prm_trde_acc_trnsn', 'query'),
+ 'ka90008': ('종목시간별프로그램매매추이요청', '/api/dostk/mrkcond', 'POST', True, 'stk_tm_prm_trde_trnsn', 'query'),
+ 'ka90009': ('외국인기관매매상위요청', '/api/dostk/rkinfo', 'POST', True, 'frgnr_orgn_trde_upper', 'query'),
+ 'ka90010': ('프로그램매매추이요청 일자별', '/api/dostk/mrkcond', 'POST', True, 'prm_trde_trnsn', 'query'),
+ 'ka90012': ('대차거래내역요청', '/api/dostk/stkinfo', 'POST', True, 'dbrt_trde_prps', 'query'),
+ 'ka90013': ('종목일별프로그램매매추이요청', '/api/dostk/mrkcond', 'POST', True, 'stk_daly_prm_trde_trnsn', 'query'),
+ 'kt00001': ('예수금상세현황요청', '/api/dostk/acnt', 'POST', True, 'stk_entr_prst', 'query'),
+ 'kt00002': ('일별추정예탁자산현황요청', '/api/dostk/acnt', 'POST', True, 'daly_prsm_dpst_aset_amt_prst', 'query'),
+ 'kt00003': ('추정자산조회요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00004': ('계좌평가현황요청', '/api/dostk/acnt', 'POST', True, 'stk_acnt_evlt_prst', 'query'),
+ 'kt00005': ('체결잔고요청', '/api/dostk/acnt', 'POST', True, 'stk_cntr_remn', 'query'),
+ 'kt00007': ('계좌별주문체결현황요청', '/api/dostk/acnt', 'POST', True, 'acnt_ord_cntr_prps_dtl', 'query'),
+ 'kt00008': ('계좌별익일결제예정내역요청', '/api/dostk/acnt', 'POST', True, 'acnt_nxdy_setl_frcs_prps_array', 'query'),
+ 'kt00010': ('주문인출가능금액요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00011': ('증거금율별주문가능수량조회요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00012': ('신용보증금율별주문가능수량조회요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00013': ('증거금세부내역조회요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00015': ('위탁종합거래내역요청', '/api/dostk/acnt', 'POST', True, 'trst_ovrl_trde_prps_array', 'query'),
+ 'kt00016': ('일별계좌수익률상세현황요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00017': ('계좌별당일현황요청', '/api/dostk/acnt', 'POST', True, None, 'query'),
+ 'kt00018': ('계좌평가잔고내역요청', '/api/dostk/acnt', 'POST', True, 'acnt_evlt_remn_indv_tot', 'query'),
+ 'kt10000': ('주식 매수주문', '/api/dostk/ordr', 'POST', True, None, 'order'),
+ 'kt10001': ('주식 매도주문', '/api/dostk/ordr', 'POST', True, None, 'order'),
+ 'kt10002': ('주식 정정주문', '/api/dostk/ordr', 'POST', True, None, 'order'),
+ 'kt10003': ('주식 취소주문', '/api/dostk/ordr', 'POST', True, None, 'order'),
+ 'kt10006': ('신용 매수주문', '/api/dostk/crdordr', 'POST', True, None, 'order'),
+ 'kt10007': ('신용 매도주문', '/api/dostk/crdordr', 'POST', True, None, 'order'),
+ 'kt10008': ('신용 정정주문', '/api/dostk/crdordr', 'POST', True, None, 'order'),
+ 'kt10009': ('신용 취소주문', '/api/dostk/crdordr', 'POST', True, None, 'order')}
@@ -0,0 +1,404 @@
+"""
+키움증권 API 응답 행 변환 모듈
+
+키움 API 는 가격·수량을 "+72300", "-1500" 처럼 부호가 붙은 문자열로 반환합니다.
+TR 별 필드 스키마(kiwoom_api.schema, document/*.txt 에서 생성)로 숫자 필드를 한 번만 변환하여
+__slots__ 행 객체(parse_rows) 또는 필드별 배열로 저장하는 레코드 배치(parse_batch)를 만듭니다.
+
+부호는 그대로 유지됩니다. 현재가처럼 부호가 등락 방향을 뜻하는 필드의 가격 자체는 abs() 로 구합니다.
+"""
+
+import keyword
+import re
+from array import array
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from .registry import lookup
+from .schema import TR_SCHEMAS
+
+# 필드 종류
+INT = 'int'
+FLOAT = 'float'
+STR = 'str'
+
+# 문자열 필드로 판별하는 필드명 마지막 단어
+STR_TOKENS = frozenset((
+    'nm', 'cd', 'tp', 'dt', 'tm', 'no', 'yn', 'id', 'msg', 'date', 'code', 'time', 'name', 'txt',
+    'sig', 'sign', 'stat', 'state', 'type', 'token',
+))
+
+# 문자열 필드로 판별하는 한글명 끝부분
+STR_LABELS = (
+    '코드', '명', '일자', '시간', '구분', '번호', '여부', '부호', '기호', '시각', '유형', '상태', '내용', '사유',
+    '방법', '분류', '날짜', '지점', '이름', '거래원', '기초자산', '정보', '종목', '시장', '통화',
+    '토큰', '텍스트', '메시지',
+)
+
+# 실수 필드로 판별하는 필드명 마지막 단어
+FLOAT_TOKENS = frozenset((
+    'rt', 'wght', 'per', 'pbr', 'roe', 'str', 'delta', 'gam', 'theta', 'vega', 'law', 'drng', 'ratio',
+))
+
+# 실수 필드로 판별하는 한글명 끝부분 ('대비'는 가격 차이이므로 제외)
+FLOAT_LABELS = ('률', '율', '비율', '비중', '강도', '델타', '감마', '쎄타', '베가', '배수', '비')
+
+
+def classify_field(name: str, label: str = '') -> str:
+    """
+    필드명과 한글명으로 필드 종류 판별
+
+    Args:
+        name (str): 필드명 (예: 'cur_prc')
+        label (str, optional): 한글명 (예: '현재가')
+
+    Returns:
+        str: INT, FLOAT 또는 STR
+    """
+    token = re.sub(r'(_n|_?\d+)$', '', name).rsplit('_', 1)[-1]
+    label = re.sub(r'\(.*?\)|n$|\d+$', '', label.strip())
+    if token in STR_TOKENS or label.endswith(STR_LABELS):
+        return STR
+    if token in FLOAT_TOKENS or (label.endswith(FLOAT_LABELS) and not label.endswith('대비')):
+        return FLOAT
+    return INT
+
+
+def parse_int(value: Any) -> Any:
+    """
+    부호 있는 정수 문자열 변환 ("+72300" -> 72300, "-1500" -> -1500, "" -> 0)
+
+    소수점이 있으면 실수로, 숫자가 아니면 원래 값 그대로 반환합니다.
+    """
+    if value.__class__ is not str:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    stripped = value.strip()
+    if stripped in ('', '+', '-'):
+        return 0
+    try:
+        return float(stripped)
+    except ValueError:
+        return value
+
+
+def parse_float(value: Any) -> Any:
+    """
+    부호 있는 실수 문자열 변환 ("+1.50" -> 1.5, "" -> 0.0)
+
+    숫자가 아니면 원래 값 그대로 반환합니다.
+    """
+    if value.__class__ is not str:
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if value.strip() in ('', '+', '-'):
+        return 0.0
+    return value
+
+
+def parse_str(value: Any) -> Any:
+    """문자열 필드 (변환하지 않음)"""
+    return value
+
+
+PARSERS: Dict[str, Callable[[Any], Any]] = {INT: parse_int, FLOAT: parse_float, STR: parse_str}
+
+
+def _attr_name(field: str) -> str:
+    """필드명을 속성 이름으로 변환 (숫자로 시작하거나 예약어이면 앞에 'f_' 추가)"""
+    attr = field.replace('-', '_')
+    if not attr.isidentifier() or keyword.iskeyword(attr):
+        attr = 'f_' + attr
+    return attr
+
+
+def schema_for(api_id: str, list_field: str = None, body: Mapping = None) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    TR 응답의 필드 스키마 조회
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        list_field (str, optional): 행 목록 필드명. 기본값은 None
+            (TR 등록 정보의 목록 필드, 없으면 스키마의 첫 번째 목록 또는 응답의 첫 번째 목록 필드)
+        body (Mapping, optional): 응답 본문. 스키마가 없는 TR 은 본문의 필드로 추정
+
+    Returns:
+        Tuple[str, Dict[str, str]]: (목록 필드명, 필드명별 종류). 목록이 아닌 본문 필드이면 목록 필드명은 None
+    """
+    schema = TR_SCHEMAS.get(api_id, {})
+    lists = schema.get('lists', {})
+
+    if list_field is None:
+        info = lookup(api_id)
+        if info is not None and info.list_field is not None and (body is None or info.list_field in body):
+            list_field = info.list_field
+
+    if list_field is None and body is not None:
+        for key, value in body.items():
+            if isinstance(value, list):
+                list_field = key
+                break
+    elif list_field is None and lists:
+        list_field = next(iter(lists))
+
+    if list_field is not None and list_field in lists:
+        return list_field, lists[list_field]
+    if list_field is None and 'fields' in schema:
+        return None, schema['fields']
+
+    # 스키마가 없으면 응답의 필드명으로 추정
+    sample = {}
+    if body is not None:
+        if list_field is None:
+            sample = body
+        else:
+            rows = body.get(list_field) or []
+            sample = rows[0] if rows else {}
+    return list_field, {
+        name: classify_field(name) for name, value in sample.items() if not isinstance(value, (list, dict))
+    }
+
+
+class Row:
+    """TR 응답 행 객체의 기본 클래스 (TR 별 __slots__ 클래스는 row_class 로 생성)"""
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _attrs: Tuple[str, ...] = ()
+    _parsers: Tuple[Callable[[Any], Any], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'Row':
+        """
+        응답 행 딕셔너리로 행 객체 생성 (숫자 필드 변환)
+
+        Args:
+            data (Mapping): 응답 행
+
+        Returns:
+            Row: 행 객체 (응답에 없는 필드는 None)
+        """
+        row = cls.__new__(cls)
+        get = data.get
+        for attr, field, parse in zip(cls._attrs, cls._fields, cls._parsers):
+            value = get(field)
+            setattr(row, attr, None if value is None else parse(value))
+        return row
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원래 필드명을 키로 하는 딕셔너리로 변환"""
+        return {field: getattr(self, attr) for field, attr in zip(self._fields, self._attrs)}
+
+    def __getitem__(self, field: str) -> Any:
+        return getattr(self, _attr_name(field))
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{attr}={getattr(self, attr)!r}" for attr in self._attrs)
+        return f"{type(self).__name__}({values})"
+
+
+_ROW_CLASSES: Dict[Tuple[str, Optional[str], Tuple[str, ...]], Type[Row]] = {}
+
+
+def row_class(api_id: str, list_field: str = None, schema: Dict[str, str] = None) -> Type[Row]:
+    """
+    TR 응답 행의 __slots__ 클래스 생성 (같은 스키마는 한 번만 생성)
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        list_field (str, optional): 행 목록 필드명. 기본값은 None (스키마의 첫 번째 목록)
+        schema (Dict[str, str], optional): 필드명별 종류. 기본값은 None (kiwoom_api.schema 에서 조회)
+
+    Returns:
+        Type[Row]: 행 클래스
+    """
+    if schema is None:
+        list_field, schema = schema_for(api_id, list_field)
+    key = (api_id, list_field, tuple(schema.items()))
+    cls = _ROW_CLASSES.get(key)
+    if cls is None:
+        attrs = tuple(_attr_name(field) for field in schema)
+        name = ''.join(part.capitalize() for part in re.split(r'[^0-9a-zA-Z]+', f"{api_id}_{list_field or 'body'}"))
+        cls = _ROW_CLASSES[key] = type(name, (Row,), {
+            '__slots__': attrs,
+            '_fields': tuple(schema),
+            '_attrs': attrs,
+            '_parsers': tuple(PARSERS[kind] for kind in schema.values()),
+        })
+        cls.from_dict = classmethod(_compile_from_dict(schema, attrs))
+    return cls
+
+
+def _compile_from_dict(schema: Dict[str, str], attrs: Tuple[str, ...]) -> Callable:
+    """필드별 변환을 펼쳐 쓴 from_dict 함수 생성 (반복문과 동적 속성 설정 비용 제거)"""
+    lines = ['def from_dict(cls, data):', '    row = _new(cls)', '    get = data.get']
+    for (field, kind), attr in zip(schema.items(), attrs):
+        lines.append(f'    value = get({field!r})')
+        if kind == STR:
+            lines.append(f'    row.{attr} = value')
+        else:
+            lines.append(f'    row.{attr} = None if value is None else parse_{kind}(value)')
+    lines.append('    return row')
+    namespace = {'_new': object.__new__, 'parse_int': parse_int, 'parse_float': parse_float}
+    exec('\n'.join(lines), namespace)
+    return namespace['from_dict']
+
+
+def parse_rows(api_id: str, body: Mapping, list_field: str = None) -> List[Row]:
+    """
+    응답 본문의 행 목록을 행 객체 목록으로 변환
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        body (Mapping): API 응답 본문 (request_api 결과의 'data')
+        list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+
+    Returns:
+        List[Row]: 행 객체 목록
+    """
+    list_field, schema = schema_for(api_id, list_field, body)
+    if list_field is None:
+        return []
+    from_dict = row_class(api_id, list_field, schema).from_dict
+    return [from_dict(row) for row in body.get(list_field) or []]
+
+
+def parse_record(api_id: str, body: Mapping) -> Row:
+    """
+    목록이 아닌 응답 본문 필드(예: 주식기본정보)를 행 객체로 변환
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        body (Mapping): API 응답 본문
+
+    Returns:
+        Row: 행 객체
+    """
+    schema = TR_SCHEMAS.get(api_id, {}).get('fields')
+    if schema is None:
+        schema = {name: classify_field(name) for name, value in body.items() if not isinstance(value, (list, dict))}
+    return row_class(api_id, None, schema).from_dict(body)
+
+
+def _column(kind: str, values: List[Any]) -> Union[array, List[Any]]:
+    """필드 값 목록을 한 번에 변환하여 배열로 저장 (숫자가 아닌 값이 섞이면 목록)"""
+    if kind == INT:
+        parsed = list(map(parse_int, values))
+        try:
+            return array('q', parsed)
+        except (TypeError, OverflowError):
+            kind, values = FLOAT, parsed
+    if kind == FLOAT:
+        parsed = list(map(parse_float, values))
+        try:
+            return array('d', parsed)
+        except TypeError:
+            return parsed
+    return list(values)
+
+
+class RecordBatch:
+    """필드별 배열(array.array)로 저장한 TR 응답 행 묶음"""
+
+    def __init__(self, api_id: str, schema: Dict[str, str], columns: Dict[str, Sequence[Any]], list_field: str = None):
+        """
+        레코드 배치 초기화 (보통 parse_batch 로 생성)
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            schema (Dict[str, str]): 필드명별 종류
+            columns (Dict[str, Sequence]): 필드명별 값 배열
+            list_field (str, optional): 행 목록 필드명
+        """
+        self.api_id = api_id
+        self.schema = schema
+        self.columns = columns
+        self.list_field = list_field
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_rows(cls, api_id: str, rows: Sequence[Mapping], schema: Dict[str, str], list_field: str = None) -> 'RecordBatch':
+        """
+        응답 행 목록을 필드별로 한 번에 변환하여 레코드 배치 생성
+
+        Args:
+            api_id (str): API ID (TR 코드)
+            rows (Sequence[Mapping]): 응답 행 목록
+            schema (Dict[str, str]): 필드명별 종류
+            list_field (str, optional): 행 목록 필드명
+
+        Returns:
+            RecordBatch: 레코드 배치
+        """
+        columns = {field: _column(kind, [row.get(field, '') for row in rows]) for field, kind in schema.items()}
+        return cls(api_id, schema, columns, list_field)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Row:
+        cls = row_class(self.api_id, self.list_field, self.schema)
+        row = cls.__new__(cls)
+        for field, attr in zip(cls._fields, cls._attrs):
+            setattr(row, attr, self.columns[field][index])
+        return row
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self._length):
+            yield self[index]
+
+    def column(self, field: str) -> Sequence[Any]:
+        """
+        필드 값 배열 조회
+
+        Args:
+            field (str): 필드명
+
+        Returns:
+            Sequence: 숫자 필드는 array.array, 문자열 필드는 list
+        """
+        return self.columns[field]
+
+    def extend(self, other: 'RecordBatch'):
+        """
+        같은 스키마의 레코드 배치 이어붙이기 (연속조회 페이지 누적)
+
+        Args:
+            other (RecordBatch): 이어붙일 레코드 배치
+        """
+        for field, values in other.columns.items():
+            column = self.columns[field]
+            if isinstance(column, array) and isinstance(values, array) and column.typecode == values.typecode:
+                column.extend(values)
+            else:
+                self.columns[field] = list(column) + list(values)
+        self._length += len(other)
+
+    def __repr__(self) -> str:
+        return f"RecordBatch({self.api_id}, {self._length} rows, {len(self.columns)} fields)"
+
+
+def parse_batch(api_id: str, body: Mapping, list_field: str = None) -> RecordBatch:
+    """
+    응답 본문의 행 목록을 레코드 배치로 변환
+
+    Args:
+        api_id (str): API ID (TR 코드)
+        body (Mapping): API 응답 본문 (request_api 결과의 'data')
+        list_field (str, optional): 행 목록 필드명. 기본값은 None (TR 등록 정보의 목록 필드, 없으면 응답의 첫 번째 목록 필드)
+
+    Returns:
+        RecordBatch: 레코드 배치
+    """
+    list_field, schema = schema_for(api_id, list_field, body)
+    rows = (body.get(list_field) or []) if list_field is not None else []
+    return RecordBatch.from_rows(api_id, rows, schema, list_field)
@@ -0,0 +1,2728 @@
+"""
+키움증권 TR 응답 필드 스키마
+
+이 파일은 tools/gen_schema.py 로 document/*.txt 에서 자동 생성되었습니다. 직접 수정하지 마세요.
+
+TR_SCHEMAS[api_id] = {
+    'title': TR 명,
+    'fields': 목록이 아닌 본문 필드 {필드명: 종류},
+    'lists': 목록 필드별 행 필드 {목록 필드명: {필드명: 종류}},
+}
+"""
+
+TR_SCHEMAS = {'ka10001': {'title': '주식기본정보요청',
+             'fields': {'stk_cd': 'str',
+                        'stk_nm': 'str',
+                        'setl_mm': 'int',
+                        'fav': 'int',
+                        'cap': 'int',
+                        'flo_stk': 'int',
+                        'crd_rt': 'float',
+                        'oyr_hgst': 'int',
+                        'oyr_lwst': 'int',
+                        'mac': 'int',
+                        'mac_wght': 'float',
+                        'for_exh_rt': 'float',
+                        'repl_pric': 'int',
+                        'per': 'float',
+                        'eps': 'int',
+                        'roe': 'float',
+                        'pbr': 'float',
+                        'ev': 'int',
+                        'bps': 'int',
+                        'sale_amt': 'int',
+                        'bus_pro': 'int',
+                        'cup_nga': 'int',
+                        '250hgst': 'int',
+                        '250lwst': 'int',
+                        'high_pric': 'int',
+                        'open_pric': 'int',
+                        'low_pric': 'int',
+                        'upl_pric': 'int',
+                        'lst_pric': 'int',
+                        'base_pric': 'int',
+                        'exp_cntr_pric': 'int',
+                        'exp_cntr_qty': 'int',
+                        '250hgst_pric_dt': 'str',
+                        '250hgst_pric_pre_rt': 'float',
+                        '250lwst_pric_dt': 'str',
+                        '250lwst_pric_pre_rt': 'float',
+                        'cur_prc': 'int',
+                        'pre_sig': 'str',
+                        'pred_pre': 'int',
+                        'flu_rt': 'float',
+                        'trde_qty': 'int',
+                        'trde_pre': 'int',
+                        'fav_unit': 'int',
+                        'dstr_stk': 'int',
+                        'dstr_rt': 'float'},
+             'lists': {}},
+ 'ka10002': {'title': '주식거래원요청',
+             'fields': {'stk_cd': 'str',
+                        'stk_nm': 'str',
+                        'cur_prc': 'int',
+                        'flu_smbol': 'str',
+                        'base_pric': 'int',
+                        'pred_pre': 'int',
+                        'flu_rt': 'float',
+                        'sel_trde_ori_nm_1': 'str',
+                        'sel_trde_ori_1': 'str',
+                        'sel_trde_qty_1': 'int',
+                        'buy_trde_ori_nm_1': 'str',
+                        'buy_trde_ori_1': 'str',
+                        'buy_trde_qty_1': 'int',
+                        'sel_trde_ori_nm_2': 'str',
+                        'sel_trde_ori_2': 'str',
+                        'sel_trde_qty_2': 'int',
+                        'buy_trde_ori_nm_2': 'str',
+                        'buy_trde_ori_2': 'str',
+                        'buy_trde_qty_2': 'int',
+                        'sel_trde_ori_nm_3': 'str',
+                        'sel_trde_ori_3': 'str',
+                        'sel_trde_qty_3': 'int',
+                        'buy_trde_ori_nm_3': 'str',
+                        'buy_trde_ori_3': 'str',
+                        'buy_trde_qty_3': 'int',
+                        'sel_trde_ori_nm_4': 'str',
+                        'sel_trde_ori_4': 'str',
+                        'sel_trde_qty_4': 'int',
+                        'buy_trde_ori_nm_4': 'str',
+                        'buy_trde_ori_4': 'str',
+                        'buy_trde_qty_4': 'int',
+                        'sel_trde_ori_nm_5': 'str',
+                        'sel_trde_ori_5': 'str',
+                        'sel_trde_qty_5': 'int',
+                        'buy_trde_ori_nm_5': 'str',
+                        'buy_trde_ori_5': 'str',
+                        'buy_trde_qty_5': 'int'},
+             'lists': {}},
+ 'ka10003': {'title': '체결정보요청',
+             'fields': {},
+             'lists': {'cntr_infr': {'tm': 'str',
+                                     'cur_prc': 'int',
+                                     'pred_pre': 'int',
+                                     'pre_rt': 'float',
+                                     'pri_sel_bid_unit': 'int',
+                                     'pri_buy_bid_unit': 'int',
+                                     'cntr_trde_qty': 'int',
+                                     'sign': 'str',
+                                     'acc_trde_qty': 'int',
+                                     'acc_trde_prica': 'int',
+                                     'cntr_str': 'float',
+                                     'stex_tp': 'str'}}},
+ 'ka10004': {'title': '주식호가요청',
+             'fields': {'bid_req_base_tm': 'str',
+                        'sel_10th_pre_req_pre': 'int',
+                        'sel_10th_pre_req': 'int',
+                        'sel_10th_pre_bid': 'int',
+                        'sel_9th_pre_req_pre': 'int',
+                        'sel_9th_pre_req': 'int',
+                        'sel_9th_pre_bid': 'int',
+                        'sel_8th_pre_req_pre': 'int',
+                        'sel_8th_pre_req': 'int',
+                        'sel_8th_pre_bid': 'int',
+                        'sel_7th_pre_req_pre': 'int',
+                        'sel_7th_pre_req': 'int',
+                        'sel_7th_pre_bid': 'int',
+                        'sel_6th_pre_req_pre': 'int',
+                        'sel_6th_pre_req': 'int',
+                        'sel_6th_pre_bid': 'int',
+                        'sel_5th_pre_req_pre': 'int',
+                        'sel_5th_pre_req': 'int',
+                        'sel_5th_pre_bid': 'int',
+                        'sel_4th_pre_req_pre': 'int',
+                        'sel_4th_pre_req': 'int',
+                        'sel_4th_pre_bid': 'int',
+                        'sel_3th_pre_req_pre': 'int',
+                        'sel_3th_pre_req': 'int',
+                        'sel_3th_pre_bid': 'int',
+                        'sel_2th_pre_req_pre': 'int',
+                        'sel_2th_pre_req': 'int',
+                        'sel_2th_pre_bid': 'int',
+                        'sel_1th_pre_req_pre': 'int',
+                        'sel_fpr_req': 'int',
+                        'sel_fpr_bid': 'int',
+                        'buy_fpr_bid': 'int',
+                        'buy_fpr_req': 'int',
+                        'buy_1th_pre_req_pre': 'int',
+                        'buy_2th_pre_bid': 'int',
+                        'buy_2th_pre_req': 'int',
+                        'buy_2th_pre_req_pre': 'int',
+                        'buy_3th_pre_bid': 'int',
+                        'buy_3th_pre_req': 'int',
+                        'buy_3th_pre_req_pre': 'int',
+                        'buy_4th_pre_bid': 'int',
+                        'buy_4th_pre_req': 'int',
+                        'buy_4th_pre_req_pre': 'int',
+                        'buy_5th_pre_bid': 'int',
+                        'buy_5th_pre_req': 'int',
+                        'buy_5th_pre_req_pre': 'int',
+                        'buy_6th_pre_bid': 'int',
+                        'buy_6th_pre_req': 'int',
+                        'buy_6th_pre_req_pre': 'int',
+                        'buy_7th_pre_bid': 'int',
+                        'buy_7th_pre_req': 'int',
+                        'buy_7th_pre_req_pre': 'int',
+                        'buy_8th_pre_bid': 'int',
+                        'buy_8th_pre_req': 'int',
+                        'buy_8th_pre_req_pre': 'int',
+                        'buy_9th_pre_bid': 'int',
+                        'buy_9th_pre_req': 'int',
+                        'buy_9th_pre_req_pre': 'int',
+                        'buy_10th_pre_bid': 'int',
+                        'buy_10th_pre_req': 'int',
+                        'buy_10th_pre_req_pre': 'int',
+                        'tot_sel_req_jub_pre': 'int',
+                        'tot_sel_req': 'int',
+                        'tot_buy_req': 'int',
+                        'tot_buy_req_jub_pre': 'int',
+                        'ovt_sel_req_pre': 'int',
+                        'ovt_sel_req': 'int',
+                        'ovt_buy_req': 'int',
+                        'ovt_buy_req_pre': 'int'},
+             'lists': {}},
+ 'ka10005': {'title': '주식일주월시분요청',
+             'fields': {},
+             'lists': {'stk_ddwkmm': {'date': 'str',
+                                      'open_pric': 'int',
+                                      'high_pric': 'int',
+                                      'low_pric': 'int',
+                                      'close_pric': 'int',
+                                      'pre': 'int',
+                                      'flu_rt': 'float',
+                                      'trde_qty': 'int',
+                                      'trde_prica': 'int',
+                                      'for_poss': 'int',
+                                      'for_wght': 'float',
+                                      'for_netprps': 'int',
+                                      'orgn_netprps': 'int',
+                                      'ind_netprps': 'int',
+                                      'crd_remn_rt': 'float',
+                                      'frgn': 'int',
+                                      'prm': 'int'}}},
+ 'ka10006': {'title': '주식시분요청',
+             'fields': {'date': 'str',
+                        'open_pric': 'int',
+                        'high_pric': 'int',
+                        'low_pric': 'int',
+                        'close_pric': 'int',
+                        'pre': 'int',
+                        'flu_rt': 'float',
+                        'trde_qty': 'int',
+                        'trde_prica': 'int',
+                        'cntr_str': 'float'},
+             'lists': {}},
+ 'ka10007': {'title': '시세표성정보요청',
+             'fields': {'stk_nm': 'str',
+                        'stk_cd': 'str',
+                        'date': 'str',
+                        'tm': 'str',
+                        'pred_close_pric': 'int',
+                        'pred_trde_qty': 'int',
+                        'upl_pric': 'int',
+                        'lst_pric': 'int',
+                        'pred_trde_prica': 'int',
+                        'flo_stkcnt': 'int',
+                        'cur_prc': 'int',
+                        'smbol': 'str',
+                        'flu_rt': 'float',
+                        'pred_rt': 'float',
+                        'open_pric': 'int',
+                        'high_pric': 'int',
+                        'low_pric': 'int',
+                        'cntr_qty': 'int',
+                        'trde_qty': 'int',
+                        'trde_prica': 'int',
+                        'exp_cntr_pric': 'int',
+                        'exp_cntr_qty': 'int',
+                        'exp_sel_pri_bid': 'int',
+                        'exp_buy_pri_bid': 'int',
+                        'trde_strt_dt': 'str',
+                        'exec_pric': 'int',
+                        'hgst_pric': 'int',
+                        'lwst_pric': 'int',
+                        'hgst_pric_dt': 'str',
+                        'lwst_pric_dt': 'str',
+                        'sel_1bid': 'int',
+                        'sel_2bid': 'int',
+                        'sel_3bid': 'int',
+                        'sel_4bid': 'int',
+                        'sel_5bid': 'int',
+                        'sel_6bid': 'int',
+                        'sel_7bid': 'int',
+                        'sel_8bid': 'int',
+                        'sel_9bid': 'int',
+                        'sel_10bid': 'int',
+                        'buy_1bid': 'int',
+                        'buy_2bid': 'int',
+                        'buy_3bid': 'int',
+                        'buy_4bid': 'int',
+                        'buy_5bid': 'int',
+                        'buy_6bid': 'int',
+                        'buy_7bid': 'int',
+                        'buy_8bid': 'int',
+                        'buy_9bid': 'int',
+                        'buy_10bid': 'int',
+                        'sel_1bid_req': 'int',
+                        'sel_2bid_req': 'int',
+                        'sel_3bid_req': 'int',
+                        'sel_4bid_req': 'int',
+                        'sel_5bid_req': 'int',
+                        'sel_6bid_req': 'int',
+                        'sel_7bid_req': 'int',
+                        'sel_8bid_req': 'int',
+                        'sel_9bid_req': 'int',
+                        'sel_10bid_req': 'int',
+                        'buy_1bid_req': 'int',
+                        'buy_2bid_req': 'int',
+                        'buy_3bid_req': 'int',
+                        'buy_4bid_req': 'int',
+                        'buy_5bid_req': 'int',
+                        'buy_6bid_req': 'int',
+                        'buy_7bid_req': 'int',
+                        'buy_8bid_req': 'int',
+                        'buy_9bid_req': 'int',
+                        'buy_10bid_req': 'int',
+                        'sel_1bid_jub_pre': 'int',
+                        'sel_2bid_jub_pre': 'int',
+                        'sel_3bid_jub_pre': 'int',
+                        'sel_4bid_jub_pre': 'int',
+                        'sel_5bid_jub_pre': 'int',
+                        'sel_6bid_jub_pre': 'int',
+                        'sel_7bid_jub_pre': 'int',
+                        'sel_8bid_jub_pre': 'int',
+                        'sel_9bid_jub_pre': 'int',
+                        'sel_10bid_jub_pre': 'int',
+                        'buy_1bid_jub_pre': 'int',
+                        'buy_2bid_jub_pre': 'int',
+                        'buy_3bid_jub_pre': 'int',
+                        'buy_4bid_jub_pre': 'int',
+                        'buy_5bid_jub_pre': 'int',
+                        'buy_6bid_jub_pre': 'int',
+                        'buy_7bid_jub_pre': 'int',
+                        'buy_8bid_jub_pre': 'int',
+                        'buy_9bid_jub_pre': 'int',
+                        'buy_10bid_jub_pre': 'int',
+                        'sel_1bid_cnt': 'int',
+                        'sel_2bid_cnt': 'int',
+                        'sel_3bid_cnt': 'int',
+                        'sel_4bid_cnt': 'int',
+                        'sel_5bid_cnt': 'int',
+                        'buy_1bid_cnt': 'int',
+                        'buy_2bid_cnt': 'int',
+                        'buy_3bid_cnt': 'int',
+                        'buy_4bid_cnt': 'int',
+                        'buy_5bid_cnt': 'int',
+                        'lpsel_1bid_req': 'int',
+                        'lpsel_2bid_req': 'int',
+                        'lpsel_3bid_req': 'int',
+                        'lpsel_4bid_req': 'int',
+                        'lpsel_5bid_req': 'int',
+                        'lpsel_6bid_req': 'int',
+                        'lpsel_7bid_req': 'int',
+                        'lpsel_8bid_req': 'int',
+                        'lpsel_9bid_req': 'int',
+                        'lpsel_10bid_req': 'int',
+                        'lpbuy_1bid_req': 'int',
+                        'lpbuy_2bid_req': 'int',
+                        'lpbuy_3bid_req': 'int',
+                        'lpbuy_4bid_req': 'int',
+                        'lpbuy_5bid_req': 'int',
+                        'lpbuy_6bid_req': 'int',
+                        'lpbuy_7bid_req': 'int',
+                        'lpbuy_8bid_req': 'int',
+                        'lpbuy_9bid_req': 'int',
+                        'lpbuy_10bid_req': 'int',
+                        'tot_buy_req': 'int',
+                        'tot_sel_req': 'int',
+                        'tot_buy_cnt': 'int',
+                        'tot_sel_cnt': 'int'},
+             'lists': {}},
+ 'ka10008': {'title': '주식외국인종목별매매동향',
+             'fields': {},
+             'lists': {'stk_frgnr': {'dt': 'str',
+                                     'close_pric': 'int',
+                                     'pred_pre': 'int',
+                                     'trde_qty': 'int',
+                                     'chg_qty': 'int',
+                                     'poss_stkcnt': 'int',
+                                     'wght': 'float',
+                                     'gain_pos_stkcnt': 'int',
+                                     'frgnr_limit': 'int',
+                                     'frgnr_limit_irds': 'int',
+                                     'limit_exh_rt': 'float'}}},
+ 'ka10009': {'title': '주식기관요청',
+             'fields': {'date': 'str',
+                        'close_pric': 'int',
+                        'pre': 'int',
+                        'orgn_dt_acc': 'int',
+                        'orgn_daly_nettrde': 'int',
+                        'frgnr_daly_nettrde': 'int',
+                        'frgnr_qota_rt': 'float'},
+             'lists': {}},
+ 'ka10010': {'title': '업종프로그램요청',
+             'fields': {'dfrt_trst_sell_qty': 'int',
+                        'dfrt_trst_sell_amt': 'int',
+                        'dfrt_trst_buy_qty': 'int',
+                        'dfrt_trst_buy_amt': 'int',
+                        'dfrt_trst_netprps_qty': 'int',
+                        'dfrt_trst_netprps_amt': 'int',
+                        'ndiffpro_trst_sell_qty': 'int',
+                        'ndiffpro_trst_sell_amt': 'int',
+                        'ndiffpro_trst_buy_qty': 'int',
+                        'ndiffpro_trst_buy_amt': 'int',
+                        'ndiffpro_trst_netprps_qty': 'int',
+                        'ndiffpro_trst_netprps_amt': 'int',
+                        'all_dfrt_trst_sell_qty': 'int',
+                        'all_dfrt_trst_sell_amt': 'int',
+                        'all_dfrt_trst_buy_qty': 'int',
+                        'all_dfrt_trst_buy_amt': 'int',
+                        'all_dfrt_trst_netprps_qty': 'int',
+                        'all_dfrt_trst_netprps_amt': 'int'},
+             'lists': {}},
+ 'ka10011': {'title': '신주인수권전체시세요청',
+             'fields': {},
+             'lists': {'newstk_recvrht_mrpr': {'stk_cd': 'str',
+                                               'stk_nm': 'str',
+                                               'cur_prc': 'int',
+                                               'pred_pre_sig': 'str',
+                                               'pred_pre': 'int',
+                                               'flu_rt': 'float',
+                                               'fpr_sel_bid': 'int',
+                                               'fpr_buy_bid': 'int',
+                                               'acc_trde_qty': 'int',
+                                               'open_pric': 'int',
+                                               'high_pric': 'int',
+                                               'low_pric': 'int'}}},
+ 'ka10013': {'title': '신용매매동향요청',
+             'fields': {},
+             'lists': {'crd_trde_trend': {'dt': 'str',
+                                          'cur_prc': 'int',
+                                          'pred_pre_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'trde_qty': 'int',
+                                          'new': 'int',
+                                          'rpya': 'int',
+                                          'remn': 'int',
+                                          'amt': 'int',
+                                          'pre': 'int',
+                                          'shr_rt': 'float',
+                                          'remn_rt': 'float'}}},
+ 'ka10015': {'title': '일별거래상세요청',
+             'fields': {},
+             'lists': {'daly_trde_dtl': {'dt': 'str',
+                                         'close_pric': 'int',
+                                         'pred_pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'flu_rt': 'float',
+                                         'trde_qty': 'int',
+                                         'trde_prica': 'int',
+                                         'bf_mkrt_trde_qty': 'int',
+                                         'bf_mkrt_trde_wght': 'float',
+                                         'opmr_trde_qty': 'int',
+                                         'opmr_trde_wght': 'float',
+                                         'af_mkrt_trde_qty': 'int',
+                                         'af_mkrt_trde_wght': 'float',
+                                         'tot_3': 'int',
+                                         'prid_trde_qty': 'int',
+                                         'cntr_str': 'float',
+                                         'for_poss': 'int',
+                                         'for_wght': 'float',
+                                         'for_netprps': 'int',
+                                         'orgn_netprps': 'int',
+                                         'ind_netprps': 'int',
+                                         'frgn': 'int',
+                                         'crd_remn_rt': 'float',
+                                         'prm': 'int',
+                                         'bf_mkrt_trde_prica': 'int',
+                                         'bf_mkrt_trde_prica_wght': 'float',
+                                         'opmr_trde_prica': 'int',
+                                         'opmr_trde_prica_wght': 'float',
+                                         'af_mkrt_trde_prica': 'int',
+                                         'af_mkrt_trde_prica_wght': 'float'}}},
+ 'ka10016': {'title': '신고저가요청',
+             'fields': {},
+             'lists': {'ntl_pric': {'stk_cd': 'str',
+                                    'stk_nm': 'str',
+                                    'cur_prc': 'int',
+                                    'pred_pre_sig': 'str',
+                                    'pred_pre': 'int',
+                                    'flu_rt': 'float',
+                                    'trde_qty': 'int',
+                                    'pred_trde_qty_pre_rt': 'float',
+                                    'sel_bid': 'int',
+                                    'buy_bid': 'int',
+                                    'high_pric': 'int',
+                                    'low_pric': 'int'}}},
+ 'ka10017': {'title': '상하한가요청',
+             'fields': {},
+             'lists': {'updown_pric': {'stk_cd': 'str',
+                                       'stk_infr': 'str',
+                                       'stk_nm': 'str',
+                                       'cur_prc': 'int',
+                                       'pred_pre_sig': 'str',
+                                       'pred_pre': 'int',
+                                       'flu_rt': 'float',
+                                       'trde_qty': 'int',
+                                       'pred_trde_qty': 'int',
+                                       'sel_req': 'int',
+                                       'sel_bid': 'int',
+                                       'buy_bid': 'int',
+                                       'buy_req': 'int',
+                                       'cnt': 'int'}}},
+ 'ka10018': {'title': '고저가근접요청',
+             'fields': {},
+             'lists': {'high_low_pric_alacc': {'stk_cd': 'str',
+                                               'stk_nm': 'str',
+                                               'cur_prc': 'int',
+                                               'pred_pre_sig': 'str',
+                                               'pred_pre': 'int',
+                                               'flu_rt': 'float',
+                                               'trde_qty': 'int',
+                                               'sel_bid': 'int',
+                                               'buy_bid': 'int',
+                                               'tdy_high_pric': 'int',
+                                               'tdy_low_pric': 'int'}}},
+ 'ka10019': {'title': '가격급등락요청',
+             'fields': {},
+             'lists': {'pric_jmpflu': {'stk_cd': 'str',
+                                       'stk_cls': 'str',
+                                       'stk_nm': 'str',
+                                       'pred_pre_sig': 'str',
+                                       'pred_pre': 'int',
+                                       'flu_rt': 'float',
+                                       'base_pric': 'int',
+                                       'cur_prc': 'int',
+                                       'base_pre': 'int',
+                                       'trde_qty': 'int',
+                                       'jmp_rt': 'float'}}},
+ 'ka10020': {'title': '호가잔량상위요청',
+             'fields': {},
+             'lists': {'bid_req_upper': {'stk_cd': 'str',
+                                         'stk_nm': 'str',
+                                         'cur_prc': 'int',
+                                         'pred_pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'trde_qty': 'int',
+                                         'tot_sel_req': 'int',
+                                         'tot_buy_req': 'int',
+                                         'netprps_req': 'int',
+                                         'buy_rt': 'float'}}},
+ 'ka10021': {'title': '호가잔량급증요청',
+             'fields': {},
+             'lists': {'bid_req_sdnin': {'stk_cd': 'str',
+                                         'stk_nm': 'str',
+                                         'cur_prc': 'int',
+                                         'pred_pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'int': 'float',
+                                         'now': 'int',
+                                         'sdnin_qty': 'int',
+                                         'sdnin_rt': 'float',
+                                         'tot_buy_qty': 'int'}}},
+ 'ka10022': {'title': '잔량율급증요청',
+             'fields': {},
+             'lists': {'req_rt_sdnin': {'stk_cd': 'str',
+                                        'stk_nm': 'str',
+                                        'cur_prc': 'int',
+                                        'pred_pre_sig': 'str',
+                                        'pred_pre': 'int',
+                                        'int': 'float',
+                                        'now_rt': 'float',
+                                        'sdnin_rt': 'float',
+                                        'tot_sel_req': 'int',
+                                        'tot_buy_req': 'int'}}},
+ 'ka10023': {'title': '거래량급증요청',
+             'fields': {},
+             'lists': {'trde_qty_sdnin': {'stk_cd': 'str',
+                                          'stk_nm': 'str',
+                                          'cur_prc': 'int',
+                                          'pred_pre_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'flu_rt': 'float',
+                                          'prev_trde_qty': 'int',
+                                          'now_trde_qty': 'int',
+                                          'sdnin_qty': 'int',
+                                          'sdnin_rt': 'float'}}},
+ 'ka10024': {'title': '거래량갱신요청',
+             'fields': {},
+             'lists': {'trde_qty_updt': {'stk_cd': 'str',
+                                         'stk_nm': 'str',
+                                         'cur_prc': 'int',
+                                         'pred_pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'flu_rt': 'float',
+                                         'prev_trde_qty': 'int',
+                                         'now_trde_qty': 'int',
+                                         'sel_bid': 'int',
+                                         'buy_bid': 'int'}}},
+ 'ka10025': {'title': '매물대집중요청',
+             'fields': {},
+             'lists': {'prps_cnctr': {'stk_cd': 'str',
+                                      'stk_nm': 'str',
+                                      'cur_prc': 'int',
+                                      'pred_pre_sig': 'str',
+                                      'pred_pre': 'int',
+                                      'flu_rt': 'float',
+                                      'now_trde_qty': 'int',
+                                      'pric_strt': 'int',
+                                      'pric_end': 'int',
+                                      'prps_qty': 'int',
+                                      'prps_rt': 'float'}}},
+ 'ka10026': {'title': '고저PER요청',
+             'fields': {},
+             'lists': {'high_low_per': {'stk_cd': 'str',
+                                        'stk_nm': 'str',
+                                        'per': 'float',
+                                        'cur_prc': 'int',
+                                        'pred_pre_sig': 'str',
+                                        'pred_pre': 'int',
+                                        'flu_rt': 'float',
+                                        'now_trde_qty': 'int',
+                                        'sel_bid': 'int'}}},
+ 'ka10027': {'title': '전일대비등락률상위요청',
+             'fields': {},
+             'lists': {'pred_pre_flu_rt_upper': {'stk_cls': 'str',
+                                                 'stk_cd': 'str',
+                                                 'stk_nm': 'str',
+                                                 'cur_prc': 'int',
+                                                 'pred_pre_sig': 'str',
+                                                 'pred_pre': 'int',
+                                                 'flu_rt': 'float',
+                                                 'sel_req': 'int',
+                                                 'buy_req': 'int',
+                                                 'now_trde_qty': 'int',
+                                                 'cntr_str': 'float',
+                                                 'cnt': 'int'}}},
+ 'ka10028': {'title': '시가대비등락률요청',
+             'fields': {},
+             'lists': {'open_pric_pre_flu_rt': {'stk_cd': 'str',
+                                                'stk_nm': 'str',
+                                                'cur_prc': 'int',
+                                                'pred_pre_sig': 'str',
+                                                'pred_pre': 'int',
+                                                'flu_rt': 'float',
+                                                'open_pric': 'int',
+                                                'high_pric': 'int',
+                                                'low_pric': 'int',
+                                                'open_pric_pre': 'int',
+                                                'now_trde_qty': 'int',
+                                                'cntr_str': 'float'}}},
+ 'ka10029': {'title': '예상체결등락률상위요청',
+             'fields': {},
+             'lists': {'exp_cntr_flu_rt_upper': {'stk_cd': 'str',
+                                                 'stk_nm': 'str',
+                                                 'exp_cntr_pric': 'int',
+                                                 'base_pric': 'int',
+                                                 'pred_pre_sig': 'str',
+                                                 'pred_pre': 'int',
+                                                 'flu_rt': 'float',
+                                                 'exp_cntr_qty': 'int',
+                                                 'sel_req': 'int',
+                                                 'sel_bid': 'int',
+                                                 'buy_bid': 'int',
+                                                 'buy_req': 'int'}}},
+ 'ka10030': {'title': '당일거래량상위요청',
+             'fields': {},
+             'lists': {'tdy_trde_qty_upper': {'stk_cd': 'str',
+                                              'stk_nm': 'str',
+                                              'cur_prc': 'int',
+                                              'pred_pre_sig': 'str',
+                                              'pred_pre': 'int',
+                                              'flu_rt': 'float',
+                                              'trde_qty': 'int',
+                                              'pred_rt': 'float',
+                                              'trde_tern_rt': 'float',
+                                              'trde_amt': 'int',
+                                              'opmr_trde_qty': 'int',
+                                              'opmr_pred_rt': 'float',
+                                              'opmr_trde_rt': 'float',
+                                              'opmr_trde_amt': 'int',
+                                              'af_mkrt_trde_qty': 'int',
+                                              'af_mkrt_pred_rt': 'float',
+                                              'af_mkrt_trde_rt': 'float',
+                                              'af_mkrt_trde_amt': 'int',
+                                              'bf_mkrt_trde_qty': 'int',
+                                              'bf_mkrt_pred_rt': 'float',
+                                              'bf_mkrt_trde_rt': 'float',
+                                              'bf_mkrt_trde_amt': 'int'}}},
+ 'ka10031': {'title': '전일거래량상위요청',
+             'fields': {},
+             'lists': {'pred_trde_qty_upper': {'stk_cd': 'str',
+                                               'stk_nm': 'str',
+                                               'cur_prc': 'int',
+                                               'pred_pre_sig': 'str',
+                                               'pred_pre': 'int',
+                                               'trde_qty': 'int'}}},
+ 'ka10032': {'title': '거래대금상위요청',
+             'fields': {},
+             'lists': {'trde_prica_upper': {'stk_cd': 'str',
+                                            'now_rank': 'int',
+                                            'pred_rank': 'int',
+                                            'stk_nm': 'str',
+                                            'cur_prc': 'int',
+                                            'pred_pre_sig': 'str',
+                                            'pred_pre': 'int',
+                                            'flu_rt': 'float',
+                                            'sel_bid': 'int',
+                                            'buy_bid': 'int',
+                                            'now_trde_qty': 'int',
+                                            'pred_trde_qty': 'int',
+                                            'trde_prica': 'int'}}},
+ 'ka10033': {'title': '신용비율상위요청',
+             'fields': {},
+             'lists': {'crd_rt_upper': {'stk_infr': 'str',
+                                        'stk_cd': 'str',
+                                        'stk_nm': 'str',
+                                        'cur_prc': 'int',
+                                        'pred_pre_sig': 'str',
+                                        'pred_pre': 'int',
+                                        'flu_rt': 'float',
+                                        'crd_rt': 'float',
+                                        'sel_req': 'int',
+                                        'buy_req': 'int',
+                                        'now_trde_qty': 'int'}}},
+ 'ka10034': {'title': '외인기간별매매상위요청',
+             'fields': {},
+             'lists': {'for_dt_trde_upper': {'rank': 'int',
+                                             'stk_cd': 'str',
+                                             'stk_nm': 'str',
+                                             'cur_prc': 'int',
+                                             'pred_pre_sig': 'str',
+                                             'pred_pre': 'int',
+                                             'sel_bid': 'int',
+                                             'buy_bid': 'int',
+                                             'trde_qty': 'int',
+                                             'netprps_qty': 'int',
+                                             'gain_pos_stkcnt': 'int'}}},
+ 'ka10035': {'title': '외인연속순매매상위요청',
+             'fields': {},
+             'lists': {'for_cont_nettrde_upper': {'stk_cd': 'str',
+                                                  'stk_nm': 'str',
+                                                  'cur_prc': 'int',
+                                                  'pred_pre_sig': 'str',
+                                                  'pred_pre': 'int',
+                                                  'dm1': 'int',
+                                                  'dm2': 'int',
+                                                  'dm3': 'int',
+                                                  'tot': 'int',
+                                                  'limit_exh_rt': 'float',
+                                                  'pred_pre_1': 'int',
+                                                  'pred_pre_2': 'int',
+                                                  'pred_pre_3': 'int'}}},
+ 'ka10036': {'title': '외인한도소진율증가상위',
+             'fields': {},
+             'lists': {'for_limit_exh_rt_incrs_upper': {'rank': 'int',
+                                                        'stk_cd': 'str',
+                                                        'stk_nm': 'str',
+                                                        'cur_prc': 'int',
+                                                        'pred_pre_sig': 'str',
+                                                        'pred_pre': 'int',
+                                                        'trde_qty': 'int',
+                                                        'poss_stkcnt': 'int',
+                                                        'gain_pos_stkcnt': 'int',
+                                                        'base_limit_exh_rt': 'float',
+                                                        'limit_exh_rt': 'float',
+                                                        'exh_rt_incrs': 'int'}}},
+ 'ka10037': {'title': '외국계창구매매상위요청',
+             'fields': {},
+             'lists': {'frgn_wicket_trde_upper': {'rank': 'int',
+                                                  'stk_cd': 'str',
+                                                  'stk_nm': 'str',
+                                                  'cur_prc': 'int',
+                                                  'pred_pre_sig': 'str',
+                                                  'pred_pre': 'int',
+                                                  'flu_rt': 'float',
+                                                  'sel_trde_qty': 'int',
+                                                  'buy_trde_qty': 'int',
+                                                  'netprps_trde_qty': 'int',
+                                                  'netprps_prica': 'int',
+                                                  'trde_qty': 'int',
+                                                  'trde_prica': 'int'}}},
+ 'ka10038': {'title': '종목별증권사순위요청',
+             'fields': {'rank_1': 'int', 'rank_2': 'int', 'rank_3': 'int', 'prid_trde_qty': 'int'},
+             'lists': {'stk_sec_rank': {'rank': 'int',
+                                        'mmcm_nm': 'str',
+                                        'buy_qty': 'int',
+                                        'sell_qty': 'int',
+                                        'acc_netprps_qty': 'int'}}},
+ 'ka10039': {'title': '증권사별매매상위요청',
+             'fields': {},
+             'lists': {'sec_trde_upper': {'rank': 'int',
+                                          'stk_cd': 'str',
+                                          'stk_nm': 'str',
+                                          'prid_stkpc_flu': 'int',
+                                          'flu_rt': 'float',
+                                          'prid_trde_qty': 'int',
+                                          'netprps': 'int',
+                                          'buy_trde_qty': 'int',
+                                          'sel_trde_qty': 'int'}}},
+ 'ka10040': {'title': '당일주요거래원요청',
+             'fields': {'sel_trde_ori_irds_1': 'int',
+                        'sel_trde_ori_qty_1': 'int',
+                        'sel_trde_ori_1': 'str',
+                        'sel_trde_ori_cd_1': 'str',
+                        'buy_trde_ori_1': 'str',
+                        'buy_trde_ori_cd_1': 'str',
+                        'buy_trde_ori_qty_1': 'int',
+                        'buy_trde_ori_irds_1': 'int',
+                        'sel_trde_ori_irds_2': 'int',
+                        'sel_trde_ori_qty_2': 'int',
+                        'sel_trde_ori_2': 'str',
+                        'sel_trde_ori_cd_2': 'str',
+                        'buy_trde_ori_2': 'str',
+                        'buy_trde_ori_cd_2': 'str',
+                        'buy_trde_ori_qty_2': 'int',
+                        'buy_trde_ori_irds_2': 'int',
+                        'sel_trde_ori_irds_3': 'int',
+                        'sel_trde_ori_qty_3': 'int',
+                        'sel_trde_ori_3': 'str',
+                        'sel_trde_ori_cd_3': 'str',
+                        'buy_trde_ori_3': 'str',
+                        'buy_trde_ori_cd_3': 'str',
+                        'buy_trde_ori_qty_3': 'int',
+                        'buy_trde_ori_irds_3': 'int',
+                        'sel_trde_ori_irds_4': 'int',
+                        'sel_trde_ori_qty_4': 'int',
+                        'sel_trde_ori_4': 'str',
+                        'sel_trde_ori_cd_4': 'str',
+                        'buy_trde_ori_4': 'str',
+                        'buy_trde_ori_cd_4': 'str',
+                        'buy_trde_ori_qty_4': 'int',
+                        'buy_trde_ori_irds_4': 'int',
+                        'sel_trde_ori_irds_5': 'int',
+                        'sel_trde_ori_qty_5': 'int',
+                        'sel_trde_ori_5': 'str',
+                        'sel_trde_ori_cd_5': 'str',
+                        'buy_trde_ori_5': 'str',
+                        'buy_trde_ori_cd_5': 'str',
+                        'buy_trde_ori_qty_5': 'int',
+                        'buy_trde_ori_irds_5': 'int',
+                        'frgn_sel_prsm_sum_chang': 'int',
+                        'frgn_sel_prsm_sum': 'int',
+                        'frgn_buy_prsm_sum': 'int',
+                        'frgn_buy_prsm_sum_chang': 'int'},
+             'lists': {'tdy_main_trde_ori': {'sel_scesn_tm': 'str',
+                                             'sell_qty': 'int',
+                                             'sel_upper_scesn_ori': 'int',
+                                             'buy_scesn_tm': 'str',
+                                             'buy_qty': 'int',
+                                             'buy_upper_scesn_ori': 'int',
+                                             'qry_dt': 'str',
+                                             'qry_tm': 'str'}}},
+ 'ka10042': {'title': '순매수거래원순위요청',
+             'fields': {},
+             'lists': {'netprps_trde_ori_rank': {'rank': 'int', 'mmcm_cd': 'str', 'mmcm_nm': 'str'}}},
+ 'ka10043': {'title': '거래원매물대분석요청',
+             'fields': {},
+             'lists': {'trde_ori_prps_anly': {'dt': 'str',
+                                              'close_pric': 'int',
+                                              'pre_sig': 'str',
+                                              'pred_pre': 'int',
+                                              'sel_qty': 'int',
+                                              'buy_qty': 'int',
+                                              'netprps_qty': 'int',
+                                              'trde_qty_sum': 'int',
+                                              'trde_wght': 'float'}}},
+ 'ka10044': {'title': '일별기관매매종목요청',
+             'fields': {},
+             'lists': {'daly_orgn_trde_stk': {'stk_cd': 'str',
+                                              'stk_nm': 'str',
+                                              'netprps_qty': 'int',
+                                              'netprps_amt': 'int'}}},
+ 'ka10045': {'title': '종목별기관매매추이요청',
+             'fields': {'orgn_prsm_avg_pric': 'int', 'for_prsm_avg_pric': 'int'},
+             'lists': {'stk_orgn_trde_trnsn': {'dt': 'str',
+                                               'close_pric': 'int',
+                                               'pre_sig': 'str',
+                                               'pred_pre': 'int',
+                                               'flu_rt': 'float',
+                                               'trde_qty': 'int',
+                                               'orgn_dt_acc': 'int',
+                                               'orgn_daly_nettrde_qty': 'int',
+                                               'for_dt_acc': 'int',
+                                               'for_daly_nettrde_qty': 'int',
+                                               'limit_exh_rt': 'float'}}},
+ 'ka10046': {'title': '체결강도추이시간별요청',
+             'fields': {},
+             'lists': {'cntr_str_tm': {'cntr_tm': 'str',
+                                       'cur_prc': 'int',
+                                       'pred_pre': 'int',
+                                       'pred_pre_sig': 'str',
+                                       'flu_rt': 'float',
+                                       'trde_qty': 'int',
+                                       'acc_trde_prica': 'int',
+                                       'acc_trde_qty': 'int',
+                                       'cntr_str': 'float',
+                                       'cntr_str_5min': 'int',
+                                       'cntr_str_20min': 'int',
+                                       'cntr_str_60min': 'int',
+                                       'stex_tp': 'str'}}},
+ 'ka10047': {'title': '체결강도추이일별요청',
+             'fields': {},
+             'lists': {'cntr_str_daly': {'dt': 'str',
+                                         'cur_prc': 'int',
+                                         'pred_pre': 'int',
+                                         'pred_pre_sig': 'str',
+                                         'flu_rt': 'float',
+                                         'trde_qty': 'int',
+                                         'acc_trde_prica': 'int',
+                                         'acc_trde_qty': 'int',
+                                         'cntr_str': 'float',
+                                         'cntr_str_5min': 'int',
+                                         'cntr_str_20min': 'int',
+                                         'cntr_str_60min': 'int'}}},
+ 'ka10048': {'title': 'ELW일별민감도지표요청',
+             'fields': {},
+             'lists': {'elwdaly_snst_ix': {'dt': 'str',
+                                           'iv': 'int',
+                                           'delta': 'float',
+                                           'gam': 'float',
+                                           'theta': 'float',
+                                           'vega': 'float',
+                                           'law': 'float',
+                                           'lp': 'int'}}},
+ 'ka10050': {'title': 'ELW민감도지표요청',
+             'fields': {},
+             'lists': {'elwsnst_ix_array': {'cntr_tm': 'str',
+                                            'cur_prc': 'int',
+                                            'elwtheory_pric': 'int',
+                                            'iv': 'int',
+                                            'delta': 'float',
+                                            'gam': 'float',
+                                            'theta': 'float',
+                                            'vega': 'float',
+                                            'law': 'float',
+                                            'lp': 'int'}}},
+ 'ka10051': {'title': '업종별투자자순매수요청',
+             'fields': {},
+             'lists': {'inds_netprps': {'inds_cd': 'str',
+                                        'inds_nm': 'str',
+                                        'cur_prc': 'int',
+                                        'pre_smbol': 'str',
+                                        'pred_pre': 'int',
+                                        'flu_rt': 'float',
+                                        'trde_qty': 'int',
+                                        'sc_netprps': 'int',
+                                        'insrnc_netprps': 'int',
+                                        'invtrt_netprps': 'int',
+                                        'bank_netprps': 'int',
+                                        'jnsinkm_netprps': 'int',
+                                        'endw_netprps': 'int',
+                                        'etc_corp_netprps': 'int',
+                                        'ind_netprps': 'int',
+                                        'frgnr_netprps': 'int',
+                                        'native_trmt_frgnr_netprps': 'int',
+                                        'natn_netprps': 'int',
+                                        'samo_fund_netprps': 'int',
+                                        'orgn_netprps': 'int'}}},
+ 'ka10052': {'title': '거래원순간거래량요청',
+             'fields': {},
+             'lists': {'trde_ori_mont_trde_qty': {'tm': 'str',
+                                                  'stk_cd': 'str',
+                                                  'stk_nm': 'str',
+                                                  'trde_ori_nm': 'str',
+                                                  'tp': 'str',
+                                                  'mont_trde_qty': 'int',
+                                                  'acc_netprps': 'int',
+                                                  'cur_prc': 'int',
+                                                  'pred_pre_sig': 'str',
+                                                  'pred_pre': 'int',
+                                                  'flu_rt': 'float'}}},
+ 'ka10053': {'title': '당일상위이탈원요청',
+             'fields': {},
+             'lists': {'tdy_upper_scesn_ori': {'sel_scesn_tm': 'str',
+                                               'sell_qty': 'int',
+                                               'sel_upper_scesn_ori': 'int',
+                                               'buy_scesn_tm': 'str',
+                                               'buy_qty': 'int',
+                                               'buy_upper_scesn_ori': 'int',
+                                               'qry_dt': 'str',
+                                               'qry_tm': 'str'}}},
+ 'ka10054': {'title': '변동성완화장치발동종목요청',
+             'fields': {},
+             'lists': {'motn_stk': {'stk_cd': 'str',
+                                    'stk_nm': 'str',
+                                    'acc_trde_qty': 'int',
+                                    'motn_pric': 'int',
+                                    'dynm_dispty_rt': 'float',
+                                    'trde_cntr_proc_time': 'str',
+                                    'virelis_time': 'str',
+                                    'viaplc_tp': 'str',
+                                    'dynm_stdpc': 'int',
+                                    'static_stdpc': 'int',
+                                    'static_dispty_rt': 'float',
+                                    'open_pric_pre_flu_rt': 'float',
+                                    'vimotn_cnt': 'int',
+                                    'stex_tp': 'str'}}},
+ 'ka10055': {'title': '당일전일체결량요청',
+             'fields': {},
+             'lists': {'tdy_pred_cntr_qty': {'cntr_tm': 'str',
+                                             'cntr_pric': 'int',
+                                             'pred_pre_sig': 'str',
+                                             'pred_pre': 'int',
+                                             'flu_rt': 'float',
+                                             'cntr_qty': 'int',
+                                             'acc_trde_qty': 'int',
+                                             'acc_trde_prica': 'int'}}},
+ 'ka10058': {'title': '투자자별일별매매종목요청',
+             'fields': {},
+             'lists': {'invsr_daly_trde_stk': {'stk_cd': 'str',
+                                               'stk_nm': 'str',
+                                               'netslmt_qty': 'int',
+                                               'netslmt_amt': 'int',
+                                               'prsm_avg_pric': 'int',
+                                               'cur_prc': 'int',
+                                               'pre_sig': 'str',
+                                               'pred_pre': 'int',
+                                               'avg_pric_pre': 'int',
+                                               'pre_rt': 'float',
+                                               'dt_trde_qty': 'int'}}},
+ 'ka10059': {'title': '종목별투자자기관별요청',
+             'fields': {},
+             'lists': {'stk_invsr_orgn': {'dt': 'str',
+                                          'cur_prc': 'int',
+                                          'pre_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'flu_rt': 'float',
+                                          'acc_trde_qty': 'int',
+                                          'acc_trde_prica': 'int',
+                                          'ind_invsr': 'int',
+                                          'frgnr_invsr': 'int',
+                                          'orgn': 'int',
+                                          'fnnc_invt': 'int',
+                                          'insrnc': 'int',
+                                          'invtrt': 'int',
+                                          'etc_fnnc': 'int',
+                                          'bank': 'int',
+                                          'penfnd_etc': 'int',
+                                          'samo_fund': 'int',
+                                          'natn': 'int',
+                                          'etc_corp': 'int',
+                                          'natfor': 'int'}}},
+ 'ka10060': {'title': '종목별투자자기관별차트요청',
+             'fields': {},
+             'lists': {'stk_invsr_orgn_chart': {'dt': 'str',
+                                                'cur_prc': 'int',
+                                                'pred_pre': 'int',
+                                                'acc_trde_prica': 'int',
+                                                'ind_invsr': 'int',
+                                                'frgnr_invsr': 'int',
+                                                'orgn': 'int',
+                                                'fnnc_invt': 'int',
+                                                'insrnc': 'int',
+                                                'invtrt': 'int',
+                                                'etc_fnnc': 'int',
+                                                'bank': 'int',
+                                                'penfnd_etc': 'int',
+                                                'samo_fund': 'int',
+                                                'natn': 'int',
+                                                'etc_corp': 'int',
+                                                'natfor': 'int'}}},
+ 'ka10061': {'title': '종목별투자자기관별합계요청',
+             'fields': {},
+             'lists': {'stk_invsr_orgn_tot': {'ind_invsr': 'int',
+                                              'frgnr_invsr': 'int',
+                                              'orgn': 'int',
+                                              'fnnc_invt': 'int',
+                                              'insrnc': 'int',
+                                              'invtrt': 'int',
+                                              'etc_fnnc': 'int',
+                                              'bank': 'int',
+                                              'penfnd_etc': 'int',
+                                              'samo_fund': 'int',
+                                              'natn': 'int',
+                                              'etc_corp': 'int',
+                                              'natfor': 'int'}}},
+ 'ka10062': {'title': '동일순매매순위요청',
+             'fields': {},
+             'lists': {'eql_nettrde_rank': {'stk_cd': 'str',
+                                            'rank': 'int',
+                                            'stk_nm': 'str',
+                                            'cur_prc': 'int',
+                                            'pre_sig': 'str',
+                                            'pred_pre': 'int',
+                                            'flu_rt': 'float',
+                                            'acc_trde_qty': 'int',
+                                            'orgn_nettrde_qty': 'int',
+                                            'orgn_nettrde_amt': 'int',
+                                            'orgn_nettrde_avg_pric': 'int',
+                                            'for_nettrde_qty': 'int',
+                                            'for_nettrde_amt': 'int',
+                                            'for_nettrde_avg_pric': 'int',
+                                            'nettrde_qty': 'int',
+                                            'nettrde_amt': 'int'}}},
+ 'ka10063': {'title': '장중투자자별매매요청',
+             'fields': {},
+             'lists': {'opmr_invsr_trde': {'stk_cd': 'str',
+                                           'stk_nm': 'str',
+                                           'cur_prc': 'int',
+                                           'pre_sig': 'str',
+                                           'pred_pre': 'int',
+                                           'flu_rt': 'float',
+                                           'acc_trde_qty': 'int',
+                                           'netprps_qty': 'int',
+                                           'prev_pot_netprps_qty': 'int',
+                                           'netprps_irds': 'int',
+                                           'buy_qty': 'int',
+                                           'buy_qty_irds': 'int',
+                                           'sell_qty': 'int',
+                                           'sell_qty_irds': 'int'}}},
+ 'ka10064': {'title': '장중투자자별매매차트요청',
+             'fields': {},
+             'lists': {'opmr_invsr_trde_chart': {'tm': 'str',
+                                                 'frgnr_invsr': 'int',
+                                                 'orgn': 'int',
+                                                 'invtrt': 'int',
+                                                 'insrnc': 'int',
+                                                 'bank': 'int',
+                                                 'penfnd_etc': 'int',
+                                                 'etc_corp': 'int',
+                                                 'natn': 'int'}}},
+ 'ka10065': {'title': '장중투자자별매매상위요청',
+             'fields': {},
+             'lists': {'opmr_invsr_trde_upper': {'stk_cd': 'str',
+                                                 'stk_nm': 'str',
+                                                 'sel_qty': 'int',
+                                                 'buy_qty': 'int',
+                                                 'netslmt': 'int'}}},
+ 'ka10066': {'title': '장마감후투자자별매매요청',
+             'fields': {},
+             'lists': {'opaf_invsr_trde': {'stk_cd': 'str',
+                                           'stk_nm': 'str',
+                                           'cur_prc': 'int',
+                                           'pre_sig': 'str',
+                                           'pred_pre': 'int',
+                                           'flu_rt': 'float',
+                                           'trde_qty': 'int',
+                                           'ind_invsr': 'int',
+                                           'frgnr_invsr': 'int',
+                                           'orgn': 'int',
+                                           'fnnc_invt': 'int',
+                                           'insrnc': 'int',
+                                           'invtrt': 'int',
+                                           'etc_fnnc': 'int',
+                                           'bank': 'int',
+                                           'penfnd_etc': 'int',
+                                           'samo_fund': 'int',
+                                           'natn': 'int',
+                                           'etc_corp': 'int'}}},
+ 'ka10069': {'title': '대차거래상위10종목요청',
+             'fields': {'dbrt_trde_cntrcnt_sum': 'int',
+                        'dbrt_trde_rpy_sum': 'int',
+                        'rmnd_sum': 'int',
+                        'remn_amt_sum': 'int',
+                        'dbrt_trde_cntrcnt_rt': 'float',
+                        'dbrt_trde_rpy_rt': 'float',
+                        'rmnd_rt': 'float',
+                        'remn_amt_rt': 'float'},
+             'lists': {'dbrt_trde_upper_10stk': {'stk_nm': 'str',
+                                                 'stk_cd': 'str',
+                                                 'dbrt_trde_cntrcnt': 'int',
+                                                 'dbrt_trde_rpy': 'int',
+                                                 'rmnd': 'int',
+                                                 'remn_amt': 'int'}}},
+ 'ka10072': {'title': '일자별종목별실현손익요청_일자',
+             'fields': {},
+             'lists': {'dt_stk_div_rlzt_pl': {'stk_nm': 'str',
+                                              'cntr_qty': 'int',
+                                              'buy_uv': 'int',
+                                              'cntr_pric': 'int',
+                                              'tdy_sel_pl': 'int',
+                                              'pl_rt': 'float',
+                                              'stk_cd': 'str',
+                                              'tdy_trde_cmsn': 'int',
+                                              'tdy_trde_tax': 'int',
+                                              'wthd_alowa': 'int',
+                                              'loan_dt': 'str',
+                                              'crd_tp': 'str',
+                                              'stk_cd_1': 'str',
+                                              'tdy_sel_pl_1': 'int'}}},
+ 'ka10073': {'title': '일자별종목별실현손익요청_기간',
+             'fields': {'tot_buy_amt': 'int',
+                        'tot_sell_amt': 'int',
+                        'rlzt_pl': 'int',
+                        'trde_cmsn': 'int',
+                        'trde_tax': 'int'},
+             'lists': {'dt_rlzt_pl': {'dt': 'str',
+                                      'buy_amt': 'int',
+                                      'sell_amt': 'int',
+                                      'tdy_sel_pl': 'int',
+                                      'tdy_trde_cmsn': 'int',
+                                      'tdy_trde_tax': 'int'}}},
+ 'ka10074': {'title': '일자별실현손익요청',
+             'fields': {'tot_buy_amt': 'int',
+                        'tot_sell_amt': 'int',
+                        'rlzt_pl': 'int',
+                        'trde_cmsn': 'int',
+                        'trde_tax': 'int'},
+             'lists': {'dt_rlzt_pl': {'dt': 'str',
+                                      'buy_amt': 'int',
+                                      'sell_amt': 'int',
+                                      'tdy_sel_pl': 'int',
+                                      'tdy_trde_cmsn': 'int',
+                                      'tdy_trde_tax': 'int'}}},
+ 'ka10075': {'title': '미체결요청',
+             'fields': {},
+             'lists': {'oso': {'acnt_no': 'str',
+                               'ord_no': 'str',
+                               'mang_empno': 'int',
+                               'stk_cd': 'str',
+                               'tsk_tp': 'str',
+                               'ord_stt': 'str',
+                               'stk_nm': 'str',
+                               'ord_qty': 'int',
+                               'ord_pric': 'int',
+                               'oso_qty': 'int',
+                               'cntr_tot_amt': 'int',
+                               'orig_ord_no': 'str',
+                               'io_tp_nm': 'str',
+                               'trde_tp': 'str',
+                               'tm': 'str',
+                               'cntr_no': 'str',
+                               'cntr_pric': 'int',
+                               'cntr_qty': 'int',
+                               'cur_prc': 'int',
+                               'sel_bid': 'int',
+                               'buy_bid': 'int',
+                               'unit_cntr_pric': 'int',
+                               'unit_cntr_qty': 'int',
+                               'tdy_trde_cmsn': 'int',
+                               'tdy_trde_tax': 'int',
+                               'ind_invsr': 'int',
+                               'stex_tp': 'str',
+                               'stex_tp_txt': 'str',
+                               'sor_yn': 'str',
+                               'stop_pric': 'int'}}},
+ 'ka10076': {'title': '체결요청',
+             'fields': {},
+             'lists': {'cntr': {'ord_no': 'str',
+                                'stk_nm': 'str',
+                                'io_tp_nm': 'str',
+                                'ord_pric': 'int',
+                                'ord_qty': 'int',
+                                'cntr_pric': 'int',
+                                'cntr_qty': 'int',
+                                'oso_qty': 'int',
+                                'tdy_trde_cmsn': 'int',
+                                'tdy_trde_tax': 'int',
+                                'ord_stt': 'str',
+                                'trde_tp': 'str',
+                                'orig_ord_no': 'str',
+                                'ord_tm': 'str',
+                                'stk_cd': 'str',
+                                'stex_tp': 'str',
+                                'stex_tp_txt': 'str',
+                                'sor_yn': 'str',
+                                'stop_pric': 'int'}}},
+ 'ka10077': {'title': '당일실현손익상세요청',
+             'fields': {'tdy_rlzt_pl': 'int'},
+             'lists': {'tdy_rlzt_pl_dtl': {'stk_nm': 'str',
+                                           'cntr_qty': 'int',
+                                           'buy_uv': 'int',
+                                           'cntr_pric': 'int',
+                                           'tdy_sel_pl': 'int',
+                                           'pl_rt': 'float',
+                                           'tdy_trde_cmsn': 'int',
+                                           'tdy_trde_tax': 'int',
+                                           'stk_cd': 'str'}}},
+ 'ka10078': {'title': '증권사별종목매매동향요청',
+             'fields': {},
+             'lists': {'sec_stk_trde_trend': {'dt': 'str',
+                                              'cur_prc': 'int',
+                                              'pre_sig': 'str',
+                                              'pred_pre': 'int',
+                                              'flu_rt': 'float',
+                                              'acc_trde_qty': 'int',
+                                              'netprps_qty': 'int',
+                                              'buy_qty': 'int',
+                                              'sell_qty': 'int'}}},
+ 'ka10079': {'title': '주식틱차트조회요청',
+             'fields': {'stk_cd': 'str', 'last_tic_cnt': 'int'},
+             'lists': {'stk_tic_chart_qry': {'cur_prc': 'int',
+                                             'trde_qty': 'int',
+                                             'cntr_tm': 'str',
+                                             'open_pric': 'int',
+                                             'high_pric': 'int',
+                                             'low_pric': 'int',
+                                             'upd_stkpc_tp': 'str',
+                                             'upd_rt': 'float',
+                                             'bic_inds_tp': 'str',
+                                             'sm_inds_tp': 'str',
+                                             'stk_infr': 'str',
+                                             'upd_stkpc_event': 'int',
+                                             'pred_close_pric': 'int'}}},
+ 'ka10080': {'title': '주식분봉차트조회요청',
+             'fields': {'stk_cd': 'str'},
+             'lists': {'stk_min_pole_chart_qry': {'cur_prc': 'int',
+                                                  'trde_qty': 'int',
+                                                  'cntr_tm': 'str',
+                                                  'open_pric': 'int',
+                                                  'high_pric': 'int',
+                                                  'low_pric': 'int',
+                                                  'upd_stkpc_tp': 'str',
+                                                  'upd_rt': 'float',
+                                                  'bic_inds_tp': 'str',
+                                                  'sm_inds_tp': 'str',
+                                                  'stk_infr': 'str',
+                                                  'upd_stkpc_event': 'int',
+                                                  'pred_close_pric': 'int'}}},
+ 'ka10081': {'title': '주식일봉차트조회요청',
+             'fields': {'stk_cd': 'str'},
+             'lists': {'stk_dt_pole_chart_qry': {'cur_prc': 'int',
+                                                 'trde_qty': 'int',
+                                                 'trde_prica': 'int',
+                                                 'dt': 'str',
+                                                 'open_pric': 'int',
+                                                 'high_pric': 'int',
+                                                 'low_pric': 'int',
+                                                 'upd_stkpc_tp': 'str',
+                                                 'upd_rt': 'float',
+                                                 'bic_inds_tp': 'str',
+                                                 'sm_inds_tp': 'str',
+                                                 'stk_infr': 'str',
+                                                 'upd_stkpc_event': 'int',
+                                                 'pred_close_pric': 'int'}}},
+ 'ka10082': {'title': '주식주봉차트조회요청',
+             'fields': {'stk_cd': 'str'},
+             'lists': {'stk_stk_pole_chart_qry': {'cur_prc': 'int',
+                                                  'trde_qty': 'int',
+                                                  'trde_prica': 'int',
+                                                  'dt': 'str',
+                                                  'open_pric': 'int',
+                                                  'high_pric': 'int',
+                                                  'low_pric': 'int',
+                                                  'upd_stkpc_tp': 'str',
+                                                  'upd_rt': 'float',
+                                                  'bic_inds_tp': 'str',
+                                                  'sm_inds_tp': 'str',
+                                                  'stk_infr': 'str',
+                                                  'upd_stkpc_event': 'int',
+                                                  'pred_close_pric': 'int'}}},
+ 'ka10083': {'title': '주식월봉차트조회요청',
+             'fields': {'stk_cd': 'str'},
+             'lists': {'stk_mth_pole_chart_qry': {'cur_prc': 'int',
+                                                  'trde_qty': 'int',
+                                                  'trde_prica': 'int',
+                                                  'dt': 'str',
+                                                  'open_pric': 'int',
+                                                  'high_pric': 'int',
+                                                  'low_pric': 'int',
+                                                  'upd_stkpc_tp': 'str',
+                                                  'upd_rt': 'float',
+                                                  'bic_inds_tp': 'str',
+                                                  'sm_inds_tp': 'str',
+                                                  'stk_infr': 'str',
+                                                  'upd_stkpc_event': 'int',
+                                                  'pred_close_pric': 'int'}}},
+ 'ka10084': {'title': '당일전일체결요청',
+             'fields': {},
+             'lists': {'tdy_pred_cntr': {'tm': 'str',
+                                         'cur_prc': 'int',
+                                         'pred_pre': 'int',
+                                         'pre_rt': 'float',
+                                         'pri_sel_bid_unit': 'int',
+                                         'pri_buy_bid_unit': 'int',
+                                         'cntr_trde_qty': 'int',
+                                         'sign': 'str',
+                                         'acc_trde_qty': 'int',
+                                         'acc_trde_prica': 'int',
+                                         'cntr_str': 'float',
+                                         'stex_tp': 'str'}}},
+ 'ka10085': {'title': '계좌수익률요청',
+             'fields': {},
+             'lists': {'acnt_prft_rt': {'dt': 'str',
+                                        'stk_cd': 'str',
+                                        'stk_nm': 'str',
+                                        'cur_prc': 'int',
+                                        'pur_pric': 'int',
+                                        'pur_amt': 'int',
+                                        'rmnd_qty': 'int',
+                                        'tdy_sel_pl': 'int',
+                                        'tdy_trde_cmsn': 'int',
+                                        'tdy_trde_tax': 'int',
+                                        'crd_tp': 'str',
+                                        'loan_dt': 'str',
+                                        'setl_remn': 'int',
+                                        'clrn_alow_qty': 'int',
+                                        'crd_amt': 'int',
+                                        'crd_int': 'int',
+                                        'expr_dt': 'str'}}},
+ 'ka10086': {'title': '일별주가요청',
+             'fields': {},
+             'lists': {'daly_stkpc': {'date': 'str',
+                                      'open_pric': 'int',
+                                      'high_pric': 'int',
+                                      'low_pric': 'int',
+                                      'close_pric': 'int',
+                                      'pred_rt': 'float',
+                                      'flu_rt': 'float',
+                                      'trde_qty': 'int',
+                                      'amt_mn': 'int',
+                                      'crd_rt': 'float',
+                                      'ind': 'int',
+                                      'orgn': 'int',
+                                      'for_qty': 'int',
+                                      'frgn': 'int',
+                                      'prm': 'int',
+                                      'for_rt': 'float',
+                                      'for_poss': 'int',
+                                      'for_wght': 'float',
+                                      'for_netprps': 'int',
+                                      'orgn_netprps': 'int',
+                                      'ind_netprps': 'int',
+                                      'crd_remn_rt': 'float'}}},
+ 'ka10087': {'title': '시간외단일가요청',
+             'fields': {'bid_req_base_tm': 'str',
+                        'ovt_sigpric_sel_bid_jub_pre_5': 'int',
+                        'ovt_sigpric_sel_bid_jub_pre_4': 'int',
+                        'ovt_sigpric_sel_bid_jub_pre_3': 'int',
+                        'ovt_sigpric_sel_bid_jub_pre_2': 'int',
+                        'ovt_sigpric_sel_bid_jub_pre_1': 'int',
+                        'ovt_sigpric_sel_bid_qty_5': 'int',
+                        'ovt_sigpric_sel_bid_qty_4': 'int',
+                        'ovt_sigpric_sel_bid_qty_3': 'int',
+                        'ovt_sigpric_sel_bid_qty_2': 'int',
+                        'ovt_sigpric_sel_bid_qty_1': 'int',
+                        'ovt_sigpric_sel_bid_5': 'int',
+                        'ovt_sigpric_sel_bid_4': 'int',
+                        'ovt_sigpric_sel_bid_3': 'int',
+                        'ovt_sigpric_sel_bid_2': 'int',
+                        'ovt_sigpric_sel_bid_1': 'int',
+                        'ovt_sigpric_buy_bid_1': 'int',
+                        'ovt_sigpric_buy_bid_2': 'int',
+                        'ovt_sigpric_buy_bid_3': 'int',
+                        'ovt_sigpric_buy_bid_4': 'int',
+                        'ovt_sigpric_buy_bid_5': 'int',
+                        'ovt_sigpric_buy_bid_qty_1': 'int',
+                        'ovt_sigpric_buy_bid_qty_2': 'int',
+                        'ovt_sigpric_buy_bid_qty_3': 'int',
+                        'ovt_sigpric_buy_bid_qty_4': 'int',
+                        'ovt_sigpric_buy_bid_qty_5': 'int',
+                        'ovt_sigpric_buy_bid_jub_pre_1': 'int',
+                        'ovt_sigpric_buy_bid_jub_pre_2': 'int',
+                        'ovt_sigpric_buy_bid_jub_pre_3': 'int',
+                        'ovt_sigpric_buy_bid_jub_pre_4': 'int',
+                        'ovt_sigpric_buy_bid_jub_pre_5': 'int',
+                        'ovt_sigpric_sel_bid_tot_req': 'int',
+                        'ovt_sigpric_buy_bid_tot_req': 'int',
+                        'sel_bid_tot_req_jub_pre': 'int',
+                        'sel_bid_tot_req': 'int',
+                        'buy_bid_tot_req': 'int',
+                        'buy_bid_tot_req_jub_pre': 'int',
+                        'ovt_sel_bid_tot_req_jub_pre': 'int',
+                        'ovt_sel_bid_tot_req': 'int',
+                        'ovt_buy_bid_tot_req': 'int',
+                        'ovt_buy_bid_tot_req_jub_pre': 'int',
+                        'ovt_sigpric_cur_prc': 'int',
+                        'ovt_sigpric_pred_pre_sig': 'str',
+                        'ovt_sigpric_pred_pre': 'int',
+                        'ovt_sigpric_flu_rt': 'float',
+                        'ovt_sigpric_acc_trde_qty': 'int'},
+             'lists': {}},
+ 'ka10088': {'title': '미체결 분할주문 상세',
+             'fields': {},
+             'lists': {'osop': {'stk_cd': 'str',
+                                'stk_nm': 'str',
+                                'ord_no': 'str',
+                                'ord_qty': 'int',
+                                'ord_pric': 'int',
+                                'osop_qty': 'int',
+                                'io_tp_nm': 'str',
+                                'trde_tp': 'str',
+                                'sell_tp': 'str',
+                                'cntr_qty': 'int',
+                                'ord_stt': 'str',
+                                'cur_prc': 'int',
+                                'stex_tp': 'str',
+                                'stex_tp_txt': 'str'}}},
+ 'ka10094': {'title': '주식년봉차트조회요청',
+             'fields': {'stk_cd': 'str'},
+             'lists': {'stk_yr_pole_chart_qry': {'cur_prc': 'int',
+                                                 'trde_qty': 'int',
+                                                 'trde_prica': 'int',
+                                                 'dt': 'str',
+                                                 'open_pric': 'int',
+                                                 'high_pric': 'int',
+                                                 'low_pric': 'int',
+                                                 'upd_stkpc_tp': 'str',
+                                                 'upd_rt': 'float',
+                                                 'bic_inds_tp': 'str',
+                                                 'sm_inds_tp': 'str',
+                                                 'stk_infr': 'str',
+                                                 'upd_stkpc_event': 'int',
+                                                 'pred_close_pric': 'int'}}},
+ 'ka10095': {'title': '관심종목정보요청', 'fields': {}, 'lists': {}},
+ 'ka10098': {'title': '시간외단일가등락율순위요청',
+             'fields': {},
+             'lists': {'ovt_sigpric_flu_rt_rank': {'rank': 'int',
+                                                   'stk_cd': 'str',
+                                                   'stk_nm': 'str',
+                                                   'cur_prc': 'int',
+                                                   'pred_pre_sig': 'str',
+                                                   'pred_pre': 'int',
+                                                   'flu_rt': 'float',
+                                                   'sel_tot_req': 'int',
+                                                   'buy_tot_req': 'int',
+                                                   'acc_trde_qty': 'int',
+                                                   'acc_trde_prica': 'int',
+                                                   'tdy_close_pric': 'int',
+                                                   'tdy_close_pric_flu_rt': 'float'}}},
+ 'ka10099': {'title': '종목정보 리스트',
+             'fields': {},
+             'lists': {'list': {'code': 'str',
+                                'name': 'str',
+                                'listCount': 'int',
+                                'auditInfo': 'str',
+                                'regDay': 'int',
+                                'lastPrice': 'int',
+                                'state': 'str',
+                                'marketCode': 'str',
+                                'marketName': 'str',
+                                'upName': 'str',
+                                'upSizeName': 'str',
+                                'companyClassName': 'str',
+                                'orderWarning': 'str',
+                                'nxtEnable': 'str'}}},
+ 'ka10100': {'title': '종목정보 조회',
+             'fields': {'code': 'str',
+                        'name': 'str',
+                        'listCount': 'int',
+                        'auditInfo': 'str',
+                        'regDay': 'int',
+                        'lastPrice': 'int',
+                        'state': 'str',
+                        'marketCode': 'str',
+                        'marketName': 'str',
+                        'upName': 'str',
+                        'upSizeName': 'str',
+                        'companyClassName': 'str',
+                        'orderWarning': 'str',
+                        'nxtEnable': 'str'},
+             'lists': {}},
+ 'ka10101': {'title': '업종코드 리스트',
+             'fields': {},
+             'lists': {'list': {'marketCode': 'str', 'code': 'str', 'name': 'str', 'group': 'int'}}},
+ 'ka10102': {'title': '회원사 리스트', 'fields': {}, 'lists': {'list': {'code': 'str', 'name': 'str', 'gb': 'str'}}},
+ 'ka10131': {'title': '기관외국인연속매매현황요청',
+             'fields': {},
+             'lists': {'orgn_frgnr_cont_trde_prst': {'rank': 'int',
+                                                     'stk_cd': 'str',
+                                                     'stk_nm': 'str',
+                                                     'prid_stkpc_flu_rt': 'float',
+                                                     'orgn_nettrde_amt': 'int',
+                                                     'orgn_nettrde_qty': 'int',
+                                                     'orgn_cont_netprps_dys': 'int',
+                                                     'orgn_cont_netprps_qty': 'int',
+                                                     'orgn_cont_netprps_amt': 'int',
+                                                     'frgnr_nettrde_qty': 'int',
+                                                     'frgnr_nettrde_amt': 'int',
+                                                     'frgnr_cont_netprps_dys': 'int',
+                                                     'frgnr_cont_netprps_qty': 'int',
+                                                     'frgnr_cont_netprps_amt': 'int',
+                                                     'nettrde_qty': 'int',
+                                                     'nettrde_amt': 'int',
+                                                     'tot_cont_netprps_dys': 'int',
+                                                     'tot_cont_nettrde_qty': 'int',
+                                                     'tot_cont_netprps_amt': 'int'}}},
+ 'ka10170': {'title': '당일매매일지요청',
+             'fields': {'tot_sell_amt': 'int',
+                        'tot_buy_amt': 'int',
+                        'tot_cmsn_tax': 'int',
+                        'tot_exct_amt': 'int',
+                        'tot_pl_amt': 'int',
+                        'tot_prft_rt': 'float'},
+             'lists': {'tdy_trde_diary': {'stk_nm': 'str',
+                                          'buy_avg_pric': 'int',
+                                          'buy_qty': 'int',
+                                          'sel_avg_pric': 'int',
+                                          'sell_qty': 'int',
+                                          'cmsn_alm_tax': 'int',
+                                          'pl_amt': 'int',
+                                          'sell_amt': 'int',
+                                          'buy_amt': 'int',
+                                          'prft_rt': 'float',
+                                          'stk_cd': 'str'}}},
+ 'ka20001': {'title': '업종현재가요청',
+             'fields': {'cur_prc': 'int',
+                        'pred_pre_sig': 'str',
+                        'pred_pre': 'int',
+                        'flu_rt': 'float',
+                        'trde_qty': 'int',
+                        'trde_prica': 'int',
+                        'trde_frmatn_stk_num': 'int',
+                        'trde_frmatn_rt': 'float',
+                        'open_pric': 'int',
+                        'high_pric': 'int',
+                        'low_pric': 'int',
+                        'upl': 'int',
+                        'rising': 'int',
+                        'stdns': 'int',
+                        'fall': 'int',
+                        'lst': 'int',
+                        '52wk_hgst_pric': 'int',
+                        '52wk_hgst_pric_dt': 'str',
+                        '52wk_hgst_pric_pre_rt': 'float',
+                        '52wk_lwst_pric': 'int',
+                        '52wk_lwst_pric_dt': 'str',
+                        '52wk_lwst_pric_pre_rt': 'float'},
+             'lists': {'inds_cur_prc_tm': {'tm_n': 'str',
+                                           'cur_prc_n': 'int',
+                                           'pred_pre_sig_n': 'str',
+                                           'pred_pre_n': 'int',
+                                           'flu_rt_n': 'float',
+                                           'trde_qty_n': 'int',
+                                           'acc_trde_qty_n': 'int'}}},
+ 'ka20002': {'title': '업종별주가요청',
+             'fields': {},
+             'lists': {'inds_stkpc': {'stk_cd': 'str',
+                                      'stk_nm': 'str',
+                                      'cur_prc': 'int',
+                                      'pred_pre_sig': 'str',
+                                      'pred_pre': 'int',
+                                      'flu_rt': 'float',
+                                      'now_trde_qty': 'int',
+                                      'sel_bid': 'int',
+                                      'buy_bid': 'int',
+                                      'open_pric': 'int',
+                                      'high_pric': 'int',
+                                      'low_pric': 'int'}}},
+ 'ka20003': {'title': '전업종지수요청',
+             'fields': {},
+             'lists': {'all_inds_idex': {'stk_cd': 'str',
+                                         'stk_nm': 'str',
+                                         'cur_prc': 'int',
+                                         'pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'flu_rt': 'float',
+                                         'trde_qty': 'int',
+                                         'wght': 'float',
+                                         'trde_prica': 'int',
+                                         'upl': 'int',
+                                         'rising': 'int',
+                                         'stdns': 'int',
+                                         'fall': 'int',
+                                         'lst': 'int',
+                                         'flo_stk_num': 'int'}}},
+ 'ka20004': {'title': '업종틱차트조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_tic_chart_qry': {'cur_prc': 'int',
+                                              'trde_qty': 'int',
+                                              'cntr_tm': 'str',
+                                              'open_pric': 'int',
+                                              'high_pric': 'int',
+                                              'low_pric': 'int',
+                                              'bic_inds_tp': 'str',
+                                              'sm_inds_tp': 'str',
+                                              'stk_infr': 'str',
+                                              'pred_close_pric': 'int'}}},
+ 'ka20005': {'title': '업종분봉조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_min_pole_qry': {'cur_prc': 'int',
+                                             'trde_qty': 'int',
+                                             'cntr_tm': 'str',
+                                             'open_pric': 'int',
+                                             'high_pric': 'int',
+                                             'low_pric': 'int',
+                                             'bic_inds_tp': 'str',
+                                             'sm_inds_tp': 'str',
+                                             'stk_infr': 'str',
+                                             'pred_close_pric': 'int'}}},
+ 'ka20006': {'title': '업종일봉조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_dt_pole_qry': {'cur_prc': 'int',
+                                            'trde_qty': 'int',
+                                            'dt': 'str',
+                                            'open_pric': 'int',
+                                            'high_pric': 'int',
+                                            'low_pric': 'int',
+                                            'trde_prica': 'int',
+                                            'bic_inds_tp': 'str',
+                                            'sm_inds_tp': 'str',
+                                            'stk_infr': 'str',
+                                            'pred_close_pric': 'int'}}},
+ 'ka20007': {'title': '업종주봉조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_stk_pole_qry': {'cur_prc': 'int',
+                                             'trde_qty': 'int',
+                                             'dt': 'str',
+                                             'open_pric': 'int',
+                                             'high_pric': 'int',
+                                             'low_pric': 'int',
+                                             'trde_prica': 'int',
+                                             'bic_inds_tp': 'str',
+                                             'sm_inds_tp': 'str',
+                                             'stk_infr': 'str',
+                                             'pred_close_pric': 'int'}}},
+ 'ka20008': {'title': '업종월봉조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_mth_pole_qry': {'cur_prc': 'int',
+                                             'trde_qty': 'int',
+                                             'dt': 'str',
+                                             'open_pric': 'int',
+                                             'high_pric': 'int',
+                                             'low_pric': 'int',
+                                             'trde_prica': 'int',
+                                             'bic_inds_tp': 'str',
+                                             'sm_inds_tp': 'str',
+                                             'stk_infr': 'str',
+                                             'pred_close_pric': 'int'}}},
+ 'ka20009': {'title': '업종현재가일별요청',
+             'fields': {'cur_prc': 'int',
+                        'pred_pre_sig': 'str',
+                        'pred_pre': 'int',
+                        'flu_rt': 'float',
+                        'trde_qty': 'int',
+                        'trde_prica': 'int',
+                        'trde_frmatn_stk_num': 'int',
+                        'trde_frmatn_rt': 'float',
+                        'open_pric': 'int',
+                        'high_pric': 'int',
+                        'low_pric': 'int',
+                        'upl': 'int',
+                        'rising': 'int',
+                        'stdns': 'int',
+                        'fall': 'int',
+                        'lst': 'int',
+                        '52wk_hgst_pric': 'int',
+                        '52wk_hgst_pric_dt': 'str',
+                        '52wk_hgst_pric_pre_rt': 'float',
+                        '52wk_lwst_pric': 'int',
+                        '52wk_lwst_pric_dt': 'str',
+                        '52wk_lwst_pric_pre_rt': 'float'},
+             'lists': {'inds_cur_prc_daly_rept': {'dt_n': 'str',
+                                                  'cur_prc_n': 'int',
+                                                  'pred_pre_sig_n': 'str',
+                                                  'pred_pre_n': 'int',
+                                                  'flu_rt_n': 'float',
+                                                  'acc_trde_qty_n': 'int'}}},
+ 'ka20019': {'title': '업종년봉조회요청',
+             'fields': {'inds_cd': 'str'},
+             'lists': {'inds_yr_pole_qry': {'cur_prc': 'int',
+                                            'trde_qty': 'int',
+                                            'dt': 'str',
+                                            'open_pric': 'int',
+                                            'high_pric': 'int',
+                                            'low_pric': 'int',
+                                            'trde_prica': 'int',
+                                            'bic_inds_tp': 'str',
+                                            'sm_inds_tp': 'str',
+                                            'stk_infr': 'str',
+                                            'pred_close_pric': 'int'}}},
+ 'ka30001': {'title': 'ELW가격급등락요청',
+             'fields': {'base_pric_tm': 'str'},
+             'lists': {'elwpric_jmpflu': {'stk_cd': 'str',
+                                          'rank': 'int',
+                                          'stk_nm': 'str',
+                                          'pre_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'trde_end_elwbase_pric': 'int',
+                                          'cur_prc': 'int',
+                                          'base_pre': 'int',
+                                          'trde_qty': 'int',
+                                          'jmp_rt': 'float'}}},
+ 'ka30002': {'title': '거래원별ELW순매매상위요청',
+             'fields': {},
+             'lists': {'trde_ori_elwnettrde_upper': {'stk_cd': 'str',
+                                                     'stk_nm': 'str',
+                                                     'stkpc_flu': 'int',
+                                                     'flu_rt': 'float',
+                                                     'trde_qty': 'int',
+                                                     'netprps': 'int',
+                                                     'buy_trde_qty': 'int',
+                                                     'sel_trde_qty': 'int'}}},
+ 'ka30003': {'title': 'ELWLP보유일별추이요청',
+             'fields': {},
+             'lists': {'elwlpposs_daly_trnsn': {'dt': 'str',
+                                                'cur_prc': 'int',
+                                                'pre_tp': 'str',
+                                                'pred_pre': 'int',
+                                                'flu_rt': 'float',
+                                                'trde_qty': 'int',
+                                                'trde_prica': 'int',
+                                                'chg_qty': 'int',
+                                                'lprmnd_qty': 'int',
+                                                'wght': 'float'}}},
+ 'ka30004': {'title': 'ELW괴리율요청',
+             'fields': {},
+             'lists': {'elwdispty_rt': {'stk_cd': 'str',
+                                        'isscomp_nm': 'str',
+                                        'sqnc': 'int',
+                                        'base_aset_nm': 'str',
+                                        'rght_tp': 'str',
+                                        'dispty_rt': 'float',
+                                        'basis': 'int',
+                                        'srvive_dys': 'int',
+                                        'theory_pric': 'int',
+                                        'cur_prc': 'int',
+                                        'pre_tp': 'str',
+                                        'pred_pre': 'int',
+                                        'flu_rt': 'float',
+                                        'trde_qty': 'int',
+                                        'stk_nm': 'str'}}},
+ 'ka30005': {'title': 'ELW조건검색요청',
+             'fields': {},
+             'lists': {'elwcnd_qry': {'stk_cd': 'str',
+                                      'isscomp_nm': 'str',
+                                      'sqnc': 'int',
+                                      'base_aset_nm': 'str',
+                                      'rght_tp': 'str',
+                                      'expr_dt': 'str',
+                                      'cur_prc': 'int',
+                                      'pre_tp': 'str',
+                                      'pred_pre': 'int',
+                                      'flu_rt': 'float',
+                                      'trde_qty': 'int',
+                                      'trde_qty_pre': 'int',
+                                      'trde_prica': 'int',
+                                      'pred_trde_qty': 'int',
+                                      'sel_bid': 'int',
+                                      'buy_bid': 'int',
+                                      'prty': 'int',
+                                      'gear_rt': 'float',
+                                      'pl_qutr_rt': 'float',
+                                      'cfp': 'str',
+                                      'theory_pric': 'int',
+                                      'innr_vltl': 'int',
+                                      'delta': 'float',
+                                      'lvrg': 'int',
+                                      'exec_pric': 'int',
+                                      'cnvt_rt': 'float',
+                                      'lpposs_rt': 'float',
+                                      'pl_qutr_pt': 'int',
+                                      'fin_trde_dt': 'str',
+                                      'flo_dt': 'str',
+                                      'lpinitlast_suply_dt': 'str',
+                                      'stk_nm': 'str',
+                                      'srvive_dys': 'int',
+                                      'dispty_rt': 'float',
+                                      'lpmmcm_nm': 'str',
+                                      'lpmmcm_nm_1': 'str',
+                                      'lpmmcm_nm_2': 'str',
+                                      'xraymont_cntr_qty_arng_trde_tp': 'str',
+                                      'xraymont_cntr_qty_profa_100tp': 'str'}}},
+ 'ka30009': {'title': 'ELW등락율순위요청',
+             'fields': {},
+             'lists': {'elwflu_rt_rank': {'rank': 'int',
+                                          'stk_cd': 'str',
+                                          'stk_nm': 'str',
+                                          'cur_prc': 'int',
+                                          'pre_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'flu_rt': 'float',
+                                          'sel_req': 'int',
+                                          'buy_req': 'int',
+                                          'trde_qty': 'int',
+                                          'trde_prica': 'int'}}},
+ 'ka30010': {'title': 'ELW잔량순위요청',
+             'fields': {},
+             'lists': {'elwreq_rank': {'stk_cd': 'str',
+                                       'rank': 'int',
+                                       'stk_nm': 'str',
+                                       'cur_prc': 'int',
+                                       'pre_sig': 'str',
+                                       'pred_pre': 'int',
+                                       'flu_rt': 'float',
+                                       'trde_qty': 'int',
+                                       'sel_req': 'int',
+                                       'buy_req': 'int',
+                                       'netprps_req': 'int',
+                                       'trde_prica': 'int'}}},
+ 'ka30011': {'title': 'ELW근접율요청',
+             'fields': {},
+             'lists': {'elwalacc_rt': {'stk_cd': 'str',
+                                       'stk_nm': 'str',
+                                       'cur_prc': 'int',
+                                       'pre_sig': 'str',
+                                       'pred_pre': 'int',
+                                       'flu_rt': 'float',
+                                       'acc_trde_qty': 'int',
+                                       'alacc_rt': 'float'}}},
+ 'ka30012': {'title': 'ELW종목상세정보요청',
+             'fields': {'aset_cd': 'str',
+                        'cur_prc': 'int',
+                        'pred_pre_sig': 'str',
+                        'pred_pre': 'int',
+                        'flu_rt': 'float',
+                        'lpmmcm_nm': 'str',
+                        'lpmmcm_nm_1': 'str',
+                        'lpmmcm_nm_2': 'str',
+                        'elwrght_cntn': 'str',
+                        'elwexpr_evlt_pric': 'int',
+                        'elwtheory_pric': 'int',
+                        'dispty_rt': 'float',
+                        'elwinnr_vltl': 'int',
+                        'exp_rght_pric': 'int',
+                        'elwpl_qutr_rt': 'float',
+                        'elwexec_pric': 'int',
+                        'elwcnvt_rt': 'float',
+                        'elwcmpn_rt': 'float',
+                        'elwpric_rising_part_rt': 'float',
+                        'elwrght_type': 'str',
+                        'elwsrvive_dys': 'int',
+                        'stkcnt': 'int',
+                        'elwlpord_pos': 'int',
+                        'lpposs_rt': 'float',
+                        'lprmnd_qty': 'int',
+                        'elwspread': 'int',
+                        'elwprty': 'int',
+                        'elwgear': 'int',
+                        'elwflo_dt': 'str',
+                        'elwfin_trde_dt': 'str',
+                        'expr_dt': 'str',
+                        'exec_dt': 'str',
+                        'lpsuply_end_dt': 'str',
+                        'elwpay_dt': 'str',
+                        'elwinvt_ix_comput': 'int',
+                        'elwpay_agnt': 'int',
+                        'elwappr_way': 'str',
+                        'elwrght_exec_way': 'int',
+                        'elwpblicte_orgn': 'int',
+                        'dcsn_pay_amt': 'int',
+                        'kobarr': 'int',
+                        'iv': 'int',
+                        'clsprd_end_elwocr': 'int',
+                        'bsis_aset_1': 'str',
+                        'bsis_aset_comp_rt_1': 'float',
+                        'bsis_aset_2': 'str',
+                        'bsis_aset_comp_rt_2': 'float',
+                        'bsis_aset_3': 'str',
+                        'bsis_aset_comp_rt_3': 'float',
+                        'bsis_aset_4': 'str',
+                        'bsis_aset_comp_rt_4': 'float',
+                        'bsis_aset_5': 'str',
+                        'bsis_aset_comp_rt_5': 'float',
+                        'fr_dt': 'str',
+                        'to_dt': 'str',
+                        'fr_tm': 'str',
+                        'evlt_end_tm': 'str',
+                        'evlt_pric': 'int',
+                        'evlt_fnsh_yn': 'str',
+                        'all_hgst_pric': 'int',
+                        'all_lwst_pric': 'int',
+                        'imaf_hgst_pric': 'int',
+                        'imaf_lwst_pric': 'int',
+                        'sndhalf_mrkt_hgst_pric': 'int',
+                        'sndhalf_mrkt_lwst_pric': 'int'},
+             'lists': {}},
+ 'ka40001': {'title': 'ETF수익율요청',
+             'fields': {},
+             'lists': {'etfprft_rt_lst': {'etfprft_rt': 'float',
+                                          'cntr_prft_rt': 'float',
+                                          'for_netprps_qty': 'int',
+                                          'orgn_netprps_qty': 'int'}}},
+ 'ka40002': {'title': 'ETF종목정보요청',
+             'fields': {'stk_nm': 'str',
+                        'etfobjt_idex_nm': 'str',
+                        'wonju_pric': 'int',
+                        'etftxon_type': 'str',
+                        'etntxon_type': 'str'},
+             'lists': {}},
+ 'ka40003': {'title': 'ETF일별추이요청',
+             'fields': {},
+             'lists': {'etfdaly_trnsn': {'cntr_dt': 'str',
+                                         'cur_prc': 'int',
+                                         'pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'pre_rt': 'float',
+                                         'trde_qty': 'int',
+                                         'nav': 'int',
+                                         'acc_trde_prica': 'int',
+                                         'navidex_dispty_rt': 'float',
+                                         'navetfdispty_rt': 'float',
+                                         'trace_eor_rt': 'float',
+                                         'trace_cur_prc': 'int',
+                                         'trace_pred_pre': 'int',
+                                         'trace_pre_sig': 'str'}}},
+ 'ka40004': {'title': 'ETF전체시세요청',
+             'fields': {},
+             'lists': {'etfall_mrpr': {'stk_cd': 'str',
+                                       'stk_cls': 'str',
+                                       'stk_nm': 'str',
+                                       'close_pric': 'int',
+                                       'pre_sig': 'str',
+                                       'pred_pre': 'int',
+                                       'pre_rt': 'float',
+                                       'trde_qty': 'int',
+                                       'nav': 'int',
+                                       'trace_eor_rt': 'float',
+                                       'txbs': 'int',
+                                       'dvid_bf_base': 'int',
+                                       'pred_dvida': 'int',
+                                       'trace_idex_nm': 'str',
+                                       'drng': 'float',
+                                       'trace_idex_cd': 'str',
+                                       'trace_idex': 'int',
+                                       'trace_flu_rt': 'float'}}},
+ 'ka40006': {'title': 'ETF시간대별추이요청',
+             'fields': {'stk_nm': 'str',
+                        'etfobjt_idex_nm': 'str',
+                        'wonju_pric': 'int',
+                        'etftxon_type': 'str',
+                        'etntxon_type': 'str'},
+             'lists': {'etftisl_trnsn': {'tm': 'str',
+                                         'close_pric': 'int',
+                                         'pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'flu_rt': 'float',
+                                         'trde_qty': 'int',
+                                         'nav': 'int',
+                                         'trde_prica': 'int',
+                                         'navidex': 'int',
+                                         'navetf': 'int',
+                                         'trace': 'int',
+                                         'trace_idex': 'int',
+                                         'trace_idex_pred_pre': 'int',
+                                         'trace_idex_pred_pre_sig': 'str'}}},
+ 'ka40007': {'title': 'ETF시간대별체결요청',
+             'fields': {'stk_cls': 'str',
+                        'stk_nm': 'str',
+                        'etfobjt_idex_nm': 'str',
+                        'etfobjt_idex_cd': 'str',
+                        'objt_idex_pre_rt': 'float',
+                        'wonju_pric': 'int'},
+             'lists': {'etftisl_cntr_array': {'cntr_tm': 'str',
+                                              'cur_prc': 'int',
+                                              'pre_sig': 'str',
+                                              'pred_pre': 'int',
+                                              'trde_qty': 'int',
+                                              'stex_tp': 'str'}}},
+ 'ka40008': {'title': 'ETF일자별체결요청',
+             'fields': {'cntr_tm': 'str', 'cur_prc': 'int', 'pre_sig': 'str', 'pred_pre': 'int', 'trde_qty': 'int'},
+             'lists': {'etfnetprps_qty_array': {'dt': 'str',
+                                                'cur_prc_n': 'int',
+                                                'pre_sig_n': 'str',
+                                                'pred_pre_n': 'int',
+                                                'acc_trde_qty': 'int',
+                                                'for_netprps_qty': 'int',
+                                                'orgn_netprps_qty': 'int'}}},
+ 'ka40009': {'title': 'ETF시간대별체결요청',
+             'fields': {},
+             'lists': {'etfnavarray': {'nav': 'int',
+                                       'navpred_pre': 'int',
+                                       'navflu_rt': 'float',
+                                       'trace_eor_rt': 'float',
+                                       'dispty_rt': 'float',
+                                       'stkcnt': 'int',
+                                       'base_pric': 'int',
+                                       'for_rmnd_qty': 'int',
+                                       'repl_pric': 'int',
+                                       'conv_pric': 'int',
+                                       'drstk': 'int',
+                                       'wonju_pric': 'int'}}},
+ 'ka40010': {'title': 'ETF시간대별추이요청',
+             'fields': {},
+             'lists': {'etftisl_trnsn': {'cur_prc': 'int',
+                                         'pre_sig': 'str',
+                                         'pred_pre': 'int',
+                                         'trde_qty': 'int',
+                                         'for_netprps': 'int'}}},
+ 'ka90001': {'title': '테마그룹별요청',
+             'fields': {},
+             'lists': {'thema_grp': {'thema_grp_cd': 'str',
+                                     'thema_nm': 'str',
+                                     'stk_num': 'int',
+                                     'flu_sig': 'str',
+                                     'flu_rt': 'float',
+                                     'rising_stk_num': 'int',
+                                     'fall_stk_num': 'int',
+                                     'dt_prft_rt': 'float',
+                                     'main_stk': 'str'}}},
+ 'ka90002': {'title': '테마구성종목요청',
+             'fields': {'flu_rt': 'float', 'dt_prft_rt': 'float'},
+             'lists': {'thema_comp_stk': {'stk_cd': 'str',
+                                          'stk_nm': 'str',
+                                          'cur_prc': 'int',
+                                          'flu_sig': 'str',
+                                          'pred_pre': 'int',
+                                          'flu_rt': 'float',
+                                          'acc_trde_qty': 'int',
+                                          'sel_bid': 'int',
+                                          'sel_req': 'int',
+                                          'buy_bid': 'int',
+                                          'buy_req': 'int',
+                                          'dt_prft_rt_n': 'float'}}},
+ 'ka90003': {'title': '프로그램순매수상위50요청',
+             'fields': {},
+             'lists': {'prm_netprps_upper_50': {'rank': 'int',
+                                                'stk_cd': 'str',
+                                                'stk_nm': 'str',
+                                                'cur_prc': 'int',
+                                                'flu_sig': 'str',
+                                                'pred_pre': 'int',
+                                                'flu_rt': 'float',
+                                                'acc_trde_qty': 'int',
+                                                'prm_sell_amt': 'int',
+                                                'prm_buy_amt': 'int',
+                                                'prm_netprps_amt': 'int'}}},
+ 'ka90004': {'title': '종목별프로그램매매현황요청',
+             'fields': {'tot_1': 'int', 'tot_2': 'int', 'tot_3': 'int', 'tot_4': 'int', 'tot_5': 'int', 'tot_6': 'int'},
+             'lists': {'stk_prm_trde_prst': {'stk_cd': 'str',
+                                             'stk_nm': 'str',
+                                             'cur_prc': 'int',
+                                             'flu_sig': 'str',
+                                             'pred_pre': 'int',
+                                             'buy_cntr_qty': 'int',
+                                             'buy_cntr_amt': 'int',
+                                             'sel_cntr_qty': 'int',
+                                             'sel_cntr_amt': 'int',
+                                             'netprps_prica': 'int',
+                                             'all_trde_rt': 'float'}}},
+ 'ka90005': {'title': '프로그램매매추이요청 시간대별',
+             'fields': {},
+             'lists': {'prm_trde_trnsn': {'cntr_tm': 'str',
+                                          'dfrt_trde_sel': 'int',
+                                          'dfrt_trde_buy': 'int',
+                                          'dfrt_trde_netprps': 'int',
+                                          'ndiffpro_trde_sel': 'int',
+                                          'ndiffpro_trde_buy': 'int',
+                                          'ndiffpro_trde_netprps': 'int',
+                                          'dfrt_trde_sell_qty': 'int',
+                                          'dfrt_trde_buy_qty': 'int',
+                                          'dfrt_trde_netprps_qty': 'int',
+                                          'ndiffpro_trde_sell_qty': 'int',
+                                          'ndiffpro_trde_buy_qty': 'int',
+                                          'ndiffpro_trde_netprps_qty': 'int',
+                                          'all_sel': 'int',
+                                          'all_buy': 'int',
+                                          'all_netprps': 'int',
+                                          'kospi200': 'int',
+                                          'basis': 'int'}}},
+ 'ka90006': {'title': '프로그램매매차익잔고추이요청',
+             'fields': {},
+             'lists': {'prm_trde_dfrt_remn_trnsn': {'dt': 'str',
+                                                    'buy_dfrt_trde_qty': 'int',
+                                                    'buy_dfrt_trde_amt': 'int',
+                                                    'buy_dfrt_trde_irds_amt': 'int',
+                                                    'sel_dfrt_trde_qty': 'int',
+                                                    'sel_dfrt_trde_amt': 'int',
+                                                    'sel_dfrt_trde_irds_amt': 'int'}}},
+ 'ka90007': {'title': '프로그램매매누적추이요청',
+             'fields': {},
+             'lists': {'prm_trde_acc_trnsn': {'dt': 'str',
+                                              'kospi200': 'int',
+                                              'basis': 'int',
+                                              'dfrt_trde_tdy': 'int',
+                                              'dfrt_trde_acc': 'int',
+                                              'ndiffpro_trde_tdy': 'int',
+                                              'ndiffpro_trde_acc': 'int',
+                                              'all_tdy': 'int',
+                                              'all_acc': 'int'}}},
+ 'ka90008': {'title': '종목시간별프로그램매매추이요청',
+             'fields': {},
+             'lists': {'stk_tm_prm_trde_trnsn': {'tm': 'str',
+                                                 'cur_prc': 'int',
+                                                 'pre_sig': 'str',
+                                                 'pred_pre': 'int',
+                                                 'flu_rt': 'float',
+                                                 'trde_qty': 'int',
+                                                 'prm_sell_amt': 'int',
+                                                 'prm_buy_amt': 'int',
+                                                 'prm_netprps_amt': 'int',
+                                                 'prm_netprps_amt_irds': 'int',
+                                                 'prm_sell_qty': 'int',
+                                                 'prm_buy_qty': 'int',
+                                                 'prm_netprps_qty': 'int',
+                                                 'prm_netprps_qty_irds': 'int',
+                                                 'base_pric_tm': 'str',
+                                                 'dbrt_trde_rpy_sum': 'int',
+                                                 'remn_rcvord_sum': 'int',
+                                                 'stex_tp': 'str'}}},
+ 'ka90009': {'title': '외국인기관매매상위요청',
+             'fields': {},
+             'lists': {'frgnr_orgn_trde_upper': {'for_netslmt_stk_cd': 'str',
+                                                 'for_netslmt_stk_nm': 'str',
+                                                 'for_netslmt_amt': 'int',
+                                                 'for_netslmt_qty': 'int',
+                                                 'for_netprps_stk_cd': 'str',
+                                                 'for_netprps_stk_nm': 'str',
+                                                 'for_netprps_amt': 'int',
+                                                 'for_netprps_qty': 'int',
+                                                 'orgn_netslmt_stk_cd': 'str',
+                                                 'orgn_netslmt_stk_nm': 'str',
+                                                 'orgn_netslmt_amt': 'int',
+                                                 'orgn_netslmt_qty': 'int',
+                                                 'orgn_netprps_stk_cd': 'str',
+                                                 'orgn_netprps_stk_nm': 'str',
+                                                 'orgn_netprps_amt': 'int',
+                                                 'orgn_netprps_qty': 'int'}}},
+ 'ka90010': {'title': '프로그램매매추이요청 일자별',
+             'fields': {},
+             'lists': {'prm_trde_trnsn': {'cntr_tm': 'str',
+                                          'dfrt_trde_sel': 'int',
+                                          'dfrt_trde_buy': 'int',
+                                          'dfrt_trde_netprps': 'int',
+                                          'ndiffpro_trde_sel': 'int',
+                                          'ndiffpro_trde_buy': 'int',
+                                          'ndiffpro_trde_netprps': 'int',
+                                          'dfrt_trde_sell_qty': 'int',
+                                          'dfrt_trde_buy_qty': 'int',
+                                          'dfrt_trde_netprps_qty': 'int',
+                                          'ndiffpro_trde_sell_qty': 'int',
+                                          'ndiffpro_trde_buy_qty': 'int',
+                                          'ndiffpro_trde_netprps_qty': 'int',
+                                          'all_sel': 'int',
+                                          'all_buy': 'int',
+                                          'all_netprps': 'int',
+                                          'kospi200': 'int',
+                                          'basis': 'int'}}},
+ 'ka90012': {'title': '대차거래내역요청',
+             'fields': {},
+             'lists': {'dbrt_trde_prps': {'stk_nm': 'str',
+                                          'stk_cd': 'str',
+                                          'dbrt_trde_cntrcnt': 'int',
+                                          'dbrt_trde_rpy': 'int',
+                                          'rmnd': 'int',
+                                          'remn_amt': 'int'}}},
+ 'ka90013': {'title': '종목일별프로그램매매추이요청',
+             'fields': {},
+             'lists': {'stk_daly_prm_trde_trnsn': {'dt': 'str',
+                                                   'cur_prc': 'int',
+                                                   'pre_sig': 'str',
+                                                   'pred_pre': 'int',
+                                                   'flu_rt': 'float',
+                                                   'trde_qty': 'int',
+                                                   'prm_sell_amt': 'int',
+                                                   'prm_buy_amt': 'int',
+                                                   'prm_netprps_amt': 'int',
+                                                   'prm_netprps_amt_irds': 'int',
+                                                   'prm_sell_qty': 'int',
+                                                   'prm_buy_qty': 'int',
+                                                   'prm_netprps_qty': 'int',
+                                                   'prm_netprps_qty_irds': 'int',
+                                                   'base_pric_tm': 'str',
+                                                   'dbrt_trde_rpy_sum': 'int',
+                                                   'remn_rcvord_sum': 'int',
+                                                   'stex_tp': 'str'}}},
+ 'kt00001': {'title': '예수금상세현황요청',
+             'fields': {'entr': 'int',
+                        'profa_ch': 'int',
+                        'bncr_profa_ch': 'int',
+                        'nxdy_bncr_sell_exct': 'int',
+                        'fc_stk_krw_repl_set_amt': 'int',
+                        'crd_grnta_ch': 'int',
+                        'crd_grnt_ch': 'int',
+                        'add_grnt_ch': 'int',
+                        'etc_profa': 'int',
+                        'uncl_stk_amt': 'int',
+                        'shrts_prica': 'int',
+                        'crd_set_grnta': 'int',
+                        'chck_ina_amt': 'int',
+                        'etc_chck_ina_amt': 'int',
+                        'crd_grnt_ruse': 'int',
+                        'knx_asset_evltv': 'int',
+                        'elwdpst_evlta': 'int',
+                        'crd_ls_rght_frcs_amt': 'int',
+                        'lvlh_join_amt': 'int',
+                        'lvlh_trns_alowa': 'int',
+                        'repl_amt': 'int',
+                        'remn_repl_evlta': 'int',
+                        'trst_remn_repl_evlta': 'int',
+                        'bncr_remn_repl_evlta': 'int',
+                        'profa_repl': 'int',
+                        'crd_grnta_repl': 'int',
+                        'crd_grnt_repl': 'int',
+                        'add_grnt_repl': 'int',
+                        'rght_repl_amt': 'int',
+                        'pymn_alow_amt': 'int',
+                        'wrap_pymn_alow_amt': 'int',
+                        'ord_alow_amt': 'int',
+                        'bncr_buy_alowa': 'int',
+                        '20stk_ord_alow_amt': 'int',
+                        '30stk_ord_alow_amt': 'int',
+                        '40stk_ord_alow_amt': 'int',
+                        '100stk_ord_alow_amt': 'int',
+                        'ch_uncla': 'int',
+                        'ch_uncla_dlfe': 'int',
+                        'ch_uncla_tot': 'int',
+                        'crd_int_npay': 'int',
+                        'int_npay_amt_dlfe': 'int',
+                        'int_npay_amt_tot': 'int',
+                        'etc_loana': 'int',
+                        'etc_loana_dlfe': 'int',
+                        'etc_loan_tot': 'int',
+                        'nrpy_loan': 'int',
+                        'loan_sum': 'int',
+                        'ls_sum': 'int',
+                        'crd_grnt_rt': 'float',
+                        'mdstrm_usfe': 'int',
+                        'min_ord_alow_yn': 'str',
+                        'loan_remn_evlt_amt': 'int',
+                        'dpst_grntl_remn': 'int',
+                        'sell_grntl_remn': 'int',
+                        'd1_entra': 'int',
+                        'd1_slby_exct_amt': 'int',
+                        'd1_buy_exct_amt': 'int',
+                        'd1_out_rep_mor': 'int',
+                        'd1_sel_exct_amt': 'int',
+                        'd1_pymn_alow_amt': 'int',
+                        'd2_entra': 'int',
+                        'd2_slby_exct_amt': 'int',
+                        'd2_buy_exct_amt': 'int',
+                        'd2_out_rep_mor': 'int',
+                        'd2_sel_exct_amt': 'int',
+                        'd2_pymn_alow_amt': 'int',
+                        '50stk_ord_alow_amt': 'int',
+                        '60stk_ord_alow_amt': 'int'},
+             'lists': {'stk_entr_prst': {'crnc_cd': 'str',
+                                         'fx_entr': 'int',
+                                         'fc_krw_repl_evlta': 'int',
+                                         'fc_trst_profa': 'int',
+                                         'pymn_alow_amt': 'int',
+                                         'pymn_alow_amt_entr': 'int',
+                                         'ord_alow_amt_entr': 'int',
+                                         'fc_uncla': 'int',
+                                         'fc_ch_uncla': 'int',
+                                         'dly_amt': 'int',
+                                         'd1_fx_entr': 'int',
+                                         'd2_fx_entr': 'int',
+                                         'd3_fx_entr': 'int',
+                                         'd4_fx_entr': 'int'}}},
+ 'kt00002': {'title': '일별추정예탁자산현황요청',
+             'fields': {},
+             'lists': {'daly_prsm_dpst_aset_amt_prst': {'dt': 'str',
+                                                        'entr': 'int',
+                                                        'grnt_use_amt': 'int',
+                                                        'crd_loan': 'int',
+                                                        'ls_grnt': 'int',
+                                                        'repl_amt': 'int',
+                                                        'prsm_dpst_aset_amt': 'int',
+                                                        'prsm_dpst_aset_amt_bncr_skip': 'int'}}},
+ 'kt00003': {'title': '추정자산조회요청', 'fields': {'prsm_dpst_aset_amt': 'int'}, 'lists': {}},
+ 'kt00004': {'title': '계좌평가현황요청',
+             'fields': {'acnt_nm': 'str',
+                        'brch_nm': 'str',
+                        'entr': 'int',
+                        'd2_entra': 'int',
+                        'tot_est_amt': 'int',
+                        'aset_evlt_amt': 'int',
+                        'tot_pur_amt': 'int',
+                        'prsm_dpst_aset_amt': 'int',
+                        'tot_grnt_sella': 'int',
+                        'tdy_lspft_amt': 'int',
+                        'invt_bsamt': 'int',
+                        'lspft_amt': 'int',
+                        'tdy_lspft': 'int',
+                        'lspft2': 'int',
+                        'lspft': 'int',
+                        'tdy_lspft_rt': 'float',
+                        'lspft_ratio': 'float',
+                        'lspft_rt': 'float'},
+             'lists': {'stk_acnt_evlt_prst': {'stk_cd': 'str',
+                                              'stk_nm': 'str',
+                                              'rmnd_qty': 'int',
+                                              'avg_prc': 'int',
+                                              'cur_prc': 'int',
+                                              'evlt_amt': 'int',
+                                              'pl_amt': 'int',
+                                              'pl_rt': 'float',
+                                              'loan_dt': 'str',
+                                              'pur_amt': 'int',
+                                              'setl_remn': 'int',
+                                              'pred_buyq': 'int',
+                                              'pred_sellq': 'int',
+                                              'tdy_buyq': 'int',
+                                              'tdy_sellq': 'int'}}},
+ 'kt00005': {'title': '체결잔고요청',
+             'fields': {'entr': 'int',
+                        'entr_d1': 'int',
+                        'entr_d2': 'int',
+                        'pymn_alow_amt': 'int',
+                        'uncl_stk_amt': 'int',
+                        'repl_amt': 'int',
+                        'rght_repl_amt': 'int',
+                        'ord_alowa': 'int',
+                        'ch_uncla': 'int',
+                        'crd_int_npay_gold': 'int',
+                        'etc_loana': 'int',
+                        'nrpy_loan': 'int',
+                        'profa_ch': 'int',
+                        'repl_profa': 'int',
+                        'stk_buy_tot_amt': 'int',
+                        'evlt_amt_tot': 'int',
+                        'tot_pl_tot': 'int',
+                        'tot_pl_rt': 'float',
+                        'tot_re_buy_alowa': 'int',
+                        '20ord_alow_amt': 'int',
+                        '30ord_alow_amt': 'int',
+                        '40ord_alow_amt': 'int',
+                        '50ord_alow_amt': 'int',
+                        '60ord_alow_amt': 'int',
+                        '100ord_alow_amt': 'int',
+                        'crd_loan_tot': 'int',
+                        'crd_loan_ls_tot': 'int',
+                        'crd_grnt_rt': 'float',
+                        'dpst_grnt_use_amt_amt': 'int',
+                        'grnt_loan_amt': 'int'},
+             'lists': {'stk_cntr_remn': {'crd_tp': 'str',
+                                         'loan_dt': 'str',
+                                         'expr_dt': 'str',
+                                         'stk_cd': 'str',
+                                         'stk_nm': 'str',
+                                         'setl_remn': 'int',
+                                         'cur_qty': 'int',
+                                         'cur_prc': 'int',
+                                         'buy_uv': 'int',
+                                         'pur_amt': 'int',
+                                         'evlt_amt': 'int',
+                                         'evltv_prft': 'int',
+                                         'pl_rt': 'float'}}},
+ 'kt00007': {'title': '계좌별주문체결현황요청',
+             'fields': {},
+             'lists': {'acnt_ord_cntr_prps_dtl': {'ord_no': 'str',
+                                                  'stk_cd': 'str',
+                                                  'trde_tp': 'str',
+                                                  'crd_tp': 'str',
+                                                  'ord_qty': 'int',
+                                                  'ord_uv': 'int',
+                                                  'cnfm_qty': 'int',
+                                                  'acpt_tp': 'str',
+                                                  'rsrv_tp': 'str',
+                                                  'ord_tm': 'str',
+                                                  'ori_ord': 'int',
+                                                  'stk_nm': 'str',
+                                                  'io_tp_nm': 'str',
+                                                  'loan_dt': 'str',
+                                                  'cntr_qty': 'int',
+                                                  'cntr_uv': 'int',
+                                                  'ord_remnq': 'int',
+                                                  'comm_ord_tp': 'str',
+                                                  'mdfy_cncl': 'int',
+                                                  'cnfm_tm': 'str',
+                                                  'dmst_stex_tp': 'str',
+                                                  'cond_uv': 'int'}}},
+ 'kt00008': {'title': '계좌별익일결제예정내역요청',
+             'fields': {'trde_dt': 'str', 'setl_dt': 'str', 'sell_amt_sum': 'int', 'buy_amt_sum': 'int'},
+             'lists': {'acnt_nxdy_setl_frcs_prps_array': {'seq': 'str',
+                                                          'stk_cd': 'str',
+                                                          'loan_dt': 'str',
+                                                          'qty': 'int',
+                                                          'engg_amt': 'int',
+                                                          'cmsn': 'int',
+                                                          'incm_tax': 'int',
+                                                          'rstx': 'int',
+                                                          'stk_nm': 'str',
+                                                          'sell_tp': 'str',
+                                                          'unp': 'int',
+                                                          'exct_amt': 'int',
+                                                          'trde_tax': 'int',
+                                                          'resi_tax': 'int',
+                                                          'crd_tp': 'str'}}},
+ 'kt00010': {'title': '주문인출가능금액요청',
+             'fields': {'profa_20ord_alow_amt': 'int',
+                        'profa_20ord_alowq': 'int',
+                        'profa_30ord_alow_amt': 'int',
+                        'profa_30ord_alowq': 'int',
+                        'profa_40ord_alow_amt': 'int',
+                        'profa_40ord_alowq': 'int',
+                        'profa_50ord_alow_amt': 'int',
+                        'profa_50ord_alowq': 'int',
+                        'profa_60ord_alow_amt': 'int',
+                        'profa_60ord_alowq': 'int',
+                        'profa_rdex_60ord_alow_amt': 'int',
+                        'profa_rdex_60ord_alowq': 'int',
+                        'profa_100ord_alow_amt': 'int',
+                        'profa_100ord_alowq': 'int',
+                        'pred_reu_alowa': 'int',
+                        'tdy_reu_alowa': 'int',
+                        'entr': 'int',
+                        'repl_amt': 'int',
+                        'uncla': 'int',
+                        'ord_pos_repl': 'int',
+                        'ord_alowa': 'int',
+                        'wthd_alowa': 'int',
+                        'nxdy_wthd_alowa': 'int',
+                        'pur_amt': 'int',
+                        'cmsn': 'int',
+                        'pur_exct_amt': 'int',
+                        'd2entra': 'int',
+                        'profa_rdex_aplc_tp': 'str'},
+             'lists': {}},
+ 'kt00011': {'title': '증거금율별주문가능수량조회요청',
+             'fields': {'stk_profa_rt': 'float',
+                        'profa_rt': 'float',
+                        'aplc_rt': 'float',
+                        'profa_20ord_alow_amt': 'int',
+                        'profa_20ord_alowq': 'int',
+                        'profa_20pred_reu_amt': 'int',
+                        'profa_20tdy_reu_amt': 'int',
+                        'profa_30ord_alow_amt': 'int',
+                        'profa_30ord_alowq': 'int',
+                        'profa_30pred_reu_amt': 'int',
+                        'profa_30tdy_reu_amt': 'int',
+                        'profa_40ord_alow_amt': 'int',
+                        'profa_40ord_alowq': 'int',
+                        'profa_40pred_reu_amt': 'int',
+                        'profa_40tdy_reu_amt': 'int',
+                        'profa_50ord_alow_amt': 'int',
+                        'profa_50ord_alowq': 'int',
+                        'profa_50pred_reu_amt': 'int',
+                        'profa_50tdy_reu_amt': 'int',
+                        'profa_60ord_alow_amt': 'int',
+                        'profa_60ord_alowq': 'int',
+                        'profa_60pred_reu_amt': 'int',
+                        'profa_60tdy_reu_amt': 'int',
+                        'profa_100ord_alow_amt': 'int',
+                        'profa_100ord_alowq': 'int',
+                        'profa_100pred_reu_amt': 'int',
+                        'profa_100tdy_reu_amt': 'int',
+                        'min_ord_alow_amt': 'int',
+                        'min_ord_alowq': 'int',
+                        'min_pred_reu_amt': 'int',
+                        'min_tdy_reu_amt': 'int',
+                        'entr': 'int',
+                        'repl_amt': 'int',
+                        'uncla': 'int',
+                        'ord_pos_repl': 'int',
+                        'ord_alowa': 'int'},
+             'lists': {}},
+ 'kt00012': {'title': '신용보증금율별주문가능수량조회요청',
+             'fields': {'stk_assr_rt': 'float',
+                        'stk_assr_rt_nm': 'str',
+                        'assr_30ord_alow_amt': 'int',
+                        'assr_30ord_alowq': 'int',
+                        'assr_30pred_reu_amt': 'int',
+                        'assr_30tdy_reu_amt': 'int',
+                        'assr_40ord_alow_amt': 'int',
+                        'assr_40ord_alowq': 'int',
+                        'assr_40pred_reu_amt': 'int',
+                        'assr_40tdy_reu_amt': 'int',
+                        'assr_50ord_alow_amt': 'int',
+                        'assr_50ord_alowq': 'int',
+                        'assr_50pred_reu_amt': 'int',
+                        'assr_50tdy_reu_amt': 'int',
+                        'assr_60ord_alow_amt': 'int',
+                        'assr_60ord_alowq': 'int',
+                        'assr_60pred_reu_amt': 'int',
+                        'assr_60tdy_reu_amt': 'int',
+                        'entr': 'int',
+                        'repl_amt': 'int',
+                        'uncla': 'int',
+                        'ord_pos_repl': 'int',
+                        'ord_alowa': 'int',
+                        'out_alowa': 'int',
+                        'out_pos_qty': 'int',
+                        'min_amt': 'int',
+                        'min_qty': 'int'},
+             'lists': {}},
+ 'kt00013': {'title': '증거금세부내역조회요청',
+             'fields': {'tdy_reu_objt_amt': 'int',
+                        'tdy_reu_use_amt': 'int',
+                        'tdy_reu_alowa': 'int',
+                        'tdy_reu_lmtt_amt': 'int',
+                        'tdy_reu_alowa_fin': 'int',
+                        'pred_reu_objt_amt': 'int',
+                        'pred_reu_use_amt': 'int',
+                        'pred_reu_alowa': 'int',
+                        'pred_reu_lmtt_amt': 'int',
+                        'pred_reu_alowa_fin': 'int',
+                        'ch_amt': 'int',
+                        'ch_profa': 'int',
+                        'use_pos_ch': 'int',
+                        'ch_use_lmtt_amt': 'int',
+                        'use_pos_ch_fin': 'int',
+                        'repl_amt_amt': 'int',
+                        'repl_profa': 'int',
+                        'use_pos_repl': 'int',
+                        'repl_use_lmtt_amt': 'int',
+                        'use_pos_repl_fin': 'int',
+                        'crd_grnta_ch': 'int',
+                        'crd_grnta_repl': 'int',
+                        'crd_grnt_ch': 'int',
+                        'crd_grnt_repl': 'int',
+                        'uncla': 'int',
+                        'ls_grnt_reu_gold': 'int',
+                        '20ord_alow_amt': 'int',
+                        '30ord_alow_amt': 'int',
+                        '40ord_alow_amt': 'int',
+                        '50ord_alow_amt': 'int',
+                        '60ord_alow_amt': 'int',
+                        '100ord_alow_amt': 'int',
+                        'tdy_crd_rpya_loss_amt': 'int',
+                        'pred_crd_rpya_loss_amt': 'int',
+                        'tdy_ls_rpya_loss_repl_profa': 'int',
+                        'pred_ls_rpya_loss_repl_profa': 'int',
+                        'evlt_repl_amt_spg_use_skip': 'int',
+                        'evlt_repl_rt': 'float',
+                        'crd_repl_profa': 'int',
+                        'ch_ord_repl_profa': 'int',
+                        'crd_ord_repl_profa': 'int',
+                        'crd_repl_conv_gold': 'int',
+                        'repl_alowa': 'int',
+                        'repl_alowa_2': 'int',
+                        'ch_repl_lck_gold': 'int',
+                        'crd_repl_lck_gold': 'int',
+                        'ch_ord_alow_repla': 'int',
+                        'crd_ord_alow_repla': 'int',
+                        'd2vexct_entr': 'int',
+                        'd2ch_ord_alow_amt': 'int'},
+             'lists': {}},
+ 'kt00015': {'title': '위탁종합거래내역요청',
+             'fields': {},
+             'lists': {'trst_ovrl_trde_prps_array': {'trde_dt': 'str',
+                                                     'trde_no': 'str',
+                                                     'rmrk_nm': 'str',
+                                                     'crd_deal_tp_nm': 'str',
+                                                     'exct_amt': 'int',
+                                                     'loan_amt_rpya': 'int',
+                                                     'fc_trde_amt': 'int',
+                                                     'fc_exct_amt': 'int',
+                                                     'entra_remn': 'int',
+                                                     'crnc_cd': 'str',
+                                                     'trde_ocr_tp': 'str',
+                                                     'trde_kind_nm': 'str',
+                                                     'stk_nm': 'str',
+                                                     'trde_amt': 'int',
+                                                     'trde_agri_tax': 'int',
+                                                     'rpy_diffa': 'int',
+                                                     'fc_trde_tax': 'int',
+                                                     'dly_sum': 'int',
+                                                     'fc_entra': 'int',
+                                                     'mdia_tp_nm': 'str',
+                                                     'io_tp': 'str',
+                                                     'io_tp_nm': 'str',
+                                                     'orig_deal_no': 'str',
+                                                     'stk_cd': 'str',
+                                                     'trde_qty_jwa_cnt': 'int',
+                                                     'cmsn': 'int',
+                                                     'int_ls_usfe': 'int',
+                                                     'fc_cmsn': 'int',
+                                                     'fc_dly_sum': 'int',
+                                                     'vlbl_nowrm': 'int',
+                                                     'proc_tm': 'str',
+                                                     'isin_cd': 'str',
+                                                     'stex_cd': 'str',
+                                                     'stex_nm': 'str',
+                                                     'trde_unit': 'float',
+                                                     'incm_resi_tax': 'int',
+                                                     'loan_dt': 'str',
+                                                     'uncl_ocr': 'int',
+                                                     'rpym_sum': 'int',
+                                                     'cntr_dt': 'str',
+                                                     'rcpy_no': 'str',
+                                                     'prcsr': 'int',
+                                                     'proc_brch': 'int',
+                                                     'trde_stle': 'int',
+                                                     'txon_base_pric': 'int',
+                                                     'tax_sum_cmsn': 'int',
+                                                     'frgn_pay_txam': 'int',
+                                                     'fc_uncl_ocr': 'int',
+                                                     'rpym_sum_fr': 'int',
+                                                     'rcpmnyer': 'int',
+                                                     'trde_prtc_tp': 'str'}}},
+ 'kt00016': {'title': '일별계좌수익률상세현황요청',
+             'fields': {'mang_empno': 'str',
+                        'mngr_nm': 'str',
+                        'dept_nm': 'str',
+                        'entr_fr': 'int',
+                        'entr_to': 'int',
+                        'scrt_evlt_amt_fr': 'int',
+                        'scrt_evlt_amt_to': 'int',
+                        'ls_grnt_fr': 'int',
+                        'ls_grnt_to': 'int',
+                        'crd_loan_fr': 'int',
+                        'crd_loan_to': 'int',
+                        'ch_uncla_fr': 'int',
+                        'ch_uncla_to': 'int',
+                        'krw_asgna_fr': 'int',
+                        'krw_asgna_to': 'int',
+                        'ls_evlta_fr': 'int',
+                        'ls_evlta_to': 'int',
+                        'rght_evlta_fr': 'int',
+                        'rght_evlta_to': 'int',
+                        'loan_amt_fr': 'int',
+                        'loan_amt_to': 'int',
+                        'etc_loana_fr': 'int',
+                        'etc_loana_to': 'int',
+                        'crd_int_npay_gold_fr': 'int',
+                        'crd_int_npay_gold_to': 'int',
+                        'crd_int_fr': 'int',
+                        'crd_int_to': 'int',
+                        'tot_amt_fr': 'int',
+                        'tot_amt_to': 'int',
+                        'invt_bsamt': 'int',
+                        'evltv_prft': 'int',
+                        'prft_rt': 'float',
+                        'tern_rt': 'float',
+                        'termin_tot_trns': 'int',
+                        'termin_tot_pymn': 'int',
+                        'termin_tot_inq': 'int',
+                        'termin_tot_outq': 'int',
+                        'futr_repl_sella': 'int',
+                        'trst_repl_sella': 'int'},
+             'lists': {}},
+ 'kt00017': {'title': '계좌별당일현황요청',
+             'fields': {'d2_entra': 'int',
+                        'crd_int_npay_gold': 'int',
+                        'etc_loana': 'int',
+                        'gnrl_stk_evlt_amt_d2': 'int',
+                        'dpst_grnt_use_amt_d2': 'int',
+                        'crd_stk_evlt_amt_d2': 'int',
+                        'crd_loan_d2': 'int',
+                        'crd_loan_evlta_d2': 'int',
+                        'crd_ls_grnt_d2': 'int',
+                        'crd_ls_evlta_d2': 'int',
+                        'ina_amt': 'int',
+                        'outa': 'int',
+                        'inq_amt': 'int',
+                        'outq_amt': 'int',
+                        'sell_amt': 'int',
+                        'buy_amt': 'int',
+                        'cmsn': 'int',
+                        'tax': 'int',
+                        'stk_pur_cptal_loan_amt': 'int',
+                        'rp_evlt_amt': 'int',
+                        'bd_evlt_amt': 'int',
+                        'elsevlt_amt': 'int',
+                        'crd_int_amt': 'int',
+                        'sel_prica_grnt_loan_int_amt_amt': 'int',
+                        'dvida_amt': 'int'},
+             'lists': {}},
+ 'kt00018': {'title': '계좌평가잔고내역요청',
+             'fields': {'tot_pur_amt': 'int',
+                        'tot_evlt_amt': 'int',
+                        'tot_evlt_pl': 'int',
+                        'tot_prft_rt': 'float',
+                        'prsm_dpst_aset_amt': 'int',
+                        'tot_loan_amt': 'int',
+                        'tot_crd_loan_amt': 'int',
+                        'tot_crd_ls_amt': 'int'},
+             'lists': {'acnt_evlt_remn_indv_tot': {'stk_cd': 'str',
+                                                   'stk_nm': 'str',
+                                                   'evltv_prft': 'int',
+                                                   'prft_rt': 'float',
+                                                   'pur_pric': 'int',
+                                                   'pred_close_pric': 'int',
+                                                   'rmnd_qty': 'int',
+                                                   'trde_able_qty': 'int',
+                                                   'cur_prc': 'int',
+                                                   'pred_buyq': 'int',
+                                                   'pred_sellq': 'int',
+                                                   'tdy_buyq': 'int',
+                                                   'tdy_sellq': 'int',
+                                                   'pur_amt': 'int',
+                                                   'pur_cmsn': 'int',
+                                                   'evlt_amt': 'int',
+                                                   'sell_cmsn': 'int',
+                                                   'tax': 'int',
+                                                   'sum_cmsn': 'int',
+                                                   'poss_rt': 'float',
+                                                   'crd_tp': 'str',
+                                                   'crd_tp_nm': 'str',
+                                                   'crd_loan_dt': 'str'}}},
+ 'kt10000': {'title': '주식 매수주문', 'fields': {'ord_no': 'str', 'dmst_stex_tp': 'str'}, 'lists': {}},
+ 'kt10001': {'title': '주식 매도주문', 'fields': {'ord_no': 'str', 'dmst_stex_tp': 'str'}, 'lists': {}},
+ 'kt10002': {'title': '주식 정정주문',
+             'fields': {'ord_no': 'str', 'base_orig_ord_no': 'str', 'mdfy_qty': 'int', 'dmst_stex_tp': 'str'},
+             'lists': {}},
+ 'kt10003': {'title': '주식 취소주문',
+             'fields': {'ord_no': 'str', 'base_orig_ord_no': 'str', 'cncl_qty': 'int'},
+             'lists': {}},
+ 'kt10006': {'title': '신용 매수주문', 'fields': {'ord_no': 'str', 'dmst_stex_tp': 'str'}, 'lists': {}},
+ 'kt10007': {'title': '신용 매도주문', 'fields': {'ord_no': 'str', 'dmst_stex_tp': 'str'}, 'lists': {}},
+ 'kt10008': {'title': '신용 정정주문',
+             'fields': {'ord_no': 'str', 'base_orig_ord_no': 'str', 'mdfy_qty': 'int', 'dmst_stex_tp': 'str'},
+             'lists': {}},
+ 'kt10009': {'title': '신용 취소주문',
+             'fields': {'ord_no': 'str', 'base_orig_ord_no': 'str', 'cncl_qty': 'int'},
+             'lists': {}}}
@@ -0,0 +1,384 @@
+"""
+키움증권 실시간시세 다중 연결 클라이언트
+
+한 WebSocket 연결의 수신 루프가 처리할 수 있는 프레임 수를 넘는 종목을 등록할 수 있도록
+종목코드를 해시하여 여러 연결(샤드)과 그룹번호에 나누어 등록하고, 모든 연결의 REAL 메시지를
+하나의 콜백 흐름으로 합칩니다.
+
+    sharded = ShardedRealtimeClient(appkey, secretkey, shards=4, items_per_shard=500)
+    sharded.add_callback('0B', on_tick)
+    await sharded.connect()
+    await sharded.register_realtime(codes, ['0B', '0D'])
+
+모든 연결은 하나의 인증 객체(KiwoomAuth)로 접근 토큰을 함께 사용하므로 연결마다 토큰을 새로 발급하지 않습니다.
+
+종목은 rendezvous 해시로 연결에 배치하므로 연결 수가 바뀌어도 옮겨지는 종목은 늘어나거나 줄어든 연결의 몫뿐입니다.
+배치 표와 다른 연결에서 들어온 프레임은 버리므로 한 종목의 프레임은 항상 한 연결의 수신 순서대로 전달됩니다.
+옮겨지는 종목은 새 연결에 먼저 등록하고, 새 연결에서 그 종목의 첫 프레임이 들어오면 배치 표를 바꾼 뒤
+이전 연결에서 해지합니다. 전환 전까지는 이전 연결의 프레임을 계속 전달하므로 전환 중에 빠지는 프레임은 없으며,
+두 연결의 수신 시점 차이만큼 전환 직후 같은 체결이 한 번 더 전달될 수 있습니다.
+handover_timeout 안에 새 연결에서 프레임이 오지 않는 종목(거래가 드문 종목 등)은 그대로 전환합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import zlib
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .auth import KiwoomAuth
+from .consumer import DROP_OLDEST, AsyncConsumer, default_key
+from .realtime import REG_CHUNK, WILDCARD, Callback, DispatchTable, KiwoomRealtimeClient
+
+logger = logging.getLogger(__name__)
+
+
+def _score(shard: int, item: str) -> int:
+    """rendezvous 해시 점수 (프로세스와 관계없이 같은 값)"""
+    return int.from_bytes(hashlib.blake2b(f'{shard}:{item}'.encode(), digest_size=8).digest(), 'big')
+
+
+def shard_of(item: str, shards: int) -> int:
+    """
+    종목을 배치할 연결 번호
+
+    Args:
+        item (str): 실시간 등록 요소 (종목코드 등)
+        shards (int): 연결 수
+
+    Returns:
+        int: 연결 번호 (0부터 시작)
+    """
+    return max(range(shards), key=lambda shard: _score(shard, item))
+
+
+def group_of(item: str, groups: int) -> str:
+    """
+    연결 안에서 종목을 등록할 그룹번호
+
+    Args:
+        item (str): 실시간 등록 요소 (종목코드 등)
+        groups (int): 연결별 그룹 수
+
+    Returns:
+        str: 그룹번호 ('1' 부터 시작)
+    """
+    return str(zlib.crc32(item.encode()) % groups + 1)
+
+
+class ShardedRealtimeClient:
+    """종목코드 해시로 여러 WebSocket 연결에 실시간시세를 나누어 등록하는 클라이언트"""
+
+    def __init__(self,
+                 appkey: str = None,
+                 secretkey: str = None,
+                 shards: int = 2,
+                 groups: int = 1,
+                 items_per_shard: Optional[int] = None,
+                 max_shards: int = 16,
+                 token: str = None,
+                 auth: Optional[KiwoomAuth] = None,
+                 handover_timeout: float = 1.0,
+                 **kwargs):
+        """
+        다중 연결 실시간시세 클라이언트 초기화
+
+        Args:
+            appkey (str, optional): API 앱키. 기본값은 환경변수 'kiwoom_appkey'에서 가져옴
+            secretkey (str, optional): API 시크릿키. 기본값은 환경변수 'kiwoom_secretkey'에서 가져옴
+            shards (int, optional): 최소 연결 수. 기본값은 2
+            groups (int, optional): 연결별 그룹번호 수. 기본값은 1
+            items_per_shard (int, optional): 연결 하나에 등록할 최대 종목 수. 기본값은 None (연결 수 고정).
+                지정하면 종목을 등록하거나 해지할 때 필요한 만큼 연결을 늘리거나 줄이고 종목을 다시 배치
+            max_shards (int, optional): 최대 연결 수. 기본값은 16
+            token (str, optional): 접근 토큰. 기본값은 None (첫 연결을 만들 때 발급)
+            auth (KiwoomAuth, optional): 모든 연결이 함께 쓸 인증 객체 (KiwoomClient.auth 등).
+                기본값은 None (appkey, secretkey, is_mock, token_store 로 하나 생성)
+            handover_timeout (float, optional): 옮겨지는 종목의 첫 프레임을 새 연결에서 기다릴 최대 시간(초). 기본값은 1.0
+            **kwargs: 연결별 KiwoomRealtimeClient 인자 (is_mock, websocket_url, reconnect_policy, metrics 등)
+        """
+        if shards < 1 or groups < 1:
+            raise ValueError("shards 와 groups 는 1 이상이어야 합니다.")
+        self.appkey = appkey
+        self.secretkey = secretkey
+        self.min_shards = shards
+        self.groups = groups
+        self.items_per_shard = items_per_shard
+        self.max_shards = max(max_shards, shards)
+        self.token = token
+        self.auth = auth or KiwoomAuth(appkey, secretkey, kwargs.get('is_mock', False),
+                                       token_store=kwargs.get('token_store'))
+        self.handover_timeout = handover_timeout
+        self.options = kwargs
+        self.clients: List[KiwoomRealtimeClient] = []
+        self.tasks: List[List[asyncio.Task]] = []
+
+        # 종목별 등록한 실시간 항목과 배치된 연결 번호 (handover 는 첫 프레임을 기다리는 옮겨갈 연결 번호)
+        self.subscribed: Dict[str, Dict[str, None]] = {}
+        self.placement: Dict[str, int] = {}
+        self.handover: Dict[str, int] = {}
+        self.moves = 0
+        self._lock = asyncio.Lock()
+        self.dispatch_table = DispatchTable(
+            lambda: ((realtime_type, item) for item, types in self.subscribed.items() for realtime_type in types))
+
+    def add_callback(self, realtime_type: str, callback: Callback, item: str = WILDCARD):
+        """
+        실시간시세 수신 콜백 함수 추가
+
+        Args:
+            realtime_type (str): 실시간 항목 (TR 코드). WILDCARD('*') 이면 모든 항목
+            callback (Callable): 콜백 함수 (인자로 실시간 데이터를 받음)
+            item (str, optional): 종목코드. 기본값은 WILDCARD (모든 종목)
+        """
+        self.dispatch_table.add(realtime_type, callback, item)
+
+    def remove_callback(self, realtime_type: str, callback: Callback, item: str = WILDCARD) -> bool:
+        """
+        실시간시세 수신 콜백 함수 제거
+
+        Args:
+            realtime_type (str): 등록한 실시간 항목
+            callback (Callable): 등록한 콜백 함수
+            item (str, optional): 등록한 종목코드. 기본값은 WILDCARD
+
+        Returns:
+            bool: 제거한 콜백이 있으면 True
+        """
+        return self.dispatch_table.remove(realtime_type, callback, item)
+
+    def add_consumer(self,
+                     realtime_type: str,
+                     callback: Callable[[Dict[str, Any]], Any],
+                     item: str = WILDCARD,
+                     maxsize: int = 1000,
+                     policy: str = DROP_OLDEST,
+                     key: Callable[[Dict[str, Any]], Any] = default_key) -> AsyncConsumer:
+        """
+        수신 루프와 따로 실행되는 대기열 소비자로 콜백 추가 (KiwoomRealtimeClient.add_consumer 와 같음)
+
+        Returns:
+            AsyncConsumer: 등록한 소비자
+        """
+        return self.dispatch_table.add_consumer(realtime_type, callback, item, maxsize, policy, key)
+
+    def _dispatch(self, shard: int, message: Dict[str, Any]) -> Optional[List[Awaitable[None]]]:
+        """연결 하나의 REAL 메시지 처리 (배치 표와 다른 연결에서 들어온 종목은 버림)"""
+        placement = self.placement
+        handover = self.handover
+        lookup = self.dispatch_table.lookup
+        blocked = None
+        try:
+            for item_data in message.get('data', []):
+                item = item_data.get('item')
+                if placement.get(item) != shard:
+                    if handover.get(item) != shard:
+                        continue
+                    # 옮겨갈 연결에서 첫 프레임이 들어오면 이 연결로 전환
+                    placement[item] = shard
+                    del handover[item]
+                for callback in lookup(item_data.get('type'), item):
+                    result = callback(item_data)
+                    if result is not None and isawaitable(result):
+                        if blocked is None:
+                            blocked = []
+                        blocked.append(result)
+        except Exception:
+            logger.exception('실시간 데이터 처리 중 오류 발생')
+        return blocked
+
+    def _target_shards(self) -> int:
+        """등록한 종목 수에 맞는 연결 수"""
+        if not self.items_per_shard:
+            return self.min_shards
+        needed = math.ceil(len(self.subscribed) / self.items_per_shard)
+        return min(self.max_shards, max(self.min_shards, needed))
+
+    async def _open(self) -> bool:
+        """연결 하나를 추가하고 수신 태스크 시작"""
+        shard = len(self.clients)
+        client = KiwoomRealtimeClient(token=self.token, auth=self.auth,
+                                      dispatcher=lambda message: self._dispatch(shard, message), **self.options)
+        self.token = client.token
+        if not await client.connect():
+            return False
+        self.clients.append(client)
+        self.tasks.append([asyncio.ensure_future(client.receive_messages()),
+                           asyncio.ensure_future(client._ping_sender())])
+        return True
+
+    async def _close(self):
+        """마지막 연결 종료"""
+        client = self.clients.pop()
+        tasks = self.tasks.pop()
+        await client.disconnect()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def connect(self) -> bool:
+        """
+        최소 연결 수만큼 WebSocket 서버에 연결
+
+        Returns:
+            bool: 모든 연결에 성공하면 True
+        """
+        async with self._lock:
+            while len(self.clients) < self._target_shards():
+                if not await self._open():
+                    return False
+            return True
+
+    async def _send(self, shard: int, entries: Dict[Tuple[str, ...], List[str]], register: bool):
+        """
+        연결 하나에 종목을 그룹번호별로 묶어 등록 또는 해지
+
+        Args:
+            shard (int): 연결 번호
+            entries (Dict[Tuple[str, ...], List[str]]): 실시간 항목 조합별 종목 목록
+            register (bool): True 이면 등록, False 이면 해지
+        """
+        client = self.clients[shard]
+        for types, items in entries.items():
+            by_group: Dict[str, List[str]] = {}
+            for item in items:
+                by_group.setdefault(group_of(item, self.groups), []).append(item)
+            for group_no, group_items in by_group.items():
+                for start in range(0, len(group_items), REG_CHUNK):
+                    chunk = group_items[start:start + REG_CHUNK]
+                    if register:
+                        await client.register_realtime(chunk, list(types), group_no)
+                    else:
+                        await client.unregister_realtime(chunk, list(types), group_no)
+
+    async def register_realtime(self, items: List[str], types: List[str]):
+        """
+        실시간시세 항목 등록 (종목코드 해시로 연결과 그룹번호 결정)
+
+        Args:
+            items (List[str]): 실시간 등록 요소 (종목코드 등)
+            types (List[str]): 실시간 항목 (TR 코드)
+        """
+        async with self._lock:
+            for item in items:
+                registered = self.subscribed.setdefault(item, {})
+                for realtime_type in types:
+                    registered[realtime_type] = None
+            self.dispatch_table.invalidate()
+            await self._rebalance()
+
+            by_shard: Dict[int, Dict[Tuple[str, ...], List[str]]] = {}
+            for item in items:
+                by_shard.setdefault(self.placement[item], {}).setdefault(tuple(types), []).append(item)
+            for shard, entries in by_shard.items():
+                await self._send(shard, entries, register=True)
+
+    async def unregister_realtime(self, items: List[str], types: List[str]):
+        """
+        실시간시세 항목 해지
+
+        Args:
+            items (List[str]): 실시간 등록 요소 (종목코드 등)
+            types (List[str]): 실시간 항목 (TR 코드)
+        """
+        async with self._lock:
+            by_shard: Dict[int, Dict[Tuple[str, ...], List[str]]] = {}
+            for item in items:
+                registered = self.subscribed.get(item)
+                if registered is None:
+                    continue
+                by_shard.setdefault(self.placement[item], {}).setdefault(tuple(types), []).append(item)
+                for realtime_type in types:
+                    registered.pop(realtime_type, None)
+                if not registered:
+                    del self.subscribed[item]
+                    del self.placement[item]
+            self.dispatch_table.invalidate()
+            for shard, entries in by_shard.items():
+                await self._send(shard, entries, register=False)
+            await self._rebalance()
+
+    async def rebalance(self):
+        """등록한 종목 수에 맞게 연결 수를 조정하고 종목을 다시 배치"""
+        async with self._lock:
+            await self._rebalance()
+
+    async def _rebalance(self):
+        """연결 수 조정 및 종목 재배치 (self._lock 잠금 상태에서 호출)"""
+        target = self._target_shards()
+        while len(self.clients) < target:
+            if not await self._open():
+                target = len(self.clients)
+                break
+        if not self.clients:
+            raise ConnectionError("실시간시세 서버에 연결하지 못했습니다.")
+
+        # 옮길 종목을 (이전 연결, 새 연결)별로 모음 (배치 표는 새 연결에서 첫 프레임이 들어올 때 바꿈)
+        moves: Dict[Tuple[int, int], Dict[Tuple[str, ...], List[str]]] = {}
+        for item, registered in self.subscribed.items():
+            shard = shard_of(item, target)
+            previous = self.placement.get(item)
+            if previous is None:
+                self.placement[item] = shard
+            elif previous != shard:
+                self.handover[item] = shard
+                moves.setdefault((previous, shard), {}).setdefault(tuple(registered), []).append(item)
+                self.moves += 1
+
+        # 새 연결에 먼저 등록하고, 전환을 마치면 이전 연결에서 해지
+        if moves:
+            for (previous, shard), entries in moves.items():
+                await self._send(shard, entries, register=True)
+            await self._await_handover()
+            for (previous, shard), entries in moves.items():
+                await self._send(previous, entries, register=False)
+
+        while len(self.clients) > target:
+            await self._close()
+
+    async def _await_handover(self):
+        """옮겨지는 종목이 모두 새 연결로 전환될 때까지 대기 (handover_timeout 이 지나면 남은 종목을 그대로 전환)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.handover_timeout
+        while self.handover and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+        for item, shard in self.handover.items():
+            self.placement[item] = shard
+        self.handover.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        연결별 배치 현황 조회
+
+        Returns:
+            Dict[str, Any]: shards(연결 수), items(등록 종목 수), per_shard(연결별 종목 수), moves(재배치한 종목 수),
+                reconnects(연결별 재연결 횟수 합), consumers(소비자별 대기열 통계)
+        """
+        per_shard = [0] * len(self.clients)
+        for shard in self.placement.values():
+            if shard < len(per_shard):
+                per_shard[shard] += 1
+        return {
+            'shards': len(self.clients),
+            'items': len(self.subscribed),
+            'per_shard': per_shard,
+            'moves': self.moves,
+            'reconnects': sum(client.reconnects for client in self.clients),
+            'consumers': [consumer.stats() for consumer in self.dispatch_table.consumers],
+        }
+
+    async def disconnect(self):
+        """모든 WebSocket 연결 종료"""
+        async with self._lock:
+            while self.clients:
+                await self._close()
+        await self.dispatch_table.close()
+
+    async def run(self):
+        """모든 연결의 수신이 끝날 때까지 실행"""
+        if await self.connect():
+            await asyncio.gather(*(task for tasks in self.tasks for task in tasks), return_exceptions=True)
+        else:
+            logger.error('WebSocket 연결에 실패했습니다.')
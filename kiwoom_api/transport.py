@@ -0,0 +1,557 @@
+"""
+키움증권 API 요청 전송 엔진
+
+연결 풀, 호출 속도 제한, 응답 캐시, 동일 요청 병합, 재시도, 요청 훅(지표)을 한 곳에서 적용합니다.
+KiwoomClient, AsyncKiwoomClient(request_async), KiwoomOpenAPI(api/base.py 의 APIBase) 가
+같은 Transport 를 사용하면 모든 TR 요청이 하나의 호출 한도와 캐시를 나누어 씁니다.
+
+    client = KiwoomClient(appkey, secretkey)
+    api = KiwoomOpenAPI(appkey, secretkey, transport=client.transport)
+    async_client = AsyncKiwoomClient(transport=client.transport)
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from .auth import KiwoomAuth
+from .cache import ResponseCache
+from .codec import Codec, get_codec
+from .coalesce import AsyncSingleFlight, SingleFlight, request_key
+from .credentials import CredentialPool
+from .hooks import BEFORE_SEND, AFTER_RECEIVE, ON_ERROR, RequestEvent, RequestHooks
+from .metrics import MetricsCollector
+from .pool import AsyncConnectionPool, ConnectionPool, get_default_pool
+from .ratelimit import RateLimiter
+from .retry import RetryEngine
+
+
+# 요청 데이터를 쿼리 파라미터로 보내는 HTTP 메서드 (나머지는 JSON 본문)
+QUERY_METHODS = ('GET', 'DELETE')
+
+
+class Transport:
+    """요청 전송 엔진 클래스 (동기 request, 비동기 request_async)"""
+
+    def __init__(self,
+                 auth: Optional[KiwoomAuth] = None,
+                 pool: Optional[ConnectionPool] = None,
+                 rate_limiter: Union[RateLimiter, bool, None] = None,
+                 credential_pool: Optional[CredentialPool] = None,
+                 cache: Optional[ResponseCache] = None,
+                 coalesce: bool = True,
+                 retry: Union[RetryEngine, bool, None] = None,
+                 codec: Union[Codec, str, None] = None,
+                 raw: bool = False,
+                 hooks: Optional[RequestHooks] = None,
+                 metrics: Optional[MetricsCollector] = None,
+                 async_pool: Optional[AsyncConnectionPool] = None):
+        """
+        요청 전송 엔진 초기화
+
+        Args:
+            auth (KiwoomAuth, optional): 토큰을 발급할 인증 객체. 기본값은 None
+                (request 를 사용하려면 auth 또는 credential_pool 필요. send 는 호출한 쪽의 헤더를 그대로 사용)
+            pool (ConnectionPool, optional): HTTP 연결 풀. 기본값은 프로세스 공유 연결 풀
+            rate_limiter (RateLimiter, optional): 호출 속도 제한 스케줄러. 기본값은 None (기본 한도로 생성),
+                False 이면 속도 제한을 사용하지 않음
+            credential_pool (CredentialPool, optional): 여러 앱키에 요청을 분산할 앱키 풀.
+                지정하면 auth, rate_limiter 대신 앱키별 인증과 속도 제한을 사용
+            cache (ResponseCache, optional): 기준정보 TR 응답 캐시. 기본값은 None (캐시하지 않음)
+            coalesce (bool, optional): 동시에 들어온 같은 조회 요청을 한 번만 전송. 기본값은 True
+            retry (RetryEngine, optional): 재시도 및 서킷 브레이커 실행기. 기본값은 None (기본 정책으로 생성),
+                False 이면 재시도하지 않음
+            codec (Codec | str, optional): 응답 JSON 코덱 ('json', 'orjson'). 기본값은 None (orjson 이 있으면 orjson)
+            raw (bool, optional): True 이면 응답 본문을 필드를 처음 읽을 때 변환하는 LazyJSON 으로 반환. 기본값은 False
+            hooks (RequestHooks, optional): 요청 전송 전, 응답 수신 후, 오류 발생시 호출할 훅. 기본값은 None
+            metrics (MetricsCollector, optional): TR 별 지연 시간, 전송량, 오류 코드 지표 수집기. 기본값은 None
+            async_pool (AsyncConnectionPool, optional): request_async 가 사용할 비동기 HTTP 연결 풀.
+                기본값은 None (request_async 를 처음 호출할 때 전송 엔진 전용 연결 풀 생성)
+        """
+        self._shared_pool = pool is None
+        self.pool = pool or get_default_pool()
+        self.async_pool = async_pool
+        self.credentials = credential_pool
+        self.cache = cache
+        self.codec = get_codec(codec)
+        self.raw = raw
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.metrics = metrics.attach(self.hooks) if metrics is not None else None
+        self.retry = RetryEngine() if retry is None else (retry or None)
+        self.single_flight = SingleFlight() if coalesce else None
+        self.async_single_flight = AsyncSingleFlight() if coalesce else None
+        self._token_locks = {}
+        if credential_pool is not None:
+            self.auth = credential_pool.primary.auth
+            self.rate_limiter = None
+        else:
+            self.auth = auth
+            self.rate_limiter = RateLimiter() if rate_limiter is None else (rate_limiter or None)
+
+    def auths(self) -> List[KiwoomAuth]:
+        """전송 엔진이 사용하는 모든 인증 객체"""
+        if self.credentials is not None:
+            return [credential.auth for credential in self.credentials.credentials]
+        return [self.auth] if self.auth is not None else []
+
+    def request(self,
+                method: str,
+                url: str,
+                endpoint: str,
+                api_id: str,
+                data: Dict[str, Any] = None,
+                cont_yn: str = 'N',
+                next_key: str = '',
+                account: Optional[str] = None) -> Dict[str, Any]:
+        """
+        TR 요청 (캐시, 요청 병합, 호출 한도, 토큰, 재시도, 훅 적용)
+
+        Args:
+            method (str): HTTP 메서드 (GET, POST 등)
+            url (str): 요청 URL
+            endpoint (str): API 엔드포인트 경로
+            api_id (str): API ID (TR 코드)
+            data (Dict[str, Any], optional): 요청 데이터
+            cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+            next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+            account (str, optional): 계좌·주문 TR 을 처리할 계좌번호 (앱키 풀에서 계좌를 소유한 앱키 선택).
+                기본값은 None (기본 앱키의 계좌)
+
+        Returns:
+            Dict[str, Any]: API 응답 데이터 (status_code, headers, data)
+        """
+        # 캐시된 기준정보 응답은 호출 한도를 사용하지 않고 바로 반환
+        if self.cache is not None:
+            cached = self.cache.get(api_id, data, cont_yn, next_key)
+            if cached is not None:
+                return cached
+
+        # 같은 요청이 진행 중이면 새로 전송하지 않고 그 응답을 함께 사용
+        if self.single_flight is not None and self.single_flight.applies(api_id):
+            return self.single_flight.do(
+                request_key(api_id, data, cont_yn, next_key, account),
+                lambda: self._fetch(method, url, endpoint, api_id, data, cont_yn, next_key, account))
+
+        return self._fetch(method, url, endpoint, api_id, data, cont_yn, next_key, account)
+
+    def _fetch(self,
+               method: str,
+               url: str,
+               endpoint: str,
+               api_id: str,
+               data: Dict[str, Any] = None,
+               cont_yn: str = 'N',
+               next_key: str = '',
+               account: Optional[str] = None) -> Dict[str, Any]:
+        """요청을 전송하고 캐시 대상 응답을 저장"""
+        result = self._dispatch(method, url, endpoint, api_id, data, cont_yn, next_key, account)
+
+        if self.cache is not None:
+            self.cache.set(api_id, data, result, cont_yn, next_key)
+        return result
+
+    def _dispatch(self,
+                  method: str,
+                  url: str,
+                  endpoint: str,
+                  api_id: str,
+                  data: Dict[str, Any] = None,
+                  cont_yn: str = 'N',
+                  next_key: str = '',
+                  account: Optional[str] = None) -> Dict[str, Any]:
+        """요청을 처리할 앱키의 인증과 호출 한도로 전송"""
+        # 앱키 풀을 사용하면 요청을 처리할 앱키의 인증과 호출 한도를 사용
+        if self.credentials is not None:
+            with self.credentials.use(api_id, endpoint, account) as credential:
+                return self._request(method, url, endpoint, api_id, data, cont_yn, next_key,
+                                     credential.auth, credential.rate_limiter)
+
+        return self._request(method, url, endpoint, api_id, data, cont_yn, next_key, self.auth, self.rate_limiter)
+
+    def _request(self,
+                 method: str,
+                 url: str,
+                 endpoint: str,
+                 api_id: str,
+                 data: Dict[str, Any],
+                 cont_yn: str,
+                 next_key: str,
+                 auth: KiwoomAuth,
+                 limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
+        """토큰을 붙여 요청을 전송하고 응답 변환 (등록한 훅이 있으면 요청 이벤트 전달)"""
+        # 등록한 훅이 있을 때만 요청 이벤트 생성 (호출 한도 대기 시간은 전송 시도마다 누적)
+        event = RequestEvent(api_id, endpoint, method, data, cont_yn, next_key) if self.hooks else None
+        if event is not None:
+            self.hooks.emit(BEFORE_SEND, event)
+
+        try:
+            token = auth.ensure_token()
+            response = self._send_tr(method, url, endpoint, token, api_id, data, cont_yn, next_key, limiter, event)
+
+            # 토큰이 거부되면 한 번만 재발급 후 재요청 (재요청도 호출 허가를 새로 받음)
+            if response.status_code == 401:
+                token = auth.refresh_token(token)
+                response = self._send_tr(method, url, endpoint, token, api_id, data, cont_yn, next_key, limiter, event)
+
+            result = self._result(response)
+        except Exception as e:
+            if event is not None:
+                event.finish(getattr(e, 'response', None), error=e)
+                self.hooks.emit(ON_ERROR, event)
+            raise
+
+        if event is not None:
+            event.finish(response, result['data'])
+            self.hooks.emit(AFTER_RECEIVE, event)
+        return result
+
+    def _result(self, response) -> Dict[str, Any]:
+        """HTTP 에러를 확인하고 응답 헤더 정보와 본문을 함께 반환"""
+        response.raise_for_status()
+
+        # 응답 헤더 정보 저장
+        response_headers = {
+            'cont-yn': response.headers.get('cont-yn'),
+            'next-key': response.headers.get('next-key'),
+            'api-id': response.headers.get('api-id')
+        }
+
+        return {
+            'status_code': response.status_code,
+            'headers': response_headers,
+            'data': self.codec.decode(response.content, self.raw)
+        }
+
+    def _send_tr(self,
+                 method: str,
+                 url: str,
+                 endpoint: str,
+                 token: str,
+                 api_id: str,
+                 data: Dict[str, Any] = None,
+                 cont_yn: str = 'N',
+                 next_key: str = '',
+                 limiter: Optional[RateLimiter] = None,
+                 event: Optional[RequestEvent] = None):
+        """TR 요청 헤더를 만들어 전송 (GET, DELETE 는 쿼리 파라미터, 나머지는 JSON 본문)"""
+        headers = build_headers(token, api_id, cont_yn, next_key)
+        method = method.upper()
+        if method in QUERY_METHODS:
+            return self.send(method, url, endpoint, api_id, headers, limiter, event, params=data)
+        return self.send(method, url, endpoint, api_id, headers, limiter, event, json=data)
+
+    def acquire(self, api_id: str = '') -> float:
+        """
+        호출 허가 획득 (속도 제한을 사용하지 않으면 바로 반환)
+
+        Args:
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열 (TR 유형별 한도 없이 전체 한도만 적용)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        return self.rate_limiter.acquire(api_id) if self.rate_limiter else 0.0
+
+    def send(self,
+             method: str,
+             url: str,
+             endpoint: str,
+             api_id: str = '',
+             headers: Dict[str, str] = None,
+             limiter: Optional[RateLimiter] = None,
+             event: Optional[RequestEvent] = None,
+             **kwargs):
+        """
+        재시도 정책과 엔드포인트 계열별 서킷 브레이커를 적용하여 HTTP 요청 전송
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            endpoint (str): API 엔드포인트 경로 (서킷 브레이커 단위)
+            api_id (str, optional): API ID (TR 코드). 기본값은 빈 문자열
+            headers (Dict[str, str], optional): 요청 헤더
+            limiter (RateLimiter, optional): 전송 시도(재시도 포함)마다 호출 허가를 받을 속도 제한 스케줄러.
+                기본값은 None (호출 한도를 적용하지 않음)
+            event (RequestEvent, optional): 호출 한도 대기 시간을 누적할 요청 이벤트. 기본값은 None
+            **kwargs: 연결 풀 request 인자 (params, json)
+
+        Returns:
+            requests.Response: 응답 객체 (재시도 후에도 실패한 응답은 그대로 반환)
+
+        Raises:
+            CircuitOpenError: 엔드포인트 장애로 서킷이 열려 있는 경우
+        """
+        def attempt():
+            # 재시도도 실제 호출이므로 시도마다 호출 허가를 받음
+            if limiter is not None:
+                waited = limiter.acquire(api_id)
+                if event is not None:
+                    event.limiter_wait += waited
+            return self.pool.request(method, url, headers=headers, **kwargs)
+
+        if self.retry:
+            return self.retry.call(api_id, endpoint, attempt)
+        return attempt()
+
+    async def request_async(self,
+                            method: str,
+                            url: str,
+                            endpoint: str,
+                            api_id: str,
+                            data: Dict[str, Any] = None,
+                            cont_yn: str = 'N',
+                            next_key: str = '',
+                            account: Optional[str] = None) -> Dict[str, Any]:
+        """
+        비동기 TR 요청 (request 와 동일한 인자, 호출 한도 대기와 토큰 발급이 이벤트 루프를 막지 않음)
+
+        Returns:
+            Dict[str, Any]: API 응답 데이터 (status_code, headers, data)
+        """
+        # 캐시된 기준정보 응답은 호출 한도를 사용하지 않고 바로 반환
+        if self.cache is not None:
+            cached = self.cache.get(api_id, data, cont_yn, next_key)
+            if cached is not None:
+                return cached
+
+        # 같은 요청이 진행 중이면 새로 전송하지 않고 그 응답을 함께 사용
+        if self.async_single_flight is not None and self.async_single_flight.applies(api_id):
+            return await self.async_single_flight.do(
+                request_key(api_id, data, cont_yn, next_key, account),
+                lambda: self._fetch_async(method, url, endpoint, api_id, data, cont_yn, next_key, account))
+
+        return await self._fetch_async(method, url, endpoint, api_id, data, cont_yn, next_key, account)
+
+    async def _fetch_async(self,
+                           method: str,
+                           url: str,
+                           endpoint: str,
+                           api_id: str,
+                           data: Dict[str, Any] = None,
+                           cont_yn: str = 'N',
+                           next_key: str = '',
+                           account: Optional[str] = None) -> Dict[str, Any]:
+        """요청을 비동기 전송하고 캐시 대상 응답을 저장"""
+        result = await self._dispatch_async(method, url, endpoint, api_id, data, cont_yn, next_key, account)
+
+        if self.cache is not None:
+            self.cache.set(api_id, data, result, cont_yn, next_key)
+        return result
+
+    async def _dispatch_async(self,
+                              method: str,
+                              url: str,
+                              endpoint: str,
+                              api_id: str,
+                              data: Dict[str, Any] = None,
+                              cont_yn: str = 'N',
+                              next_key: str = '',
+                              account: Optional[str] = None) -> Dict[str, Any]:
+        """요청을 처리할 앱키의 인증과 호출 한도로 비동기 전송"""
+        if self.credentials is not None:
+            with self.credentials.use(api_id, endpoint, account) as credential:
+                return await self._request_async(method, url, endpoint, api_id, data, cont_yn, next_key,
+                                                 credential.auth, credential.rate_limiter)
+
+        return await self._request_async(method, url, endpoint, api_id, data, cont_yn, next_key,
+                                         self.auth, self.rate_limiter)
+
+    async def _request_async(self,
+                             method: str,
+                             url: str,
+                             endpoint: str,
+                             api_id: str,
+                             data: Dict[str, Any],
+                             cont_yn: str,
+                             next_key: str,
+                             auth: KiwoomAuth,
+                             limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
+        """토큰을 붙여 요청을 비동기 전송하고 응답 변환 (등록한 훅이 있으면 요청 이벤트 전달)"""
+        event = RequestEvent(api_id, endpoint, method, data, cont_yn, next_key) if self.hooks else None
+        if event is not None:
+            self.hooks.emit(BEFORE_SEND, event)
+
+        try:
+            token = await self.ensure_token_async(auth)
+            response = await self._send_tr_async(method, url, endpoint, token, api_id, data, cont_yn, next_key,
+                                                 limiter, event)
+
+            # 토큰이 거부되면 한 번만 재발급 후 재요청 (재요청도 호출 허가를 새로 받음)
+            if response.status_code == 401:
+                token = await self.refresh_token_async(token, auth)
+                response = await self._send_tr_async(method, url, endpoint, token, api_id, data, cont_yn, next_key,
+                                                     limiter, event)
+
+            result = self._result(response)
+        except Exception as e:
+            if event is not None:
+                event.finish(getattr(e, 'response', None), error=e)
+                self.hooks.emit(ON_ERROR, event)
+            raise
+
+        if event is not None:
+            event.finish(response, result['data'])
+            self.hooks.emit(AFTER_RECEIVE, event)
+        return result
+
+    async def _send_tr_async(self,
+                             method: str,
+                             url: str,
+                             endpoint: str,
+                             token: str,
+                             api_id: str,
+                             data: Dict[str, Any] = None,
+                             cont_yn: str = 'N',
+                             next_key: str = '',
+                             limiter: Optional[RateLimiter] = None,
+                             event: Optional[RequestEvent] = None):
+        """TR 요청 헤더를 만들어 비동기 전송 (_send_tr 과 동일한 규칙)"""
+        headers = build_headers(token, api_id, cont_yn, next_key)
+        method = method.upper()
+        if method in QUERY_METHODS:
+            return await self.send_async(method, url, endpoint, api_id, headers, limiter, event, params=data)
+        return await self.send_async(method, url, endpoint, api_id, headers, limiter, event, json=data)
+
+    async def send_async(self,
+                         method: str,
+                         url: str,
+                         endpoint: str,
+                         api_id: str = '',
+                         headers: Dict[str, str] = None,
+                         limiter: Optional[RateLimiter] = None,
+                         event: Optional[RequestEvent] = None,
+                         **kwargs):
+        """
+        재시도 정책과 서킷 브레이커를 적용하여 비동기 HTTP 요청 전송 (send 와 동일한 인자)
+
+        Returns:
+            AsyncResponse: 응답 객체 (재시도 후에도 실패한 응답은 그대로 반환)
+
+        Raises:
+            CircuitOpenError: 엔드포인트 장애로 서킷이 열려 있는 경우
+        """
+        pool = self.get_async_pool()
+
+        async def attempt():
+            # 재시도도 실제 호출이므로 시도마다 이벤트 루프를 막지 않고 호출 허가를 기다림
+            if limiter is not None:
+                waited = await limiter.acquire_async(api_id)
+                if event is not None:
+                    event.limiter_wait += waited
+            return await pool.request(method, url, headers=headers, **kwargs)
+
+        if self.retry:
+            return await self.retry.call_async(api_id, endpoint, attempt)
+        return await attempt()
+
+    def get_async_pool(self) -> AsyncConnectionPool:
+        """비동기 HTTP 연결 풀 반환 (없으면 전송 엔진 전용 연결 풀 생성)"""
+        if self.async_pool is None:
+            self.async_pool = AsyncConnectionPool()
+        return self.async_pool
+
+    async def get_access_token_async(self, auth: KiwoomAuth = None) -> str:
+        """
+        접근 토큰 비동기 발급 (au10001)
+
+        Args:
+            auth (KiwoomAuth, optional): 토큰을 발급할 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 발급된 접근 토큰
+        """
+        auth = auth or self.auth
+        url, headers, data = auth._token_request()
+
+        response = await self.get_async_pool().request('POST', url, headers=headers, json=data)
+        response.raise_for_status()
+
+        return auth._set_token(response.json())
+
+    def _get_token_lock(self, auth: KiwoomAuth) -> 'asyncio.Lock':
+        """인증 객체별 토큰 발급 잠금 반환 (이벤트 루프 안에서 생성)"""
+        import asyncio
+
+        lock = self._token_locks.get(id(auth))
+        if lock is None:
+            lock = self._token_locks[id(auth)] = asyncio.Lock()
+        return lock
+
+    async def ensure_token_async(self, auth: KiwoomAuth = None) -> str:
+        """
+        유효한 접근 토큰 비동기 반환 (만료가 가까우면 갱신)
+
+        여러 코루틴이 동시에 호출해도 토큰 발급 요청은 한 번만 수행됩니다.
+
+        Args:
+            auth (KiwoomAuth, optional): 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 유효한 접근 토큰
+        """
+        import asyncio
+
+        auth = auth or self.auth
+        if auth.is_token_valid():
+            return auth.token
+
+        async with self._get_token_lock(auth):
+            if auth.is_token_valid():
+                return auth.token
+            if auth.token_store is not None:
+                # 토큰 저장소 접근과 프로세스 간 잠금은 블로킹이므로 스레드에서 처리
+                return await asyncio.get_running_loop().run_in_executor(None, auth.ensure_token)
+            return await self.get_access_token_async(auth)
+
+    async def refresh_token_async(self, stale_token: str = None, auth: KiwoomAuth = None) -> str:
+        """
+        접근 토큰 비동기 재발급 (401 응답 등으로 토큰이 거부된 경우)
+
+        Args:
+            stale_token (str, optional): 거부된 토큰. 기본값은 현재 토큰
+            auth (KiwoomAuth, optional): 인증 객체. 기본값은 self.auth
+
+        Returns:
+            str: 새 접근 토큰
+        """
+        import asyncio
+
+        auth = auth or self.auth
+        stale_token = stale_token or auth.token
+        async with self._get_token_lock(auth):
+            if auth.token and auth.token != stale_token:
+                return auth.token
+            if auth.token_store is not None:
+                return await asyncio.get_running_loop().run_in_executor(None, auth.refresh_token, stale_token)
+            return await self.get_access_token_async(auth)
+
+    def close(self):
+        """전송 엔진 전용 연결 풀 종료 (공유 연결 풀은 close_default_pool 로 종료)"""
+        if not self._shared_pool:
+            self.pool.close()
+
+    async def close_async(self):
+        """비동기 연결 풀 종료"""
+        if self.async_pool is not None:
+            await self.async_pool.close()
+            self.async_pool = None
+
+
+def build_headers(token: str, api_id: str, cont_yn: str = 'N', next_key: str = '') -> Dict[str, str]:
+    """
+    API 요청 헤더 생성
+
+    Args:
+        token (str): 접근 토큰
+        api_id (str): API ID (TR 코드)
+        cont_yn (str, optional): 연속조회여부. 기본값은 'N'
+        next_key (str, optional): 연속조회키. 기본값은 빈 문자열
+
+    Returns:
+        Dict[str, str]: 요청 헤더
+    """
+    return {
+        'Content-Type': 'application/json;charset=UTF-8',
+        'authorization': f'Bearer {token}',
+        'cont-yn': cont_yn,
+        'next-key': next_key,
+        'api-id': api_id,
+    }
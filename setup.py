@@ -34,6 +34,11 @@ setup(
         "numpy>=1.20.0",
         "tabulate>=0.9.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "redis": ["redis>=4.0.0"],
+        "fast": ["orjson>=3.6.0"],
+    },
     keywords=[
         "finance",
         "trading",
@@ -0,0 +1,28 @@
+"""
+테스트 공통 fixture (로컬 모의 서버와 클라이언트)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kiwoom_api.client import KiwoomClient  # noqa: E402
+from kiwoom_api.mock import MockKiwoomServer  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """테스트마다 새로 띄우는 모의 서버"""
+    with MockKiwoomServer(rows=5) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    """모의 서버에 연결한 동기 클라이언트"""
+    client = KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False)
+    yield client
+    client.close()
@@ -0,0 +1,225 @@
+"""
+TR 별 API 모듈(kiwoom_api.api) 테스트
+
+각 메서드가 명세에 있는 TR 과 엔드포인트로 요청하는지 확인합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from kiwoom_api.api.account import AccountAPI
+from kiwoom_api.api.chart import ChartAPI
+from kiwoom_api.api.order import OrderAPI
+from kiwoom_api.api.price import PriceAPI
+from kiwoom_api.api.stock import StockAPI
+from kiwoom_api.async_client import AsyncKiwoomClient
+from kiwoom_api.registry import is_order, lookup
+
+
+class RecordingClient:
+    """request_api 호출을 기록하는 클라이언트"""
+
+    def __init__(self):
+        self.calls = []
+
+    def request_api(self, api_id, data=None, method='POST', endpoint=None, cont_yn='N', next_key=''):
+        self.calls.append((api_id, data, cont_yn, next_key))
+        return {'api_id': api_id}
+
+
+ACCOUNT_CALLS = [
+    ('get_account_balance', ('1234', '01'), 'kt00018'),
+    ('get_account_info', ('1234', '01'), 'kt00004'),
+    ('get_deposit', ('1234', '01'), 'kt00001'),
+    ('get_account_profit_loss', ('1234', '01'), 'ka10085'),
+    ('get_credit_info', ('1234', '01'), 'kt00013'),
+    ('get_transaction_history', ('1234', '01', '20241101', '20241130'), 'kt00015'),
+    ('get_overseas_transaction_history', ('1234', '01', 'NASD', '20241101', '20241130'), 'kt00015'),
+]
+
+ORDER_CALLS = [
+    ('place_domestic_order', ('1234', '01', '005930', '00', '1', '70000'), {'sell_tp': '2'}, 'kt10000'),
+    ('place_domestic_order', ('1234', '01', '005930', '01', '1', ''), {'sell_tp': '1'}, 'kt10001'),
+    ('place_domestic_order', ('1234', '01', '005930', '00', '1', '70000', '01'), {'sell_tp': '2'}, 'kt10006'),
+    ('place_domestic_order', ('1234', '01', '005930', '00', '1', '70000', '01', '20241101'), {'sell_tp': '1'},
+     'kt10007'),
+    ('modify_domestic_order', ('1234', '01', '005930', '0000139', '1', '71000', '00'), {}, 'kt10002'),
+    ('cancel_domestic_order', ('1234', '01', '005930', '0000139', '0'), {}, 'kt10003'),
+    ('get_order_status', ('1234', '01'), {}, 'kt00007'),
+]
+
+
+@pytest.mark.parametrize('method, args, api_id', ACCOUNT_CALLS)
+def test_account_methods_use_registered_trs(method, args, api_id):
+    client = RecordingClient()
+    getattr(AccountAPI(client), method)(*args)
+
+    assert client.calls[0][0] == api_id
+    assert lookup(api_id).endpoint == '/api/dostk/acnt'
+    assert not is_order(api_id)
+
+
+@pytest.mark.parametrize('method, args, kwargs, api_id', ORDER_CALLS)
+def test_order_methods_use_registered_trs(method, args, kwargs, api_id):
+    client = RecordingClient()
+    getattr(OrderAPI(client), method)(*args, **kwargs)
+
+    assert client.calls[0][0] == api_id
+    assert lookup(api_id) is not None
+    assert is_order(api_id) == api_id.startswith('kt1')
+
+
+def test_domestic_order_body():
+    client = RecordingClient()
+    OrderAPI(client).place_domestic_order('1234', '01', '005930', '01', '10', '', sell_tp='1')
+
+    _, data, _, _ = client.calls[0]
+    assert data == {'dmst_stex_tp': 'KRX', 'stk_cd': '005930', 'ord_qty': '10', 'ord_uv': '',
+                    'trde_tp': '3', 'cond_uv': ''}
+
+
+def test_domestic_order_requires_side():
+    with pytest.raises(ValueError):
+        OrderAPI(RecordingClient()).place_domestic_order('1234', '01', '005930', '00', '1', '70000')
+
+
+def test_next_key_continues_query():
+    client = RecordingClient()
+    AccountAPI(client).get_account_balance('1234', '01', next_key='abc')
+
+    assert client.calls[0][2:] == ('Y', 'abc')
+
+
+@pytest.mark.parametrize('api, method, args', [
+    (AccountAPI, 'get_overseas_account_balance', ('1234', '01', 'NASD', 'USD')),
+    (OrderAPI, 'place_overseas_order', ('1234', '01', 'NASD', 'AAPL', '00', '1', '100', 'USD')),
+    (OrderAPI, 'get_overseas_order_status', ('1234', '01', 'NASD')),
+])
+def test_overseas_methods_are_unsupported(api, method, args):
+    with pytest.raises(NotImplementedError):
+        getattr(api(RecordingClient()), method)(*args)
+
+
+def test_async_account_and_order(server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as client:
+            balance = await client.account.get_account_balance('1234', '01')
+            order = await client.order.place_domestic_order('1234', '01', '005930', '00', '1', '70000', sell_tp='2')
+        return balance, order
+
+    balance, order = asyncio.run(main())
+    assert balance['headers']['api-id'] == 'kt00018'
+    assert order['data']['ord_no']
+
+
+CHART_LEGACY_CALLS = [
+    ('get_domestic_stock_minute_by_period', ('005930',), 'ka10080'),
+    ('get_domestic_stock_day_trend', ('005930', '20241101'), 'ka10086'),
+    ('get_domestic_elw_daily', ('57JB12',), 'ka10081'),
+    ('get_domestic_chart', ('005930', '20241101', 'W'), 'ka10082'),
+    ('get_domestic_chart', ('005930', '20241101', 'D', '5'), 'ka10080'),
+    ('get_domestic_tick_chart', ('005930', '20241101', '090000'), 'ka10079'),
+    ('get_indices_chart', ('001', '20241101', 'Y'), 'ka20019'),
+    ('get_real_time_stock_price', ('005930',), 'ka10001'),
+    ('get_today_price_trend', ('005930',), 'ka10084'),
+    ('get_daily_price_trend', ('005930',), 'ka10086'),
+    ('get_today_time_price', ('005930', '0930', '1'), 'ka10084'),
+    ('get_stock_completion_chart', ('005930', '20241001', '20241101', '', 'M'), 'ka10083'),
+    ('get_domestic_stock_daily_chart', ('005930',), 'ka10081'),
+    ('get_domestic_stock_minute_chart', ('005930', '3'), 'ka10080'),
+    ('get_stock_price_by_date', ('005930', '20241101'), 'ka10086'),
+    ('get_stock_price_by_time', ('005930',), 'ka10003'),
+    ('get_domestic_ticker_real_time', ('005930',), 'ka10003'),
+    ('get_stock_depth', ('005930',), 'ka10004'),
+    ('get_index_daily_chart', ('001',), 'ka20006'),
+    ('get_stock_current_price', ('005930',), 'ka10001'),
+]
+
+
+@pytest.mark.parametrize('method, args, api_id', CHART_LEGACY_CALLS)
+def test_legacy_chart_methods_are_deprecated_aliases(method, args, api_id):
+    client = RecordingClient()
+    with pytest.warns(DeprecationWarning):
+        getattr(ChartAPI(client), method)(*args)
+
+    assert client.calls[0][0] == api_id
+    assert lookup(api_id) is not None
+
+
+def test_legacy_chart_arguments():
+    client = RecordingClient()
+    chart = ChartAPI(client)
+    with pytest.warns(DeprecationWarning):
+        chart.get_domestic_stock_daily('005930', inq_strt_dt='20240101', inq_end_dt='20241101', adj_cls_prc_yn='N')
+    with pytest.warns(DeprecationWarning):
+        chart.get_domestic_index_minute(stk_id_cd='101', inq_time='5')
+
+    assert client.calls[0][1] == {'stk_cd': '005930', 'base_dt': '20241101', 'upd_stkpc_tp': '0'}
+    assert client.calls[1][:2] == ('ka20005', {'inds_cd': '101', 'tic_scope': '5'})
+
+    with pytest.raises(TypeError):
+        chart.get_domestic_stock_daily('005930', unknown='1')
+
+
+def test_overseas_chart_is_unsupported():
+    with pytest.raises(NotImplementedError):
+        ChartAPI(RecordingClient()).get_overseas_chart('AAPL', 'NASD', '20241101', 'D')
+
+
+PRICE_CALLS = [
+    ('get_current_price', ('005930',), 'ka10001'),
+    ('get_askbid_price', ('005930',), 'ka10004'),
+    ('get_investor_breakdown', ('005930',), 'ka10059'),
+    ('get_daily_price', ('005930',), 'ka10081'),
+    ('get_daily_price', ('005930', 'W'), 'ka10082'),
+    ('get_daily_price', ('005930', 'M'), 'ka10083'),
+    ('get_minute_price', ('005930', '5'), 'ka10080'),
+    ('get_tick_price', ('005930',), 'ka10003'),
+    ('get_time_price', ('005930',), 'ka10006'),
+    ('get_trade_history', ('005930',), 'ka10084'),
+]
+
+
+@pytest.mark.parametrize('method, args, api_id', PRICE_CALLS)
+def test_price_methods_use_registered_trs(method, args, api_id):
+    client = RecordingClient()
+    getattr(PriceAPI(client), method)(*args)
+
+    assert client.calls[0][0] == api_id
+    assert lookup(api_id).endpoint in ('/api/dostk/stkinfo', '/api/dostk/mrkcond', '/api/dostk/chart')
+    assert client.calls[0][1]['stk_cd'] == '005930'
+
+
+def test_price_daily_rejects_unknown_period():
+    with pytest.raises(ValueError):
+        PriceAPI(RecordingClient()).get_daily_price('005930', 'Y')
+
+
+def test_legacy_stock_arguments():
+    client = RecordingClient()
+    stock = StockAPI(client)
+    with pytest.warns(DeprecationWarning):
+        stock.get_stock_investor_trend('005930', inq_strt_dt='20241001', inq_end_dt='20241101')
+    with pytest.warns(DeprecationWarning):
+        stock.get_stock_financial_info('005930')
+
+    assert client.calls[0][1]['dt'] == '20241101'
+    assert client.calls[1][0] == 'ka10001'
+
+    with pytest.raises(ValueError):
+        stock.get_stock_investor_trend('005930')
+
+
+@pytest.mark.parametrize('method, args', [
+    ('get_delisted_stocks', ()),
+    ('get_suspended_stocks', ()),
+    ('get_watch_stocks', ()),
+    ('get_stock_disclosure', ('005930',)),
+    ('get_stock_symbol_search', ('삼성',)),
+    ('get_overseas_stock_symbol_search', ('AAPL',)),
+    ('get_overseas_stock_info', ('AAPL', 'NASD')),
+])
+def test_removed_stock_methods_are_unsupported(method, args):
+    with pytest.raises(NotImplementedError):
+        getattr(StockAPI(RecordingClient()), method)(*args)
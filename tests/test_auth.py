@@ -0,0 +1,27 @@
+"""
+토큰 저장소(kiwoom_api.auth) 테스트
+"""
+
+import os
+import stat
+
+import pytest
+
+from kiwoom_api.auth import FileTokenStore, TokenStore
+
+
+def test_token_store_is_abstract():
+    with pytest.raises(TypeError):
+        TokenStore()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX 파일 권한 확인')
+def test_file_token_store_is_private(tmp_path):
+    path = tmp_path / 'token.json'
+    store = FileTokenStore(str(path))
+    record = {'token': 'abc', 'token_type': 'bearer', 'expires_dt': '20991231235959'}
+    store.save('appkey', record)
+
+    assert store.load('appkey') == record
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path) == ['token.json']
@@ -0,0 +1,116 @@
+"""
+다종목 동시 조회(kiwoom_api.bulk) 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kiwoom_api.async_client import AsyncKiwoomClient
+from kiwoom_api.bulk import BulkResult, fan_out, fan_out_async
+
+CODES = ['005930', '000660', '035420', '035720', '051910', '068270']
+
+
+class ConcurrencyProbe:
+    """동시에 실행 중인 호출 수의 최댓값을 기록"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.active -= 1
+
+
+def test_fan_out_yields_in_completion_order():
+    def func(key):
+        time.sleep(0.3 if key == 'slow' else 0.01)
+        return {'key': key}
+
+    results = list(fan_out(func, ['slow', 'a', 'b', 'c'], max_workers=2))
+
+    assert [item.key for item in results][-1] == 'slow'
+    assert sorted(item.key for item in results) == ['a', 'b', 'c', 'slow']
+    assert all(item.ok and item.result == {'key': item.key} for item in results)
+
+
+def test_fan_out_captures_errors_per_key():
+    def func(key):
+        if key == 'bad':
+            raise ValueError(key)
+        return {'key': key}
+
+    results = {item.key: item for item in fan_out(func, ['a', 'bad', 'b'], max_workers=2)}
+
+    assert isinstance(results['bad'].error, ValueError)
+    assert results['bad'].result is None and not results['bad'].ok
+    assert results['a'].ok and results['b'].ok
+
+
+def test_fan_out_respects_max_workers(client):
+    probe = ConcurrencyProbe()
+
+    def func(stk_cd):
+        with probe:
+            time.sleep(0.02)
+            return client.price.get_current_price(stk_cd)
+
+    results = list(client.fan_out(func, CODES, max_workers=2))
+
+    assert len(results) == len(CODES)
+    assert probe.peak <= 2
+
+
+def test_price_bulk_against_mock_server(client):
+    results = list(client.price.bulk('get_current_price', CODES, max_workers=3))
+
+    assert sorted(item.key for item in results) == sorted(CODES)
+    assert all(isinstance(item, BulkResult) and item.ok for item in results)
+    assert {item.result['headers']['api-id'] for item in results} == {'ka10001'}
+
+
+def test_price_bulk_reports_unknown_method(client):
+    with pytest.raises(AttributeError):
+        client.price.bulk('get_unknown', CODES)
+
+
+def test_fan_out_async_orders_errors_and_bound():
+    probe = ConcurrencyProbe()
+
+    async def func(key):
+        with probe:
+            await asyncio.sleep(0.2 if key == 'slow' else 0.01)
+        if key == 'bad':
+            raise ValueError(key)
+        return {'key': key}
+
+    async def main():
+        return [item async for item in fan_out_async(func, ['slow', 'a', 'bad', 'b', 'c'], max_workers=2)]
+
+    results = asyncio.run(main())
+
+    assert results[-1].key == 'slow'
+    assert sorted(item.key for item in results) == ['a', 'b', 'bad', 'c', 'slow']
+    assert [item.key for item in results if not item.ok] == ['bad']
+    assert probe.peak <= 2
+
+
+def test_async_price_bulk_against_mock_server(server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as client:
+            return [item async for item in client.price.bulk('get_current_price', CODES, max_workers=2)]
+
+    results = asyncio.run(main())
+
+    assert sorted(item.key for item in results) == sorted(CODES)
+    assert all(item.ok for item in results)
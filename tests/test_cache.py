@@ -0,0 +1,31 @@
+"""
+응답 캐시(kiwoom_api.cache) 테스트
+"""
+
+import pytest
+
+from kiwoom_api.cache import DEFAULT_TTLS, ResponseCache
+from kiwoom_api.schema import TR_SCHEMAS
+
+# 시세가 바뀌는 필드
+QUOTE_FIELDS = {'cur_prc', 'flu_rt', 'pred_pre', 'trde_qty', 'now_trde_qty'}
+
+
+@pytest.mark.parametrize('api_id', sorted(DEFAULT_TTLS))
+def test_default_ttls_exclude_quote_fields(api_id):
+    schema = TR_SCHEMAS[api_id]
+    fields = set(schema['fields']).union(*schema['lists'].values())
+    assert not fields & QUOTE_FIELDS
+
+
+def test_quote_trs_are_not_cached_by_default():
+    cache = ResponseCache()
+    assert cache.ttl_for('ka10001') is None
+    assert cache.ttl_for('ka10099') == DEFAULT_TTLS['ka10099']
+    assert ResponseCache(ttls={'ka10001': 1.0}).ttl_for('ka10001') == 1.0
+
+
+def test_orders_ignore_default_ttl():
+    cache = ResponseCache(default_ttl=60)
+    assert cache.ttl_for('ka10081') == 60
+    assert cache.ttl_for('kt10000') is None
@@ -0,0 +1,178 @@
+"""
+REST 클라이언트(kiwoom_api.client, kiwoom_api.async_client) 테스트
+
+연속조회, 토큰 갱신과 401 재인증, 응답 캐시, 동일 요청 병합을 로컬 모의 서버로 확인합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kiwoom_api.async_client import AsyncKiwoomClient
+from kiwoom_api.cache import ResponseCache
+from kiwoom_api.client import KiwoomClient
+from kiwoom_api.mock import MockKiwoomServer
+
+CHART_DATA = {'stk_cd': '005930', 'base_dt': '20241108', 'upd_stkpc_tp': '1'}
+
+
+@pytest.fixture
+def paged_server():
+    """연속조회 응답을 3 페이지로 나누는 모의 서버"""
+    with MockKiwoomServer(rows=4, pages=3) as server:
+        yield server
+
+
+def test_paginate_follows_next_key(paged_server):
+    with KiwoomClient('appkey', 'secretkey', host=paged_server.url, auto_refresh=False) as client:
+        pages = list(client.paginate('ka10081', CHART_DATA))
+        rows = list(client.paginate('ka10081', CHART_DATA, rows=True))
+
+    assert len(pages) == 3
+    assert [page['headers']['cont-yn'] for page in pages] == ['Y', 'Y', 'N']
+    assert len(rows) == 12
+
+
+def test_paginate_limits(paged_server):
+    with KiwoomClient('appkey', 'secretkey', host=paged_server.url, auto_refresh=False) as client:
+        assert len(list(client.paginate('ka10081', CHART_DATA, max_pages=2))) == 2
+        assert len(list(client.paginate('ka10081', CHART_DATA, rows=True, max_rows=6))) == 6
+        assert len(list(client.paginate('ka10081', CHART_DATA, rows=True, prefetch=True))) == 12
+
+
+def test_async_paginate(paged_server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=paged_server.url) as client:
+            return [row async for row in client.paginate('ka10081', CHART_DATA, rows=True)]
+
+    assert len(asyncio.run(main())) == 12
+
+
+def test_reauthenticates_once_after_401(server, client):
+    token = client.auth.token
+    server.expire_tokens()
+
+    result = client.request_api('ka10001', {'stk_cd': '005930'})
+
+    assert result['status_code'] == 200
+    assert client.auth.token != token
+    stats = server.stats()
+    assert stats['unauthorized'] == 1
+    assert stats['tokens'] == 2
+
+
+def test_refreshes_token_before_expiry(server, client):
+    token = client.auth.token
+    client.auth.expires_at = time.time() + client.auth.refresh_margin - 1
+
+    client.request_api('ka10001', {'stk_cd': '005930'})
+
+    assert client.auth.token != token
+    assert server.stats()['unauthorized'] == 0
+    assert server.stats()['tokens'] == 2
+
+
+def test_async_reauthenticates_after_401(server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as client:
+            await client.request_api('ka10001', {'stk_cd': '005930'})
+            server.expire_tokens()
+            return await client.request_api('ka10001', {'stk_cd': '005930'})
+
+    assert asyncio.run(main())['status_code'] == 200
+    assert server.stats()['unauthorized'] == 1
+
+
+def test_cache_ttl(server):
+    cache = ResponseCache(ttls={'ka10001': 0.2})
+    with KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False, cache=cache) as client:
+        before = server.stats()['requests']
+        first = client.request_api('ka10001', {'stk_cd': '005930'})
+        second = client.request_api('ka10001', {'stk_cd': '005930'})
+        assert second is first
+        assert server.stats()['requests'] - before == 1
+
+        # 요청 데이터가 다르면 다른 항목
+        client.request_api('ka10001', {'stk_cd': '000660'})
+        assert server.stats()['requests'] - before == 2
+
+        time.sleep(0.25)
+        client.request_api('ka10001', {'stk_cd': '005930'})
+        assert server.stats()['requests'] - before == 3
+
+    assert cache.stats()['hits'] == 1
+
+
+def test_cache_skips_error_responses():
+    cache = ResponseCache(ttls={'ka10001': 60})
+    result = {'status_code': 200, 'headers': {}, 'data': {'return_code': 5, 'return_msg': '호출 한도 초과'}}
+    cache.set('ka10001', {}, result)
+    assert cache.get('ka10001', {}) is None
+
+
+def test_coalesces_concurrent_identical_requests():
+    with MockKiwoomServer(latency=0.1) as server:
+        with KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False) as client:
+            barrier = threading.Barrier(5)
+            results = []
+
+            def call():
+                barrier.wait()
+                results.append(client.request_api('ka10001', {'stk_cd': '005930'}))
+
+            before = server.stats()['requests']
+            threads = [threading.Thread(target=call) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert server.stats()['requests'] - before == 1
+            assert all(result is results[0] for result in results)
+            assert client.coalesce_stats()['coalesced'] == 4
+
+
+def test_async_coalesces_identical_requests():
+    with MockKiwoomServer(latency=0.05) as server:
+        async def main():
+            async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as client:
+                await client.ensure_token()
+                before = server.stats()['requests']
+                await asyncio.gather(*(client.request_api('ka10001', {'stk_cd': '005930'}) for _ in range(5)))
+                return server.stats()['requests'] - before, client.coalesce_stats()
+
+        sent, stats = asyncio.run(main())
+
+    assert sent == 1
+    assert stats['coalesced'] == 4
+
+
+def test_orders_are_not_coalesced(server, client):
+    assert not client.single_flight.applies('kt10000')
+    assert client.single_flight.applies('ka10001')
+
+
+def test_async_close_keeps_shared_transport(server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as owner:
+            async with AsyncKiwoomClient(host=server.url, transport=owner.transport) as borrower:
+                await borrower.request_api('ka10001', {'stk_cd': '005930'})
+            # 공유받은 클라이언트를 닫아도 원래 클라이언트의 연결 풀은 유지
+            assert owner.transport.async_pool is not None
+            result = await owner.request_api('ka10001', {'stk_cd': '005930'})
+        assert owner.transport.async_pool is None
+        return result
+
+    assert asyncio.run(main())['status_code'] == 200
+
+
+def test_close_keeps_default_pool(server):
+    from kiwoom_api.pool import get_default_pool
+
+    pool = get_default_pool()
+    with KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False) as client:
+        assert client.pool is pool
+    # 클라이언트 전용이 아닌 공유 연결 풀은 close_default_pool 로만 종료
+    assert not pool._closed
@@ -0,0 +1,90 @@
+"""
+JSON 코덱(kiwoom_api.codec) 테스트
+"""
+
+import json
+
+import pytest
+
+from kiwoom_api.client import KiwoomClient
+from kiwoom_api.codec import (JSON_CODEC, ORJSON_CODEC, Codec, LazyJSON, get_codec, set_default_codec,
+                              to_plain)
+
+CODECS = [JSON_CODEC] + ([ORJSON_CODEC] if ORJSON_CODEC is not None else [])
+PAYLOAD = {'stk_nm': '삼성전자', 'cur_prc': '+71000', 'rows': [{'dt': '20241101', 'flu_rt': '-0.71'}], 'return_code': 0}
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_round_trip(codec):
+    text = codec.dumps(PAYLOAD)
+
+    assert isinstance(text, str)
+    assert '삼성전자' in text
+    assert codec.loads(text) == PAYLOAD
+    assert codec.loads(text.encode()) == PAYLOAD
+    assert codec.decode(text.encode()) == PAYLOAD
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_lazy_decode(codec):
+    lazy = codec.decode(codec.dumps(PAYLOAD).encode(), lazy=True)
+
+    assert isinstance(lazy, LazyJSON)
+    assert not lazy.decoded
+    assert 'bytes' in repr(lazy)
+    assert lazy['stk_nm'] == '삼성전자'
+    assert lazy.decoded
+    assert dict(lazy) == PAYLOAD and len(lazy) == len(PAYLOAD)
+    # 지연 변환 객체를 담은 값도 그대로 직렬화
+    assert codec.loads(codec.dumps({'data': lazy})) == {'data': PAYLOAD}
+
+
+def test_to_plain_rejects_other_objects():
+    assert to_plain(LazyJSON(b'{"a": 1}', json.loads)) == {'a': 1}
+    with pytest.raises(TypeError):
+        to_plain(object())
+
+
+def test_get_codec():
+    custom = Codec('custom', json.loads, json.dumps)
+
+    assert get_codec('json') is JSON_CODEC
+    assert get_codec(custom) is custom
+    assert get_codec() is (ORJSON_CODEC or JSON_CODEC)
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_set_default_codec():
+    previous = set_default_codec('json')
+    try:
+        assert get_codec() is JSON_CODEC
+    finally:
+        set_default_codec(previous)
+    assert get_codec() is previous
+
+
+@pytest.mark.parametrize('codec', [codec.name for codec in CODECS])
+def test_client_codecs_against_mock_server(server, codec):
+    client = KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False, codec=codec)
+    try:
+        response = client.stock.get_stock_basic_info('005930')
+    finally:
+        client.close()
+
+    assert client.codec.name == codec
+    assert response['data']['return_code'] == 0
+    assert response['data']['cur_prc'] == '+71000'
+
+
+def test_raw_client_returns_lazy_body(server):
+    client = KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False, raw=True)
+    try:
+        response = client.stock.get_stock_basic_info('005930')
+    finally:
+        client.close()
+
+    body = response['data']
+    assert isinstance(body, LazyJSON)
+    assert not body.decoded
+    assert body['cur_prc'] == '+71000'
@@ -0,0 +1,49 @@
+"""
+컬럼형 결과(kiwoom_api.columnar) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from kiwoom_api.async_client import AsyncKiwoomClient  # noqa: E402
+from kiwoom_api.columnar import ColumnarResult  # noqa: E402
+
+
+def test_documented_chart_example(client):
+    pytest.importorskip('pandas')
+    result = client.columnar().chart.get_domestic_stock_minute('005930')
+
+    assert result['status_code'] == 200
+    assert isinstance(result['data'], ColumnarResult)
+    assert result['data'].api_id == 'ka10080'
+    assert result['data'].num_rows == 5
+    assert result['data']['cur_prc'].dtype == np.int64
+
+    df = result['data'].to_dataframe()
+    assert len(df) == 5
+    assert 'cntr_tm' in df.columns
+
+
+def test_columnar_keeps_cached_response(client):
+    raw = client.chart.get_domestic_stock_minute('005930')
+    converted = client.columnar().chart.get_domestic_stock_minute('005930')
+
+    assert isinstance(raw['data'], dict)
+    assert isinstance(converted['data'], ColumnarResult)
+
+
+def test_async_columnar_chart(server):
+    async def main():
+        async with AsyncKiwoomClient('appkey', 'secretkey', host=server.url) as client:
+            return await client.columnar().chart.get_domestic_stock_minute('005930')
+
+    result = asyncio.run(main())
+    assert isinstance(result['data'], ColumnarResult)
+    assert result['data'].num_rows == 5
+
+
+def test_columnar_delegates_other_attributes(client):
+    assert client.columnar().host == client.host
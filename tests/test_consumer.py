@@ -0,0 +1,151 @@
+"""
+실시간 데이터 소비자(kiwoom_api.consumer) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from kiwoom_api.consumer import BLOCK, CONFLATE, DROP_OLDEST, AsyncConsumer
+
+
+def _data(item: str, price: int, realtime_type: str = '0B'):
+    return {'type': realtime_type, 'item': item, 'values': {'10': str(price)}}
+
+
+def _prices(received):
+    return [(data['item'], data['values']['10']) for data in received]
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        AsyncConsumer(print, policy='unknown')
+    with pytest.raises(ValueError):
+        AsyncConsumer(print, maxsize=0)
+
+
+def test_drop_oldest():
+    received = []
+
+    async def main():
+        consumer = AsyncConsumer(received.append, maxsize=3, policy=DROP_OLDEST)
+        # 작업 태스크가 실행되기 전에 5개를 넣으면 가장 오래된 2개를 버림
+        for price in range(5):
+            assert consumer.offer(_data('005930', price)) is None
+        await consumer.close(drain=True)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    assert _prices(received) == [('005930', '2'), ('005930', '3'), ('005930', '4')]
+    assert stats['dropped'] == 2
+    assert stats['max_depth'] == 3
+    assert stats['delivered'] == 3
+
+
+def test_conflate_keeps_latest_value_per_key():
+    received = []
+
+    async def main():
+        consumer = AsyncConsumer(received.append, maxsize=2, policy=CONFLATE)
+        consumer.offer(_data('005930', 1))
+        consumer.offer(_data('000660', 1))
+        consumer.offer(_data('005930', 2))
+        consumer.offer(_data('005930', 3))
+        await consumer.close(drain=True)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    # 대기열 순서는 처음 들어온 순서를 유지하고 값만 최신으로 교체
+    assert _prices(received) == [('005930', '3'), ('000660', '1')]
+    assert stats['conflated'] == 2
+    assert stats['dropped'] == 0
+
+
+def test_conflate_drops_oldest_key_when_full():
+    received = []
+
+    async def main():
+        consumer = AsyncConsumer(received.append, maxsize=2, policy=CONFLATE)
+        for item in ('005930', '000660', '035720'):
+            consumer.offer(_data(item, 1))
+        await consumer.close(drain=True)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    assert [data['item'] for data in received] == ['000660', '035720']
+    assert stats['dropped'] == 1
+
+
+def test_block_applies_backpressure():
+    received = []
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def slow(data):
+            await gate.wait()
+            received.append(data)
+
+        consumer = AsyncConsumer(slow, maxsize=1, policy=BLOCK)
+        assert consumer.offer(_data('005930', 1)) is None
+        await asyncio.sleep(0)  # 작업 태스크가 첫 데이터를 꺼내 콜백에서 대기
+        assert consumer.offer(_data('005930', 2)) is None
+        waiter = consumer.offer(_data('005930', 3))
+        assert waiter is not None
+
+        put = asyncio.ensure_future(waiter)
+        await asyncio.sleep(0.01)
+        assert not put.done()  # 자리가 날 때까지 수신 루프가 기다림
+
+        gate.set()
+        await asyncio.wait_for(put, 1)
+        await consumer.close(drain=True)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    assert _prices(received) == [('005930', '1'), ('005930', '2'), ('005930', '3')]
+    assert stats['blocked'] == 1
+    assert stats['dropped'] == 0
+
+
+@pytest.mark.parametrize('stop', ['cancel', 'close'])
+def test_stopping_wakes_blocked_put(stop):
+    async def main():
+        gate = asyncio.Event()
+
+        async def stuck(data):
+            await gate.wait()
+
+        consumer = AsyncConsumer(stuck, maxsize=1, policy=BLOCK)
+        consumer.offer(_data('005930', 1))
+        await asyncio.sleep(0)
+        consumer.offer(_data('005930', 2))
+        put = asyncio.ensure_future(consumer.offer(_data('005930', 3)))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+
+        if stop == 'cancel':
+            consumer.cancel()
+        else:
+            await consumer.close()
+        await asyncio.wait_for(put, 1)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    assert stats['dropped'] == 1
+    assert stats['depth'] <= 1
+
+
+def test_callback_errors_are_counted():
+    async def main():
+        def fail(data):
+            raise RuntimeError('boom')
+
+        consumer = AsyncConsumer(fail)
+        consumer.offer(_data('005930', 1))
+        await consumer.close(drain=True)
+        return consumer.stats()
+
+    stats = asyncio.run(main())
+    assert stats['errors'] == 1
+    assert stats['delivered'] == 1
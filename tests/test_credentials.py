@@ -0,0 +1,97 @@
+"""
+다중 앱키 풀(kiwoom_api.credentials) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from kiwoom_api.async_client import AsyncKiwoomClient
+from kiwoom_api.client import KiwoomClient
+from kiwoom_api.credentials import LEAST_LOADED, CredentialPool
+
+
+def make_pool(server=None, **kwargs):
+    host = server.url if server is not None else None
+    return CredentialPool([('key-a', 'secret-a', ['1111']), ('key-b', 'secret-b', ['2222'])], host=host, **kwargs)
+
+
+def test_lookup_trs_are_spread_round_robin():
+    pool = make_pool()
+
+    selected = [pool.select('ka10001', '/api/dostk/stkinfo').appkey for _ in range(4)]
+
+    assert selected == ['key-a', 'key-b', 'key-a', 'key-b']
+
+
+def test_least_loaded_prefers_idle_credential():
+    pool = make_pool(strategy=LEAST_LOADED)
+
+    with pool.use('ka10001', '/api/dostk/stkinfo') as busy:
+        assert pool.select('ka10001', '/api/dostk/stkinfo') is not busy
+
+
+def test_account_trs_stick_to_bound_account():
+    pool = make_pool()
+
+    for _ in range(3):
+        assert pool.select('kt00018', '/api/dostk/acnt', '2222').appkey == 'key-b'
+        assert pool.select('kt10000', '/api/dostk/ordr', '2222').appkey == 'key-b'
+    assert pool.select('kt00018', '/api/dostk/acnt').appkey == 'key-a'
+
+
+def test_account_trs_ignore_request_body():
+    # 키움증권 REST API 요청 본문에는 계좌번호가 없으므로 본문이 아니라 지정한 계좌로만 앱키를 고른다
+    pool = make_pool()
+
+    assert pool.select('kt00018', '/api/dostk/acnt').appkey == 'key-a'
+
+
+def test_unknown_account_is_rejected():
+    pool = make_pool()
+
+    with pytest.raises(ValueError):
+        pool.select('kt00018', '/api/dostk/acnt', '9999')
+    with pytest.raises(ValueError):
+        KiwoomClient(credential_pool=pool, account_no='9999', auto_auth=False)
+
+
+def test_assign_account():
+    pool = make_pool()
+    pool.assign_account('3333', 'key-b')
+
+    assert pool.owner('3333').appkey == 'key-b'
+    with pytest.raises(ValueError):
+        pool.assign_account('4444', 'key-c')
+
+
+def test_clients_bound_to_different_accounts(server):
+    pool = make_pool(server)
+    first = KiwoomClient(credential_pool=pool, host=server.url, auto_refresh=False, account_no='1111')
+    second = KiwoomClient(credential_pool=pool, host=server.url, auto_refresh=False, account_no='2222',
+                          transport=first.transport)
+
+    first.account.get_account_balance()
+    second.account.get_account_balance()
+    second.account.get_deposit()
+
+    stats = pool.stats()
+    assert stats['key-a']['requests'] == 1
+    assert stats['key-b']['requests'] == 2
+    first.close()
+
+
+def test_concurrent_account_requests_are_not_coalesced_across_accounts(server):
+    pool = make_pool(server)
+
+    async def main():
+        async with AsyncKiwoomClient(credential_pool=pool, host=server.url, account_no='1111') as first:
+            second = AsyncKiwoomClient(credential_pool=pool, host=server.url, account_no='2222',
+                                       transport=first.transport)
+            await asyncio.gather(first.account.get_account_balance(), second.account.get_account_balance())
+
+    asyncio.run(main())
+
+    stats = pool.stats()
+    assert stats['key-a']['requests'] == 1
+    assert stats['key-b']['requests'] == 1
@@ -0,0 +1,82 @@
+"""
+지연 import 와 API 모듈 지연 생성 테스트 (kiwoom_api 패키지 속성, KiwoomOpenAPI 모듈)
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import kiwoom_api
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 패키지 import 만으로는 로드되면 안 되는 모듈 (benchmarks/bench_import.py 와 같은 목록)
+DEFERRED_MODULES = ('asyncio', 'aiohttp', 'websockets', 'pandas', 'numpy', 'sqlite3', 'http.server',
+                    'kiwoom_api.async_client', 'kiwoom_api.rows', 'kiwoom_api.schema', 'kiwoom_api.replay')
+
+# KiwoomOpenAPI(kiwoom.py)는 저장소 최상위를 패키지로 보고 상대 import 하므로 임의 이름의 패키지로 로드
+ROOT_PACKAGE = '_kiwoom_root'
+
+
+@pytest.fixture(scope='module')
+def openapi():
+    if ROOT_PACKAGE not in sys.modules:
+        package = types.ModuleType(ROOT_PACKAGE)
+        package.__path__ = [ROOT]
+        sys.modules[ROOT_PACKAGE] = package
+    return importlib.import_module(f'{ROOT_PACKAGE}.kiwoom')
+
+
+def test_import_does_not_load_deferred_modules():
+    code = ('import sys, kiwoom_api; '
+            f'print(",".join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))')
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip() == ''
+
+
+def test_lazy_exports_resolve_and_cache():
+    for name in kiwoom_api.__all__:
+        assert getattr(kiwoom_api, name) is not None, name
+    assert 'AsyncKiwoomClient' in vars(kiwoom_api)
+    assert set(kiwoom_api._LAZY_IMPORTS) <= set(dir(kiwoom_api))
+    assert kiwoom_api.parse_rows is importlib.import_module('kiwoom_api.rows').parse_rows
+
+    with pytest.raises(AttributeError):
+        kiwoom_api.does_not_exist
+
+
+def test_facades_are_built_on_first_access(openapi):
+    api = openapi.KiwoomOpenAPI('appkey', 'secretkey')
+
+    assert not set(openapi.API_MODULES) & set(vars(api))
+    ranking = api.ranking
+    assert api.ranking is ranking
+    assert set(vars(api)) & set(openapi.API_MODULES) == {'ranking'}
+    assert ranking.transport is api.transport
+
+    with pytest.raises(AttributeError):
+        api.unknown_module
+
+
+def test_every_facade_is_registered(openapi):
+    api = openapi.KiwoomOpenAPI('appkey', 'secretkey')
+
+    for name, (_module, class_name) in openapi.API_MODULES.items():
+        assert type(getattr(api, name)).__name__ == class_name
+
+
+def test_init_api_modules_rebuilds_with_new_base_url(openapi):
+    api = openapi.KiwoomOpenAPI('appkey', 'secretkey')
+    before = api.stock
+
+    api.BASE_URL = 'http://127.0.0.1:9'
+    api._init_api_modules()
+
+    assert api.stock is not before
+    assert api.stock.base_url == 'http://127.0.0.1:9'
+    assert api.stock.transport is api.transport
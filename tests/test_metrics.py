@@ -0,0 +1,101 @@
+"""
+요청 훅과 지표(kiwoom_api.hooks, kiwoom_api.metrics) 테스트
+"""
+
+import urllib.request
+
+import pytest
+import requests
+
+from kiwoom_api.client import KiwoomClient
+from kiwoom_api.hooks import AFTER_RECEIVE, BEFORE_SEND, ON_ERROR, RequestEvent, RequestHooks
+from kiwoom_api.metrics import MetricsCollector
+from kiwoom_api.mock import MockKiwoomServer
+
+
+class Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize('status_code, body, error, expected', [
+    (200, {'return_code': 0}, None, None),
+    (200, {'return_code': 5}, None, 'rc5'),
+    (429, None, requests.HTTPError('429'), '429'),
+    (500, None, requests.HTTPError('500'), '500'),
+    (None, None, requests.ConnectionError('refused'), 'ConnectionError'),
+])
+def test_error_code(status_code, body, error, expected):
+    event = RequestEvent('ka10001', '/api/dostk/stkinfo', 'POST')
+    event.finish(Response(status_code) if status_code else None, body, error)
+    assert event.error_code == expected
+
+
+def test_error_code_from_exception_response():
+    error = requests.HTTPError('401', response=Response(401))
+    event = RequestEvent('ka10001', '/api/dostk/stkinfo', 'POST')
+    event.finish(error=error)
+    assert event.error_code == '401'
+
+
+def _client(server, metrics, hooks=None):
+    return KiwoomClient('appkey', 'secretkey', host=server.url, auto_refresh=False, rate_limiter=False,
+                        retry=False, coalesce=False, hooks=hooks, metrics=metrics)
+
+
+def test_on_error_labels_http_status():
+    hooks = RequestHooks()
+    events = {BEFORE_SEND: [], AFTER_RECEIVE: [], ON_ERROR: []}
+    for name, received in events.items():
+        hooks.add(name, lambda event, received=received: received.append(event.error_code))
+
+    with MockKiwoomServer(rate=1) as server:
+        with _client(server, None, hooks) as client:
+            client.request_api('ka10001', {'stk_cd': '005930'})
+            with pytest.raises(requests.HTTPError):
+                client.request_api('ka10001', {'stk_cd': '005930'})
+            with pytest.raises(requests.HTTPError):
+                client.request_api('ka10001', {'stk_cd': '005930'}, endpoint='/api/unknown')
+
+    assert len(events[BEFORE_SEND]) == 3
+    assert events[AFTER_RECEIVE] == [None]
+    assert events[ON_ERROR] == ['429', '404']
+
+
+def test_prometheus_render(server):
+    metrics = MetricsCollector()
+    with _client(server, metrics) as client:
+        client.request_api('ka10001', {'stk_cd': '005930'})
+        client.request_api('ka10001', {'stk_cd': '005930'})
+        with pytest.raises(requests.HTTPError):
+            client.request_api('ka10081', {'stk_cd': '005930'}, endpoint='/api/unknown')
+
+    text = metrics.render()
+    lines = text.splitlines()
+    assert '# TYPE kiwoom_request_duration_seconds histogram' in lines
+    assert 'kiwoom_request_duration_seconds_count{api_id="ka10001",endpoint="/api/dostk/stkinfo"} 2' in lines
+    assert 'kiwoom_request_duration_seconds_bucket{api_id="ka10001",endpoint="/api/dostk/stkinfo",le="+Inf"} 2' in lines
+    assert '# TYPE kiwoom_errors_total counter' in lines
+    assert 'kiwoom_errors_total{api_id="ka10081",code="404"} 1' in lines
+    assert not any(line.startswith('kiwoom_errors_total{api_id="ka10001"') for line in lines)
+    response_bytes = [line for line in lines if line.startswith('kiwoom_response_bytes_total{api_id="ka10001"')]
+    assert len(response_bytes) == 1 and float(response_bytes[0].rsplit(' ', 1)[1]) > 0
+
+    snapshot = metrics.snapshot()
+    assert snapshot['ka10001']['requests'] == 2
+    assert snapshot['ka10081']['errors'] == {'404': 1}
+
+
+def test_metrics_server(server):
+    metrics = MetricsCollector()
+    with _client(server, metrics) as client:
+        client.request_api('ka10001', {'stk_cd': '005930'})
+
+    metrics_server = metrics.serve(0)
+    try:
+        with urllib.request.urlopen(metrics_server.url) as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith('text/plain')
+    finally:
+        metrics_server.stop()
+    assert body == metrics.render()
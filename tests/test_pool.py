@@ -0,0 +1,28 @@
+"""
+연결 풀(kiwoom_api.pool) 테스트
+"""
+
+from kiwoom_api.pool import ConnectionPool
+
+
+def test_stats_count_reused_connections(server):
+    with ConnectionPool() as pool:
+        for _ in range(5):
+            pool.request('POST', server.url + '/oauth2/token', json={'grant_type': 'client_credentials'})
+        stats = pool.stats()
+
+    assert stats['requests'] == 5
+    assert stats['new_connections'] == 1
+    assert stats['hits'] == 4
+    assert stats['hosts'] == 1
+
+
+def test_stats_without_keep_alive(server):
+    with ConnectionPool(keep_alive=False) as pool:
+        for _ in range(3):
+            pool.request('POST', server.url + '/oauth2/token', json={'grant_type': 'client_credentials'})
+        stats = pool.stats()
+
+    assert stats['requests'] == 3
+    assert stats['new_connections'] == 3
+    assert stats['hits'] == 0
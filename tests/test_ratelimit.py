@@ -0,0 +1,82 @@
+"""
+호출 속도 제한(kiwoom_api.ratelimit) 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+from kiwoom_api.ratelimit import PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_TYPES, RateLimiter
+from kiwoom_api.registry import ORDER_TYPES
+
+
+def _drain(limiter: RateLimiter):
+    """버킷의 토큰을 모두 사용하여 다음 요청부터 대기하도록 함"""
+    for _ in range(int(limiter.rate)):
+        limiter.acquire('ka10001')
+
+
+def test_priority_types_alias_order_types():
+    assert PRIORITY_TYPES is ORDER_TYPES
+
+
+def test_priority_of():
+    limiter = RateLimiter()
+    assert limiter.priority_of('kt10000') == PRIORITY_HIGH
+    assert limiter.priority_of('ka10001') == PRIORITY_NORMAL
+
+
+def test_orders_jump_ahead_of_queued_queries():
+    limiter = RateLimiter(rate=20)
+    _drain(limiter)
+    order = []
+
+    async def call(api_id, name):
+        await limiter.acquire_async(api_id)
+        order.append(name)
+
+    async def main():
+        tasks = [asyncio.ensure_future(call('ka10001', f'query{index}')) for index in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.ensure_future(call('kt10000', 'order')))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ['order', 'query0', 'query1', 'query2']
+
+
+def test_same_priority_is_fifo_across_threads():
+    limiter = RateLimiter(rate=20)
+    _drain(limiter)
+    order = []
+    threads = []
+    for index in range(4):
+        thread = threading.Thread(target=lambda index=index: (limiter.acquire('ka10001'), order.append(index)))
+        thread.start()
+        threads.append(thread)
+        # 대기열에 도착 순서대로 들어가도록 간격을 둠
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2, 3]
+    stats = limiter.stats()
+    assert stats['acquired'] == 24
+    assert stats['waited'] == 4
+    assert stats['queued'] == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    limiter = RateLimiter(rate=20)
+    _drain(limiter)
+
+    async def main():
+        task = asyncio.ensure_future(limiter.acquire_async('ka10001'))
+        await asyncio.sleep(0)
+        assert limiter.stats()['queued'] == 1
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await limiter.acquire_async('ka10001')
+
+    asyncio.run(main())
+    assert limiter.stats()['queued'] == 0
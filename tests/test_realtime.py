@@ -0,0 +1,131 @@
+"""
+실시간시세 클라이언트(kiwoom_api.realtime) 테스트
+"""
+
+import asyncio
+
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.mock import MockKiwoomServer
+from kiwoom_api.realtime import WILDCARD, DispatchTable, KiwoomRealtimeClient
+from kiwoom_api.retry import RetryPolicy
+
+
+def _message(*keys):
+    return {'trnm': 'REAL', 'data': [{'type': realtime_type, 'item': item, 'values': {}} for realtime_type, item in keys]}
+
+
+def test_dispatch_table_routing():
+    table = DispatchTable(lambda: [('0B', '005930'), ('0B', '000660')])
+    exact, by_type, everything = [], [], []
+    table.add('0B', exact.append, '005930')
+    table.add('0B', by_type.append)
+    table.add(WILDCARD, everything.append)
+
+    table.dispatch(_message(('0B', '005930'), ('0B', '000660'), ('0D', '005930')))
+
+    assert [data['item'] for data in exact] == ['005930']
+    assert [data['item'] for data in by_type] == ['005930', '000660']
+    assert [(data['type'], data['item']) for data in everything] == [('0B', '005930'), ('0B', '000660'), ('0D', '005930')]
+    # 등록하지 않은 (실시간 항목, 종목)은 처음 수신할 때 표에 추가
+    assert ('0D', '005930') in table.table
+
+
+def test_dispatch_table_callback_order_and_remove():
+    table = DispatchTable(lambda: [('0B', '005930')])
+    calls = []
+    first = lambda data: calls.append('first')  # noqa: E731
+    second = lambda data: calls.append('second')  # noqa: E731
+    table.add('0B', first)
+    table.add('0B', second, '005930')
+    assert table.lookup('0B', '005930') == (first, second)
+
+    assert table.remove('0B', first)
+    assert not table.remove('0B', first)
+    table.dispatch(_message(('0B', '005930')))
+    assert calls == ['second']
+
+
+def test_dispatch_table_coroutine_callbacks_use_consumers():
+    received = []
+
+    async def save(data):
+        received.append(data['item'])
+
+    async def main():
+        table = DispatchTable()
+        table.add('0B', save)
+        assert len(table.consumers) == 1
+        table.dispatch(_message(('0B', '005930'), ('0B', '000660')))
+        await table.consumers[0].close(drain=True)
+
+    asyncio.run(main())
+    assert received == ['005930', '000660']
+
+
+def test_resubscribes_after_reconnect():
+    with MockKiwoomServer(tick_rate=200) as server:
+        async def main():
+            loop = asyncio.get_event_loop()
+            token = await loop.run_in_executor(None, KiwoomAuth('appkey', 'secretkey', host=server.url).ensure_token)
+            client = KiwoomRealtimeClient(token, 'appkey', 'secretkey', websocket_url=server.websocket_url,
+                                          reconnect_policy=RetryPolicy(0, 0.05, 0.2))
+            client.auth.host = server.url
+            received = []
+            client.add_callback('0B', lambda data: received.append(data['item']))
+
+            await client.connect()
+            await client.register_realtime(['005930', '000660'], ['0B'])
+            receiver = asyncio.ensure_future(client.receive_messages())
+            try:
+                await asyncio.sleep(0.2)
+                assert set(received) == {'005930', '000660'}
+
+                # 토큰이 만료된 상태에서 연결이 끊겨도 새 토큰으로 로그인하고 다시 등록
+                server.expire_tokens()
+                server.drop_connections()
+                await asyncio.sleep(0.1)
+                received.clear()
+                await asyncio.sleep(0.4)
+                return client.stats(), set(received), client.token != token
+            finally:
+                await client.disconnect()
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+
+        stats, received, new_token = asyncio.run(main())
+
+    assert stats['reconnects'] == 1
+    assert stats['subscriptions'] == 2
+    assert received == {'005930', '000660'}
+    assert new_token
+
+
+class FakeWebSocket:
+    """PING 한 번을 보낸 뒤 연결을 닫는 WebSocket"""
+
+    def __init__(self, frame):
+        self.frames = [frame]
+        self.sent = []
+
+    async def recv(self):
+        import websockets
+        if self.frames:
+            return self.frames.pop(0)
+        raise websockets.ConnectionClosed(None, None)
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def close(self):
+        pass
+
+
+def test_ping_frame_is_echoed_unchanged():
+    for frame in ('{"trnm":"PING"}', b'{"trnm":"PING"}'):
+        client = KiwoomRealtimeClient('token', 'appkey', 'secretkey', auto_reconnect=False)
+        websocket = client.websocket = FakeWebSocket(frame)
+        client.connected = True
+        asyncio.run(client.receive_messages())
+
+        assert websocket.sent == [frame]
+        assert client.reconnects == 0
@@ -0,0 +1,113 @@
+"""
+TR 등록 정보(kiwoom_api.registry)와 스키마 생성 스크립트(tools/gen_schema.py) 테스트
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+from kiwoom_api.registry import (ORDER, ORDER_ENDPOINTS, QUERY, classify_quota, is_order, lookup, quota_class,
+                                 registry, resolve_endpoint)
+from kiwoom_api.routes import TR_ROUTES
+from kiwoom_api.rows import FLOAT, INT, STR
+from kiwoom_api.schema import TR_SCHEMAS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 언어 탭으로 같은 TR 예제가 반복되는 명세 (탭 이름은 TR 명이 아님)
+SAMPLE_DOC = '''주식기본정보요청
+ka10001
+import requests
+
+def fn_ka10001(token, data, cont_yn='N', next_key=''):
+\thost = 'https://api.kiwoom.com'
+\tendpoint = '/api/dostk/stkinfo'
+\theaders = {
+\t\t'api-id': 'ka10001',
+\t}
+\tresponse = requests.post(host + endpoint, headers=headers, json=data)
+응답
+Header
+Element\t한글명\ttype
+cont-yn\t연속조회여부\tString
+Body
+Element\t한글명\ttype
+stk_cd\t종목코드\tString
+cur_prc\t현재가\tString
+stk_list\t종목리스트\tLIST
+- dt\t일자\tString
+- flu_rt\t등락율\tString
+Java
+import requests
+\theaders = {
+\t\t'api-id': 'ka10001',
+\t}
+'''
+
+
+@pytest.fixture(scope='module')
+def gen_schema():
+    spec = importlib.util.spec_from_file_location('gen_schema', os.path.join(ROOT, 'tools', 'gen_schema.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_files_match_documents(gen_schema):
+    # document/*.txt 를 고치고 python tools/gen_schema.py 를 다시 실행하지 않았으면 실패
+    assert gen_schema.build_schemas() == TR_SCHEMAS
+    assert gen_schema.build_routes() == TR_ROUTES
+
+
+def test_split_entries_skips_language_tabs(gen_schema, tmp_path):
+    path = tmp_path / 'sample.txt'
+    path.write_text(SAMPLE_DOC, encoding='utf-8')
+
+    entries = list(gen_schema.split_entries(str(path)))
+
+    assert [(title, api_id) for title, api_id, _lines in entries] == [('주식기본정보요청', 'ka10001')] * 2
+
+
+def test_parse_response_body_and_route(gen_schema, tmp_path):
+    path = tmp_path / 'sample.txt'
+    path.write_text(SAMPLE_DOC, encoding='utf-8')
+    _title, _api_id, lines = next(gen_schema.split_entries(str(path)))
+
+    fields, lists = gen_schema.parse_response_body(lines)
+
+    assert fields == {'stk_cd': STR, 'cur_prc': INT}
+    assert lists == {'stk_list': {'dt': STR, 'flu_rt': FLOAT}}
+    assert gen_schema.parse_route(lines, lists) == ('/api/dostk/stkinfo', 'POST', True, 'stk_list')
+    assert gen_schema.parse_response_body(['no response table']) == ({}, {})
+
+
+def test_registry_entries():
+    trs = registry()
+
+    assert registry() is trs
+    assert set(trs) == set(TR_ROUTES)
+    info = lookup('ka10081')
+    assert info.endpoint == '/api/dostk/chart'
+    assert info.list_field == 'stk_dt_pole_chart_qry'
+    assert info.schema is TR_SCHEMAS['ka10081']
+    assert lookup('zz99999') is None
+
+
+def test_order_quota_follows_endpoint():
+    for api_id, info in registry().items():
+        assert info.quota == classify_quota(info.endpoint), api_id
+        assert is_order(api_id) == (info.endpoint in ORDER_ENDPOINTS), api_id
+
+    assert quota_class('kt10000') == ORDER
+    assert quota_class('kt00018') == QUERY  # 계좌 조회는 kt 유형이어도 조회 한도
+    assert is_order('kt99999') and not is_order('ka99999')
+
+
+def test_resolve_endpoint():
+    assert resolve_endpoint('ka10001') == '/api/dostk/stkinfo'
+    assert resolve_endpoint('kt10000') == '/api/dostk/ordr'
+    # 명세에 없는 TR 은 API 유형별 기본 엔드포인트
+    assert resolve_endpoint('kt99999') == '/api/dostk/ordr'
+    with pytest.raises(ValueError):
+        resolve_endpoint('zz99999')
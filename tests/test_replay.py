@@ -0,0 +1,120 @@
+"""
+기록/재생(kiwoom_api.replay) 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from kiwoom_api.async_client import AsyncKiwoomClient
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.client import KiwoomClient
+from kiwoom_api.mock import MockKiwoomServer
+from kiwoom_api.realtime import KiwoomRealtimeClient
+from kiwoom_api.replay import REDACTED, REST, WS_IN, WS_OUT, ReplayMissError, SessionRecorder, SessionReplay
+
+# 재생할 때는 연결할 수 없는 호스트를 사용해 네트워크를 쓰지 않음을 확인
+OFFLINE_HOST = 'http://127.0.0.1:9'
+
+
+def _records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _record_rest(server, path):
+    with SessionRecorder(str(path)) as recorder:
+        client = KiwoomClient('appkey', 'secret-value', host=server.url, pool=recorder.pool(), auto_refresh=False)
+        responses = [client.stock.get_stock_basic_info('005930'),
+                     client.stock.get_stock_basic_info('000660'),
+                     client.chart.get_domestic_stock_daily('005930', base_dt='20241101')]
+        client.close()
+    return responses
+
+
+def test_recorded_session_is_redacted(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    _record_rest(server, path)
+    text = path.read_text(encoding='utf-8')
+    records = _records(path)
+
+    assert 'secret-value' not in text
+    assert all(record['k'] == REST for record in records)
+    token = next(record for record in records if record['path'].startswith('/oauth2/'))
+    assert json.loads(token['body'])['token'] == REDACTED
+    assert [record['api_id'] for record in records if record['api_id']] == ['ka10001', 'ka10001', 'ka10081']
+
+
+def test_replays_rest_without_network(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    recorded = _record_rest(server, path)
+
+    replay = SessionReplay(str(path), speed=None)
+    client = KiwoomClient('replay', 'replay', host=OFFLINE_HOST, pool=replay.pool(), auto_refresh=False)
+    replayed = [client.stock.get_stock_basic_info('005930'),
+                client.stock.get_stock_basic_info('000660'),
+                client.chart.get_domestic_stock_daily('005930', base_dt='20241101')]
+
+    assert [response['data'] for response in replayed] == [response['data'] for response in recorded]
+    assert replayed[0]['headers']['api-id'] == 'ka10001'
+
+    with pytest.raises(ReplayMissError):
+        client.stock.get_stock_basic_info('035420')
+    stats = replay.stats()
+    assert stats['missed'] == 1 and stats['replayed'] >= 3
+
+
+def test_replays_rest_asynchronously(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    recorded = _record_rest(server, path)
+    replay = SessionReplay(str(path), speed=None)
+
+    async def main():
+        async with AsyncKiwoomClient('replay', 'replay', host=OFFLINE_HOST, pool=replay.async_pool()) as client:
+            return await client.stock.get_stock_basic_info('005930')
+
+    assert asyncio.run(main())['data'] == recorded[0]['data']
+
+
+def test_records_and_replays_realtime_frames(tmp_path):
+    path = tmp_path / 'realtime.jsonl'
+    with MockKiwoomServer(tick_rate=200) as server:
+        async def record():
+            loop = asyncio.get_running_loop()
+            token = await loop.run_in_executor(None, KiwoomAuth('appkey', 'secretkey', host=server.url).ensure_token)
+            with SessionRecorder(str(path)) as recorder:
+                client = KiwoomRealtimeClient(token, 'appkey', 'secretkey', auto_reconnect=False,
+                                              websocket_url=server.websocket_url, connector=recorder.connector())
+                received = []
+                client.add_callback('0B', lambda data: received.append(data['item']))
+                await client.connect()
+                await client.register_realtime(['005930', '000660'], ['0B'])
+                receiver = asyncio.ensure_future(client.receive_messages())
+                await asyncio.sleep(0.2)
+                await client.disconnect()
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+            return received, token
+
+        recorded, token = asyncio.run(record())
+
+    records = _records(path)
+    assert token not in path.read_text(encoding='utf-8')
+    assert {record['k'] for record in records} == {WS_IN, WS_OUT}
+
+    replay = SessionReplay(str(path), speed=None)
+
+    async def play():
+        client = KiwoomRealtimeClient('replay', 'replay', 'replay', auto_reconnect=False,
+                                      connector=replay.connector())
+        received = []
+        client.add_callback('0B', lambda data: received.append(data['item']))
+        await client.connect()
+        await asyncio.wait_for(client.receive_messages(), 5)
+        return received
+
+    replayed = asyncio.run(play())
+    # 기록기는 콜백 처리 전에 프레임을 기록하므로 재생 결과는 기록 중 받은 프레임을 모두 포함
+    assert replayed[:len(recorded)] == recorded
+    assert set(replayed) == {'005930', '000660'}
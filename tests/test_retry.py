@@ -0,0 +1,118 @@
+"""
+재시도와 서킷 브레이커(kiwoom_api.retry) 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from kiwoom_api.retry import CLOSED, HALF_OPEN, OPEN, CircuitOpenError, RetryEngine, RetryPolicy
+
+ENDPOINT = '/api/dostk/chart'
+
+
+class Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.headers = {}
+
+
+def _engine(**kwargs) -> RetryEngine:
+    return RetryEngine(RetryPolicy(max_attempts=1), failure_threshold=2, recovery_timeout=0.05, **kwargs)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    engine = _engine()
+    for _ in range(2):
+        assert engine.call('ka10081', ENDPOINT, lambda: Response(500)).status_code == 500
+
+    assert engine.breaker(ENDPOINT).state == OPEN
+    with pytest.raises(CircuitOpenError):
+        engine.call('ka10081', ENDPOINT, lambda: Response(200))
+    assert engine.stats()['rejected'] == 1
+
+    # 다른 엔드포인트 계열은 영향 없음
+    assert engine.call('ka10001', '/api/dostk/stkinfo', lambda: Response(200)).status_code == 200
+
+
+def test_breaker_half_open_trial_closes_on_success():
+    engine = _engine()
+    breaker = engine.breaker(ENDPOINT)
+    for _ in range(2):
+        breaker.record_failure()
+
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # 시험 요청이 진행 중이면 다른 요청은 차단
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+def test_breaker_half_open_trial_reopens_on_failure():
+    engine = _engine()
+    for _ in range(2):
+        engine.call('ka10081', ENDPOINT, lambda: Response(503))
+
+    time.sleep(0.06)
+    engine.call('ka10081', ENDPOINT, lambda: Response(500))
+    assert engine.breaker(ENDPOINT).state == OPEN
+    with pytest.raises(CircuitOpenError):
+        engine.call('ka10081', ENDPOINT, lambda: Response(200))
+
+
+def test_cancelled_trial_releases_half_open_slot():
+    engine = _engine()
+
+    async def fail():
+        return Response(500)
+
+    async def slow():
+        await asyncio.sleep(10)
+        return Response(200)
+
+    async def ok():
+        return Response(200)
+
+    async def main():
+        for _ in range(2):
+            await engine.call_async('ka10081', ENDPOINT, fail)
+        await asyncio.sleep(0.06)
+
+        trial = asyncio.ensure_future(engine.call_async('ka10081', ENDPOINT, slow))
+        await asyncio.sleep(0.01)
+        assert engine.breaker(ENDPOINT).state == HALF_OPEN
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        # 취소된 시험 요청의 자리가 반환되어 다음 요청이 시험 요청이 됨
+        return await engine.call_async('ka10081', ENDPOINT, ok)
+
+    assert asyncio.run(main()).status_code == 200
+    assert engine.breaker(ENDPOINT).state == CLOSED
+
+
+def test_retries_transient_status_then_succeeds():
+    engine = RetryEngine(RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002))
+    responses = [Response(429), Response(503), Response(200)]
+
+    assert engine.call('ka10001', '/api/dostk/stkinfo', lambda: responses.pop(0)).status_code == 200
+    assert engine.stats()['retries'] == 2
+
+
+def test_orders_are_not_retried():
+    engine = RetryEngine(RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002))
+    calls = []
+
+    def send():
+        calls.append(1)
+        return Response(503)
+
+    assert engine.call('kt10000', '/api/dostk/ordr', send).status_code == 503
+    assert len(calls) == 1
@@ -0,0 +1,124 @@
+"""
+응답 행 변환(kiwoom_api.rows) 테스트
+"""
+
+import pytest
+
+from kiwoom_api.mock import sample_body
+from kiwoom_api.registry import registry
+from kiwoom_api.rows import (FLOAT, INT, STR, RecordBatch, classify_field, parse_batch, parse_float, parse_int,
+                             parse_record, parse_rows)
+from kiwoom_api.schema import TR_SCHEMAS
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('+72300', 72300),
+    ('-1500', -1500),
+    ('00072300', 72300),
+    ('+00072300', 72300),
+    ('-00001500', -1500),
+    ('  +72300 ', 72300),
+    ('', 0),
+    ('+', 0),
+    ('-', 0),
+    ('+71000.50', 71000.5),
+    ('N/A', 'N/A'),
+    (72300, 72300),
+])
+def test_parse_int(value, expected):
+    assert parse_int(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('+1.50', 1.5),
+    ('-0.71', -0.71),
+    ('+000.50', 0.5),
+    ('', 0.0),
+    ('-', 0.0),
+    ('N/A', 'N/A'),
+])
+def test_parse_float(value, expected):
+    assert parse_float(value) == expected
+
+
+@pytest.mark.parametrize('name, label, kind', [
+    ('cur_prc', '현재가', INT),
+    ('flu_rt', '등락율', FLOAT),
+    ('pred_pre', '전일대비', INT),
+    ('stk_cd', '종목코드', STR),
+    ('dt', '일자', STR),
+    ('250hgst_pric_pre_rt', '', FLOAT),
+])
+def test_classify_field(name, label, kind):
+    assert classify_field(name, label) == kind
+
+
+def test_parse_rows_from_mock_payload():
+    body = sample_body('ka10081', rows=3)
+    rows = parse_rows('ka10081', body)
+    schema = TR_SCHEMAS['ka10081']['lists']['stk_dt_pole_chart_qry']
+
+    assert len(rows) == 3
+    for row in rows:
+        for field, kind in schema.items():
+            assert isinstance(row[field], {INT: int, FLOAT: float, STR: str}[kind]), field
+    # 예시 응답은 홀수 행에 음수 부호를 붙임 (부호 유지)
+    assert rows[0].cur_prc == 71000 and rows[1].cur_prc == -71010
+    assert rows[0].dt == '20240101'
+    assert rows[0].to_dict()['cur_prc'] == 71000
+
+
+def test_parse_record_from_mock_payload():
+    record = parse_record('ka10001', sample_body('ka10001'))
+
+    assert record.stk_cd == 'stk_cd0'
+    assert record.cur_prc == 71000
+    assert isinstance(record.flu_rt, float)
+    # 숫자로 시작하는 필드명은 'f_' 속성과 원래 필드명으로 조회
+    assert record.f_250hgst == record['250hgst'] == 71000
+
+
+def test_parse_batch_matches_rows():
+    body = sample_body('ka10081', rows=4)
+    batch = parse_batch('ka10081', body)
+
+    assert isinstance(batch, RecordBatch) and len(batch) == 4
+    assert batch.column('cur_prc').typecode == 'q'
+    assert list(batch) == parse_rows('ka10081', body)
+
+    batch.extend(parse_batch('ka10081', body))
+    assert len(batch) == 8 and list(batch.column('cur_prc'))[4:] == list(batch.column('cur_prc'))[:4]
+
+
+def test_unknown_tr_passes_through():
+    body = {'items': [{'cur_prc': '+100', 'stk_nm': '삼성전자', 'flu_rt': '-1.5', 'odd': 'x'}], 'return_code': 0}
+
+    rows = parse_rows('zz99999', body)
+    record = parse_record('zz99999', {'cur_prc': '-00050', 'stk_cd': '005930'})
+
+    assert rows[0].to_dict() == {'cur_prc': 100, 'stk_nm': '삼성전자', 'flu_rt': -1.5, 'odd': 'x'}
+    assert record.to_dict() == {'cur_prc': -50, 'stk_cd': '005930'}
+    assert parse_rows('zz99999', {'return_code': 0}) == []
+
+
+def test_missing_fields_are_none():
+    rows = parse_rows('ka10081', {'stk_dt_pole_chart_qry': [{'cur_prc': '+1'}]})
+
+    assert rows[0].cur_prc == 1
+    assert rows[0].open_pric is None
+
+
+def test_schema_matches_registry():
+    trs = registry()
+
+    assert set(trs) == set(TR_SCHEMAS)
+    for api_id, info in trs.items():
+        schema = TR_SCHEMAS[api_id]
+        assert info.title == schema['title'], api_id
+        lists = schema.get('lists', {})
+        if info.list_field is not None:
+            assert info.list_field in lists, api_id
+        else:
+            assert not lists, api_id
+        for fields in [schema.get('fields', {}), *lists.values()]:
+            assert set(fields.values()) <= {INT, FLOAT, STR}, api_id
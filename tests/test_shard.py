@@ -0,0 +1,118 @@
+"""
+다중 연결 실시간시세 클라이언트(kiwoom_api.shard) 테스트
+"""
+
+import asyncio
+
+from kiwoom_api.auth import KiwoomAuth
+from kiwoom_api.mock import MockKiwoomServer
+from kiwoom_api.shard import ShardedRealtimeClient, group_of, shard_of
+
+CODES = [f'{i:06d}' for i in range(1000)]
+
+
+def test_shard_of_is_stable():
+    assert [shard_of(code, 4) for code in CODES] == [shard_of(code, 4) for code in CODES]
+    assert all(0 <= shard_of(code, 4) < 4 for code in CODES)
+    assert all(group_of(code, 3) in ('1', '2', '3') for code in CODES)
+
+
+def test_adding_a_shard_only_moves_items_to_it():
+    for shards in (1, 2, 4, 7):
+        before = {code: shard_of(code, shards) for code in CODES}
+        after = {code: shard_of(code, shards + 1) for code in CODES}
+        moved = [code for code in CODES if before[code] != after[code]]
+
+        assert all(after[code] == shards for code in moved)
+        # 늘어난 연결의 몫(1/(shards+1)) 정도만 옮겨짐
+        assert abs(len(moved) / len(CODES) - 1 / (shards + 1)) < 0.05
+
+
+def test_removing_a_shard_only_moves_its_items():
+    before = {code: shard_of(code, 5) for code in CODES}
+    after = {code: shard_of(code, 4) for code in CODES}
+
+    assert all(before[code] == 4 for code in CODES if before[code] != after[code])
+
+
+def test_dispatch_switches_on_first_frame_from_new_shard():
+    client = ShardedRealtimeClient(auth=KiwoomAuth('appkey', 'secretkey'), token='token')
+    received = []
+    client.add_callback('0B', lambda data: received.append(data['item']))
+    client.subscribed['005930'] = {'0B': None}
+    client.placement['005930'] = 0
+    client.handover['005930'] = 1
+
+    def frame(shard):
+        client._dispatch(shard, {'trnm': 'REAL', 'data': [{'type': '0B', 'item': '005930', 'values': {}}]})
+
+    frame(0)  # 전환 전에는 이전 연결의 프레임 전달
+    frame(1)  # 새 연결의 첫 프레임에서 전환
+    frame(0)  # 전환 후 이전 연결의 프레임은 버림
+
+    assert received == ['005930', '005930']
+    assert client.placement['005930'] == 1
+    assert not client.handover
+
+
+def test_merges_shards_with_shared_token():
+    codes = CODES[:40]
+    with MockKiwoomServer(tick_rate=500, tick_batch=5) as server:
+        async def main():
+            auth = KiwoomAuth('appkey', 'secretkey', host=server.url)
+            sharded = ShardedRealtimeClient(shards=3, auth=auth, auto_reconnect=False,
+                                            websocket_url=server.websocket_url)
+            received = {}
+            sharded.add_callback('0B', lambda data: received.setdefault(data['item'], 0))
+            await sharded.connect()
+            await sharded.register_realtime(codes, ['0B'])
+            receiver = asyncio.ensure_future(sharded.run())
+            auths = [client.auth for client in sharded.clients]
+            try:
+                await asyncio.sleep(0.5)
+            finally:
+                await sharded.disconnect()
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+            return sharded, auths, received
+
+        sharded, auths, received = asyncio.run(main())
+        tokens = server.stats()['tokens']
+
+    assert set(received) == set(codes)
+    assert len(auths) == 3 and all(auth is sharded.auth for auth in auths)
+    assert tokens == 1
+    assert sharded.placement == {code: shard_of(code, 3) for code in codes}
+
+
+def test_rebalance_hands_over_without_gaps():
+    first, second = CODES[:20], CODES[20:40]
+    with MockKiwoomServer(tick_rate=1000, tick_batch=10) as server:
+        async def main():
+            auth = KiwoomAuth('appkey', 'secretkey', host=server.url)
+            sharded = ShardedRealtimeClient(shards=1, items_per_shard=20, auth=auth, handover_timeout=5.0,
+                                            auto_reconnect=False, websocket_url=server.websocket_url)
+            await sharded.connect()
+            await sharded.register_realtime(first, ['0B'])
+            receiver = asyncio.ensure_future(sharded.run())
+            try:
+                await asyncio.sleep(0.2)
+                started = asyncio.get_running_loop().time()
+                await sharded.register_realtime(second, ['0B'])
+                elapsed = asyncio.get_running_loop().time() - started
+                stats = sharded.stats()
+                handover = dict(sharded.handover)
+            finally:
+                await sharded.disconnect()
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+            return sharded, stats, handover, elapsed
+
+        sharded, stats, handover, elapsed = asyncio.run(main())
+
+    moved = [code for code in first if shard_of(code, 2) == 1]
+    assert stats['shards'] == 2
+    assert stats['moves'] == len(moved) > 0
+    # 시간 초과가 아니라 새 연결의 첫 프레임으로 전환을 마침
+    assert handover == {} and elapsed < 2.0
+    assert all(sharded.placement[code] == shard_of(code, 2) for code in first + second)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+TR 응답 필드 스키마와 TR 라우팅 정보 생성 스크립트
+
+document/*.txt 의 API 명세에서 TR 별 응답 Body 필드 표를 읽어
+필드 종류(int, float, str)를 판별하고 kiwoom_api/schema.py 를 생성합니다.
+예제 코드의 엔드포인트와 HTTP 메서드, 응답 Header 의 연속조회 여부, 첫 번째 목록 필드로
+kiwoom_api/routes.py 를 생성합니다.
+
+    python tools/gen_schema.py
+"""
+
+import glob
+import os
+import re
+import sys
+from pprint import pformat
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from kiwoom_api.registry import classify_quota  # noqa: E402
+from kiwoom_api.rows import classify_field  # noqa: E402
+
+API_ID_PATTERN = re.compile(r'^[a-z]{2}\d{5}$')
+
+# 명세의 예제 코드 언어 탭 이름 (TR 명이 아님)
+LANGUAGE_TABS = ('Python', 'Java', 'Javascript')
+
+HEADER = '''"""
+키움증권 TR 응답 필드 스키마
+
+이 파일은 tools/gen_schema.py 로 document/*.txt 에서 자동 생성되었습니다. 직접 수정하지 마세요.
+
+TR_SCHEMAS[api_id] = {
+    'title': TR 명,
+    'fields': 목록이 아닌 본문 필드 {필드명: 종류},
+    'lists': 목록 필드별 행 필드 {목록 필드명: {필드명: 종류}},
+}
+"""
+
+'''
+
+ROUTES_HEADER = '''"""
+키움증권 TR 라우팅 정보
+
+이 파일은 tools/gen_schema.py 로 document/*.txt 에서 자동 생성되었습니다. 직접 수정하지 마세요.
+
+TR_ROUTES[api_id] = (TR 명, 엔드포인트, HTTP 메서드, 연속조회 지원 여부, 목록 필드명, 호출 한도 구분)
+"""
+
+'''
+
+
+def split_entries(path):
+    """명세 파일을 (TR 명, api_id, 본문 줄 목록) 단위로 분리 (각 TR 은 예제 코드의 import requests 로 시작)"""
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().split('\n')
+
+    titles = {}
+    starts = [index for index, line in enumerate(lines) if line == 'import requests']
+    for number, start in enumerate(starts):
+        end = starts[number + 1] if number + 1 < len(starts) else len(lines)
+        body = lines[start:end]
+        match = re.search(r"'api-id': '(\w+)'", '\n'.join(body))
+        if not match:
+            continue
+        api_id = match.group(1)
+        title = ''
+        for line in reversed(lines[:start]):
+            line = line.strip()
+            if line in LANGUAGE_TABS:
+                # 언어 탭(Python/Java/Javascript)으로 반복된 예제는 앞서 나온 같은 TR 의 TR 명 사용
+                title = titles.get(api_id, '')
+                break
+            if line and not API_ID_PATTERN.match(line) and line != 'TR명':
+                title = line
+                break
+        titles.setdefault(api_id, title)
+        yield title, api_id, body
+
+
+def parse_response_body(lines):
+    """응답 Body 표에서 본문 필드와 목록 필드 추출"""
+    text = '\n'.join(lines)
+    if '\n응답\n' not in text:
+        return {}, {}
+    response = text.split('\n응답\n', 1)[1]
+    if '\nBody\n' not in response:
+        return {}, {}
+
+    fields, lists = {}, {}
+    current = None
+    for row in response.split('\nBody\n', 1)[1].split('\n'):
+        columns = row.split('\t')
+        if len(columns) < 3 or not columns[0].strip() or columns[0] == 'Element':
+            continue
+        name, label, kind = columns[0], columns[1], columns[2].strip()
+        if name.startswith('-'):
+            if current is not None:
+                name = name.lstrip('- ').strip()
+                lists[current][name] = classify_field(name, label)
+            continue
+        name = name.strip()
+        if kind == 'LIST':
+            current = name
+            lists[current] = {}
+        else:
+            current = None
+            fields[name] = classify_field(name, label)
+    return fields, lists
+
+
+def parse_route(lines, lists):
+    """예제 코드와 응답 Header 표에서 (엔드포인트, HTTP 메서드, 연속조회 지원 여부, 목록 필드명) 추출"""
+    text = '\n'.join(lines)
+    endpoint = re.search(r"endpoint = '([^']+)'", text)
+    method = re.search(r'requests\.(\w+)\(', text)
+    response = text.split('\n응답\n', 1)[1] if '\n응답\n' in text else ''
+    paginated = 'cont-yn' in response.split('\nBody\n', 1)[0]
+    return (endpoint.group(1) if endpoint else None,
+            method.group(1).upper() if method else 'POST',
+            paginated,
+            next(iter(lists), None))
+
+
+def build_routes():
+    """모든 명세 파일의 TR 라우팅 정보 생성"""
+    routes = {}
+    for path in sorted(glob.glob(os.path.join(ROOT, 'document', '*.txt'))):
+        for title, api_id, lines in split_entries(path):
+            _fields, lists = parse_response_body(lines)
+            endpoint, method, paginated, list_field = parse_route(lines, lists)
+            if endpoint is None:
+                continue
+            routes[api_id] = (title, endpoint, method, paginated, list_field, classify_quota(endpoint))
+    return dict(sorted(routes.items()))
+
+
+def build_schemas():
+    """모든 명세 파일의 TR 스키마 생성"""
+    schemas = {}
+    for path in sorted(glob.glob(os.path.join(ROOT, 'document', '*.txt'))):
+        for title, api_id, lines in split_entries(path):
+            fields, lists = parse_response_body(lines)
+            schemas[api_id] = {'title': title, 'fields': fields, 'lists': lists}
+    return dict(sorted(schemas.items()))
+
+
+def main():
+    schemas = build_schemas()
+    output = os.path.join(ROOT, 'kiwoom_api', 'schema.py')
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write('TR_SCHEMAS = ' + pformat(schemas, width=120, sort_dicts=False) + '\n')
+    print(f'{len(schemas)}개 TR 스키마를 {output} 에 저장했습니다.')
+
+    routes = build_routes()
+    output = os.path.join(ROOT, 'kiwoom_api', 'routes.py')
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(ROUTES_HEADER)
+        f.write('TR_ROUTES = ' + pformat(routes, width=120, sort_dicts=False) + '\n')
+    print(f'{len(routes)}개 TR 라우팅 정보를 {output} 에 저장했습니다.')
+
+
+if __name__ == '__main__':
+    main()